@@ -0,0 +1,18 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+import pytest
+
+from signals.apps.signals.utils.area_index import area_index
+from signals.cache import clear_local_tiers
+
+
+@pytest.fixture(autouse=True)
+def clear_local_cache_tiers():
+    """
+    The database (and with it the shared cache) is rolled back after every test, the local tiers of the cache are not.
+    Clear them so that no test sees entries cached by a previous test.
+    """
+    clear_local_tiers()
+    # The area index checks its version stamp only every few seconds, drop the areas of a previous test right away
+    area_index.reset()
+    yield
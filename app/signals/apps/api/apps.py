@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2023 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
 from django.apps import AppConfig
 
 
@@ -16,6 +16,8 @@ class ApiConfig(AppConfig):
         See: https://docs.djangoproject.com/en/3.2/ref/applications/#django.apps.AppConfig.ready
 
         In this case it is used to import the signals.auth.schema module. Which
-        is needed to register the auth drf-spectacular schema.
+        is needed to register the auth drf-spectacular schema. And to connect
+        the signal receivers.
         """
+        import signals.apps.api.signal_receivers  # noqa: F401
         import signals.auth.schema  # noqa: F401
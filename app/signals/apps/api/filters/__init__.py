@@ -1,12 +1,13 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2020 - 2021 Gemeente Amsterdam
+# Copyright (C) 2020 - 2026 Gemeente Amsterdam
 from signals.apps.api.filters.area import AreaFilterSet
 from signals.apps.api.filters.department import DepartmentFilterSet
 from signals.apps.api.filters.question import QuestionFilterSet
 from signals.apps.api.filters.signal import (
     SignalCategoryRemovedAfterFilterSet,
     SignalFilterSet,
-    SignalPromotedToParentFilter
+    SignalPromotedToParentFilter,
+    get_signal_filter_metadata
 )
 from signals.apps.api.filters.utils import (
     _get_child_category_queryset,
@@ -20,6 +21,7 @@ from signals.apps.api.filters.utils import (
     contact_details_choices,
     department_choices,
     feedback_choices,
+    invalidate_filter_choices,
     kind_choices,
     source_choices,
     stadsdelen_choices,
@@ -51,4 +53,6 @@ __all__ = [
     'stadsdelen_choices',
     '_get_child_category_queryset',
     '_get_parent_category_queryset',
+    'get_signal_filter_metadata',
+    'invalidate_filter_choices',
 ]
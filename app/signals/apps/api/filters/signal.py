@@ -1,8 +1,15 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2020 - 2022 Gemeente Amsterdam
+# Copyright (C) 2020 - 2026 Gemeente Amsterdam
+import hashlib
+import json
+
 from django.conf import settings
 from django.contrib.gis.geos import Point, Polygon
-from django.db.models import Count, F, Max, Min, Q
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count, Exists, F, FloatField, Max, Min, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils.http import quote_etag
 from django.utils.timezone import now
 from django_filters.rest_framework import FilterSet, filters
 from rest_framework.exceptions import ValidationError
@@ -25,7 +32,11 @@ from signals.apps.api.filters.utils import (
     status_choices
 )
 from signals.apps.signals import workflow
-from signals.apps.signals.models import Category, Priority, Type
+from signals.apps.signals.models import Category, Note, Priority, Type
+from signals.apps.signals.models.note import NOTE_SEARCH_CONFIG, get_note_search_vector
+
+# Annotated by the note_keyword and note_search filters, signals can be ordered by it with "ordering=-note_rank"
+NOTE_RANK = 'note_rank'
 
 
 class SignalFilterSet(FilterSet):
@@ -60,6 +71,7 @@ class SignalFilterSet(FilterSet):
         field_name='category_assignment__category__parent__slug',
     )
     note_keyword = filters.CharFilter(method='note_keyword_filter')
+    note_search = filters.CharFilter(method='note_search_filter')
     priority = filters.MultipleChoiceFilter(field_name='priority__priority', choices=Priority.PRIORITY_CHOICES)
     source = filters.MultipleChoiceFilter(choices=source_choices)
     stadsdeel = filters.MultipleChoiceFilter(field_name='location__stadsdeel', choices=stadsdelen_choices)
@@ -97,8 +109,28 @@ class SignalFilterSet(FilterSet):
 
         self._cleanup_form_data()
         queryset = super().filter_queryset(queryset=queryset)
+
+        if NOTE_RANK not in queryset.query.annotations and self._is_ordered_by_note_rank():
+            # Without a note keyword or search all signals are equally relevant
+            queryset = queryset.annotate(**{NOTE_RANK: Value(0.0, output_field=FloatField())})
         return queryset
 
+    def _is_ordered_by_note_rank(self):
+        ordering = self.request.GET.get('ordering', '') if self.request is not None else ''
+        return NOTE_RANK in [field.strip().lstrip('-') for field in ordering.split(',')]
+
+    def _annotate_note_rank(self, queryset, query):
+        """
+        The relevance of the best matching note of every signal, only annotated when the signals are ordered by it
+        """
+        if not self._is_ordered_by_note_rank():
+            return queryset
+
+        rank = Note.objects.filter(_signal=OuterRef('pk')).annotate(
+            rank=SearchRank(get_note_search_vector(), query)
+        ).order_by('-rank').values('rank')[:1]
+        return queryset.annotate(**{NOTE_RANK: Coalesce(Subquery(rank), Value(0.0), output_field=FloatField())})
+
     # Custom filter functions
 
     def contact_details_filter(self, queryset, name, value):
@@ -231,7 +263,21 @@ class SignalFilterSet(FilterSet):
         return queryset.filter(q_filter).distinct() if q_filter else queryset
 
     def note_keyword_filter(self, queryset, name, value):
-        return queryset.filter(notes__text__icontains=value).distinct()
+        """
+        Filter Signals with a note containing the keyword (case insensitive), uses the trigram index on the notes
+        """
+        notes = Note.objects.filter(_signal=OuterRef('pk'), text__icontains=value)
+        queryset = queryset.filter(Exists(notes))
+        return self._annotate_note_rank(queryset, SearchQuery(value, config=NOTE_SEARCH_CONFIG))
+
+    def note_search_filter(self, queryset, name, value):
+        """
+        Full-text search (Dutch) in the notes of Signals, supports the web search syntax ("quoted text", or, -word)
+        """
+        query = SearchQuery(value, config=NOTE_SEARCH_CONFIG, search_type='websearch')
+        notes = Note.objects.annotate(search=get_note_search_vector()).filter(_signal=OuterRef('pk'), search=query)
+        queryset = queryset.filter(Exists(notes))
+        return self._annotate_note_rank(queryset, query)
 
     def assigned_user_email_filter(self, queryset, name, value):
         if value == 'null':
@@ -382,3 +428,21 @@ class PublicSignalGeographyFilter(FilterSet):
             # Filter Signal's in the given bounding box
             geometrie_filter
         ))
+
+
+def get_signal_filter_metadata() -> tuple[dict, str]:
+    """
+    The choices of the choice filters of the SignalFilterSet and their ETag. The choices read from the database are
+    cached, see signals.apps.api.filters.utils.cached_choices.
+    """
+    metadata = {}
+    for name, signal_filter in SignalFilterSet.base_filters.items():
+        choices = signal_filter.extra.get('choices')
+        if choices is None:
+            continue
+
+        choices = choices() if callable(choices) else choices
+        metadata[name] = [{'value': value, 'label': str(label)} for value, label in choices]
+
+    content = json.dumps(metadata, sort_keys=True, cls=DjangoJSONEncoder).encode()
+    return metadata, quote_etag(hashlib.sha1(content).hexdigest())
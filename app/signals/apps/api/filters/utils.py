@@ -1,5 +1,11 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2020 - 2021 Gemeente Amsterdam
+# Copyright (C) 2020 - 2026 Gemeente Amsterdam
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
 from signals.apps.signals.models import (
     STADSDELEN,
     Area,
@@ -11,8 +17,38 @@ from signals.apps.signals.models import (
     ExpressionType,
     Source
 )
+from signals.apps.signals.utils.version_stamp import VersionStamp
 from signals.apps.signals.workflow import STATUS_CHOICES
 
+# Bumped whenever the areas, area types, buurten, categories, departments or sources change
+filter_choices_version = VersionStamp('api:filter_choices:version')
+
+
+def invalidate_filter_choices() -> None:
+    """
+    Bump the version stamp, so all cached choices are determined again. The version is bumped again once the
+    transaction is committed, choices cached before the commit (from the old data) are not used afterwards.
+    """
+    filter_choices_version.bump()
+    transaction.on_commit(filter_choices_version.bump)
+
+
+def cached_choices(func):
+    """
+    Cache the choices in the Django cache until the reference data they are read from changes, the choices of a
+    FilterSet are determined every time the FilterSet is instantiated.
+    """
+    @wraps(func)
+    def wrapper():
+        cache_key = f'api:filter_choices:{filter_choices_version.get()}:{func.__name__}'
+        choices = cache.get(cache_key)
+        if choices is None:
+            choices = func()
+            cache.set(cache_key, choices, settings.FILTER_CHOICES_CACHE_TIMEOUT)
+        return choices
+    return wrapper
+
+
 # Helper functions to to determine available choices used for filtering
 
 
@@ -24,12 +60,14 @@ def area_type_code_choices():
     return [(area_type.code, area_type.code) for area_type in AreaType.objects.only('code').all().distinct()]
 
 
+@cached_choices
 def area_type_choices():
     return [
         ('null', 'null'),
     ] + [(c, f'{n} ({c})') for c, n in AreaType.objects.values_list('code', 'name')]
 
 
+@cached_choices
 def area_choices():
     return [
         ('null', 'null'),
@@ -41,6 +79,7 @@ boolean_false_choices = [(False, 'False'), ('false', 'false'), ('False', 'False'
 boolean_choices = boolean_true_choices + boolean_false_choices
 
 
+@cached_choices
 def buurt_choices():
     return [(c, f'{n} ({c})') for c, n in Buurt.objects.values_list('vollcode', 'naam')]
 
@@ -49,6 +88,7 @@ def contact_details_choices():
     return (('none', 'none'), ('email', 'email'), ('phone', 'phone'), )
 
 
+@cached_choices
 def department_choices():
     return [
         ('null', 'null'),
@@ -86,6 +126,7 @@ def status_choices():
     return [(c, f'{n} ({c})') for c, n in STATUS_CHOICES]
 
 
+@cached_choices
 def source_choices():
     return [(choice, f'{choice}') for choice in Source.objects.order_by('name').values_list('name', flat=True).distinct()]  # noqa
 
@@ -105,6 +146,7 @@ def _get_parent_category_queryset():
     return Category.objects.filter(parent__isnull=True)
 
 
+@cached_choices
 def category_choices():
     # Only select id and name to prevent retrieving the related models as we don't need them here
     choices = [(category['id'], f'{category["name"]}') for category in Category.objects.values('id', 'name').all()]
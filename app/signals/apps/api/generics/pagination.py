@@ -1,10 +1,23 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2020 - 2023 Gemeente Amsterdam
+# Copyright (C) 2020 - 2026 Gemeente Amsterdam
+import base64
+import binascii
+import datetime
+import json
+from collections import OrderedDict
+
 from datapunt_api.pagination import HALPagination as DataPuntHALPagination
+from django.core.exceptions import FieldDoesNotExist
 from django.core.paginator import InvalidPage
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import F, Field, Func, Q, Value
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.lookups import GreaterThan, LessThan
 from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 
 class HALPagination(DataPuntHALPagination):
@@ -118,3 +131,310 @@ class LinkHeaderPaginationForQuerysets(LinkHeaderPagination):
 
         self.request = request
         return self.page.object_list
+
+
+class _CursorJSONEncoder(DjangoJSONEncoder):
+    """
+    The DjangoJSONEncoder truncates datetimes to milliseconds, cursors need the exact value.
+    """
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+class KeysetPaginationMixin:
+    """
+    Opt-in keyset (cursor) pagination for the page number based paginators.
+
+    Page number pagination needs a COUNT(*) over the full queryset and an OFFSET scan that gets slower with every
+    page. When a client requests `?pagination=cursor` the queryset is instead filtered on the values of the ordering
+    fields of the last row of the previous page. The next link carries these values as an opaque `cursor`, so every
+    page costs the same as the first one. When all ordering fields are sorted in the same direction the rows after the
+    cursor are selected with a row-value comparison, `(created_at, id) < (%s, %s)`, an index range condition.
+
+    The queryset ordering (as set by the `FieldMappingOrderingFilter` or the default ordering of the model) is used
+    and the primary key is appended to it to make it a total ordering. The total count is optional, use `?count=exact`
+    for an exact count or `?count=estimate` for the estimate of the PostgreSQL query planner.
+    """
+    pagination_mode_query_param = 'pagination'
+    pagination_mode_cursor = 'cursor'
+    cursor_query_param = 'cursor'
+    count_query_param = 'count'
+    count_exact = 'exact'
+    count_estimate = 'estimate'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def is_keyset_request(self, request) -> bool:
+        return (
+            request.query_params.get(self.pagination_mode_query_param) == self.pagination_mode_cursor or
+            self.cursor_query_param in request.query_params
+        )
+
+    @staticmethod
+    def _get_keyset_ordering(queryset) -> list[tuple[str, bool]]:
+        """
+        Returns the ordering of the queryset as a list of (field, descending) tuples that always ends with the pk.
+        """
+        ordering = list(queryset.query.order_by) or list(queryset.model._meta.ordering)
+
+        keyset_ordering = []
+        for field in ordering:
+            if not isinstance(field, str) or field == '?':
+                raise NotFound('Cursor pagination is not supported for this ordering')
+
+            descending = field.startswith('-')
+            field = field.lstrip('-')
+            keyset_ordering.append(('pk' if field in ('id', 'pk') else field, descending))
+
+        if 'pk' not in [field for field, _ in keyset_ordering]:
+            keyset_ordering.append(('pk', keyset_ordering[0][1] if keyset_ordering else False))
+
+        # Fields after the pk can never make a difference, they are removed
+        fields = [field for field, _ in keyset_ordering]
+        return keyset_ordering[:fields.index('pk') + 1]
+
+    def _encode_cursor(self, ordering: list[tuple[str, bool]], values) -> str:
+        payload = {'o': [f'-{field}' if descending else field for field, descending in ordering], 'v': list(values)}
+        data = json.dumps(payload, cls=_CursorJSONEncoder, separators=(',', ':'))
+        return base64.urlsafe_b64encode(data.encode('utf-8')).decode('ascii')
+
+    def _decode_cursor(self, ordering: list[tuple[str, bool]], cursor: str) -> list:
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8'))
+            values = payload['v']
+            signature = payload['o']
+        except (TypeError, ValueError, KeyError, UnicodeError, binascii.Error):
+            raise NotFound(self.invalid_cursor_message)
+
+        # A cursor is only valid for the ordering it was created for
+        if signature != [f'-{field}' if descending else field for field, descending in ordering]:
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return values
+
+    @staticmethod
+    def _get_after_condition(field: str, descending: bool, value) -> Q | None:
+        """
+        Condition for the rows that come after the given value. PostgreSQL sorts NULL values last when ordering
+        ascending and first when ordering descending.
+        """
+        if descending:
+            return Q(**{f'{field}__isnull': False}) if value is None else Q(**{f'{field}__lt': value})
+        if value is None:
+            return None
+        return Q(**{f'{field}__gt': value}) | Q(**{f'{field}__isnull': True})
+
+    def _get_keyset_filter(self, ordering: list[tuple[str, bool]], values: list) -> Q:
+        """
+        Rows after the cursor: (f1 after v1) OR (f1 = v1 AND f2 after v2) OR ...
+        """
+        condition = Q(pk__in=[])
+        equal = Q()
+        for (field, descending), value in zip(ordering, values):
+            after = self._get_after_condition(field, descending, value)
+            if after is not None:
+                condition |= equal & after
+            equal &= Q(**{f'{field}__isnull': True}) if value is None else Q(**{field: value})
+        return condition
+
+    @staticmethod
+    def _get_row_fields(queryset, ordering: list[tuple[str, bool]], values: list) -> list | None:
+        """
+        The model fields of the ordering when the rows after the cursor can be selected with a row-value comparison,
+        which PostgreSQL can use as a range condition on an index. That is the case when all fields are sorted in the
+        same direction and are non-nullable columns of the model itself.
+        """
+        if len({descending for _, descending in ordering}) != 1 or None in values:
+            return None
+
+        opts = queryset.model._meta
+        model_fields = []
+        for field, _ in ordering:
+            if field == 'pk':
+                model_fields.append(opts.pk)
+                continue
+            if LOOKUP_SEP in field:
+                return None
+
+            try:
+                model_field = opts.get_field(field)
+            except FieldDoesNotExist:
+                # An annotation
+                return None
+            if not model_field.concrete or model_field.is_relation or model_field.null:
+                return None
+            model_fields.append(model_field)
+        return model_fields
+
+    def _filter_after_cursor(self, queryset, ordering: list[tuple[str, bool]], values: list):
+        model_fields = self._get_row_fields(queryset, ordering, values)
+        if model_fields is None:
+            return queryset.filter(self._get_keyset_filter(ordering, values))
+
+        # (f1, f2, ...) < (v1, v2, ...) for a descending ordering, > for an ascending ordering
+        lookup = LessThan if ordering[0][1] else GreaterThan
+        columns = Func(*[F(field) for field, _ in ordering], function='ROW', output_field=Field())
+        cursor = Func(*[Value(value, output_field=model_field) for value, model_field in zip(values, model_fields)],
+                      function='ROW', output_field=Field())
+        return queryset.filter(lookup(columns, cursor))
+
+    def _get_estimated_count(self, queryset) -> int:
+        """
+        The row estimate of the PostgreSQL query planner, does not execute the query.
+        """
+        sql, params = queryset.order_by().query.sql_with_params()
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]['Plan']['Plan Rows'])
+
+    def _get_keyset_count(self, queryset, request) -> int | None:
+        count = request.query_params.get(self.count_query_param)
+        if count == self.count_exact:
+            return queryset.count()
+        if count == self.count_estimate:
+            return self._get_estimated_count(queryset)
+        return None
+
+    def get_keyset_queryset(self, queryset, request):
+        """
+        Returns the (lazy) queryset of the rows after the cursor, in the keyset ordering.
+        """
+        self.request = request
+        self.keyset_ordering = self._get_keyset_ordering(queryset)
+        self.keyset_count = self._get_keyset_count(queryset, request)
+
+        queryset = queryset.order_by(*[f'-{field}' if descending else field
+                                       for field, descending in self.keyset_ordering])
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            values = self._decode_cursor(self.keyset_ordering, cursor)
+            queryset = self._filter_after_cursor(queryset, self.keyset_ordering, values)
+        return queryset
+
+    def set_keyset_next_cursor(self, keys: list, page_size: int) -> None:
+        """
+        Set the cursor of the next page from the ordering values of page_size + 1 rows, the extra row only tells
+        whether there is a next page.
+        """
+        self.next_cursor = None
+        if len(keys) > page_size:
+            self.next_cursor = self._encode_cursor(self.keyset_ordering, keys[page_size - 1])
+
+    def paginate_queryset_by_keyset(self, queryset, request, page_size: int) -> list:
+        """
+        Returns the rows of the requested page. The first row of the next page is fetched by the same query, together
+        with the ordering values of all rows.
+        """
+        queryset = self.get_keyset_queryset(queryset, request)
+
+        aliases = [f'_keyset_{position}' for position in range(len(self.keyset_ordering))]
+        queryset = queryset.annotate(**{alias: F(field) for alias, (field, _) in zip(aliases, self.keyset_ordering)})
+
+        rows = list(queryset[:page_size + 1])
+        self.set_keyset_next_cursor([
+            [row[alias] if isinstance(row, dict) else getattr(row, alias) for alias in aliases] for row in rows
+        ], page_size)
+        return rows[:page_size]
+
+    def get_keyset_next_link(self) -> str | None:
+        if self.next_cursor is None:
+            return None
+
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.pagination_mode_query_param, self.pagination_mode_cursor)
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_keyset_first_link(self) -> str:
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.pagination_mode_query_param, self.pagination_mode_cursor)
+        return remove_query_param(url, self.cursor_query_param)
+
+
+class HALKeysetPagination(KeysetPaginationMixin, HALPagination):
+    """
+    HAL pagination that switches to keyset pagination when requested, see `KeysetPaginationMixin`.
+    """
+    keyset = False
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = self.is_keyset_request(request)
+        if not self.keyset:
+            return super().paginate_queryset(queryset, request, view=view)
+
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        # The page is aggregated by the caller, so only the ordering values of the rows are fetched here. The page
+        # itself is selected by primary key.
+        queryset = self.get_keyset_queryset(queryset, request)
+        fields = [field for field, _ in self.keyset_ordering]
+        keys = list(queryset.values_list(*fields)[:page_size + 1])
+        self.set_keyset_next_cursor(keys, page_size)
+
+        pk_position = fields.index('pk')
+        return queryset.filter(pk__in=[key[pk_position] for key in keys[:page_size]])[:page_size]
+
+    def get_paginated_response(self, data):
+        if not self.keyset:
+            return super().get_paginated_response(data)
+
+        next_link = self.get_keyset_next_link()
+        return Response(OrderedDict([
+            ('_links', OrderedDict([
+                ('self', {'href': self.request.build_absolute_uri()}),
+                ('first', {'href': self.get_keyset_first_link()}),
+                ('next', {'href': next_link}),
+                ('previous', {'href': None}),
+            ])),
+            ('count', self.keyset_count),
+            ('results', data),
+        ]))
+
+
+class LinkHeaderKeysetPaginationForQuerysets(KeysetPaginationMixin, LinkHeaderPaginationForQuerysets):
+    """
+    Link header pagination for querysets that switches to keyset pagination when requested, see
+    `KeysetPaginationMixin`. The X-Total-Count header is only present when a count was requested.
+    """
+    keyset = False
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = self.is_keyset_request(request)
+        if not self.keyset:
+            return super().paginate_queryset(queryset, request, view=view)
+
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        # The page is aggregated by the caller, so only the ordering values of the rows are fetched here. The page
+        # itself is selected by primary key.
+        queryset = self.get_keyset_queryset(queryset, request)
+        fields = [field for field, _ in self.keyset_ordering]
+        keys = list(queryset.values_list(*fields)[:page_size + 1])
+        self.set_keyset_next_cursor(keys, page_size)
+
+        pk_position = fields.index('pk')
+        return queryset.filter(pk__in=[key[pk_position] for key in keys[:page_size]])[:page_size]
+
+    def get_pagination_headers(self):
+        if not self.keyset:
+            return super().get_pagination_headers()
+
+        header_links = [f'<{self.request.build_absolute_uri()}>; rel="self"',
+                        f'<{self.get_keyset_first_link()}>; rel="first"']
+        next_link = self.get_keyset_next_link()
+        if next_link:
+            header_links.append(f'<{next_link}>; rel="next"')
+
+        headers = {'Link': ','.join(header_links)}
+        if self.keyset_count is not None:
+            headers['X-Total-Count'] = self.keyset_count
+        return headers
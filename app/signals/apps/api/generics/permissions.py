@@ -1,12 +1,15 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2023 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
 from django.views import View
 from rest_framework import exceptions
 from rest_framework.permissions import BasePermission, DjangoModelPermissions
 from rest_framework.request import Request
 
 from signals.apps.api.generics.exceptions import UnsupportedViewException
-from signals.apps.services.domain.permissions.signal import SignalPermissionService
+from signals.apps.services.domain.permissions.signal import (
+    SignalPermissionService,
+    get_signal_permission_evaluator
+)
 from signals.apps.signals.models import Reporter
 
 
@@ -105,12 +108,8 @@ class ModelWritePermissions(DjangoModelPermissions):
 
 
 class SignalViewObjectPermission(DjangoModelPermissions):
-    permission_service = SignalPermissionService
-
     def has_object_permission(self, request, view, obj):
-        if self.permission_service.has_permission(request.user, 'signals.sia_can_view_all_categories'):
-            return True
-        return self.permission_service.has_signal_permission(request.user, obj)
+        return get_signal_permission_evaluator(request).can_view_signal(obj)
 
 
 class SIAReportPermissions(SIABasePermission):
@@ -153,13 +152,7 @@ class ReporterPermission(BasePermission):
         if not request.user.has_perm('signals.sia_can_view_contact_details'):
             return False
 
-        return SignalPermissionService.has_signal_permission(
-            user=request.user,
-            signal=view.get_signal()
-        ) or SignalPermissionService.has_permission(
-            user=request.user,
-            permission='signals.sia_can_view_all_categories',
-        )
+        return get_signal_permission_evaluator(request).can_view_signal(view.get_signal())
 
     def has_object_permission(self, request: Request, view: View, obj: Reporter) -> bool:
         """
@@ -173,13 +166,7 @@ class ReporterPermission(BasePermission):
         if not request.user.has_perm('signals.sia_can_view_contact_details'):
             return False
 
-        return SignalPermissionService.has_signal_permission(
-            user=request.user,
-            signal=obj._signal
-        ) or SignalPermissionService.has_permission(
-            user=request.user,
-            permission='signals.sia_can_view_all_categories',
-        )
+        return get_signal_permission_evaluator(request).can_view_signal(obj._signal)
 
 
 class CanCreateI18NextTranslationFile(BasePermission):
@@ -1,15 +1,25 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2018 - 2024 Gemeente Amsterdam
+# Copyright (C) 2018 - 2026 Gemeente Amsterdam
 import os
+import time
 from typing import Callable
 
 from django.conf import settings
 from django.contrib.auth import login
 from django.contrib.auth.models import AnonymousUser
+from django.core.exceptions import MiddlewareNotUsed
 from django.http import HttpRequest, HttpResponse
 from django.urls import resolve
 
 from signals import __version__
+from signals.instrumentation import (
+    get_action,
+    get_query_budget,
+    get_view_name,
+    instrument,
+    record,
+    request_metrics
+)
 
 
 class APIVersionHeaderMiddleware:
@@ -58,3 +68,41 @@ class MaintenanceModeMiddleware:
             response = self.get_response(request)
 
         return response
+
+
+class QueryInstrumentationMiddleware:
+    """
+    Counts the queries and cache lookups of every request, see signals.instrumentation.
+
+    The stats are added to the "requests" metrics per view and, when QUERY_INSTRUMENTATION_HEADERS is enabled, returned
+    in the X-Query-Count, X-Query-Time (ms), X-Duplicate-Queries, X-Cache-Hits and Server-Timing response headers.
+    """
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        if not settings.QUERY_INSTRUMENTATION_ENABLED:
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        started = time.perf_counter()
+        with instrument('unresolved') as stats:
+            request._query_instrumentation_stats = stats
+            response = self.get_response(request)
+        duration = time.perf_counter() - started
+
+        record(request_metrics, stats, duration)
+
+        if settings.QUERY_INSTRUMENTATION_HEADERS:
+            response['X-Query-Count'] = str(stats.queries)
+            response['X-Query-Time'] = f'{stats.db_time * 1000:.1f}'
+            response['X-Duplicate-Queries'] = str(stats.duplicate_queries)
+            response['X-Cache-Hits'] = f'{stats.cache_hits}/{stats.cache_hits + stats.cache_misses}'
+            response['Server-Timing'] = (f'db;dur={stats.db_time * 1000:.1f};desc="{stats.queries} queries", '
+                                         f'total;dur={duration * 1000:.1f}')
+        return response
+
+    def process_view(self, request: HttpRequest, view_func, view_args, view_kwargs) -> None:
+        # The view is known once the URL is resolved, the queries of the preceding middleware are counted as well
+        stats = request._query_instrumentation_stats
+        action = get_action(view_func, request.method)
+        stats.name = get_view_name(view_func, action)
+        stats.query_budget = get_query_budget(view_func, action)
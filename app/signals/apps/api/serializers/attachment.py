@@ -14,15 +14,33 @@ from signals.apps.api.fields import (
 )
 from signals.apps.feedback.app_settings import FEEDBACK_EXPECTED_WITHIN_N_DAYS
 from signals.apps.feedback.models import Feedback
-from signals.apps.signals.models import Attachment, Signal
+from signals.apps.signals.models import Attachment, AttachmentRendition, Signal
 from signals.apps.signals.workflow import AFGEHANDELD, GEMELD, REACTIE_GEVRAAGD
 
 PUBLIC_UPLOAD_ALLOWED_STATES = (AFGEHANDELD, GEMELD, REACTIE_GEVRAAGD)
 
 
+class AttachmentRenditionSerializer(serializers.ModelSerializer):
+    location = serializers.FileField(source='file', read_only=True)
+
+    class Meta:
+        model = AttachmentRendition
+        fields = (
+            'kind',
+            'location',
+            'mimetype',
+            'width',
+            'height',
+            'size',
+            'checksum',
+        )
+        read_only_fields = fields
+
+
 class BaseSignalAttachmentSerializer(HALSerializer):
     _display: DisplayField = DisplayField()
     location = serializers.FileField(source='file', required=False, read_only=True)
+    renditions = AttachmentRenditionSerializer(many=True, read_only=True)
 
     def create(self, validated_data: dict) -> Attachment:
         user = self.context['request'].user
@@ -53,6 +71,7 @@ class PublicSignalAttachmentSerializer(BaseSignalAttachmentSerializer):
             '_display',
             '_links',
             'location',
+            'renditions',
             'is_image',
             'created_at',
             'file',
@@ -62,6 +81,7 @@ class PublicSignalAttachmentSerializer(BaseSignalAttachmentSerializer):
             '_display',
             '_links',
             'location',
+            'renditions',
             'is_image',
             'created_at',
         )
@@ -107,6 +127,7 @@ class PrivateSignalAttachmentSerializer(BaseSignalAttachmentSerializer):
             '_display',
             '_links',
             'location',
+            'renditions',
             'is_image',
             'created_at',
             'file',
@@ -119,6 +140,7 @@ class PrivateSignalAttachmentSerializer(BaseSignalAttachmentSerializer):
             '_display',
             '_links',
             'location',
+            'renditions',
             'is_image',
             'created_at',
             'created_by',
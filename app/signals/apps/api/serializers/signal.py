@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2023 Vereniging van Nederlandse Gemeenten, Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Vereniging van Nederlandse Gemeenten, Gemeente Amsterdam
 import os
 
 from datapunt_api.rest import DisplayField, HALSerializer
@@ -39,6 +39,7 @@ from signals.apps.api.validators.source import (
     PublicSignalSourceValidator
 )
 from signals.apps.questionnaires.models import Session
+from signals.apps.services.domain.permissions.signal import get_signal_permission_evaluator
 from signals.apps.signals import workflow
 from signals.apps.signals.models import Attachment, Priority, Signal
 
@@ -104,6 +105,24 @@ class _SignalListSerializer(serializers.ListSerializer):
 
         return attrs
 
+    def create(self, validated_data):
+        """
+        Create all Signals at once with `Signal.actions.create_initial_bulk`, instead of creating them one by one.
+        """
+        items, attachments = [], []
+        for attrs in validated_data:
+            create_initial_data, signal_attachments = self.child.get_create_initial_data(attrs)
+            items.append(create_initial_data)
+            attachments.append(signal_attachments)
+
+        signals = Signal.actions.create_initial_bulk(items)
+
+        for signal, signal_attachments in zip(signals, attachments):
+            if signal_attachments:
+                self.child.copy_attachments(signal, signal_attachments)
+
+        return list(Signal.objects.filter(pk__in=[signal.pk for signal in signals]).order_by('pk'))
+
 
 class PrivateSignalSerializerDetail(HALSerializer, AddressValidationMixin):
     """
@@ -477,7 +496,10 @@ class PrivateSignalSerializerList(SignalValidationMixin, HALSerializer):
 
         return super().validate(attrs=attrs)
 
-    def create(self, validated_data):
+    def get_create_initial_data(self, validated_data):
+        """
+        The keyword arguments for `Signal.actions.create_initial` and the attachments to copy to the new Signal
+        """
         # Set default status
         logged_in_user = self.context['request'].user
         INITIAL_STATUS = {
@@ -506,24 +528,33 @@ class PrivateSignalSerializerList(SignalValidationMixin, HALSerializer):
         attachments = validated_data.pop('attachments') if 'attachments' in validated_data else None
         session = validated_data.pop('session')
 
-        signal = Signal.actions.create_initial(
-            validated_data,
-            location_data,
-            INITIAL_STATUS,
-            category_assignment_data,
-            reporter_data,
-            priority_data,
-            type_data,
-            session=session,
-        )
+        return {
+            'signal_data': validated_data,
+            'location_data': location_data,
+            'status_data': INITIAL_STATUS,
+            'category_assignment_data': category_assignment_data,
+            'reporter_data': reporter_data,
+            'priority_data': priority_data,
+            'type_data': type_data,
+            'session': session,
+        }, attachments
+
+    def copy_attachments(self, signal, attachments):
+        logged_in_user = self.context['request'].user
+
+        Signal.actions.copy_attachments(data=attachments, signal=signal, created_by=logged_in_user.email)
+        # Add history entries for every attachment that was copied. Only photos allowed for now.
+        for attachment in Attachment.objects.filter(_signal=signal).order_by('created_at'):
+            filename = os.path.basename(attachment.file.name)
+            msg = f'Bijlage gekopieerd van hoofdmelding: {filename}'
+            Signal.actions.create_note(data={'text': msg}, signal=signal)
+
+    def create(self, validated_data):
+        create_initial_data, attachments = self.get_create_initial_data(validated_data)
+        signal = Signal.actions.create_initial(**create_initial_data)
 
         if attachments:
-            Signal.actions.copy_attachments(data=attachments, signal=signal, created_by=logged_in_user.email)
-            # Add history entries for every attachment that was copied. Only photos allowed for now.
-            for attachment in Attachment.objects.filter(_signal=signal).order_by('created_at'):
-                filename = os.path.basename(attachment.file.name)
-                msg = f'Bijlage gekopieerd van hoofdmelding: {filename}'
-                Signal.actions.create_note(data={'text': msg}, signal=signal)
+            self.copy_attachments(signal, attachments)
 
         signal.refresh_from_db()
         return signal
@@ -719,4 +750,4 @@ class AbridgedChildSignalSerializer(HALSerializer):
         }
 
     def get_can_view_signal(self, obj):
-        return Signal.objects.filter(pk=obj.pk).filter_for_user(self.context['request'].user).exists()
+        return get_signal_permission_evaluator(self.context['request']).is_visible(obj.pk)
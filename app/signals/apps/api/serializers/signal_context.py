@@ -1,18 +1,14 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2021 - 2023 Gemeente Amsterdam
-import datetime
-
+# Copyright (C) 2021 - 2026 Gemeente Amsterdam
 from datapunt_api.rest import HALSerializer
-from django.conf import settings
-from django.contrib.gis.db.models.functions import Distance
-from django.db.models import Q
-from django.utils import timezone
 from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 from rest_framework_gis.fields import GeometryField
 from rest_framework_gis.serializers import GeoFeatureModelSerializer
 
 from signals.apps.api.fields import PrivateSignalWithContextLinksField
+from signals.apps.services.domain.permissions.signal import get_signal_permission_evaluator
+from signals.apps.services.domain.reporter_statistics import ReporterStatisticsService
 from signals.apps.signals import workflow
 from signals.apps.signals.models import Signal
 
@@ -110,14 +106,14 @@ class SignalContextReporterSerializer(serializers.ModelSerializer):
         """
         Returns the latest feedback object if it exists else None
         """
-        if obj.feedback.exists():
-            latest_feedback = obj.feedback.first()
+        latest_feedback = obj.feedback.first()
+        if latest_feedback is not None:
             return {'is_satisfied': latest_feedback.is_satisfied, 'submitted_at': latest_feedback.submitted_at, }
 
         return None
 
     def get_can_view_signal(self, obj) -> bool:
-        return Signal.objects.filter(pk=obj.pk).filter_for_user(self.context['request'].user).exists()
+        return get_signal_permission_evaluator(self.context['request']).is_visible(obj.pk)
 
     def get_has_children(self, obj) -> bool:
         return obj.children.exists()
@@ -149,16 +145,7 @@ class SignalContextSerializer(HALSerializer):
         },
     })
     def get_near(self, obj) -> dict:
-        signals_for_geography_qs = Signal.objects.annotate(
-            distance_from_point=Distance('location__geometrie', obj.location.geometrie),
-        ).filter(
-            (Q(parent__isnull=True) & Q(children__isnull=True)) | Q(parent__isnull=False),
-            distance_from_point__lte=settings.SIGNAL_API_CONTEXT_GEOGRAPHY_RADIUS,
-            category_assignment__category_id=obj.category_assignment.category.pk,
-            created_at__gte=(
-                timezone.now() - datetime.timedelta(weeks=settings.SIGNAL_API_CONTEXT_GEOGRAPHY_CREATED_DELTA_WEEKS)
-            ),
-        ).exclude(pk=obj.pk)
+        signals_for_geography_qs = Signal.objects.filter_context_near(obj)
 
         return {
             'signal_count': signals_for_geography_qs.count(),
@@ -200,23 +187,13 @@ class SignalContextSerializer(HALSerializer):
         if not obj.reporter.email:
             return None
 
-        reporter_email = obj.reporter.email
-
-        signals_for_reporter_count = Signal.objects.filter_reporter(
-            email=reporter_email
-        ).filter(parent__isnull=True).count()
-        open_signals_for_reporter_count = Signal.objects.filter_reporter(email=reporter_email).exclude(
-            status__state__in=[workflow.GEANNULEERD, workflow.AFGEHANDELD, workflow.GESPLITST]
-        ).filter(parent__isnull=True).count()
-        # Not filtering parent__isnull=True, as feedback is not requested for child signals.
-        satisfied_count = Signal.objects.reporter_feedback_satisfied_count(email=reporter_email)
-        not_satisfied_count = Signal.objects.reporter_feedback_not_satisfied_count(email=reporter_email)
+        statistics = ReporterStatisticsService.get_for_email(obj.reporter.email)
 
         return {
-            'signal_count': signals_for_reporter_count,
-            'open_count': open_signals_for_reporter_count,
-            'positive_count': satisfied_count,
-            'negative_count': not_satisfied_count,
+            'signal_count': statistics.signal_count,
+            'open_count': statistics.open_count,
+            'positive_count': statistics.positive_count,
+            'negative_count': statistics.negative_count,
         }
 
 
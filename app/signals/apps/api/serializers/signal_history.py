@@ -26,3 +26,18 @@ class HistoryLogHalSerializer(HALSerializer):
             'who',
             '_signal',
         )
+
+    def to_representation(self, instance):
+        if not instance.rendered:
+            # Entries written before the representation was stored, these are rendered on the fly
+            return super().to_representation(instance)
+
+        return {
+            'identifier': instance.rendered['identifier'],
+            'when': self.fields['when'].to_representation(instance.created_at),
+            'what': instance.rendered['what'],
+            'action': instance.rendered['action'],
+            'description': instance.rendered['description'],
+            'who': instance.rendered['who'],
+            '_signal': instance._signal_id,
+        }
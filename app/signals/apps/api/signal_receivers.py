@@ -0,0 +1,23 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from signals.apps.api.filters.utils import invalidate_filter_choices
+from signals.apps.signals.models import Area, AreaType, Buurt, Category, Department, Source
+
+
+@receiver(post_save, sender=Area, dispatch_uid='api_filter_choices_area_post_save')
+@receiver(post_delete, sender=Area, dispatch_uid='api_filter_choices_area_post_delete')
+@receiver(post_save, sender=AreaType, dispatch_uid='api_filter_choices_area_type_post_save')
+@receiver(post_delete, sender=AreaType, dispatch_uid='api_filter_choices_area_type_post_delete')
+@receiver(post_save, sender=Buurt, dispatch_uid='api_filter_choices_buurt_post_save')
+@receiver(post_delete, sender=Buurt, dispatch_uid='api_filter_choices_buurt_post_delete')
+@receiver(post_save, sender=Category, dispatch_uid='api_filter_choices_category_post_save')
+@receiver(post_delete, sender=Category, dispatch_uid='api_filter_choices_category_post_delete')
+@receiver(post_save, sender=Department, dispatch_uid='api_filter_choices_department_post_save')
+@receiver(post_delete, sender=Department, dispatch_uid='api_filter_choices_department_post_delete')
+@receiver(post_save, sender=Source, dispatch_uid='api_filter_choices_source_post_save')
+@receiver(post_delete, sender=Source, dispatch_uid='api_filter_choices_source_post_delete')
+def filter_choices_changed_handler(sender, instance, **kwargs):
+    invalidate_filter_choices()
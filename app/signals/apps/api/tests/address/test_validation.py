@@ -1,12 +1,14 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2023 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
+import time
 from json import dumps, load
 from os.path import abspath, dirname, join
+from unittest import mock
 from unittest.mock import MagicMock
 
 from django.contrib.gis.geos import Point
-from django.test import SimpleTestCase
-from requests.exceptions import ConnectionError
+from django.test import SimpleTestCase, override_settings
+from requests.exceptions import ConnectionError, ReadTimeout
 from requests_mock.mocker import Mocker
 from rest_framework.exceptions import ValidationError
 
@@ -14,8 +16,15 @@ from signals.apps.api.validation.address.base import (
     AddressValidationUnavailableException,
     NoResultsException
 )
+from signals.apps.api.validation.address.circuit_breaker import CircuitBreaker
+from signals.apps.api.validation.address.fixture import FixtureAddressValidation
 from signals.apps.api.validation.address.mixin import AddressValidationMixin
-from signals.apps.api.validation.address.pdok import PDOKAddressValidation
+from signals.apps.api.validation.address.pdok import (
+    PDOKAddressValidation,
+    get_pdok_client,
+    normalize_query_params,
+    pdok_metrics
+)
 
 
 class TestPDOKAddressValidation(SimpleTestCase):
@@ -30,6 +39,10 @@ class TestPDOKAddressValidation(SimpleTestCase):
         "woonplaats": "Amsterdam"
     }
 
+    def setUp(self):
+        get_pdok_client().reset()
+        pdok_metrics.reset()
+
     def _get_mocked_response(self):
         if self.pdok_response is None:
             with open(join(dirname(abspath(__file__)), self.PDOK_RESPONSE_JSON)) as f:
@@ -100,3 +113,160 @@ class TestPDOKAddressValidation(SimpleTestCase):
         with Mocker() as m:
             m.get(address_validation.address_validation_url, text=dumps(result))
             self.assertEqual(address_validation._search(self.address_dict), expected)
+
+    def test_search_results_cached(self):
+        address_validation = PDOKAddressValidation()
+        result = self._get_mocked_response()
+
+        with Mocker() as m:
+            m.get(address_validation.address_validation_url, text=dumps(result))
+            address_validation._search(self.address_dict, 4.864506, 52.373544)
+
+            # The same address, written differently and from a few centimeters away
+            address = dict(self.address_dict, openbare_ruimte=' geuzenkade ', woonplaats='AMSTERDAM')
+            docs = PDOKAddressValidation()._search(address, 4.8645061, 52.3735441)
+
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(docs, result['response']['docs'])
+        self.assertEqual(pdok_metrics.get('hits'), 1)
+
+    def test_failed_search_not_cached(self):
+        address_validation = PDOKAddressValidation()
+
+        with Mocker() as m:
+            m.get(address_validation.address_validation_url, status_code=503)
+            self.assertRaises(AddressValidationUnavailableException, address_validation._search, self.address_dict)
+
+        with Mocker() as m:
+            m.get(address_validation.address_validation_url, text=dumps(self._get_mocked_response()))
+            self.assertEqual(len(address_validation._search(self.address_dict)), 1)
+
+    def test_search_timeout(self):
+        address_validation = PDOKAddressValidation()
+
+        with Mocker() as m:
+            m.get(address_validation.address_validation_url, exc=ReadTimeout)
+            self.assertRaises(AddressValidationUnavailableException, address_validation._search, self.address_dict)
+
+        self.assertEqual(m.last_request.timeout, get_pdok_client().timeout)
+
+    def test_circuit_breaker(self):
+        address_validation = PDOKAddressValidation()
+        circuit_breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+
+        with Mocker() as m, mock.patch.object(get_pdok_client(), 'circuit_breaker', circuit_breaker):
+            m.get(address_validation.address_validation_url, exc=ConnectionError)
+            for _ in range(3):
+                self.assertRaises(AddressValidationUnavailableException, address_validation._search, self.address_dict)
+
+        # The third search did not wait for PDOK
+        self.assertEqual(m.call_count, 2)
+        self.assertEqual(circuit_breaker.state, CircuitBreaker.OPEN)
+        self.assertEqual(pdok_metrics.get('circuit_open'), 1)
+
+        # The address is accepted unvalidated
+        validation_mixin = AddressValidationMixin()
+        validation_mixin.get_address_validation = MagicMock(return_value=address_validation)
+        with mock.patch.object(get_pdok_client(), 'circuit_breaker', circuit_breaker):
+            location_data = validation_mixin.validate_location({
+                'geometrie': Point(4.898466, 52.361585),
+                'address': dict(self.address_dict),
+            })
+        self.assertNotIn('bag_validated', location_data)
+
+    def test_client_error_does_not_open_circuit(self):
+        address_validation = PDOKAddressValidation()
+        client = get_pdok_client()
+
+        with Mocker() as m:
+            m.get(address_validation.address_validation_url, status_code=400)
+            for _ in range(client.circuit_breaker.failure_threshold + 1):
+                self.assertRaises(AddressValidationUnavailableException, address_validation._search, self.address_dict)
+
+        self.assertEqual(client.circuit_breaker.state, CircuitBreaker.CLOSED)
+
+    def test_normalize_query_params(self):
+        address_validation = PDOKAddressValidation()
+        query_params = address_validation._pdok_request_query_params(self.address_dict, 4.864506, 52.373544)
+        other_query_params = address_validation._pdok_request_query_params(
+            dict(self.address_dict, openbare_ruimte='GEUZENKADE'), 4.864506, 52.373544
+        )
+        other_address_query_params = address_validation._pdok_request_query_params(
+            dict(self.address_dict, huisnummer=57), 4.864506, 52.373544
+        )
+
+        self.assertEqual(normalize_query_params(query_params), normalize_query_params(other_query_params))
+        self.assertNotEqual(normalize_query_params(query_params), normalize_query_params(other_address_query_params))
+
+
+class TestCircuitBreaker(SimpleTestCase):
+    def test_open_and_close(self):
+        circuit_breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+        self.assertTrue(circuit_breaker.allow_request())
+
+        circuit_breaker.record_failure()
+        self.assertEqual(circuit_breaker.state, CircuitBreaker.CLOSED)
+        circuit_breaker.record_failure()
+        self.assertEqual(circuit_breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(circuit_breaker.allow_request())
+
+        with mock.patch('signals.apps.api.validation.address.circuit_breaker.time.monotonic',
+                        return_value=time.monotonic() + 31):
+            self.assertEqual(circuit_breaker.state, CircuitBreaker.HALF_OPEN)
+            # Only one trial request
+            self.assertTrue(circuit_breaker.allow_request())
+            self.assertFalse(circuit_breaker.allow_request())
+
+            # A failed trial opens the circuit again
+            circuit_breaker.record_failure()
+            self.assertEqual(circuit_breaker.state, CircuitBreaker.OPEN)
+
+        with mock.patch('signals.apps.api.validation.address.circuit_breaker.time.monotonic',
+                        return_value=time.monotonic() + 62):
+            self.assertTrue(circuit_breaker.allow_request())
+            circuit_breaker.record_success()
+            self.assertEqual(circuit_breaker.state, CircuitBreaker.CLOSED)
+
+
+class TestFixtureAddressValidation(SimpleTestCase):
+    def setUp(self):
+        get_pdok_client().reset()
+
+    def test_validate_address(self):
+        address_validation = FixtureAddressValidation()
+
+        address = address_validation.validate_address({'openbare_ruimte': 'Achtergracht', 'huisnummer': 72})
+        self.assertEqual(address['openbare_ruimte'], 'Nieuwe Achtergracht')
+        self.assertEqual(address['postcode'], '1018XZ')
+
+        address = address_validation.validate_address(
+            {'openbare_ruimte': 'achtergracht', 'huisnummer': '72', 'woonplaats': 'Weesp'}
+        )
+        self.assertEqual(address['postcode'], '1381BP')
+
+        address = address_validation.validate_address(
+            {'openbare_ruimte': 'Geuzenkade', 'huisnummer': 58, 'huisnummer_toevoeging': '1', 'postcode': '1056KN'}
+        )
+        self.assertEqual(address['huisnummer_toevoeging'], '1')
+
+    def test_no_results(self):
+        address_validation = FixtureAddressValidation()
+
+        self.assertRaises(NoResultsException, address_validation.validate_address,
+                          {'openbare_ruimte': 'Achtergracht', 'huisnummer': 73})
+        self.assertRaises(NoResultsException, address_validation.validate_address,
+                          {'openbare_ruimte': 'Geuzenkade', 'huisnummer': 58, 'woonplaats': 'Weesp'})
+
+    @override_settings(
+        ADDRESS_VALIDATION_CLASS='signals.apps.api.validation.address.fixture.FixtureAddressValidation'
+    )
+    def test_mixin(self):
+        validation_mixin = AddressValidationMixin()
+        self.assertIsInstance(validation_mixin.get_address_validation(), FixtureAddressValidation)
+
+        location_data = validation_mixin.validate_location({
+            'geometrie': Point(4.898466, 52.361585),
+            'address': {'openbare_ruimte': 'Achtergracht', 'huisnummer': 72},
+        })
+        self.assertTrue(location_data['bag_validated'])
+        self.assertEqual(location_data['address']['woonplaats'], 'Amsterdam')
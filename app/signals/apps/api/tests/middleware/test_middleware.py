@@ -1,8 +1,15 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2023 Gemeente Amsterdam
-from django.test import modify_settings
+# Copyright (C) 2023 - 2026 Gemeente Amsterdam
+from unittest.mock import patch
 
-from signals.test.utils import SIAReadUserMixin, SignalsBaseApiTestCase
+from django.db import connection
+from django.test import modify_settings, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from signals.apps.api.views import PrivateSignalViewSet
+from signals.apps.signals.factories import SignalFactory
+from signals.instrumentation import BUDGET_ACTION_RAISE, QueryBudgetExceeded, request_metrics
+from signals.test.utils import SIAReadUserMixin, SignalsBaseApiTestCase, SuperUserMixin
 
 
 @modify_settings(MIDDLEWARE={'append': 'signals.apps.api.middleware.SessionLoginMiddleware'})
@@ -17,3 +24,58 @@ class TestSessionLoginMiddleware(SIAReadUserMixin, SignalsBaseApiTestCase):
     def test_session_cookie_is_not_provided_on_public_endpoint(self):
         response = self.client.get('/signals/v1/public/terms/categories/')
         self.assertIsNone(response.cookies.get('sessionid'))
+
+
+@override_settings(QUERY_INSTRUMENTATION_HEADERS=True)
+class TestQueryInstrumentationMiddleware(SuperUserMixin, SignalsBaseApiTestCase):
+    def setUp(self):
+        SignalFactory.create_batch(2)
+        self.client.force_authenticate(user=self.superuser)
+        request_metrics.reset()
+
+    def test_headers(self):
+        response = self.client.get('/signals/v1/private/signals/')
+        self.assertEqual(response.status_code, 200)
+        self.assertGreater(int(response['X-Query-Count']), 0)
+        self.assertGreaterEqual(float(response['X-Query-Time']), 0)
+        self.assertIn('X-Duplicate-Queries', response)
+        self.assertIn('X-Cache-Hits', response)
+        self.assertTrue(response['Server-Timing'].startswith('db;dur='))
+
+    def test_metrics_per_view(self):
+        response = self.client.get('/signals/v1/private/signals/')
+        self.assertEqual(request_metrics.get('PrivateSignalViewSet.list.count'), 1)
+        self.assertEqual(request_metrics.get('PrivateSignalViewSet.list.queries'), int(response['X-Query-Count']))
+
+    def test_list_queries_independent_of_page_size(self):
+        def count_queries(page_size):
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get('/signals/v1/private/signals/', {'page_size': page_size})
+            self.assertEqual(len(response.json()['results']), page_size)
+            # Lookups in the (database backed) shared cache depend on what is still in the local tier
+            return len([query for query in context.captured_queries if 'signals_cache' not in query['sql']])
+
+        count_queries(1)  # Fills the caches
+        queries = count_queries(1)
+
+        SignalFactory.create_batch(8)
+        self.assertEqual(count_queries(10), queries)
+
+    @override_settings(QUERY_INSTRUMENTATION_HEADERS=False)
+    def test_no_headers(self):
+        response = self.client.get('/signals/v1/private/signals/')
+        self.assertNotIn('X-Query-Count', response)
+
+    def test_query_budget_exceeded(self):
+        with self.settings(QUERY_BUDGET_ACTION=BUDGET_ACTION_RAISE):
+            with self.assertLogs('signals.instrumentation', level='WARNING'):
+                with self.assertRaises(QueryBudgetExceeded):
+                    with patch.object(PrivateSignalViewSet, 'query_budget', {'list': 1}):
+                        self.client.get('/signals/v1/private/signals/')
+
+        with self.assertLogs('signals.instrumentation', level='WARNING') as logs:
+            with patch.object(PrivateSignalViewSet, 'query_budget', {'list': 1}):
+                response = self.client.get('/signals/v1/private/signals/')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('PrivateSignalViewSet.list issued', logs.output[0])
+        self.assertEqual(request_metrics.get('PrivateSignalViewSet.list.budget_exceeded'), 2)
@@ -1,12 +1,16 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2023 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
 from datetime import datetime, timedelta
 from random import shuffle
 
 from django.contrib.gis.geos import MultiPolygon, Point, Polygon
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from freezegun import freeze_time
 
+from signals.apps.api.filters import area_choices, department_choices, invalidate_filter_choices
+from signals.apps.api.filters.utils import filter_choices_version
 from signals.apps.feedback.factories import FeedbackFactory
 from signals.apps.signals import workflow
 from signals.apps.signals.factories import (
@@ -26,6 +30,7 @@ from signals.apps.signals.factories import (
 )
 from signals.apps.signals.models import Category, Priority, Signal, SignalDepartments
 from signals.apps.signals.workflow import BEHANDELING, GEMELD, ON_HOLD
+from signals.cache import clear_local_tiers
 from signals.test.utils import SignalsBaseApiTestCase
 
 
@@ -713,6 +718,39 @@ class TestNoteKeywordFilter(SignalsBaseApiTestCase):
         ids = self._request_filter_signals(filter_params)
         self.assertEqual(ids, [])
 
+    def test_note_search(self):
+        signal_fiets = SignalFactory()
+        NoteFactory(_signal=signal_fiets, text='Er staat een fiets tegen de boom')
+        signal_fietsen = SignalFactory()
+        NoteFactory(_signal=signal_fietsen, text='Weesfietsen: de fietsen, fietsen en nog meer fietsen')
+
+        # Words are stemmed, "fietsen" matches "fiets"
+        ids = self._request_filter_signals({'note_search': 'fietsen'})
+        self.assertEqual(set(ids), {signal_fiets.id, signal_fietsen.id})
+
+        ids = self._request_filter_signals({'note_search': 'fiets -boom'})
+        self.assertEqual(ids, [signal_fietsen.id])
+
+        # Ordered by relevance
+        ids = self._request_filter_signals({'note_search': 'fiets', 'ordering': '-note_rank'})
+        self.assertEqual(ids, [signal_fietsen.id, signal_fiets.id])
+
+    def test_note_rank_only_when_ordered_by_it(self):
+        for params, ranked in [({'note_keyword': self.keyword}, False),
+                               ({'note_keyword': self.keyword, 'ordering': '-note_rank'}, True)]:
+            with CaptureQueriesContext(connection) as context:
+                ids = self._request_filter_signals(params)
+            self.assertEqual(ids, [self.signal_with_keyword.id])
+            self.assertEqual(any('ts_rank' in query['sql'] for query in context.captured_queries), ranked)
+
+    def test_ordering_by_note_rank(self):
+        ids = self._request_filter_signals({'note_keyword': self.keyword, 'ordering': '-note_rank'})
+        self.assertEqual(ids, [self.signal_with_keyword.id])
+
+        # Without a note keyword all signals are equally relevant
+        ids = self._request_filter_signals({'ordering': '-note_rank,id'})
+        self.assertEqual(ids, [self.signal_with_keyword.id, self.signal_no_keyword.id])
+
 
 class TestContactDetailsPresentFilter(SignalsBaseApiTestCase):
     SIGNALS_LIST_ENDPOINT = '/signals/v1/private/signals/'
@@ -1376,3 +1414,60 @@ class TestPunctualityFilter(SignalsBaseApiTestCase):
             ids = self._request_filter_signals(params)
         late = [self.signal_slo_c.id, self.signal_slo_w.id]
         self.assertEqual(set(late), set(ids))
+
+
+class TestFilterChoices(SignalsBaseApiTestCase):
+    FILTER_METADATA_ENDPOINT = '/signals/v1/private/signals/filter-metadata'
+
+    def setUp(self):
+        clear_local_tiers()
+        invalidate_filter_choices()
+
+    def test_choices_cached(self):
+        area = AreaFactory.create(code='centrum', _type__code='district')
+        self.assertIn('centrum', [code for code, _ in area_choices()])
+
+        with self.assertNumQueries(0):
+            self.assertIn('centrum', [code for code, _ in area_choices()])
+
+        area.delete()
+        self.assertNotIn('centrum', [code for code, _ in area_choices()])
+
+    def test_choices_invalidated(self):
+        department_choices()
+
+        department = DepartmentFactory.create(code='TST')
+        self.assertIn('TST', [code for code, _ in department_choices()])
+
+        department.code = 'TSU'
+        department.save()
+        self.assertEqual([code for code, _ in department_choices() if code in ('TST', 'TSU')], ['TSU'])
+
+    def test_invalidate_bumps_again_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_filter_choices()
+            version = filter_choices_version.get()
+        self.assertNotEqual(filter_choices_version.get(), version)
+
+    def test_filter_metadata(self):
+        self.client.force_authenticate(user=self.superuser)
+
+        response = self.client.get(self.FILTER_METADATA_ENDPOINT)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn({'value': 'null', 'label': 'null'}, response.json()['directing_department'])
+        self.assertIn('status', response.json())
+        self.assertNotIn('category_slug', response.json())
+
+        etag = response.headers['ETag']
+        response = self.client.get(self.FILTER_METADATA_ENDPOINT, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        SourceFactory.create(name='test-source')
+        response = self.client.get(self.FILTER_METADATA_ENDPOINT, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+        self.assertIn({'value': 'test-source', 'label': 'test-source'}, response.json()['source'])
+
+    def test_filter_metadata_not_authenticated(self):
+        response = self.client.get(self.FILTER_METADATA_ENDPOINT)
+        self.assertEqual(response.status_code, 401)
@@ -8,6 +8,7 @@ from django.utils import timezone
 from freezegun import freeze_time
 
 from signals.apps.feedback.factories import FeedbackFactory
+from signals.apps.history.models import Log
 from signals.apps.history.services import SignalLogService
 from signals.apps.signals import workflow
 from signals.apps.signals.factories import (
@@ -99,6 +100,20 @@ class TestHistoryAction(SIAReadWriteUserMixin, SignalsBaseApiTestCase):
         self.assertEqual(new_entry['who'], self.user.username)
         self.assertEqual(new_entry['description'], status.text)
 
+    def test_history_rendered_entries(self):
+        self.sia_read_write_user.user_permissions.add(Permission.objects.get(codename='sia_can_view_all_categories'))
+        self.client.force_authenticate(user=self.sia_read_write_user)
+
+        response = self.client.get(f'/signals/v1/private/signals/{self.signal.id}/history')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(all(log.rendered for log in Log.objects.filter(_signal=self.signal)))
+
+        # Entries without a stored representation (not backfilled yet) are rendered on the fly, the same way
+        Log.objects.filter(_signal=self.signal).update(rendered=None)
+        response_not_rendered = self.client.get(f'/signals/v1/private/signals/{self.signal.id}/history')
+        self.assertEqual(response_not_rendered.status_code, 200)
+        self.assertEqual(response.json(), response_not_rendered.json())
+
     def test_sla_in_history(self):
         # Get a baseline for the Signal history
         self.sia_read_write_user.user_permissions.add(Permission.objects.get(codename='sia_can_view_all_categories'))
@@ -0,0 +1,122 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from django.contrib.auth.models import Permission
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from freezegun import freeze_time
+
+from signals.apps.signals.factories import SignalFactory
+from signals.apps.signals.models import Signal
+from signals.test.utils import SIAReadWriteUserMixin, SignalsBaseApiTestCase
+
+
+class TestPrivateSignalKeysetPagination(SIAReadWriteUserMixin, SignalsBaseApiTestCase):
+    list_endpoint = '/signals/v1/private/signals/'
+    geo_list_endpoint = '/signals/v1/private/signals/geography'
+
+    def setUp(self):
+        # Signals created at the same moment share the created_at, the pk is used to break the tie
+        with freeze_time('2026-01-01 12:00:00'):
+            SignalFactory.create_batch(3)
+        with freeze_time('2026-01-02 12:00:00'):
+            SignalFactory.create_batch(4)
+
+        self.sia_read_write_user.user_permissions.add(
+            Permission.objects.get(codename='sia_can_view_all_categories')
+        )
+        self.client.force_authenticate(user=self.sia_read_write_user)
+
+    def _walk_list(self, url):
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+
+            data = response.json()
+            self.assertIsNone(data['_links']['previous']['href'])
+            ids.extend(signal['id'] for signal in data['results'])
+            url = data['_links']['next']['href']
+        return ids
+
+    def test_list(self):
+        ids = self._walk_list(f'{self.list_endpoint}?pagination=cursor&page_size=2')
+
+        expected = list(Signal.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+        self.assertEqual(ids, expected)
+
+    def test_list_ordering(self):
+        for ordering in ['status', '-priority', 'address', 'created_at']:
+            ids = self._walk_list(f'{self.list_endpoint}?pagination=cursor&page_size=3&ordering={ordering}')
+            self.assertEqual(len(ids), 7)
+            self.assertEqual(len(set(ids)), 7)
+
+    def test_list_row_value_comparison(self):
+        response = self.client.get(f'{self.list_endpoint}?pagination=cursor&page_size=2')
+        next_link = response.json()['_links']['next']['href']
+
+        # Both ordering fields are descending, the rows after the cursor are selected with a single row comparison
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(next_link)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len([query for query in context.captured_queries
+                              if 'ROW("signals_signal"."created_at", "signals_signal"."id") <' in query['sql']]), 1)
+
+        # A mixed ordering falls back to the OR conditions
+        response = self.client.get(f'{self.list_endpoint}?pagination=cursor&page_size=2&ordering=status')
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(response.json()['_links']['next']['href'])
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse([query for query in context.captured_queries if 'ROW(' in query['sql']])
+
+    def test_list_count(self):
+        response = self.client.get(f'{self.list_endpoint}?pagination=cursor&page_size=2')
+        self.assertIsNone(response.json()['count'])
+
+        response = self.client.get(f'{self.list_endpoint}?pagination=cursor&page_size=2&count=exact')
+        self.assertEqual(response.json()['count'], 7)
+
+        response = self.client.get(f'{self.list_endpoint}?pagination=cursor&page_size=2&count=estimate')
+        self.assertIsInstance(response.json()['count'], int)
+
+    def test_list_invalid_cursor(self):
+        response = self.client.get(f'{self.list_endpoint}?cursor=not-a-cursor')
+        self.assertEqual(response.status_code, 404)
+
+    def test_list_cursor_for_other_ordering(self):
+        response = self.client.get(f'{self.list_endpoint}?pagination=cursor&page_size=2')
+        next_link = response.json()['_links']['next']['href']
+
+        response = self.client.get(f'{next_link}&ordering=status')
+        self.assertEqual(response.status_code, 404)
+
+    def test_list_without_cursor_pagination(self):
+        response = self.client.get(f'{self.list_endpoint}?page_size=2')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['count'], 7)
+
+    @override_settings(SIGNALS_API_GEO_PAGINATE_BY=3)
+    def test_geography(self):
+        ids = []
+        url = f'{self.geo_list_endpoint}?pagination=cursor'
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertFalse(response.has_header('X-Total-Count'))
+
+            ids.extend(feature['properties']['id'] for feature in response.json()['features'] or [])
+
+            url = None
+            for link in response['Link'].split(','):
+                href, rel = link.split(';')
+                if rel.strip() == 'rel="next"':
+                    url = href.strip()[1:-1]
+
+        expected = list(Signal.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+        self.assertEqual(ids, expected)
+
+    @override_settings(SIGNALS_API_GEO_PAGINATE_BY=3)
+    def test_geography_count(self):
+        response = self.client.get(f'{self.geo_list_endpoint}?pagination=cursor&count=exact')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['X-Total-Count'], '7')
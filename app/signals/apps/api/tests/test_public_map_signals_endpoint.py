@@ -1,12 +1,18 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2021 - 2023 Vereniging van Nederlandse Gemeenten, Gemeente Amsterdam
+# Copyright (C) 2021 - 2026 Vereniging van Nederlandse Gemeenten, Gemeente Amsterdam
+import gzip
+import json
 import os
+from unittest import mock
 
+from django.core.cache import cache
 from django.test import override_settings
 
 from signals.apps.api.generics.routers import SignalsRouter
 from signals.apps.api.views import PublicSignalMapViewSet
+from signals.apps.services.domain.public_signal_map import PublicSignalMapService
 from signals.apps.signals.factories import SignalFactoryValidLocation
+from signals.cache import clear_local_tiers
 from signals.test.utils import SignalsBaseApiTestCase
 
 THIS_DIR = os.path.dirname(__file__)
@@ -30,6 +36,8 @@ class TestMapSignalEndpoints(SignalsBaseApiTestCase):
         self.endpoint_url = '/public/map-signals/'
         self.signal1 = SignalFactoryValidLocation.create()
         self.signal2 = SignalFactoryValidLocation.create()
+        cache.clear()
+        clear_local_tiers()
         super().setUp()
 
     def test_map_signals_list(self):
@@ -51,6 +59,55 @@ class TestMapSignalEndpoints(SignalsBaseApiTestCase):
         self.assertEqual(obj['properties']['category']['main'], self.signal2.category_assignment.category.parent.name) # noqa
         self.assertEqual(obj['properties']['category']['sub'], self.signal2.category_assignment.category.name)
 
+    def test_map_signals_list_cached(self):
+        response = self.client.get(self.endpoint_url)
+        self.assertEqual(response.status_code, 200)
+
+        SignalFactoryValidLocation.create()
+        with mock.patch.object(PublicSignalMapService, 'query') as mocked_query:
+            response = self.client.get(self.endpoint_url, {'cache': 'buster'})
+        mocked_query.assert_not_called()
+        self.assertEqual(len(response.json()['features']), 2)
+
+        PublicSignalMapService.refresh()
+        response = self.client.get(self.endpoint_url)
+        self.assertEqual(len(response.json()['features']), 3)
+
+    def test_map_signals_list_not_modified(self):
+        response = self.client.get(self.endpoint_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['Vary'], 'Accept-Encoding')
+        self.assertIn('public', response.headers['Cache-Control'])
+        etag = response.headers['ETag']
+        last_modified = response.headers['Last-Modified']
+
+        response = self.client.get(self.endpoint_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers['ETag'], etag)
+
+        response = self.client.get(self.endpoint_url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+
+        # The map did not change, so neither did its validators
+        PublicSignalMapService.refresh()
+        response = self.client.get(self.endpoint_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        SignalFactoryValidLocation.create()
+        PublicSignalMapService.refresh()
+        response = self.client.get(self.endpoint_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+
+    def test_map_signals_list_gzip(self):
+        response = self.client.get(self.endpoint_url, HTTP_ACCEPT_ENCODING='gzip, deflate')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertTrue(response.headers['ETag'].endswith('-gzip"'))
+
+        data = json.loads(gzip.decompress(response.content))
+        self.assertEqual(len(data['features']), 2)
+
 
 class TestMapSignalDefaultSettingEndpoints(SignalsBaseApiTestCase):
     def test_map_signals_list_defalt(self):
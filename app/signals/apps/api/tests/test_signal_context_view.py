@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2021 - 2023 Gemeente Amsterdam
+# Copyright (C) 2021 - 2026 Gemeente Amsterdam
 from datetime import timedelta
 
 from django.contrib.gis.geos import Point
@@ -157,6 +157,42 @@ class TestSignalContextView(SuperUserMixin, APITestCase):
             response = self.client.get(f'/signals/v1/private/signals/{signal.pk}/context/near/geography/')
             self.assertEqual(response.status_code, 200)
 
+    def test_get_signal_context_geography_detail(self):
+        self.client.force_authenticate(user=self.superuser)
+
+        category = CategoryFactory.create()
+        point = Point(STADHUIS['lon'], STADHUIS['lat'])
+        signal = SignalFactory.create(location__geometrie=point, category_assignment__category=category)
+
+        # About 30 and 15 meters away
+        near = SignalFactory.create(location__geometrie=Point(STADHUIS['lon'], STADHUIS['lat'] + 0.00027),
+                                    category_assignment__category=category)
+        nearest = SignalFactory.create(location__geometrie=Point(STADHUIS['lon'], STADHUIS['lat'] + 0.000135),
+                                       category_assignment__category=category)
+        # About 110 meters away
+        SignalFactory.create(location__geometrie=Point(STADHUIS['lon'], STADHUIS['lat'] + 0.001),
+                             category_assignment__category=category)
+        # Too old
+        with freeze_time(timezone.now() - timedelta(weeks=13)):
+            SignalFactory.create(location__geometrie=point, category_assignment__category=category)
+        # A parent signal is left out, its child signals are not
+        parent = SignalFactory.create(location__geometrie=point, category_assignment__category=category)
+        child = SignalFactory.create(location__geometrie=point, category_assignment__category=category, parent=parent)
+
+        url = f'/signals/v1/private/signals/{signal.pk}/context/near/geography/'
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([feature['properties']['id'] for feature in response.json()['features']],
+                         [near.pk, nearest.pk, child.pk])
+
+        response = self.client.get(url, {'ordering': 'distance'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([feature['properties']['id'] for feature in response.json()['features']],
+                         [child.pk, nearest.pk, near.pk])
+
+        response = self.client.get(f'/signals/v1/private/signals/{signal.pk}/context/')
+        self.assertEqual(response.json()['near']['signal_count'], 3)
+
 
 class TestSignalContextPermissions(SIAReadWriteUserMixin, SignalsBaseApiTestCase):
     # Accessing SignalContext must follow the same access rules as the signals.
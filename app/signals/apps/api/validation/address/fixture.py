@@ -0,0 +1,55 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+import json
+import os
+import re
+
+from django.conf import settings
+
+from signals.apps.api.validation.address.pdok import PDOKAddressValidation
+
+DEFAULT_FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pdok_fixture.json')
+
+
+class FixtureAddressValidation(PDOKAddressValidation):
+    """
+    Stand-in for the PDOK address validation that searches a JSON file with PDOK locatieserver responses instead of
+    PDOK itself, so addresses can be validated without network access (local development, tests).
+
+    The file is set with ADDRESS_VALIDATION_FIXTURE and is searched roughly the way PDOK does: the filter queries must
+    match exactly (ignoring case) and every word of the query must occur in the name of the address.
+    """
+    _fixtures: dict[str, list[dict]] = {}
+
+    @classmethod
+    def _load_docs(cls):
+        path = settings.ADDRESS_VALIDATION_FIXTURE or DEFAULT_FIXTURE
+        if path not in cls._fixtures:
+            with open(path) as f:
+                cls._fixtures[path] = json.load(f)['response']['docs']
+        return cls._fixtures[path]
+
+    @staticmethod
+    def _matches_filter(doc, filter_query):
+        field, _, value = filter_query.partition(':')
+        doc_value = str(doc.get(field, '')).casefold()
+
+        # For example: gemeentenaam:("Amsterdam" "Weesp")
+        options = re.findall(r'"([^"]*)"', value) if value.startswith('(') else [value]
+        return doc_value in (option.casefold() for option in options)
+
+    @staticmethod
+    def _matches_query(doc, query):
+        name = ' '.join(doc.get('suggest', [])) or doc.get('weergavenaam', '')
+        name = name.casefold()
+        return all(word in name for word in query.casefold().replace('-', ' ').split())
+
+    def _fetch(self, client, query_params):
+        rows = int(query_params.get('rows', 10))
+        query = query_params.get('q', '')
+        filter_queries = query_params.getlist('fq')
+
+        return [
+            doc for doc in self._load_docs()
+            if all(self._matches_filter(doc, fq) for fq in filter_queries) and self._matches_query(doc, query)
+        ][:rows]
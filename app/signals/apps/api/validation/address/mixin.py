@@ -1,21 +1,22 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2020 - 2023 Gemeente Amsterdam
+# Copyright (C) 2020 - 2026 Gemeente Amsterdam
 import logging
 
 from django.conf import settings
+from django.utils.module_loading import import_string
 from rest_framework.exceptions import ValidationError
 
 from signals.apps.api.validation.address.base import (
     AddressValidationUnavailableException,
     NoResultsException
 )
-from signals.apps.api.validation.address.pdok import PDOKAddressValidation
 
 logger = logging.getLogger(__name__)
 
 
 class AddressValidationMixin:
-    address_validation_class = PDOKAddressValidation
+    # Defaults to the class set with ADDRESS_VALIDATION_CLASS
+    address_validation_class = None
 
     def get_address_validation(self):
         """
@@ -29,6 +30,9 @@ class AddressValidationMixin:
         Return the class to use for the address valdiation.
         Defaults to using `self.address_validation_class`.
         """
+        if self.address_validation_class is None and settings.ADDRESS_VALIDATION_CLASS:
+            return import_string(settings.ADDRESS_VALIDATION_CLASS)
+
         assert self.address_validation_class is not None, (
                 "'%s' should either include a `address_validation_class` attribute, "
                 "or override the `get_validation_class()` method."
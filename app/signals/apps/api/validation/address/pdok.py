@@ -1,15 +1,138 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2020 - 2023 Gemeente Amsterdam
+# Copyright (C) 2020 - 2026 Gemeente Amsterdam
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+import requests
+from django.conf import settings
 from django.http import QueryDict
-from requests import get
-from requests.exceptions import RequestException
+from requests.adapters import HTTPAdapter
+from requests.exceptions import HTTPError, RequestException
 
 from signals.apps.api.validation.address.base import (
     AddressValidationUnavailableException,
     BaseAddressValidation
 )
+from signals.apps.api.validation.address.circuit_breaker import CircuitBreaker
+from signals.metrics import get_metrics
 from signals.settings import DEFAULT_PDOK_MUNICIPALITIES, PDOK_LOCATIESERVER_SUGGEST_ENDPOINT
 
+pdok_metrics = get_metrics('pdok')
+
+
+def normalize_query_params(query_params: QueryDict) -> str:
+    """
+    The cache key of a PDOK query. The locatieserver ignores case and superfluous whitespace, and the coordinates only
+    affect the order of the results, so they are rounded to about a meter.
+    """
+    items = []
+    for key, values in query_params.lists():
+        for value in values:
+            if key in ('lon', 'lat'):
+                value = f'{float(value):.5f}'
+            items.append((key, ' '.join(str(value).split()).casefold()))
+    return '&'.join(f'{key}={value}' for key, value in sorted(items))
+
+
+class SearchResultCache:
+    """
+    Bounded LRU cache of PDOK search results, local to the process.
+
+    :param max_size: maximum number of search results in the cache
+    :param timeout: number of seconds a search result is cached
+    """
+    def __init__(self, max_size: int, timeout: float):
+        self.max_size = max_size
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._results: OrderedDict[str, tuple[float, list[dict]]] = OrderedDict()
+
+    def get(self, key: str) -> list[dict] | None:
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is None:
+                return None
+
+            expires_at, docs = entry
+            if expires_at <= time.monotonic():
+                del self._results[key]
+                return None
+            self._results.move_to_end(key)
+        return copy.deepcopy(docs)
+
+    def set(self, key: str, docs: list[dict]) -> None:
+        if self.max_size <= 0 or self.timeout <= 0:
+            return
+
+        with self._lock:
+            self._results[key] = (time.monotonic() + self.timeout, copy.deepcopy(docs))
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_size:
+                self._results.popitem(last=False)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._results = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+
+class PDOKClient:
+    """
+    The connection pool, search result cache and circuit breaker shared by all PDOK address validations of the process.
+    """
+    def __init__(self, pool_size: int, timeout: tuple[float, float], cache: SearchResultCache,
+                 circuit_breaker: CircuitBreaker):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.cache = cache
+        self.circuit_breaker = circuit_breaker
+        self._session: requests.Session | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                    session.mount('https://', adapter)
+                    session.mount('http://', adapter)
+                    self._session = session
+        return self._session
+
+    def reset(self) -> None:
+        self.cache.reset()
+        self.circuit_breaker.reset()
+
+
+_pdok_client: PDOKClient | None = None
+_pdok_client_lock = threading.Lock()
+
+
+def get_pdok_client() -> PDOKClient:
+    """
+    The PDOK client of this process, configured with the PDOK_* settings.
+    """
+    global _pdok_client
+    if _pdok_client is None:
+        with _pdok_client_lock:
+            if _pdok_client is None:
+                _pdok_client = PDOKClient(
+                    pool_size=settings.PDOK_POOL_SIZE,
+                    timeout=(settings.PDOK_CONNECT_TIMEOUT, settings.PDOK_READ_TIMEOUT),
+                    cache=SearchResultCache(max_size=settings.PDOK_CACHE_SIZE, timeout=settings.PDOK_CACHE_TIMEOUT),
+                    circuit_breaker=CircuitBreaker(
+                        failure_threshold=settings.PDOK_CIRCUIT_BREAKER_THRESHOLD,
+                        reset_timeout=settings.PDOK_CIRCUIT_BREAKER_RESET_TIMEOUT,
+                    ),
+                )
+    return _pdok_client
+
 
 class PDOKAddressValidation(BaseAddressValidation):
     address_validation_url = PDOK_LOCATIESERVER_SUGGEST_ENDPOINT
@@ -58,11 +181,47 @@ class PDOKAddressValidation(BaseAddressValidation):
 
         return query_dict
 
+    def _fetch(self, client, query_params):
+        """
+        Returns the documents PDOK found for the query
+        """
+        response = client.session.get(f'{self.address_validation_url}?{query_params.urlencode()}',
+                                      timeout=client.timeout)
+        response.raise_for_status()
+        return response.json()["response"]["docs"]
+
     def _search(self, address, lon=None, lat=None, *args, **kwargs):
+        client = get_pdok_client()
+        query_params = self._pdok_request_query_params(address=address, lon=lon, lat=lat)
+
+        cache_key = normalize_query_params(query_params)
+        docs = client.cache.get(cache_key)
+        if docs is not None:
+            pdok_metrics.increment('hits')
+            return docs
+        pdok_metrics.increment('misses')
+
+        if not client.circuit_breaker.allow_request():
+            # PDOK failed repeatedly, do not let every request wait for it to time out
+            pdok_metrics.increment('circuit_open')
+            raise AddressValidationUnavailableException('PDOK circuit breaker is open')
+
         try:
-            query_params = self._pdok_request_query_params(address=address, lon=lon, lat=lat)
-            response = get(f'{self.address_validation_url}?{query_params.urlencode()}')
-            response.raise_for_status()
-        except RequestException as e:
+            with pdok_metrics.timer('request'):
+                docs = self._fetch(client, query_params)
+        except HTTPError as e:
+            pdok_metrics.increment('errors')
+            if e.response is not None and e.response.status_code < 500:
+                # PDOK is up, it did not accept this query
+                client.circuit_breaker.record_success()
+            else:
+                client.circuit_breaker.record_failure()
             raise AddressValidationUnavailableException(e)
-        return response.json()["response"]["docs"]
+        except (RequestException, KeyError, TypeError) as e:
+            pdok_metrics.increment('errors')
+            client.circuit_breaker.record_failure()
+            raise AddressValidationUnavailableException(e)
+
+        client.circuit_breaker.record_success()
+        client.cache.set(cache_key, docs)
+        return docs
@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2023 Vereniging van Nederlandse Gemeenten, Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Vereniging van Nederlandse Gemeenten, Gemeente Amsterdam
 """
 Views dealing with 'signals.Attachment' model directly.
 """
@@ -21,7 +21,7 @@ from signals.apps.api.serializers import (
     PublicSignalAttachmentSerializer
 )
 from signals.apps.api.serializers.attachment import PrivateSignalAttachmentUpdateSerializer
-from signals.apps.services.domain.permissions.signal import SignalPermissionService
+from signals.apps.services.domain.permissions.signal import get_signal_permission_evaluator
 from signals.apps.signals.models import Attachment, Signal
 from signals.auth.backend import JWTAuthBackend
 
@@ -60,19 +60,15 @@ class PublicSignalAttachmentsViewSet(CreateModelMixin, GenericViewSet):
     update=extend_schema(request=PrivateSignalAttachmentUpdateSerializer)
 )
 class PrivateSignalAttachmentsViewSet(NestedViewSetMixin, ModelViewSet):
-    queryset = Attachment.objects.all()
+    queryset = Attachment.objects.prefetch_related('renditions')
     serializer_class = PrivateSignalAttachmentSerializer
     authentication_classes = [JWTAuthBackend]
     permission_classes = [SIAAttachmentPermissions]
 
     def get_queryset(self, *args, **kwargs):
-        user = self.request.user
         pk = self.kwargs.get('parent_lookup__signal__pk')
-        signal_accessible = Signal.objects.filter(id=pk).filter_for_user(user).exists()
-
-        if not SignalPermissionService.has_permission(user, 'signals.sia_can_view_all_categories'):
-            if not signal_accessible:
-                raise PermissionDenied()
+        if not get_signal_permission_evaluator(self.request).is_visible(pk):
+            raise PermissionDenied()
         return super().get_queryset()
 
     def get_signal(self):
@@ -1,12 +1,9 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2021 - 2023 Gemeente Amsterdam
+# Copyright (C) 2021 - 2026 Gemeente Amsterdam
 import logging
 
-from django.conf import settings
-from django.contrib.gis.db.models.functions import Distance
-from django.db.models import Q
-from django.utils import timezone
-from drf_spectacular.utils import extend_schema
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import mixins
 from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
@@ -20,6 +17,7 @@ from signals.apps.api.serializers import (
     SignalContextReporterSerializer,
     SignalContextSerializer
 )
+from signals.apps.services.domain.permissions.signal import get_signal_permission_evaluator
 from signals.apps.signals import workflow
 from signals.apps.signals.models import Signal
 from signals.auth.backend import JWTAuthBackend
@@ -102,21 +100,18 @@ class SignalContextViewSet(mixins.RetrieveModelMixin, GenericViewSet):
                 }
             }
         },
+        parameters=[
+            OpenApiParameter(name='ordering', location=OpenApiParameter.QUERY, type=OpenApiTypes.STR,
+                             enum=['distance'], description='Order by distance from the signal, nearest first'),
+        ],
         description='Get an overview of signals in the same category and within a certain radius of the signal',
     )
     def near(self, request, pk=None):
         signal = self.get_object()
 
-        signals_for_geography_qs = Signal.objects.annotate(
-            distance_from_point=Distance('location__geometrie', signal.location.geometrie),
-        ).filter(
-            (Q(parent__isnull=True) & Q(children__isnull=True)) | Q(parent__isnull=False),
-            distance_from_point__lte=settings.SIGNAL_API_CONTEXT_GEOGRAPHY_RADIUS,
-            category_assignment__category_id=signal.category_assignment.category.pk,
-            created_at__gte=(
-                timezone.now() - timezone.timedelta(weeks=settings.SIGNAL_API_CONTEXT_GEOGRAPHY_CREATED_DELTA_WEEKS)
-            ),
-        ).exclude(pk=signal.pk)
+        signals_for_geography_qs = Signal.objects.filter_context_near(signal).select_related('location', 'status')
+        if request.query_params.get('ordering') == 'distance':
+            signals_for_geography_qs = signals_for_geography_qs.order_by_distance(signal.location.geometrie)
 
         paginator = LinkHeaderPagination(page_query_param='geopage', page_size=4000)
         page = paginator.paginate_queryset(signals_for_geography_qs, self.request, view=self)
@@ -148,10 +143,13 @@ class SignalContextViewSet(mixins.RetrieveModelMixin, GenericViewSet):
             raise NotFound(detail=f'Signal {pk} has no reporter contact detail.')
 
         page = self.paginate_queryset(signals_for_reporter_qs)
+        signals = page if page is not None else list(signals_for_reporter_qs)
+        # Decide whether the user can view the signals in one query instead of one query per signal
+        get_signal_permission_evaluator(request).filter_visible(obj.pk for obj in signals)
+
         if page is not None:
             serializer = SignalContextReporterSerializer(page, many=True, context=self.get_serializer_context())
             return self.get_paginated_response(serializer.data)
 
-        serializer = SignalContextReporterSerializer(signals_for_reporter_qs, many=True,
-                                                     context=self.get_serializer_context())
+        serializer = SignalContextReporterSerializer(signals, many=True, context=self.get_serializer_context())
         return Response(serializer.data)
@@ -1,11 +1,12 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2023 Gemeente Amsterdam, Vereniging van Nederlandse Gemeenten
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam, Vereniging van Nederlandse Gemeenten
 import logging
 
 from django.conf import settings
 from django.db.models import CharField, Value
 from django.db.models.functions import JSONObject
 from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
@@ -17,9 +18,13 @@ from rest_framework.status import HTTP_200_OK, HTTP_201_CREATED
 from rest_framework.viewsets import ReadOnlyModelViewSet
 from rest_framework_extensions.mixins import DetailSerializerMixin
 
-from signals.apps.api.filters import SignalFilterSet
+from signals.apps.api.filters import SignalFilterSet, get_signal_filter_metadata
 from signals.apps.api.generics.filters import FieldMappingOrderingFilter
-from signals.apps.api.generics.pagination import HALPagination, LinkHeaderPaginationForQuerysets
+from signals.apps.api.generics.pagination import (
+    HALKeysetPagination,
+    HALPagination,
+    LinkHeaderKeysetPaginationForQuerysets
+)
 from signals.apps.api.generics.permissions import (
     SignalCreateInitialPermission,
     SignalViewObjectPermission
@@ -37,6 +42,7 @@ from signals.apps.api.serializers.signal_history import HistoryLogHalSerializer
 from signals.apps.email_integrations.utils import trigger_mail_action_for_email_preview
 from signals.apps.history.models import Log
 from signals.apps.services.domain.pdf import PDFSummaryService
+from signals.apps.services.domain.permissions.signal import get_signal_permission_evaluator
 from signals.apps.signals.models import Signal
 from signals.apps.signals.models.aggregates.json_agg import JSONAgg
 from signals.apps.signals.models.functions.asgeojson import AsGeoJSON
@@ -97,6 +103,13 @@ class PrivateSignalViewSet(DetailSerializerMixin, CreateModelMixin, UpdateModelM
     filter_backends = (DjangoFilterBackend, FieldMappingOrderingFilter, )
     filterset_class = SignalFilterSet
 
+    # Page number pagination by default, keyset pagination with "?pagination=cursor"
+    pagination_class = HALKeysetPagination
+
+    # Maximum number of queries per request, see signals.instrumentation. The number of queries must not depend on the
+    # number of signals on a page.
+    query_budget = {'list': 30, 'retrieve': 40, 'geography': 10, 'filter_metadata': 5}
+
     ordering = ('-created_at', )
     ordering_fields = (
         'id',
@@ -110,6 +123,7 @@ class PrivateSignalViewSet(DetailSerializerMixin, CreateModelMixin, UpdateModelM
         'address',
         'assigned_user_email',
         'area_name',
+        'note_rank',
     )
     ordering_field_mappings = {
         'id': 'id',
@@ -123,6 +137,7 @@ class PrivateSignalViewSet(DetailSerializerMixin, CreateModelMixin, UpdateModelM
         'address': 'location__address_text',
         'assigned_user_email': 'user_assignment__user__email',
         'area_name': 'location__area_name',
+        'note_rank': 'note_rank',  # Annotated by the note_keyword and note_search filters
     }
 
     http_method_names = ['get', 'post', 'patch', 'head', 'options', 'trace']
@@ -152,7 +167,10 @@ class PrivateSignalViewSet(DetailSerializerMixin, CreateModelMixin, UpdateModelM
         History endpoint filterable by action.
         """
         signal = self.get_object()
-        history_log_qs = signal.history_log.all()
+
+        # Served from the "_signal, -created_at" index, the stored representation of the entries is used so the
+        # content type and related object are only needed for entries that have not been backfilled yet.
+        history_log_qs = Log.objects.filter(_signal_id=signal.pk).select_related('content_type').order_by('-created_at')
 
         what = self.request.query_params.get('what', None)
         if what:
@@ -268,8 +286,8 @@ class PrivateSignalViewSet(DetailSerializerMixin, CreateModelMixin, UpdateModelM
         # Paginate our queryset and turn it into a GeoJSON feature collection:
         headers = []
         feature_collection = {'type': 'FeatureCollection', 'features': []}
-        paginator = LinkHeaderPaginationForQuerysets(page_query_param='geopage',
-                                                     page_size=settings.SIGNALS_API_GEO_PAGINATE_BY)
+        paginator = LinkHeaderKeysetPaginationForQuerysets(page_query_param='geopage',
+                                                           page_size=settings.SIGNALS_API_GEO_PAGINATE_BY)
         page_qs = paginator.paginate_queryset(features_qs, self.request, view=self)
 
         if page_qs is not None:
@@ -279,15 +297,45 @@ class PrivateSignalViewSet(DetailSerializerMixin, CreateModelMixin, UpdateModelM
 
         return Response(feature_collection, headers=headers)
 
+    @extend_schema(
+        responses={
+            HTTP_200_OK: {
+                'type': 'object',
+                'additionalProperties': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'object',
+                        'properties': {
+                            'value': {'example': 'null'},
+                            'label': {'type': 'string', 'example': 'null'},
+                        }
+                    }
+                },
+            }
+        },
+        description='The choices of the signal filters, revalidate with the ETag instead of downloading them again.',
+    )
+    @action(detail=False, url_path='filter-metadata', filterset_class=None, filter_backends=(), pagination_class=None)
+    def filter_metadata(self, request):
+        metadata, etag = get_signal_filter_metadata()
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = Response(metadata)
+
+        response.headers['ETag'] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
     @extend_schema(responses={HTTP_200_OK: AbridgedChildSignalSerializer(many=True)})
     @action(detail=True, url_path='children', filterset_class=None, filter_backends=())
     def children(self, request, pk=None):
         """Show abridged version of child signals for a given parent signal."""
         # Based on a user's department a signal may not be accessible.
+        evaluator = get_signal_permission_evaluator(request)
         signal_exists = Signal.objects.filter(id=pk).exists()
-        signal_accessible = Signal.objects.filter_for_user(request.user).filter(id=pk).exists()
 
-        if signal_exists and not signal_accessible:
+        if signal_exists and not evaluator.is_visible(pk):
             raise PermissionDenied()
 
         # return an HTTP 404 if we ask for a child signal's children.
@@ -303,11 +351,15 @@ class PrivateSignalViewSet(DetailSerializerMixin, CreateModelMixin, UpdateModelM
         child_qs = signal.children.all()
         page = paginator.paginate_queryset(child_qs, self.request, view=self)
 
+        children = page if page is not None else list(child_qs)
+        # Decide whether the user can view the child signals in one query instead of one query per child
+        evaluator.filter_visible(child.pk for child in children)
+
         if page is not None:
             serializer = AbridgedChildSignalSerializer(page, many=True, context=self.get_serializer_context())
             return paginator.get_paginated_response(serializer.data)
 
-        serializer = AbridgedChildSignalSerializer(child_qs, many=True, context=self.get_serializer_context())
+        serializer = AbridgedChildSignalSerializer(children, many=True, context=self.get_serializer_context())
         return Response(serializer.data)
 
     @extend_schema(responses={HTTP_200_OK: EmailPreviewSerializer},
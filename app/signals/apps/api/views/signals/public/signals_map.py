@@ -1,18 +1,19 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2023 Gemeente Amsterdam
-import logging
-
-from django.db import connection
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
 from drf_spectacular.utils import extend_schema
-from rest_framework.renderers import BrowsableAPIRenderer
-from rest_framework.response import Response
 from rest_framework.status import HTTP_200_OK
 from rest_framework.viewsets import ViewSet
 
 from signals.apps.api.renderers import SerializedJsonRenderer
-from signals.apps.signals import workflow
-
-logger = logging.getLogger(__name__)
+from signals.apps.services.domain.public_signal_map import (
+    IDENTITY,
+    PublicSignalMapService,
+    get_content_encoding
+)
 
 
 class PublicSignalMapViewSet(ViewSet):
@@ -21,12 +22,9 @@ class PublicSignalMapViewSet(ViewSet):
     Should be replaced by the new implementation A.S.A.P.
     """
 
-    renderer_classes = [SerializedJsonRenderer, BrowsableAPIRenderer]
-    # django-drf has too much overhead with these kinds of 'fast' request.
-    # When implemented using django-drf, retrieving a large number of elements cost around 4s (profiled)
-    # Using pgsql ability to generate geojson, the request time reduces to 30ms (> 130x speedup!)
-    # The downside is that this query has to be (potentially) maintained when changing one of the
-    # following models: signal, categoryassignment, category, location, status
+    # The GeoJSON is generated by the database and cached, see signals.apps.services.domain.public_signal_map. The
+    # response is returned as is, only JSON can be negotiated.
+    renderer_classes = [SerializedJsonRenderer]
 
     @extend_schema(
         responses={
@@ -113,49 +111,25 @@ class PublicSignalMapViewSet(ViewSet):
         deprecated=True,
         description='Deprecated GeoJSON of all signals that can be shown on a public map, used by \'s-Hertogenbosch.',
     )
-    def list(self, *args, **kwargs):
-        fast_query = f"""
-        select jsonb_build_object(
-            'type', 'FeatureCollection',
-            'features', json_agg(features.feature)
-        ) as result from (
-            select json_build_object(
-                'type', 'Feature',
-                'geometry', st_asgeojson(l.geometrie)::jsonb,
-                'properties', json_build_object(
-                    'id', to_jsonb(s.id),
-                    'created_at', to_jsonb(s.created_at),
-                    'status', to_jsonb(status.state),
-                    'category', json_build_object(
-                        'sub', to_jsonb(cat.name),
-                        'main', to_jsonb(maincat.name)
-                    )
-                )
-            ) as feature
-            from
-                signals_signal s
-                left join signals_categoryassignment ca on s.category_assignment_id = ca.id
-                left join signals_category cat on ca.category_id = cat.id
-                left join signals_category maincat on cat.parent_id = maincat.id,
-                signals_location l,
-                signals_status status
-            where
-                s.location_id = l.id
-                and s.status_id = status.id
-                and status.state not in ('{workflow.AFGEHANDELD}', '{workflow.AFGEHANDELD_EXTERN}', '{workflow.GEANNULEERD}', '{workflow.VERZOEK_TOT_HEROPENEN}')
-            order by s.id desc
-            limit 4000 offset 0
-        ) as features
-        """ # noqa
+    def list(self, request, *args, **kwargs):
+        # The map does not depend on the query parameters, all requests are served from the same cached map
+        public_signal_map = PublicSignalMapService.get()
+
+        encoding = get_content_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''), public_signal_map.content)
+        etag = public_signal_map.get_etag(encoding)
+        last_modified = int(public_signal_map.last_modified)
+
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = HttpResponse(public_signal_map.content[encoding], content_type='application/json')
+            if encoding != IDENTITY:
+                response.headers['Content-Encoding'] = encoding
 
-        cursor = connection.cursor()
-        try:
-            cursor.execute(fast_query)
-            row = cursor.fetchone()
-            return Response(row[0])
-        except Exception as e:
-            cursor.close
-            logger.error('failed to retrieve signals json from db', exc_info=e)
+        response.headers['ETag'] = etag
+        response.headers['Last-Modified'] = http_date(last_modified)
+        response.headers['Vary'] = 'Accept-Encoding'
+        patch_cache_control(response, public=True, max_age=settings.PUBLIC_SIGNAL_MAP_MAX_AGE)
+        return response
 
     def get_view_name(self):
         # Overridden to avoid: "Public Signal Map List" that is the default behavior here.
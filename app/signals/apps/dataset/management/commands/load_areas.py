@@ -8,6 +8,8 @@ from django.core.management import BaseCommand
 
 from signals.apps.dataset import sources
 from signals.apps.dataset.base import AreaLoader
+from signals.apps.services.domain.dsl import invalidate_routing_plan
+from signals.apps.signals.utils.area_index import invalidate_area_index
 
 
 class Command(BaseCommand):
@@ -53,4 +55,8 @@ class Command(BaseCommand):
             loader = data_loaders[type_string](**options)
             loader.load()
 
+        # Loaders also update geometries in bulk, which does not trigger the post_save signal
+        invalidate_area_index()
+        invalidate_routing_plan()
+
         self.stdout.write('...done.')
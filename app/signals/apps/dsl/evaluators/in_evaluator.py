@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: MPL-2.0
 # Copyright (C) 2020 - 2021 Vereniging van Nederlandse Gemeenten, Gemeente Amsterdam
 from django.contrib.gis import geos
+from django.contrib.gis.geos.prepared import PreparedGeometry
 
 from signals.apps.dsl.evaluators.evaluator import Evaluator
 
@@ -50,6 +51,7 @@ class InEvaluator(Evaluator):
                     rhs_val = rhs_val[prop.evaluate(ctx)]
             except KeyError:
                 raise Exception("Could not resolve {prop}".format(prop=".".join(self.rhs_prop)))
-        if type(rhs_val) is not geos.MultiPolygon:
+        # Routing plans provide the areas as prepared geometries, these are much faster to test against
+        if type(rhs_val) is not geos.MultiPolygon and not isinstance(rhs_val, PreparedGeometry):
             self._raise_type_error(exp=type(geos.MultiPolygon), act=type(rhs_val))
         return rhs_val.contains(lhs_val)
@@ -1,21 +1,143 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2023 Gemeente Amsterdam
+# Copyright (C) 2023 - 2026 Gemeente Amsterdam
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.db import transaction
 from django.template import Context, Template, loader
 
 from signals.apps.email_integrations.models import EmailTemplate
+from signals.apps.signals.utils.version_stamp import VersionStamp
+from signals.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+email_template_metrics = get_metrics('email_templates')
+email_template_version = VersionStamp('email_integrations:email_templates:version')
+
+
+@dataclass(frozen=True)
+class CompiledEmailTemplate:
+    key: str
+    revision: datetime
+    subject: Template
+    body: Template
+
+
+class EmailTemplateCache:
+    """
+    Per-process cache of compiled email templates, keyed by the template key. Every entry records the revision (the
+    moment the template was last changed) it was compiled from, a lookup only reads the current revision from the
+    database and compiles the template again when it changed.
+
+    Changing or deleting an EmailTemplate bumps a version stamp shared by all processes, every process drops its
+    compiled templates when it notices the version changed.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._templates: dict[str, CompiledEmailTemplate] = {}
+        self._version: str | None = None
+
+    @staticmethod
+    def _compile(email_template: EmailTemplate) -> CompiledEmailTemplate:
+        return CompiledEmailTemplate(
+            key=email_template.key,
+            revision=email_template.updated_at,
+            subject=Template(email_template.title),
+            body=Template(email_template.body),
+        )
+
+    def _check_version(self) -> None:
+        version = email_template_version.get()
+        if version != self._version:
+            with self._lock:
+                self._templates = {}
+                self._version = version
+
+    def get(self, key: str) -> CompiledEmailTemplate:
+        """
+        Returns the compiled template, raises EmailTemplate.DoesNotExist when there is no template for the given key.
+        """
+        self._check_version()
+
+        revision = EmailTemplate.objects.filter(key=key).values_list('updated_at', flat=True).first()
+        if revision is None:
+            raise EmailTemplate.DoesNotExist(f'No email template with key {key}')
+
+        compiled = self._templates.get(key)
+        if compiled is not None and compiled.revision == revision:
+            email_template_metrics.increment('hits')
+            return compiled
+
+        email_template_metrics.increment('misses')
+        compiled = self._compile(EmailTemplate.objects.get(key=key))
+        with self._lock:
+            self._templates[key] = compiled
+        return compiled
+
+    def warm_up(self) -> None:
+        """
+        Compile all email templates, used when a worker starts.
+        """
+        self._check_version()
+
+        templates = {email_template.key: self._compile(email_template)
+                     for email_template in EmailTemplate.objects.all()}
+        with self._lock:
+            self._templates.update(templates)
+
+        # Loading the base templates once makes the cached template loader keep them
+        loader.get_template('email/_base.txt')
+        loader.get_template('email/_base.html')
+
+    def reset(self) -> None:
+        """
+        Drop all compiled templates, they will be compiled again when used.
+        """
+        with self._lock:
+            self._templates = {}
+            self._version = None
+
+
+email_template_cache = EmailTemplateCache()
+
+
+def _bump_email_template_version() -> None:
+    email_template_version.bump()
+    email_template_cache.reset()
+
+
+def invalidate_email_template_cache() -> None:
+    """
+    Bump the shared version stamp so that all processes drop their compiled templates, and reset the local cache. The
+    version is bumped again once the transaction is committed.
+    """
+    _bump_email_template_version()
+    transaction.on_commit(_bump_email_template_version)
+
+
+def warm_up_email_template_cache() -> None:
+    try:
+        email_template_cache.warm_up()
+    except Exception as e:
+        # A worker must be able to start without its templates compiled, they are compiled when first used
+        logger.warning(f'Warming up the email template cache failed: {e}')
 
 
 class EmailTemplateRenderer:
     def __call__(self, key: str, context: dict) -> tuple[str, str, str]:
-        email_template = EmailTemplate.objects.get(key=key)
+        email_template = email_template_cache.get(key)
 
-        rendered_context = {
-            'subject': Template(email_template.title).render(Context(context)),
-            'body': Template(email_template.body).render(Context(context, autoescape=False))
-        }
+        with email_template_metrics.timer('render'):
+            rendered_context = {
+                'subject': email_template.subject.render(Context(context)),
+                'body': email_template.body.render(Context(context, autoescape=False))
+            }
 
-        subject = Template(email_template.title).render(Context(context, autoescape=False))
-        message = loader.get_template('email/_base.txt').render(rendered_context)
-        html_message = loader.get_template('email/_base.html').render(rendered_context)
+            subject = email_template.subject.render(Context(context, autoescape=False))
+            message = loader.get_template('email/_base.txt').render(rendered_context)
+            html_message = loader.get_template('email/_base.html').render(rendered_context)
 
         return subject, message, html_message
@@ -1,10 +1,16 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2022 Gemeente Amsterdam, Delta10 B.V.
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam, Delta10 B.V.
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from signals.apps.email_integrations import tasks
+from signals.apps.email_integrations.models import EmailTemplate
+from signals.apps.email_integrations.renderers.email_template_renderer import (
+    invalidate_email_template_cache
+)
 from signals.apps.signals.managers import (
     create_initial,
+    create_initial_bulk,
     update_signal_departments,
     update_status,
     update_user_assignment
@@ -16,6 +22,12 @@ def update_status_handler(sender, signal_obj, *args, **kwargs):
     tasks.send_mail_reporter.delay(pk=signal_obj.pk)
 
 
+@receiver(create_initial_bulk, dispatch_uid='core_email_integrations_create_initial_bulk')
+def create_initial_bulk_handler(sender, signal_objs, *args, **kwargs):
+    for signal_obj in signal_objs:
+        tasks.send_mail_reporter.delay(pk=signal_obj.pk)
+
+
 @receiver(update_signal_departments, dispatch_uid='core_email_integrations_update_signal_departments')
 def update_signal_departments_handler(sender, signal_obj, signal_departments, prev_signal_departments, *args, **kwargs):
     if signal_departments and prev_signal_departments:
@@ -40,3 +52,8 @@ def update_user_assignment_handler(sender, signal_obj, user_assignment, prev_use
         signal_pk=signal_obj.pk,
         user_pk=user_assignment.user.pk
     )
+
+
+@receiver((post_save, post_delete), sender=EmailTemplate, dispatch_uid='core_email_integrations_email_template_changed')
+def email_template_changed_handler(sender, instance, *args, **kwargs):
+    invalidate_email_template_cache()
@@ -0,0 +1,85 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from django.test import TestCase
+from django.utils import timezone
+
+from signals.apps.email_integrations.factories import EmailTemplateFactory
+from signals.apps.email_integrations.models import EmailTemplate
+from signals.apps.email_integrations.renderers.email_template_renderer import (
+    EmailTemplateRenderer,
+    email_template_cache,
+    email_template_metrics,
+    email_template_version,
+    invalidate_email_template_cache
+)
+
+
+class TestEmailTemplateCache(TestCase):
+    render = EmailTemplateRenderer()
+
+    def setUp(self):
+        invalidate_email_template_cache()
+        email_template_metrics.reset()
+
+        self.email_template = EmailTemplateFactory.create(key=EmailTemplate.SIGNAL_CREATED,
+                                                          title='Melding {{ signal_id }}',
+                                                          body='Bedankt voor uw melding {{ signal_id }}!')
+
+    def test_render(self):
+        subject, message, html_message = self.render(EmailTemplate.SIGNAL_CREATED, {'signal_id': 'SIG-1'})
+
+        self.assertEqual(subject, 'Melding SIG-1')
+        self.assertIn('Bedankt voor uw melding SIG-1!', message)
+        self.assertIn('Bedankt voor uw melding SIG-1!', html_message)
+
+    def test_compiled_once(self):
+        self.render(EmailTemplate.SIGNAL_CREATED, {'signal_id': 'SIG-1'})
+
+        subject, _, _ = self.render(EmailTemplate.SIGNAL_CREATED, {'signal_id': 'SIG-2'})
+        self.assertEqual(subject, 'Melding SIG-2')
+
+        self.assertEqual(email_template_metrics.get('misses'), 1)
+        self.assertEqual(email_template_metrics.get('hits'), 1)
+        self.assertEqual(email_template_metrics.snapshot()['timings']['render']['count'], 2)
+
+    def test_invalidated_on_change(self):
+        compiled = email_template_cache.get(EmailTemplate.SIGNAL_CREATED)
+        self.assertEqual(compiled.revision, self.email_template.updated_at)
+
+        self.email_template.title = 'Uw melding {{ signal_id }}'
+        self.email_template.save()
+
+        subject, _, _ = self.render(EmailTemplate.SIGNAL_CREATED, {'signal_id': 'SIG-1'})
+        self.assertEqual(subject, 'Uw melding SIG-1')
+
+        self.email_template.delete()
+        with self.assertRaises(EmailTemplate.DoesNotExist):
+            self.render(EmailTemplate.SIGNAL_CREATED, {'signal_id': 'SIG-1'})
+
+    def test_recompiled_on_new_revision(self):
+        email_template_cache.get(EmailTemplate.SIGNAL_CREATED)
+
+        # Changed without sending the post_save signal, the version stamp is not bumped
+        EmailTemplate.objects.filter(pk=self.email_template.pk).update(title='Uw melding {{ signal_id }}',
+                                                                       updated_at=timezone.now())
+
+        subject, _, _ = self.render(EmailTemplate.SIGNAL_CREATED, {'signal_id': 'SIG-1'})
+        self.assertEqual(subject, 'Uw melding SIG-1')
+        self.assertEqual(email_template_metrics.get('misses'), 2)
+
+    def test_invalidate_bumps_again_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_email_template_cache()
+            version = email_template_version.get()
+        self.assertNotEqual(email_template_version.get(), version)
+
+    def test_warm_up(self):
+        EmailTemplateFactory.create(key=EmailTemplate.SIGNAL_ASSIGNED)
+
+        email_template_cache.warm_up()
+        email_template_metrics.reset()
+
+        email_template_cache.get(EmailTemplate.SIGNAL_CREATED)
+        email_template_cache.get(EmailTemplate.SIGNAL_ASSIGNED)
+        self.assertEqual(email_template_metrics.get('hits'), 2)
+        self.assertEqual(email_template_metrics.get('misses'), 0)
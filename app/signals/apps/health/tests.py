@@ -1,9 +1,9 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2023 Gemeente Amsterdam
+# Copyright (C) 2023 - 2026 Gemeente Amsterdam
 from unittest import mock
 
 from django.db import Error
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from rest_framework.status import HTTP_200_OK, HTTP_500_INTERNAL_SERVER_ERROR
 
 
@@ -21,3 +21,27 @@ class TestHealthEndpoint(TestCase):
         response = self.client.get(self.endpoint)
         self.assertEqual(HTTP_500_INTERNAL_SERVER_ERROR, response.status_code)
         self.assertEqual(response.content, b'Database connectivity failed')
+
+
+class TestMetricsEndpoint(TestCase):
+    endpoint = '/status/metrics'
+
+    def test_disabled(self):
+        response = self.client.get(self.endpoint)
+        self.assertEqual(response.status_code, 404)
+
+    @override_settings(METRICS_ENDPOINT_ENABLED=True, METRICS_ENDPOINT_TOKEN=None)
+    def test_get(self):
+        self.client.get('/status/health')
+
+        response = self.client.get(self.endpoint)
+        self.assertEqual(HTTP_200_OK, response.status_code)
+        self.assertIn('requests', response.json())
+
+    @override_settings(METRICS_ENDPOINT_ENABLED=True, METRICS_ENDPOINT_TOKEN='secret')
+    def test_token(self):
+        response = self.client.get(self.endpoint)
+        self.assertEqual(response.status_code, 401)
+
+        response = self.client.get(self.endpoint, HTTP_AUTHORIZATION='Bearer secret')
+        self.assertEqual(HTTP_200_OK, response.status_code)
@@ -1,9 +1,10 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2018 - 2023 Gemeente Amsterdam
+# Copyright (C) 2018 - 2026 Gemeente Amsterdam
 from django.urls import path
 
-from signals.apps.health.views import health
+from signals.apps.health.views import health, metrics
 
 urlpatterns = [
     path('health', health, name='health_check'),
+    path('metrics', metrics, name='metrics'),
 ]
@@ -1,9 +1,13 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2023 Gemeente Amsterdam
+# Copyright (C) 2023 - 2026 Gemeente Amsterdam
+import hmac
 import logging
 
+from django.conf import settings
 from django.db import Error, connections
-from django.http import HttpResponse
+from django.http import Http404, HttpResponse, JsonResponse
+
+from signals.metrics import get_all_metrics
 
 logger = logging.getLogger(__name__)
 
@@ -15,3 +19,18 @@ def health(request):
     except Error as e:
         logging.error(e)
         return HttpResponse('Database connectivity failed', content_type='text/plain', status=500)
+
+
+def metrics(request):
+    """
+    The in-process metrics of this process, including the query counts per view and task.
+    """
+    if not settings.METRICS_ENDPOINT_ENABLED:
+        raise Http404()
+
+    if settings.METRICS_ENDPOINT_TOKEN:
+        authorization = request.headers.get('Authorization', '')
+        if not hmac.compare_digest(authorization, f'Bearer {settings.METRICS_ENDPOINT_TOKEN}'):
+            return HttpResponse('Unauthorized', content_type='text/plain', status=401)
+
+    return JsonResponse(get_all_metrics())
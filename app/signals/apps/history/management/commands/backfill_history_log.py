@@ -0,0 +1,44 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+"""
+Store the render-ready representation of existing Signal history log entries, see `Log.rendered`.
+"""
+from django.core.management import BaseCommand
+from django.db import transaction
+
+from signals.apps.history.models import Log
+
+
+class Command(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Number of log entries per batch.')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        queryset = Log.objects.filter(_signal__isnull=False, rendered__isnull=True).select_related('content_type')
+
+        n_rendered = 0
+        n_failed = 0
+        last_pk = 0
+        while True:
+            batch = list(queryset.filter(pk__gt=last_pk).order_by('pk')[:batch_size])
+            if not batch:
+                break
+            last_pk = batch[-1].pk
+
+            to_update = []
+            for log in batch:
+                try:
+                    log.rendered = log.render()
+                except Exception as e:
+                    self.stderr.write(f'Could not render log entry #{log.pk}: {e}')
+                    n_failed += 1
+                    continue
+                to_update.append(log)
+
+            with transaction.atomic():
+                Log.objects.bulk_update(to_update, ['rendered'])
+            n_rendered += len(to_update)
+            self.stdout.write(f'Rendered {n_rendered} log entries ...')
+
+        self.stdout.write(f'Done! Rendered {n_rendered} log entries, {n_failed} could not be rendered.')
@@ -0,0 +1,22 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('history', '0006_alter_log_action'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='log',
+            name='rendered',
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='log',
+            index=models.Index(fields=['_signal', '-created_at'], name='history_log_signal_created_idx'),
+        ),
+    ]
@@ -1,5 +1,7 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2021 - 2023 Gemeente Amsterdam
+# Copyright (C) 2021 - 2026 Gemeente Amsterdam
+import logging
+
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
@@ -9,6 +11,8 @@ from signals.apps.signals.models.signal_departments import SignalDepartments
 from signals.apps.signals.models.type import _history_translated_action
 from signals.apps.signals.workflow import STATUS_CHOICES
 
+logger = logging.getLogger(__name__)
+
 
 class Log(models.Model):
     ACTION_UNKNOWN = 'UNKNOWN'
@@ -39,6 +43,11 @@ class Log(models.Model):
     created_by = models.EmailField(null=True, blank=True)
     created_at = models.DateTimeField(editable=False)
 
+    # The render-ready representation of this log entry as shown in the Signal history endpoint. It is stored when the
+    # entry is written so the history endpoint does not need to dereference the content type and the related object of
+    # every entry. See the `render` method.
+    rendered = models.JSONField(null=True, blank=True, editable=False)
+
     # This is a reference to a specific Signal. It can be blank if the object does not have a relation to a Signal.
     #
     # We want this to be here so that for the Signal history endpoint we can easily select all history for that specific
@@ -52,7 +61,8 @@ class Log(models.Model):
     class Meta:
         ordering = ('-created_at', )
         indexes = [
-            models.Index(fields=['content_type', 'object_pk', ])
+            models.Index(fields=['content_type', 'object_pk', ]),
+            models.Index(fields=['_signal', '-created_at', ], name='history_log_signal_created_idx'),
         ]
 
     def __str__(self) -> str:
@@ -61,6 +71,34 @@ class Log(models.Model):
             representation = f'{representation}, on signal #{self._signal_id}'
         return representation
 
+    def set_rendered(self) -> None:
+        """
+        Store the render-ready representation of a log entry for a Signal, unless it is already stored.
+        """
+        if self._signal_id and self.rendered is None:
+            try:
+                self.rendered = self.render()
+            except Exception:
+                # Never fail writing the log, the history endpoint renders entries without a stored representation
+                logger.exception(f'Could not render log entry for signal #{self._signal_id}')
+
+    def save(self, *args, **kwargs):
+        self.set_rendered()
+        super().save(*args, **kwargs)
+
+    def render(self) -> dict:
+        """
+        The representation of this log entry in the Signal history endpoint, without the "when" and "_signal" fields
+        which are stored in their own columns.
+        """
+        return {
+            'identifier': self.identifier,
+            'what': self.what,
+            'action': self.get_action(),
+            'description': self.get_description(),
+            'who': self.who,
+        }
+
     # START - Backwards compatibility functions
     #
     # To keep the history endpoint intact the following functions are defined to mimic the history view in the database
@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2021 - 2023 Gemeente Amsterdam
+# Copyright (C) 2021 - 2026 Gemeente Amsterdam
 import pytz
 from django.conf import settings
 from django.utils import timezone
@@ -22,125 +22,206 @@ from signals.apps.signals.models import Type as _Type
 
 class SignalLogService:
     @staticmethod
-    def log_create_initial(signal: Signal) -> None:
+    def _create_initial_logs(signal: Signal, slo_cache: dict | None = None) -> list[Log]:
+        """
+        The (unsaved) log rules of the "create initial" action of the given Signal
+        """
+        logs = []
         if signal.is_child:
             # We cannot create a GenericRelation on the Signal model because the naming will clash with the ForeignKey
             # `_signal` defined on the Log model. So for now Log rules for a specific Signal are created as seen here:
-            Log.objects.create(
+            logs.append(Log(
                 action=Log.ACTION_CREATE,
                 extra=str(signal.id),
                 object=signal,
                 created_by=None,
                 created_at=signal.created_at,
                 _signal=signal.parent,
-            )
+            ))
 
         if signal.location:
-            SignalLogService.log_update_location(signal.location)
+            logs.append(SignalLogService._location_log(signal.location))
 
         if signal.status:
-            SignalLogService.log_update_status(signal.status)
+            logs.append(SignalLogService._status_log(signal.status))
 
         if signal.category_assignment:
-            SignalLogService.log_update_category_assignment(signal.category_assignment)
+            logs.extend(SignalLogService._category_assignment_logs(signal.category_assignment, slo_cache))
 
         if signal.priority:
-            SignalLogService.log_update_priority(signal.priority)
+            logs.append(SignalLogService._priority_log(signal.priority))
 
         if signal.type_assignment:
-            SignalLogService.log_update_type(signal.type_assignment)
+            logs.append(SignalLogService._type_log(signal.type_assignment))
+
+        return logs
 
     @staticmethod
-    def log_create_note(note: Note) -> None:
-        if not isinstance(note, Note):
-            return
+    def log_create_initial(signal: Signal) -> None:
+        for log in SignalLogService._create_initial_logs(signal):
+            log.save()
 
-        note.history_log.create(
+    @staticmethod
+    def log_create_initial_bulk(signals: list[Signal]) -> None:
+        """
+        Log the "create initial" action of many signals at once, for signals created with create_initial_bulk.
+        """
+        # The service level objective is looked up once per category
+        slo_cache = {}
+
+        logs = []
+        for signal in signals:
+            logs.extend(SignalLogService._create_initial_logs(signal, slo_cache))
+        SignalLogService._bulk_create(logs)
+
+    @staticmethod
+    def _bulk_create(logs: list[Log]) -> None:
+        # bulk_create does not call Log.save, so the render-ready representation is stored here
+        for log in logs:
+            log.set_rendered()
+        Log.objects.bulk_create(logs)
+
+    @staticmethod
+    def _note_log(note: Note) -> Log:
+        return Log(
             action=Log.ACTION_CREATE,
             description=note.text,
             extra='Notitie toegevoegd',
+            object=note,
             created_by=note.created_by,
             created_at=note.created_at,
-            _signal=note._signal,
+            _signal_id=note._signal_id,
         )
 
     @staticmethod
-    def log_update_category_assignment(category_assignment: CategoryAssignment) -> None:
-        if not isinstance(category_assignment, CategoryAssignment):
+    def log_create_note(note: Note) -> None:
+        if not isinstance(note, Note):
             return
 
-        if category_assignment.category.slo.exists() and category_assignment._signal.categories.count() == 1:
-            _slo = category_assignment.category.slo.first()
-            if _slo:
-                _slo.history_log.create(
-                    action=Log.ACTION_UPDATE,
-                    description=category_assignment.stored_handling_message,
-                    created_by=category_assignment.created_by,
-                    created_at=category_assignment.created_at,
-                    _signal=category_assignment._signal,
-                )
+        SignalLogService._note_log(note).save()
+
+    @staticmethod
+    def log_create_notes(notes: list[Note]) -> None:
+        """
+        Log the creation of many notes at once, for notes created with bulk_create (which sends no post_save).
+        """
+        SignalLogService._bulk_create([SignalLogService._note_log(note) for note in notes])
 
-        category_assignment.history_log.create(
+    @staticmethod
+    def _category_assignment_logs(category_assignment: CategoryAssignment, slo_cache: dict | None = None) -> list[Log]:
+        logs = []
+
+        if slo_cache is None:
+            # Only the first category assignment of a Signal logs the service level objective
+            _slo = (category_assignment.category.slo.first()
+                    if category_assignment._signal.categories.count() == 1 else None)
+        else:
+            # Signals created in bulk all have a single category assignment
+            if category_assignment.category_id not in slo_cache:
+                slo_cache[category_assignment.category_id] = category_assignment.category.slo.first()
+            _slo = slo_cache[category_assignment.category_id]
+
+        if _slo:
+            logs.append(Log(
+                action=Log.ACTION_UPDATE,
+                description=category_assignment.stored_handling_message,
+                object=_slo,
+                created_by=category_assignment.created_by,
+                created_at=category_assignment.created_at,
+                _signal=category_assignment._signal,
+            ))
+
+        logs.append(Log(
             action=Log.ACTION_UPDATE,
             extra=category_assignment.category.name,
+            object=category_assignment,
             created_by=category_assignment.created_by,
             created_at=category_assignment.created_at,
             _signal=category_assignment._signal,
-        )
+        ))
+        return logs
 
     @staticmethod
-    def log_update_location(location: Location) -> None:
-        if not isinstance(location, Location):
+    def log_update_category_assignment(category_assignment: CategoryAssignment) -> None:
+        if not isinstance(category_assignment, CategoryAssignment):
             return
 
-        location.history_log.create(
+        for log in SignalLogService._category_assignment_logs(category_assignment):
+            log.save()
+
+    @staticmethod
+    def _location_log(location: Location) -> Log:
+        return Log(
             action=Log.ACTION_UPDATE,
             extra='Locatie gewijzigd',
+            object=location,
             created_by=location.created_by,
             created_at=location.created_at,
             _signal=location._signal,
         )
 
     @staticmethod
-    def log_update_priority(priority: Priority) -> None:
-        if not isinstance(priority, Priority):
+    def log_update_location(location: Location) -> None:
+        if not isinstance(location, Location):
             return
 
-        priority.history_log.create(
+        SignalLogService._location_log(location).save()
+
+    @staticmethod
+    def _priority_log(priority: Priority) -> Log:
+        return Log(
             action=Log.ACTION_UPDATE,
             extra=priority.priority,
+            object=priority,
             created_by=priority.created_by,
             created_at=priority.created_at,
             _signal=priority._signal,
         )
 
     @staticmethod
-    def log_update_status(status: Status) -> None:
-        if not isinstance(status, Status):
+    def log_update_priority(priority: Priority) -> None:
+        if not isinstance(priority, Priority):
             return
 
-        status.history_log.create(
+        SignalLogService._priority_log(priority).save()
+
+    @staticmethod
+    def _status_log(status: Status) -> Log:
+        return Log(
             action=Log.ACTION_UPDATE,
             description=status.text,
             extra=status.state,
+            object=status,
             created_by=status.created_by,
             created_at=status.created_at,
             _signal=status._signal,
         )
 
     @staticmethod
-    def log_update_type(_type: _Type) -> None:
-        if not isinstance(_type, _Type):
+    def log_update_status(status: Status) -> None:
+        if not isinstance(status, Status):
             return
 
-        _type.history_log.create(
+        SignalLogService._status_log(status).save()
+
+    @staticmethod
+    def _type_log(_type: _Type) -> Log:
+        return Log(
             action=Log.ACTION_UPDATE,
             extra=_type.name,
+            object=_type,
             created_by=_type.created_by,
             created_at=_type.created_at,
             _signal=_type._signal,
         )
 
+    @staticmethod
+    def log_update_type(_type: _Type) -> None:
+        if not isinstance(_type, _Type):
+            return
+
+        SignalLogService._type_log(_type).save()
+
     @staticmethod
     def log_update_user_assignment(user_assignment: SignalUser) -> None:
         if not isinstance(user_assignment, SignalUser):
@@ -1,9 +1,9 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2021 Gemeente Amsterdam
+# Copyright (C) 2021 - 2026 Gemeente Amsterdam
 from django.dispatch import receiver
 
 from signals.apps.history.services import SignalLogService
-from signals.apps.signals.managers import create_initial
+from signals.apps.signals.managers import create_initial, create_initial_bulk
 
 
 @receiver(create_initial, dispatch_uid='create_initial_log_handler')
@@ -12,3 +12,11 @@ def create_initial_handler(sender, signal_obj, *args, **kwargs):
     Create all log rules needed for the "create initial" action
     """
     SignalLogService.log_create_initial(signal_obj)
+
+
+@receiver(create_initial_bulk, dispatch_uid='create_initial_bulk_log_handler')
+def create_initial_bulk_handler(sender, signal_objs, *args, **kwargs):
+    """
+    Create all log rules needed for the "create initial" action of signals created in bulk
+    """
+    SignalLogService.log_create_initial_bulk(signal_objs)
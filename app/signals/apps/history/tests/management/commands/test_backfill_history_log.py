@@ -0,0 +1,32 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from signals.apps.history.models import Log
+from signals.apps.history.services import SignalLogService
+from signals.apps.signals.factories import SignalFactoryValidLocation
+
+
+class TestBackfillHistoryLog(TestCase):
+    def setUp(self):
+        self.signal = SignalFactoryValidLocation.create()
+        SignalLogService.log_create_initial(self.signal)
+
+    def test_rendered_on_write(self):
+        log = self.signal.history_log.get(content_type__model='status')
+        self.assertEqual(log.rendered, log.render())
+        self.assertEqual(log.rendered['what'], 'UPDATE_STATUS')
+
+    def test_backfill(self):
+        expected = {log.pk: log.render() for log in self.signal.history_log.all()}
+        Log.objects.update(rendered=None)
+
+        out = StringIO()
+        call_command('backfill_history_log', '--batch-size', '2', stdout=out)
+
+        for log in self.signal.history_log.all():
+            self.assertEqual(log.rendered, expected[log.pk])
+        self.assertIn(f'Rendered {len(expected)} log entries', out.getvalue())
@@ -1,5 +1,7 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2021 - 2023 Gemeente Amsterdam
+# Copyright (C) 2021 - 2026 Gemeente Amsterdam
+from unittest import mock
+
 from django.db.models.signals import post_save
 from django.test import TestCase, override_settings
 from django.utils import timezone
@@ -88,6 +90,19 @@ class TestLogSignalLogService(AssertSignalsNotInLogMixin, TestCase):
         self.assertEqual(1, self.signal.history_log.filter(action=Log.ACTION_CREATE).count())
         self.assertEqual(1, note.history_log.count())
 
+    @mute_signals(post_save, create_initial, update_category_assignment, update_location, update_priority,
+                  update_signal_departments, update_status, update_type, update_user_assignment)
+    def test_log_create_notes_render_error(self):
+        notes = NoteFactory.create_batch(3, _signal=self.signal)
+
+        # A log entry that cannot be rendered is stored without its representation, the others are not lost
+        with mock.patch.object(Log, 'render', side_effect=[{'action': 'Notitie toegevoegd:'}, Exception('error'),
+                                                           {'action': 'Notitie toegevoegd:'}]):
+            SignalLogService.log_create_notes(notes)
+
+        self.assertEqual(3, self.signal.history_log.count())
+        self.assertEqual(1, self.signal.history_log.filter(rendered__isnull=True).count())
+
     @mute_signals(post_save, create_initial, update_category_assignment, update_location, update_priority,
                   update_signal_departments, update_status, update_type, update_user_assignment)
     def test_log_update_category_assignment(self):
@@ -4,6 +4,8 @@
 # App settings
 MAX_QUESTIONS = 50
 SESSION_DURATION = 2 * 60 * 60  # Two hours default
+QUESTION_GRAPH_CACHE_SIZE = 128  # Compiled QuestionGraphs kept per process
+QUESTION_GRAPH_VERSION_TIMEOUT = 24 * 60 * 60  # One day, an expired version compiles the QuestionGraph again
 
 
 # ReactionRequestService settings
@@ -6,3 +6,6 @@ from django.apps import AppConfig
 class QuestionnairesConfig(AppConfig):
     name = 'signals.apps.questionnaires'
     verbose_name = 'Questionnaires'
+
+    def ready(self):
+        import signals.apps.questionnaires.signal_receivers  # noqa
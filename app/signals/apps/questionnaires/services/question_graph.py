@@ -3,11 +3,117 @@
 """
 QuestionGraph service contains functionality that deals with QuestionGraph
 structure (reachable questions and the like).
+
+QuestionGraphs are compiled once per process into an immutable structure,
+shared by all requests handled by that process. Every QuestionGraph has a
+version stamp shared by all processes, changing its edges, questions or
+choices bumps the version stamp so that it is compiled again.
 """
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Iterable, Mapping
+
 import networkx
+from django.db import transaction
+
+from signals.apps.questionnaires.app_settings import (
+    MAX_QUESTIONS,
+    QUESTION_GRAPH_CACHE_SIZE,
+    QUESTION_GRAPH_VERSION_TIMEOUT
+)
+from signals.apps.questionnaires.models import Edge, Question, QuestionGraph
+from signals.apps.signals.utils.version_stamp import VersionStamp
+from signals.metrics import get_metrics
+
+question_graph_metrics = get_metrics('question_graphs')
+
+
+def get_question_graph_version(graph_id: int) -> VersionStamp:
+    return VersionStamp(f'questionnaires:question_graph:{graph_id}:version', timeout=QUESTION_GRAPH_VERSION_TIMEOUT)
+
+
+@dataclass(frozen=True)
+class CompiledQuestionGraph:
+    """
+    Immutable representation of a QuestionGraph. The Question and Edge
+    instances are shared by all requests and must not be modified.
+    """
+    graph_id: int
+    version: str
+    first_question: Question | None
+    edges: tuple[Edge, ...]
+    nx_graph: networkx.MultiDiGraph
+    questions_by_id: Mapping[int, Question]
+    reachable_questions_by_id: Mapping[int, Question]
+    endpoint_questions_by_id: Mapping[int, Question]
+
+
+class QuestionGraphCache:
+    """
+    Bounded LRU cache of compiled QuestionGraphs, local to the process and
+    keyed by QuestionGraph id.
+
+    :param max_size: maximum number of compiled QuestionGraphs in the cache
+    """
+    def __init__(self, max_size: int = QUESTION_GRAPH_CACHE_SIZE):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._graphs: OrderedDict[int, CompiledQuestionGraph] = OrderedDict()
+
+    def get(self, q_graph: QuestionGraph) -> CompiledQuestionGraph:
+        version = get_question_graph_version(q_graph.id).get()
+
+        with self._lock:
+            compiled = self._graphs.get(q_graph.id)
+            if compiled is not None and compiled.version == version:
+                self._graphs.move_to_end(q_graph.id)
+                question_graph_metrics.increment('hits')
+                return compiled
+
+        question_graph_metrics.increment('misses')
+        with question_graph_metrics.timer('compile'):
+            compiled = QuestionGraphService.compile(q_graph, version)
+        with self._lock:
+            self._graphs[q_graph.id] = compiled
+            self._graphs.move_to_end(q_graph.id)
+            while len(self._graphs) > self.max_size:
+                self._graphs.popitem(last=False)
+                question_graph_metrics.increment('evictions')
+        return compiled
+
+    def discard(self, graph_ids: Iterable[int]) -> None:
+        with self._lock:
+            for graph_id in graph_ids:
+                self._graphs.pop(graph_id, None)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._graphs = OrderedDict()
+
 
-from signals.apps.questionnaires.app_settings import MAX_QUESTIONS
-from signals.apps.questionnaires.models import Edge, Question
+question_graph_cache = QuestionGraphCache()
+
+
+def invalidate_question_graphs(graph_ids: Iterable[int]) -> None:
+    """
+    Bump the version stamps of the QuestionGraphs so that all processes compile
+    them again.
+    """
+    graph_ids = set(graph_ids)
+    if not graph_ids:
+        return
+
+    def bump():
+        for graph_id in graph_ids:
+            get_question_graph_version(graph_id).bump()
+        question_graph_cache.discard(graph_ids)
+
+    bump()
+    # Bump again once the change is committed, a process that compiled the
+    # QuestionGraph before that would otherwise keep the outdated version.
+    transaction.on_commit(bump)
 
 
 class QuestionGraphService:
@@ -16,22 +122,59 @@ class QuestionGraphService:
 
     def refresh_from_db(self):
         """
-        Retrieve all QuestionGraph data, cache it.
+        Retrieve the compiled QuestionGraph, compiled again if it changed.
         """
-        # Retrieve all relevant edges, questions and answers
-        self._edges = self._get_edges(self._q_graph)
-        self._nx_graph = self._build_nx_graph(self._q_graph, self._edges)
-        self._questions = self._get_all_questions(self._nx_graph)
+        compiled = question_graph_cache.get(self._q_graph)
+        self._compiled = compiled
+
+        self._edges = list(compiled.edges)
+        self._nx_graph = compiled.nx_graph
+        self._questions = list(compiled.questions_by_id.values())
 
         # setup caches for quick access
-        self._edges_by_id = {e.id: e for e in self._edges}
-        self._questions_by_id = {q.id: q for q in self._questions}
+        self._edges_by_id = {e.id: e for e in compiled.edges}
+        self._questions_by_id = compiled.questions_by_id
 
-        self._reachable_questions_by_id = self._get_reachable_questions(self._nx_graph, self._q_graph)
-        self._endpoint_questions_by_id = self._get_endpoint_questions(
-            self._nx_graph, self._questions_by_id, self._reachable_questions_by_id)
+        self._reachable_questions_by_id = compiled.reachable_questions_by_id
+        self._endpoint_questions_by_id = compiled.endpoint_questions_by_id
 
-    def _get_edges(self, q_graph):
+    @property
+    def first_question(self):
+        """
+        First question of the QuestionGraph as it was compiled.
+        """
+        if not hasattr(self, '_compiled'):
+            self.refresh_from_db()
+        return self._compiled.first_question
+
+    @classmethod
+    def compile(cls, q_graph, version):
+        """
+        Retrieve all QuestionGraph data and compile it into an immutable
+        CompiledQuestionGraph.
+        """
+        # The QuestionGraph instance may be outdated, retrieve its first question again
+        q_graph = QuestionGraph.objects.select_related('first_question').get(pk=q_graph.pk)
+
+        edges = cls._get_edges(q_graph)
+        nx_graph = cls._build_nx_graph(q_graph, edges)
+        questions_by_id = {q.id: q for q in cls._get_all_questions(nx_graph)}
+        reachable_questions_by_id = cls._get_reachable_questions(nx_graph, q_graph, questions_by_id)
+        endpoint_questions_by_id = cls._get_endpoint_questions(nx_graph, questions_by_id, reachable_questions_by_id)
+
+        return CompiledQuestionGraph(
+            graph_id=q_graph.id,
+            version=version,
+            first_question=questions_by_id.get(q_graph.first_question_id),
+            edges=tuple(edges),
+            nx_graph=networkx.freeze(nx_graph),
+            questions_by_id=MappingProxyType(questions_by_id),
+            reachable_questions_by_id=MappingProxyType(reachable_questions_by_id),
+            endpoint_questions_by_id=MappingProxyType(endpoint_questions_by_id),
+        )
+
+    @staticmethod
+    def _get_edges(q_graph):
         """
         List of Edge instances decsribing QuestionGraph structure.
         """
@@ -84,13 +227,18 @@ class QuestionGraphService:
         return nx_graph
 
     @staticmethod
-    def _get_reachable_questions(nx_graph, q_graph):
+    def _get_reachable_questions(nx_graph, q_graph, questions_by_id=None):
         """
         Grab questions linked to QuestionGraph reachable from first_question.
         """
-        reachable = networkx.descendants(nx_graph, q_graph.first_question.id)
-        reachable.add(q_graph.first_question.id)
+        if q_graph.first_question_id is None:
+            return {}
+
+        reachable = networkx.descendants(nx_graph, q_graph.first_question_id)
+        reachable.add(q_graph.first_question_id)
 
+        if questions_by_id is not None:
+            return {q_id: questions_by_id[q_id] for q_id in reachable}
         return {q.id: q for q in Question.objects.filter(id__in=reachable)}
 
     @staticmethod
@@ -44,7 +44,13 @@ class SessionService:
     def load_session_data(self):
         self._answers = self._get_all_answers(self.session)
         self._answers_by_question_id = {a.question.id: a for a in self._answers}
+        self._load_path()
 
+    def _load_path(self):
+        """
+        Determine the path through the QuestionGraph given the current answers,
+        no database access is needed.
+        """
         # Take into account QuestionGraph structure, determine questions,
         # unanswered questions and answers along path. Note that these paths
         # do not necessarily extend to the end of the questionnaire. (Only the
@@ -52,7 +58,7 @@ class SessionService:
         # without an answer being provided).
         reachable, unanswered, answered, can_freeze = self._get_reachable_questions_and_answers(
             self.question_graph_service._nx_graph,
-            self.question_graph_service._q_graph.first_question,
+            self.question_graph_service.first_question,
             self.question_graph_service._questions_by_id,
             self._answers_by_question_id
         )
@@ -198,11 +204,12 @@ class SessionService:
 
         return extra_props
 
-    def create_answer(self, answer_payload, question):
+    def _save_answer(self, answer_payload, question):
         """
-        Answer a question, update session.started_at if needed.
+        Validate and save an answer, the path through the QuestionGraph is not
+        updated.
         """
-        if not hasattr(self, '_nx_graph'):
+        if not hasattr(self, '_answers_by_question_id'):
             self.refresh_from_db()
 
         # Check that question is actually part of relevant questionnaire:
@@ -224,7 +231,19 @@ class SessionService:
         self.answer_service.validate_answer_payload(answer_payload, question)
 
         answer = Answer.objects.create(session=self.session, question=question, payload=answer_payload)
-        self.refresh_from_db()  # prevent stale data // TODO: consider only using load_session_data or updating cache
+
+        # The new answer is the most recent answer to its question, keep the
+        # cached answers up to date instead of retrieving them all again.
+        self._answers = [a for a in self._answers if a.question.id != question.id] + [answer]
+        self._answers_by_question_id[question.id] = answer
+        return answer
+
+    def create_answer(self, answer_payload, question):
+        """
+        Answer a question, update session.started_at if needed.
+        """
+        answer = self._save_answer(answer_payload, question)
+        self._load_path()
         return answer
 
     def create_answers(self, answer_payloads, questions):
@@ -242,15 +261,20 @@ class SessionService:
         # Iterate through answer payloads and questions, validate them, collect
         # any error (messages), and cache them on SessionService (subclass).
         errors_by_uuid = {}
-        for answer_payload, question in zip(answer_payloads, questions):
-            try:
-                self.create_answer(answer_payload, question)
-            except (SessionExpired, SessionFrozen) as e:
-                # Expired sessions should raise not be possible to update
-                raise e
-            except django_validation_error as e:
-                # For validation errors we keep the error messages
-                errors_by_uuid[question.uuid] = e.message
+        try:
+            for answer_payload, question in zip(answer_payloads, questions):
+                try:
+                    self._save_answer(answer_payload, question)
+                except (SessionExpired, SessionFrozen) as e:
+                    # Expired sessions should raise not be possible to update
+                    raise e
+                except django_validation_error as e:
+                    # For validation errors we keep the error messages
+                    errors_by_uuid[question.uuid] = e.message
+        finally:
+            # The path through the QuestionGraph only needs to be determined
+            # once, after all answers were saved.
+            self._load_path()
 
         # Cache our validation errors so that these can be accessed through the
         # path_validation_errors property.
@@ -0,0 +1,46 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from signals.apps.questionnaires.models import Choice, Edge, Question, QuestionGraph
+from signals.apps.questionnaires.services.question_graph import invalidate_question_graphs
+
+
+@receiver(post_save, sender=Edge, dispatch_uid='questionnaires_edge_post_save')
+@receiver(post_delete, sender=Edge, dispatch_uid='questionnaires_edge_post_delete')
+def edge_changed_handler(sender, instance, **kwargs):
+    invalidate_question_graphs([instance.graph_id])
+
+
+@receiver(post_save, sender=QuestionGraph, dispatch_uid='questionnaires_question_graph_post_save')
+@receiver(post_delete, sender=QuestionGraph, dispatch_uid='questionnaires_question_graph_post_delete')
+def question_graph_changed_handler(sender, instance, **kwargs):
+    invalidate_question_graphs([instance.pk])
+
+
+# Deleting a Question or Choice sets the first_question of QuestionGraphs and the choice of Edges to NULL without
+# sending signals, so the QuestionGraphs involved are looked up before they are deleted.
+@receiver(post_save, sender=Question, dispatch_uid='questionnaires_question_post_save')
+@receiver(pre_delete, sender=Question, dispatch_uid='questionnaires_question_pre_delete')
+def question_changed_handler(sender, instance, created=False, **kwargs):
+    if created:
+        # A new question is not part of any QuestionGraph yet
+        return
+
+    graph_ids = set(Edge.objects.filter(
+        Q(question=instance) | Q(next_question=instance)
+    ).values_list('graph_id', flat=True))
+    graph_ids.update(QuestionGraph.objects.filter(first_question=instance).values_list('id', flat=True))
+    invalidate_question_graphs(graph_ids)
+
+
+@receiver(post_save, sender=Choice, dispatch_uid='questionnaires_choice_post_save')
+@receiver(pre_delete, sender=Choice, dispatch_uid='questionnaires_choice_pre_delete')
+def choice_changed_handler(sender, instance, created=False, **kwargs):
+    if created:
+        # A new choice is not used by any Edge yet
+        return
+
+    invalidate_question_graphs(Edge.objects.filter(choice=instance).values_list('graph_id', flat=True))
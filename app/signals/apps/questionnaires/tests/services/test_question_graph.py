@@ -1,10 +1,21 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2021 Gemeente Amsterdam
+# Copyright (C) 2021 - 2026 Gemeente Amsterdam
+from django.db import connection
 from django.test import TestCase
-from networkx import MultiDiGraph
-
-from signals.apps.questionnaires.services.question_graph import QuestionGraphService
+from django.test.utils import CaptureQueriesContext
+from networkx import MultiDiGraph, NetworkXError
+
+from signals.apps.questionnaires.factories import ChoiceFactory, QuestionFactory, SessionFactory
+from signals.apps.questionnaires.models import Edge
+from signals.apps.questionnaires.services.question_graph import (
+    QuestionGraphCache,
+    QuestionGraphService,
+    question_graph_cache,
+    question_graph_metrics
+)
+from signals.apps.questionnaires.services.session import SessionService
 from signals.apps.questionnaires.tests.test_models import create_diamond_plus
+from signals.instrumentation import instrument
 
 
 class TestQuestionGraphService(TestCase):
@@ -88,3 +99,115 @@ class TestQuestionGraphService(TestCase):
         self.assertEqual(len(endpoints_by_id), 1)
         question = list(endpoints_by_id.values())[0]
         self.assertEqual(question.analysis_key, 'q5')
+
+
+class TestQuestionGraphCache(TestCase):
+    def setUp(self):
+        question_graph_cache.reset()
+        question_graph_metrics.reset()
+
+    def test_compiled_graph_is_reused(self):
+        q_graph = create_diamond_plus()
+        QuestionGraphService(q_graph).refresh_from_db()
+
+        # Only the version stamp is looked up
+        service = QuestionGraphService(q_graph)
+        with instrument('test') as stats:
+            service.refresh_from_db()
+        self.assertEqual(stats.cache_hits, 1)
+        self.assertEqual(stats.cache_misses, 0)
+        self.assertEqual(len(service._questions_by_id), 7)
+        self.assertEqual(question_graph_metrics.get('misses'), 1)
+        self.assertEqual(question_graph_metrics.get('hits'), 1)
+
+    def test_compiled_graph_is_immutable(self):
+        q_graph = create_diamond_plus()
+        service = QuestionGraphService(q_graph)
+
+        with self.assertRaises(NetworkXError):
+            service.nx_graph.add_edge(1, 2)
+
+    def test_edge_change_invalidates(self):
+        q_graph = create_diamond_plus()
+        service = QuestionGraphService(q_graph)
+        self.assertEqual(len(service.reachable_questions), 5)
+
+        # Connect the unreachable part of the graph
+        endpoint = list(service.endpoint_questions.values())[0]
+        q6 = next(q for q in service.questions if q.analysis_key == 'q6')
+        Edge.objects.create(graph=q_graph, question=endpoint, next_question=q6)
+
+        service.refresh_from_db()
+        self.assertEqual(len(service.reachable_questions), 7)
+
+    def test_question_and_choice_change_invalidates(self):
+        q_graph = create_diamond_plus()
+        edge = Edge.objects.filter(graph=q_graph, question=q_graph.first_question).first()
+        choice = ChoiceFactory.create(question=q_graph.first_question, payload='yes', display='Yes')
+        edge.choice = choice
+        edge.save()
+
+        service = QuestionGraphService(q_graph)
+        service.refresh_from_db()
+        version = service._compiled.version
+
+        choice.display = 'Yes please'
+        choice.save()
+        service.refresh_from_db()
+        self.assertNotEqual(service._compiled.version, version)
+        self.assertEqual(service.nx_graph.edges[edge.question_id, edge.next_question_id, 0]['choice_payload_display'],
+                         'Yes please')
+
+        version = service._compiled.version
+        question = service.first_question
+        question.label = 'Changed label'
+        question.save()
+        service.refresh_from_db()
+        self.assertNotEqual(service._compiled.version, version)
+        self.assertEqual(service.first_question.label, 'Changed label')
+
+    def test_other_graphs_are_not_invalidated(self):
+        q_graph = create_diamond_plus()
+        other_q_graph = create_diamond_plus(graph_name='other')
+        service = QuestionGraphService(q_graph)
+        service.refresh_from_db()
+        version = service._compiled.version
+
+        Edge.objects.create(graph=other_q_graph, question=QuestionFactory.create(),
+                            next_question=QuestionFactory.create())
+
+        service.refresh_from_db()
+        self.assertEqual(service._compiled.version, version)
+
+    def test_least_recently_used_graph_is_evicted(self):
+        q_graph = create_diamond_plus()
+        other_q_graph = create_diamond_plus(graph_name='other')
+        graph_cache = QuestionGraphCache(max_size=1)
+
+        graph_cache.get(q_graph)
+        graph_cache.get(other_q_graph)
+        self.assertEqual(list(graph_cache._graphs), [other_q_graph.id])
+        self.assertEqual(question_graph_metrics.get('evictions'), 1)
+
+        graph_cache.get(q_graph)
+        self.assertEqual(question_graph_metrics.get('misses'), 3)
+
+    def test_create_answers_compiles_graph_once(self):
+        q_graph = create_diamond_plus()
+        session = SessionFactory.create(questionnaire__graph=q_graph)
+        service = SessionService(session)
+        service.refresh_from_db()
+
+        questions = service.path_questions
+        self.assertEqual(len(questions), 4)
+
+        # Saving the answers does not retrieve the answers or the QuestionGraph again
+        with CaptureQueriesContext(connection) as context:
+            service.create_answers(['answer'] * len(questions), questions)
+        sql = [query['sql'] for query in context.captured_queries]
+        self.assertFalse([query for query in sql if 'questionnaires_edge' in query])
+        self.assertFalse([query for query in sql if query.startswith('SELECT') and 'questionnaires_answer' in query])
+
+        self.assertEqual(question_graph_metrics.get('misses'), 1)
+        self.assertEqual(len(service.path_answered_question_uuids), 4)
+        self.assertTrue(service.can_freeze)
@@ -19,8 +19,10 @@ from signals.apps.reporting.csv.datawarehouse.signals import (
 from signals.apps.reporting.csv.datawarehouse.statusses import create_statuses_csv
 from signals.apps.reporting.csv.datawarehouse.tasks import (
     save_and_zip_csv_files_endpoint,
+    save_and_zip_csv_files_incremental_endpoint,
     save_csv_file_datawarehouse,
-    save_csv_files_datawarehouse
+    save_csv_files_datawarehouse,
+    save_csv_files_datawarehouse_incremental
 )
 
 __all__ = [
@@ -38,4 +40,6 @@ __all__ = [
     'save_csv_file_datawarehouse',
     'save_csv_files_datawarehouse',
     'save_and_zip_csv_files_endpoint',
+    'save_and_zip_csv_files_incremental_endpoint',
+    'save_csv_files_datawarehouse_incremental',
 ]
@@ -10,11 +10,12 @@ from signals.apps.reporting.csv.utils import queryset_to_csv_file, reorder_csv
 from signals.apps.signals.models import CategoryAssignment, ServiceLevelObjective
 
 
-def create_category_assignments_csv(location: str) -> str:
+def create_category_assignments_csv(location: str, row_filter: Q | None = None) -> str:
     """
     Create CSV file with all `CategoryAssignment` objects.
 
     :param location: Directory for saving the CSV file
+    :param row_filter: Only export the rows matching this filter
     :returns: Path to CSV file
     """
     queryset = CategoryAssignment.objects.values(
@@ -34,7 +35,7 @@ def create_category_assignments_csv(location: str) -> str:
         'id'
     )
 
-    csv_file = queryset_to_csv_file(queryset, os.path.join(location, 'categories.csv'))
+    csv_file = queryset_to_csv_file(queryset, os.path.join(location, 'categories.csv'), row_filter=row_filter)
 
     ordered_field_names = ['id', 'main', 'sub', 'departments', 'created_at', 'updated_at', 'extra_properties',
                            '_signal_id', 'deadline', 'deadline_factor_3', ]
@@ -43,11 +44,12 @@ def create_category_assignments_csv(location: str) -> str:
     return csv_file.name
 
 
-def create_category_sla_csv(location: str) -> str:
+def create_category_sla_csv(location: str, row_filter: Q | None = None) -> str:
     """
     Create CSV file with all `ServiceLevelObjective` objects.
 
     :param location: Directory for saving the CSV file
+    :param row_filter: Only export the rows matching this filter
     :returns: Path to CSV file
     """
     queryset = ServiceLevelObjective.objects.values(
@@ -62,7 +64,7 @@ def create_category_sla_csv(location: str) -> str:
         '-created_at'
     )
 
-    csv_file = queryset_to_csv_file(queryset, os.path.join(location, 'sla.csv'))
+    csv_file = queryset_to_csv_file(queryset, os.path.join(location, 'sla.csv'), row_filter=row_filter)
 
     ordered_field_names = ['id', 'main', 'sub', 'n_days', 'use_calendar_days', 'created_at', ]
     reorder_csv(csv_file.name, ordered_field_names)
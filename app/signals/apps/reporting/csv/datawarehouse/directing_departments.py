@@ -3,16 +3,18 @@
 import os
 
 from django.contrib.postgres.aggregates import StringAgg
+from django.db.models import Q
 
 from signals.apps.reporting.csv.utils import queryset_to_csv_file, reorder_csv
 from signals.apps.signals.models import SignalDepartments
 
 
-def create_directing_departments_csv(location: str) -> str:
+def create_directing_departments_csv(location: str, row_filter: Q | None = None) -> str:
     """
     Create CSV file with all `DirectingDepartments` objects.
 
     :param location: Directory for saving the CSV file
+    :param row_filter: Only export the rows matching this filter
     :returns: Path to CSV file
     """
     queryset = SignalDepartments.objects.values(
@@ -26,7 +28,8 @@ def create_directing_departments_csv(location: str) -> str:
         '-created_at',
     )
 
-    csv_file = queryset_to_csv_file(queryset, os.path.join(location, 'directing_departments.csv'))
+    csv_file = queryset_to_csv_file(queryset, os.path.join(location, 'directing_departments.csv'),
+                                    row_filter=row_filter)
 
     ordered_field_names = ['id', 'created_at', 'updated_at', '_signal_id', 'departments', ]
     reorder_csv(csv_file.name, ordered_field_names)
@@ -0,0 +1,263 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+"""
+Incremental (change-data) export of the Datawarehouse CSV files.
+
+Every table has a high-water mark field (updated_at, created_at, submitted_at, id, ...). The highest exported value is
+stored per table, the next export only contains the rows with a higher value, written to a delta file. The lower
+bound of a timestamp mark is moved back by DWH_INCREMENTAL_OVERLAP_SECONDS so that rows committed late by a long
+running transaction are not missed, consumers must therefore upsert the delta rows by their id.
+
+Changes that do not touch the high-water mark field (for example changing the departments of a directing departments
+relation) are not part of a delta. A periodic full export is used for reconciliation.
+"""
+import csv
+import json
+import logging
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Iterable
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Max, Model, Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from signals.apps.feedback.models import Feedback
+from signals.apps.reporting.csv.datawarehouse.categories import (
+    create_category_assignments_csv,
+    create_category_sla_csv
+)
+from signals.apps.reporting.csv.datawarehouse.directing_departments import (
+    create_directing_departments_csv
+)
+from signals.apps.reporting.csv.datawarehouse.kto_feedback import create_kto_feedback_csv
+from signals.apps.reporting.csv.datawarehouse.locations import create_locations_csv
+from signals.apps.reporting.csv.datawarehouse.reporters import create_reporters_csv
+from signals.apps.reporting.csv.datawarehouse.signals import (
+    create_signals_assigned_user_csv,
+    create_signals_csv,
+    create_signals_notes_csv,
+    create_signals_routing_departments_csv
+)
+from signals.apps.reporting.csv.datawarehouse.statusses import create_statuses_csv
+from signals.apps.reporting.csv.utils import save_csv_files
+from signals.apps.reporting.models import DatawarehouseHighWaterMark
+from signals.apps.signals.models import (
+    CategoryAssignment,
+    Location,
+    Note,
+    Reporter,
+    ServiceLevelObjective,
+    Signal,
+    SignalDepartments,
+    Status
+)
+
+logger = logging.getLogger(__name__)
+
+MODE_FULL = 'full'
+MODE_DELTA = 'delta'
+
+
+@dataclass(frozen=True)
+class DatawarehouseTable:
+    name: str
+    func: Callable[..., str]
+    model: type[Model]
+    high_water_mark: str
+
+
+DATAWAREHOUSE_TABLES = (
+    DatawarehouseTable('signals', create_signals_csv, Signal, 'updated_at'),
+    DatawarehouseTable('signals_assigned_user', create_signals_assigned_user_csv, Signal,
+                       'user_assignment__created_at'),
+    DatawarehouseTable('locations', create_locations_csv, Location, 'updated_at'),
+    DatawarehouseTable('reporters', create_reporters_csv, Reporter, 'updated_at'),
+    DatawarehouseTable('category_assignments', create_category_assignments_csv, CategoryAssignment, 'updated_at'),
+    DatawarehouseTable('statusses', create_statuses_csv, Status, 'updated_at'),
+    DatawarehouseTable('category_sla', create_category_sla_csv, ServiceLevelObjective, 'created_at'),
+    DatawarehouseTable('feedback', create_kto_feedback_csv, Feedback, 'submitted_at'),
+    DatawarehouseTable('directing_departments', create_directing_departments_csv, SignalDepartments, 'updated_at'),
+    DatawarehouseTable('routing_departments', create_signals_routing_departments_csv, SignalDepartments, 'updated_at'),
+    DatawarehouseTable('notes', create_signals_notes_csv, Note, 'updated_at'),
+)
+
+
+@dataclass
+class TableExport:
+    table: str
+    mode: str
+    high_water_mark_field: str
+    high_water_mark_from: str | None
+    high_water_mark_to: str | None
+    csv_file: str | None = None
+    rows: int = 0
+
+
+def _serialize_mark(value: datetime | int) -> str:
+    return value.isoformat() if isinstance(value, datetime) else str(value)
+
+
+def _parse_mark(value: str) -> datetime | int:
+    return parse_datetime(value) or int(value)
+
+
+def _count_rows(csv_file_path: str) -> int:
+    with open(csv_file_path, 'r') as csv_file:
+        return max(sum(1 for _ in csv.reader(csv_file)) - 1, 0)
+
+
+def export_table(table: DatawarehouseTable, location: str, previous_mark: str | None = None,
+                 full: bool = False) -> TableExport:
+    """
+    Export the rows of the table changed since the previous high-water mark, or all rows when there is no previous
+    high-water mark or a full export is requested.
+
+    :param table: DatawarehouseTable
+    :param location: Directory for saving the CSV file
+    :param previous_mark: The high-water mark of the previous export
+    :param full: Export all rows
+    :returns: TableExport
+    """
+    full = full or previous_mark is None
+    export = TableExport(
+        table=table.name,
+        mode=MODE_FULL if full else MODE_DELTA,
+        high_water_mark_field=table.high_water_mark,
+        high_water_mark_from=None if full else previous_mark,
+        high_water_mark_to=previous_mark,
+    )
+
+    upper = table.model.objects.aggregate(mark=Max(table.high_water_mark))['mark']
+    if upper is None or (not full and upper <= _parse_mark(previous_mark)):
+        # Nothing changed since the previous export
+        return export
+
+    row_filter = None
+    if not full:
+        lower = _parse_mark(previous_mark)
+        if isinstance(lower, datetime):
+            lower -= timedelta(seconds=settings.DWH_INCREMENTAL_OVERLAP_SECONDS)
+        row_filter = Q(**{f'{table.high_water_mark}__gt': lower, f'{table.high_water_mark}__lte': upper})
+
+    csv_file = table.func(location, row_filter=row_filter)
+    if not full:
+        delta_file = f'{csv_file[:-4]}_delta.csv'
+        os.rename(csv_file, delta_file)
+        csv_file = delta_file
+
+    export.csv_file = csv_file
+    export.rows = _count_rows(csv_file)
+    export.high_water_mark_to = _serialize_mark(upper)
+    return export
+
+
+def _export_table_in_thread(table: DatawarehouseTable, location: str, previous_mark: str | None,
+                            full: bool) -> TableExport | None:
+    try:
+        return export_table(table, location, previous_mark, full)
+    except EnvironmentError as e:
+        logger.warning(f'Skipped the {table.name} table: {e}')
+        return None
+    finally:
+        # Every thread has its own database connection
+        connections.close_all()
+
+
+def export_tables(location: str, tables: Iterable[DatawarehouseTable] = DATAWAREHOUSE_TABLES, full: bool = False,
+                  workers: int | None = None) -> list[TableExport]:
+    """
+    Export the tables, the tables are independent so they are exported in parallel.
+
+    :param location: Directory for saving the CSV files
+    :param tables: The tables to export
+    :param full: Export all rows of the tables
+    :param workers: Number of tables exported at the same time, defaults to DWH_EXPORT_WORKERS
+    :returns: list of TableExport
+    """
+    marks = dict(DatawarehouseHighWaterMark.objects.values_list('table', 'value'))
+    workers = workers or settings.DWH_EXPORT_WORKERS
+
+    if workers <= 1:
+        exports = []
+        for table in tables:
+            try:
+                exports.append(export_table(table, location, marks.get(table.name), full))
+            except EnvironmentError as e:
+                logger.warning(f'Skipped the {table.name} table: {e}')
+        return exports
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_export_table_in_thread, table, location, marks.get(table.name), full)
+            for table in tables
+        ]
+        exports = [future.result() for future in futures]
+    return [export for export in exports if export]
+
+
+def write_manifest(location: str, exports: list[TableExport], stored_files: dict[str, str]) -> str:
+    """
+    Write the manifest describing the exported files.
+
+    :param location: Directory for saving the manifest
+    :param exports: The exported tables
+    :param stored_files: The name of every exported CSV file on the storage backend
+    :returns: Path to the manifest
+    """
+    tables = []
+    for export in exports:
+        table = asdict(export)
+        table['csv_file'] = stored_files.get(export.csv_file)
+        tables.append(table)
+
+    manifest = {
+        'generated_at': timezone.now().isoformat(),
+        'mode': MODE_FULL if all(export.mode == MODE_FULL for export in exports) else MODE_DELTA,
+        'tables': tables,
+    }
+
+    manifest_file = os.path.join(location, 'manifest.json')
+    with open(manifest_file, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest_file
+
+
+def save_high_water_marks(exports: list[TableExport]) -> None:
+    """
+    Store the high-water marks, only to be called once the exported files are saved.
+    """
+    for export in exports:
+        if export.high_water_mark_to is not None:
+            DatawarehouseHighWaterMark.objects.update_or_create(
+                table=export.table,
+                defaults={'value': export.high_water_mark_to},
+            )
+
+
+def save_incremental_export(using: str = 'datawarehouse', tables: Iterable[DatawarehouseTable] = DATAWAREHOUSE_TABLES,
+                            full: bool = False) -> tuple[list[TableExport], list[str]]:
+    """
+    Export the tables, save the CSV files and the manifest on the storage backend and store the new high-water marks.
+
+    :param using:
+    :param tables: The tables to export
+    :param full: Export all rows of the tables
+    :returns: The exported tables and the names of the saved files
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        exports = export_tables(tmp_dir, tables=tables, full=full)
+
+        csv_files = [export.csv_file for export in exports if export.csv_file]
+        stored_files = save_csv_files(csv_files=csv_files, using=using)
+
+        manifest_file = write_manifest(tmp_dir, exports, dict(zip(csv_files, stored_files)))
+        stored_files.extend(save_csv_files(csv_files=[manifest_file], using=using))
+
+    save_high_water_marks(exports)
+    return exports, stored_files
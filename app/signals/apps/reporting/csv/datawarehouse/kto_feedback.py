@@ -2,18 +2,19 @@
 # Copyright (C) 2020 - 2023 Gemeente Amsterdam
 import os
 
-from django.db.models import CharField, F, Func, TextField, Value
+from django.db.models import CharField, F, Func, Q, TextField, Value
 from django.db.models.functions import Cast, Coalesce, NullIf
 
 from signals.apps.feedback.models import Feedback
 from signals.apps.reporting.csv.utils import map_choices, queryset_to_csv_file, reorder_csv
 
 
-def create_kto_feedback_csv(location: str) -> str:
+def create_kto_feedback_csv(location: str, row_filter: Q | None = None) -> str:
     """
     Create CSV file with all `Feedback` objects.
 
     :param location: Directory for saving the CSV file
+    :param row_filter: Only export the rows matching this filter
     :returns: Path to CSV file
     """
     environment = os.getenv('ENVIRONMENT')
@@ -40,7 +41,7 @@ def create_kto_feedback_csv(location: str) -> str:
                         function_kwargs={'indent': 4, 'ensure_ascii': False}),
     ).filter(submitted_at__isnull=False)
 
-    csv_file = queryset_to_csv_file(queryset, os.path.join(location, file_name))
+    csv_file = queryset_to_csv_file(queryset, os.path.join(location, file_name), row_filter=row_filter)
 
     ordered_field_names = ['_signal_id', 'is_satisfied', 'allows_contact', 'text',
                            'text_extra', 'created_at', 'submitted_at', 'text_list']
@@ -2,18 +2,19 @@
 # Copyright (C) 2020 - 2021 Gemeente Amsterdam
 import os
 
-from django.db.models import CharField, ExpressionWrapper, FloatField, Func, Value
+from django.db.models import CharField, ExpressionWrapper, FloatField, Func, Q, Value
 from django.db.models.functions import Cast, Coalesce
 
 from signals.apps.reporting.csv.utils import map_choices, queryset_to_csv_file, reorder_csv
 from signals.apps.signals.models import STADSDELEN, Location
 
 
-def create_locations_csv(location: str) -> str:
+def create_locations_csv(location: str, row_filter: Q | None = None) -> str:
     """
     Create CSV file with all `Location` objects.
 
     :param location: Directory for saving the CSV file
+    :param row_filter: Only export the rows matching this filter
     :returns: Path to CSV file
     """
     queryset = Location.objects.values(
@@ -43,7 +44,7 @@ def create_locations_csv(location: str) -> str:
         'id'
     )
 
-    csv_file = queryset_to_csv_file(queryset, os.path.join(location, 'locations.csv'))
+    csv_file = queryset_to_csv_file(queryset, os.path.join(location, 'locations.csv'), row_filter=row_filter)
 
     ordered_field_names = ['id', 'lat', 'lng', 'stadsdeel', 'buurt_code', 'address', 'address_text', 'created_at',
                            'updated_at', 'extra_properties', '_signal_id', 'address_street', 'address_number',
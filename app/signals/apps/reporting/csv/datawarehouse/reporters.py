@@ -8,11 +8,12 @@ from signals.apps.reporting.csv.utils import map_choices, queryset_to_csv_file,
 from signals.apps.signals.models import Reporter
 
 
-def create_reporters_csv(location: str) -> str:
+def create_reporters_csv(location: str, row_filter: Q | None = None) -> str:
     """
     Create CSV file with all `Reporter` objects.
 
     :param location: Directory for saving the CSV file
+    :param row_filter: Only export the rows matching this filter
     :returns: Path to CSV file
     """
     queryset = Reporter.objects.annotate(
@@ -42,7 +43,7 @@ def create_reporters_csv(location: str) -> str:
         _is_anonymized=map_choices('is_anonymized', [(True, 'True'), (False, 'False')]),
     )
 
-    csv_file = queryset_to_csv_file(queryset, os.path.join(location, 'reporters.csv'))
+    csv_file = queryset_to_csv_file(queryset, os.path.join(location, 'reporters.csv'), row_filter=row_filter)
 
     ordered_field_names = ['id', 'email', 'phone', 'is_anonymized', 'created_at', 'updated_at', 'extra_properties',
                            '_signal_id', ]
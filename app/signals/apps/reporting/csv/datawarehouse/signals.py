@@ -7,7 +7,7 @@ import logging
 import os
 
 from django.contrib.postgres.aggregates import StringAgg
-from django.db.models import CharField, F, Value
+from django.db.models import CharField, F, Q, Value
 from django.db.models.functions import Cast, Coalesce
 
 from signals.apps.reporting.csv.utils import queryset_to_csv_file, reorder_csv
@@ -16,11 +16,12 @@ from signals.apps.signals.models import Note, Signal, SignalDepartments
 logger = logging.getLogger(__name__)
 
 
-def create_signals_csv(location: str) -> str:
+def create_signals_csv(location: str, row_filter: Q | None = None) -> str:
     """
     Create the CSV file with all `Signal` objects.
 
     :param location: Directory for saving the CSV file
+    :param row_filter: Only export the rows matching this filter
     :returns: Path to CSV file
     """
     queryset = Signal.objects.annotate(
@@ -55,7 +56,7 @@ def create_signals_csv(location: str) -> str:
                                    Value('null', output_field=CharField()))
     ).order_by('created_at')
 
-    csv_file = queryset_to_csv_file(queryset, os.path.join(location, 'signals.csv'))
+    csv_file = queryset_to_csv_file(queryset, os.path.join(location, 'signals.csv'), row_filter=row_filter)
 
     ordered_field_names = ['id', 'signal_uuid', 'source', 'text', 'text_extra', 'incident_date_start',
                            'incident_date_end', 'created_at', 'updated_at', 'operational_date', 'expire_date', 'image',
@@ -67,11 +68,12 @@ def create_signals_csv(location: str) -> str:
     return csv_file.name
 
 
-def create_signals_assigned_user_csv(location: str) -> str:
+def create_signals_assigned_user_csv(location: str, row_filter: Q | None = None) -> str:
     """
     Create the CSV file with all `Signal - assigned user relation` objects.
 
     :param location: Directory for saving the CSV file
+    :param row_filter: Only export the rows matching this filter
     :returns: Path to CSV file
     """
     queryset = Signal.objects.annotate(
@@ -82,7 +84,8 @@ def create_signals_assigned_user_csv(location: str) -> str:
         assigned_at=F('user_assignment__created_at')
     ).exclude(user_assignment__user__isnull=True).exclude(user_assignment__user__email__exact='').order_by('created_at')
 
-    csv_file = queryset_to_csv_file(queryset, os.path.join(location, 'signals_assigned_user.csv'))
+    csv_file = queryset_to_csv_file(queryset, os.path.join(location, 'signals_assigned_user.csv'),
+                                    row_filter=row_filter)
 
     ordered_field_names = ['id', 'assigned_to', 'assigned_at']
     reorder_csv(csv_file.name, ordered_field_names)
@@ -90,11 +93,12 @@ def create_signals_assigned_user_csv(location: str) -> str:
     return csv_file.name
 
 
-def create_signals_routing_departments_csv(location: str) -> str:
+def create_signals_routing_departments_csv(location: str, row_filter: Q | None = None) -> str:
     """
     Create the CSV file with all `Signal - department relation (filled by routing rules)` objects.
 
     :param location: Directory for saving the CSV file
+    :param row_filter: Only export the rows matching this filter
     :returns: Path to CSV file
     """
     queryset = SignalDepartments.objects.values(
@@ -108,7 +112,7 @@ def create_signals_routing_departments_csv(location: str) -> str:
         '-created_at',
     )
 
-    csv_file = queryset_to_csv_file(queryset, os.path.join(location, 'routing_departments.csv'))
+    csv_file = queryset_to_csv_file(queryset, os.path.join(location, 'routing_departments.csv'), row_filter=row_filter)
 
     ordered_field_names = ['id', 'created_at', 'updated_at', '_signal_id', 'departments', ]
     reorder_csv(csv_file.name, ordered_field_names)
@@ -116,11 +120,12 @@ def create_signals_routing_departments_csv(location: str) -> str:
     return csv_file.name
 
 
-def create_signals_notes_csv(location: str) -> str:
+def create_signals_notes_csv(location: str, row_filter: Q | None = None) -> str:
     """
     Create the CSV file with all `Signal - notes relation` objects.
 
     :param location: Directory for saving the CSV file
+    :param row_filter: Only export the rows matching this filter
     :returns: Path to CSV file
     """
     queryset = Note.objects.values(
@@ -134,7 +139,7 @@ def create_signals_notes_csv(location: str) -> str:
         '-created_at',
     )
 
-    csv_file = queryset_to_csv_file(queryset, os.path.join(location, 'notes.csv'))
+    csv_file = queryset_to_csv_file(queryset, os.path.join(location, 'notes.csv'), row_filter=row_filter)
 
     ordered_field_names = ['id', 'created_at', 'updated_at', '_signal_id', 'text']
     reorder_csv(csv_file.name, ordered_field_names)
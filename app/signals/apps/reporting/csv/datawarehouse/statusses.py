@@ -2,7 +2,7 @@
 # Copyright (C) 2020 - 2021 Gemeente Amsterdam
 import os
 
-from django.db.models import CharField, Value
+from django.db.models import CharField, Q, Value
 from django.db.models.functions import Cast, Coalesce
 
 from signals.apps.reporting.csv.utils import map_choices, queryset_to_csv_file, reorder_csv
@@ -10,11 +10,12 @@ from signals.apps.signals.models import Status
 from signals.apps.signals.workflow import STATUS_CHOICES
 
 
-def create_statuses_csv(location: str) -> str:
+def create_statuses_csv(location: str, row_filter: Q | None = None) -> str:
     """
     Create CSV file with all `Status` objects.
 
     :param location: Directory for saving the CSV file
+    :param row_filter: Only export the rows matching this filter
     :returns: Path to CSV file
     """
     queryset = Status.objects.values(
@@ -32,7 +33,7 @@ def create_statuses_csv(location: str) -> str:
                                    Value('null', output_field=CharField()))
     )
 
-    csv_file = queryset_to_csv_file(queryset, os.path.join(location, 'statuses.csv'))
+    csv_file = queryset_to_csv_file(queryset, os.path.join(location, 'statuses.csv'), row_filter=row_filter)
 
     ordered_field_names = ['id', 'text', 'user', 'target_api', 'state_display', 'extern', 'created_at', 'updated_at',
                            'extra_properties', '_signal_id', 'state', ]
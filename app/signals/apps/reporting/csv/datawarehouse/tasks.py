@@ -10,6 +10,7 @@ from signals.apps.reporting.csv.datawarehouse.categories import (
 from signals.apps.reporting.csv.datawarehouse.directing_departments import (
     create_directing_departments_csv
 )
+from signals.apps.reporting.csv.datawarehouse.incremental import save_incremental_export
 from signals.apps.reporting.csv.datawarehouse.kto_feedback import create_kto_feedback_csv
 from signals.apps.reporting.csv.datawarehouse.locations import create_locations_csv
 from signals.apps.reporting.csv.datawarehouse.reporters import create_reporters_csv
@@ -70,6 +71,20 @@ def save_csv_files_datawarehouse(using: str = 'datawarehouse') -> list[str]:
     return csv_files
 
 
+@app.task
+def save_csv_files_datawarehouse_incremental(using: str = 'datawarehouse', full: bool = False) -> list[str]:
+    """
+    Create delta CSV files for Datawarehouse, containing the rows created or changed since the previous export, and a
+    manifest describing them. Save them on the storage backend.
+
+    :param using:
+    :param full: Export all rows of all tables (a snapshot for reconciliation) and reset the high-water marks
+    :returns: list of files
+    """
+    _, stored_files = save_incremental_export(using=using, full=full)
+    return stored_files
+
+
 @app.task
 def zip_csv_files_endpoint(files: list[str]) -> None:
     """
@@ -92,6 +107,18 @@ def save_and_zip_csv_files_endpoint(max_csv_amount: int = 30) -> None:
     rotate_zip_files(using='datawarehouse', max_csv_amount=max_csv_amount)
 
 
+@app.task
+def save_and_zip_csv_files_incremental_endpoint(max_csv_amount: int = 30, full: bool = False) -> None:
+    """
+    Create zip file of the delta csv files and the manifest
+
+    :returns:
+    """
+    created_files = save_csv_files_datawarehouse_incremental(using='datawarehouse', full=full)
+    zip_csv_files(files_to_zip=created_files, using='datawarehouse')
+    rotate_zip_files(using='datawarehouse', max_csv_amount=max_csv_amount)
+
+
 @app.task
 def task_clean_datawarehouse_disk() -> None:
     """
@@ -9,7 +9,7 @@ from glob import glob
 from typing import TextIO
 
 from django.db import connection
-from django.db.models import Case, CharField, QuerySet, Value, When
+from django.db.models import Case, CharField, Q, QuerySet, Value, When
 from django.utils import timezone
 from storages.backends.azure_storage import AzureStorage
 
@@ -85,7 +85,7 @@ def save_csv_files(csv_files: list, using: str, path: str | None = None) -> list
     return stored_csv
 
 
-def queryset_to_csv_file(queryset: QuerySet, csv_file_path: str) -> TextIO:
+def queryset_to_csv_file(queryset: QuerySet, csv_file_path: str, row_filter: Q | None = None) -> TextIO:
     """
     Creates the CSV file based on the given queryset and stores it in the given csv file path
 
@@ -94,8 +94,12 @@ def queryset_to_csv_file(queryset: QuerySet, csv_file_path: str) -> TextIO:
 
     :param queryset:
     :param csv_file_path:
+    :param row_filter: Only export the rows matching this filter (used by the incremental export)
     :return TextIO:
     """
+    if row_filter is not None:
+        queryset = queryset.filter(row_filter)
+
     sql, params = queryset.query.sql_with_params()
     sql = f"COPY ({sql}) TO STDOUT WITH (FORMAT CSV, HEADER, DELIMITER E',')"
     sql = sql.replace('AS "_', 'AS "')
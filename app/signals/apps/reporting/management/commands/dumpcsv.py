@@ -13,6 +13,10 @@ from signals.apps.reporting.csv.datawarehouse.categories import (
 from signals.apps.reporting.csv.datawarehouse.directing_departments import (
     create_directing_departments_csv
 )
+from signals.apps.reporting.csv.datawarehouse.incremental import (
+    DATAWAREHOUSE_TABLES,
+    save_incremental_export
+)
 from signals.apps.reporting.csv.datawarehouse.kto_feedback import create_kto_feedback_csv
 from signals.apps.reporting.csv.datawarehouse.locations import create_locations_csv
 from signals.apps.reporting.csv.datawarehouse.reporters import create_reporters_csv
@@ -50,6 +54,10 @@ class Command(BaseCommand):
                             help=f'Report type to export (if none given all reports will be exported), '
                                  f'choices are: {", ".join(REPORT_OPTIONS.keys())}')
         parser.add_argument("--zip", action="store_true", dest='zip', help="Also output zip file.")
+        parser.add_argument('--incremental', action='store_true', dest='incremental',
+                            help='Only export the rows created or changed since the previous incremental export')
+        parser.add_argument('--full', action='store_true', dest='full',
+                            help='Together with --incremental, export all rows and reset the high-water marks')
 
     def handle(self, *args, **kwargs):
         start = timer()
@@ -69,12 +77,15 @@ class Command(BaseCommand):
 
         reports = set(reports)
         self.stdout.write(f'* Export: {", ".join(reports)}')
-        csv_files = list()
-        for report in reports:
-            self.stdout.write(f'* Exporting: {report}')
-            func = REPORT_OPTIONS[report]
-            csv_files.extend(save_csv_file_datawarehouse(func))
-            self.stdout.write('* ---------------------------------')
+        if kwargs['incremental']:
+            csv_files = self._export_incremental(reports, full=kwargs['full'])
+        else:
+            csv_files = list()
+            for report in reports:
+                self.stdout.write(f'* Exporting: {report}')
+                func = REPORT_OPTIONS[report]
+                csv_files.extend(save_csv_file_datawarehouse(func))
+                self.stdout.write('* ---------------------------------')
 
         if kwargs['zip']:
             self.stdout.write('* Making zipfile...')
@@ -83,3 +94,13 @@ class Command(BaseCommand):
         stop = timer()
         self.stdout.write(f'Time: {stop - start:.2f} second(s)')
         self.stdout.write('Done!')
+
+    def _export_incremental(self, reports, full=False):
+        tables = [table for table in DATAWAREHOUSE_TABLES if table.name in reports]
+        exports, stored_files = save_incremental_export(using='datawarehouse', tables=tables, full=full)
+        for export in exports:
+            self.stdout.write(f'* Exported: {export.table} ({export.mode}, {export.rows} rows, '
+                              f'{export.high_water_mark_field} {export.high_water_mark_from} - '
+                              f'{export.high_water_mark_to})')
+        self.stdout.write('* ---------------------------------')
+        return stored_files
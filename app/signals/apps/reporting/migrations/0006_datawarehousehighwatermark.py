@@ -0,0 +1,25 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reporting', '0005_alter_horecacsvexport_uploaded_file'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DatawarehouseHighWaterMark',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('table', models.CharField(max_length=64, unique=True)),
+                ('value', models.CharField(max_length=64)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ('table',),
+            },
+        ),
+    ]
@@ -1,9 +1,11 @@
 # SPDX-License-Identifier: MPL-2.0
 # Copyright (C) 2019 - 2021 Gemeente Amsterdam
+from signals.apps.reporting.models.datawarehouse import DatawarehouseHighWaterMark
 from signals.apps.reporting.models.export import HorecaCSVExport
 from signals.apps.reporting.models.tdo import TDOSignal
 
 __all__ = [
+    'DatawarehouseHighWaterMark',
     'HorecaCSVExport',
     'TDOSignal',
 ]
@@ -0,0 +1,19 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from django.contrib.gis.db import models
+
+
+class DatawarehouseHighWaterMark(models.Model):
+    """
+    The high-water mark of a table in the incremental Datawarehouse export. Rows up to and including this value of the
+    high-water mark field (updated_at, created_at, id, ...) have been exported.
+    """
+    table = models.CharField(max_length=64, unique=True)
+    value = models.CharField(max_length=64)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ('table', )
+
+    def __str__(self):
+        return f'{self.table}: {self.value}'
@@ -428,3 +428,76 @@ class TestFeedbackHandling(testcases.TestCase):
                 self.assertEqual(row['text'], self.feedback_submitted.text)
 
             self.assertEqual(i, 0)
+
+
+@override_settings(DWH_EXPORT_WORKERS=1, DWH_INCREMENTAL_OVERLAP_SECONDS=0)
+class TestIncrementalDatawarehouse(testcases.TestCase):
+    def setUp(self):
+        self.file_backend_tmp_dir = tempfile.mkdtemp()
+
+        with freeze_time('2020-09-10T12:00:00+00:00'):
+            self.signals = SignalFactory.create_batch(3)
+
+    def tearDown(self):
+        shutil.rmtree(self.file_backend_tmp_dir)
+
+    def _read_manifest(self, day_folder, stored_files):
+        manifest_file = next(file for file in stored_files if file.endswith('manifest.json'))
+        with open(path.join(self.file_backend_tmp_dir, day_folder, manifest_file)) as f:
+            return {table['table']: table for table in json.load(f)['tables']}
+
+    @mock.patch.dict('os.environ', {}, clear=True)
+    @mock.patch('signals.apps.reporting.csv.utils._get_storage_backend')
+    def test_incremental_export(self, mocked_get_storage_backend):
+        mocked_get_storage_backend.return_value = FileSystemStorage(location=self.file_backend_tmp_dir)
+
+        # Without high-water marks all rows are exported
+        with freeze_time('2020-09-10T13:00:00+00:00'):
+            stored_files = datawarehouse.save_csv_files_datawarehouse_incremental()
+
+        manifest = self._read_manifest('2020/09/10', stored_files)
+        self.assertEqual(manifest['signals']['mode'], 'full')
+        self.assertEqual(manifest['signals']['rows'], 3)
+        self.assertEqual(manifest['signals']['csv_file'], '130000UTC_signals.csv')
+        self.assertNotIn('feedback', manifest)  # The ENVIRONMENT is not set
+
+        # Only the changed signal is part of the delta
+        with freeze_time('2020-09-11T12:00:00+00:00'):
+            self.signals[0].text = 'Changed'
+            self.signals[0].save()
+
+        with freeze_time('2020-09-11T13:00:00+00:00'):
+            stored_files = datawarehouse.save_csv_files_datawarehouse_incremental()
+
+        manifest = self._read_manifest('2020/09/11', stored_files)
+        self.assertEqual(manifest['signals']['mode'], 'delta')
+        self.assertEqual(manifest['signals']['rows'], 1)
+        self.assertEqual(manifest['signals']['csv_file'], '130000UTC_signals_delta.csv')
+        self.assertIsNone(manifest['locations']['csv_file'])
+        self.assertEqual(manifest['locations']['rows'], 0)
+
+        with open(path.join(self.file_backend_tmp_dir, '2020/09/11', '130000UTC_signals_delta.csv')) as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['id'], str(self.signals[0].id))
+        self.assertEqual(rows[0]['text'], 'Changed')
+
+        # A full export ignores the high-water marks
+        with freeze_time('2020-09-12T13:00:00+00:00'):
+            stored_files = datawarehouse.save_csv_files_datawarehouse_incremental(full=True)
+
+        manifest = self._read_manifest('2020/09/12', stored_files)
+        self.assertEqual(manifest['signals']['mode'], 'full')
+        self.assertEqual(manifest['signals']['rows'], 3)
+
+    @mock.patch.dict('os.environ', {}, clear=True)
+    @mock.patch('signals.apps.reporting.csv.utils._get_storage_backend')
+    @freeze_time('2020-09-10T13:00:00+00:00')
+    def test_save_and_zip_incremental_endpoint(self, mocked_get_storage_backend):
+        mocked_get_storage_backend.return_value = FileSystemStorage(location=self.file_backend_tmp_dir)
+
+        datawarehouse.save_and_zip_csv_files_incremental_endpoint()
+
+        zip_package = path.join(self.file_backend_tmp_dir, '2020/09/10', '20200910_130000UTC.zip')
+        self.assertTrue(path.getsize(zip_package))
+        self.assertTrue(path.exists(path.join(self.file_backend_tmp_dir, '2020/09/10', '130000UTC_manifest.json')))
@@ -0,0 +1,251 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+"""
+Streaming bulk indexing of a queryset into Elasticsearch.
+
+The queryset is scanned in primary key ranges (keyset scanning) instead of offset slices, every range is loaded with
+its select/prefetch related lookups in one go and serialized to bulk actions. Serialization happens either in the
+current process or in a pool of worker processes, the actions are sent to Elasticsearch by `parallel_bulk`.
+
+After every range that is acknowledged by Elasticsearch the last primary key can be stored in a `Checkpoint`, an
+interrupted run can be resumed from there.
+"""
+import json
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional
+
+from django.db import connections
+from elasticsearch.helpers import parallel_bulk
+
+from signals.apps.search.settings import app_settings
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class BulkIndexStats:
+    """
+    Number of documents indexed in this run and the time it took, `total` includes the documents of resumed runs.
+    """
+    indexed: int = 0
+    elapsed: float = 0.0
+    total: int = 0
+
+    @property
+    def docs_per_second(self) -> float:
+        return self.indexed / self.elapsed if self.elapsed else 0.0
+
+
+class Checkpoint:
+    """
+    Progress of a bulk index run, stored as JSON in a file.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self.data = self._load()
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def update(self, **kwargs) -> None:
+        self.data.update(kwargs)
+
+        # Write to a temporary file first, so an interrupted write never leaves a corrupt checkpoint behind
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.data, f)
+        os.replace(tmp_path, self.path)
+
+    def clear(self) -> None:
+        self.data = {}
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def serialize_range(document, queryset, index: Optional[str], low: Optional[int], high: int) -> list[dict]:
+    """
+    Serialize all objects with a primary key in the range (low, high] to bulk actions.
+    """
+    qs = queryset.filter(pk__lte=high)
+    if low is not None:
+        qs = qs.filter(pk__gt=low)
+
+    actions = []
+    # Evaluating the queryset as a whole (instead of using iterator()) makes the prefetch_related lookups work
+    for obj in qs.order_by('pk'):
+        action = document.create_document(obj).create_document_dict()
+        if index:
+            action['_index'] = index
+        actions.append(action)
+    return actions
+
+
+# State of a worker process, set by the initializer of the pool
+_worker_document = None
+_worker_queryset = None
+
+
+def _init_worker(document, queryset) -> None:
+    global _worker_document, _worker_queryset
+
+    # A forked worker must not use the database connections inherited from its parent, dropping them (without closing,
+    # which would also close them for the parent) makes the worker open its own
+    for connection in connections.all():
+        connection.connection = None
+
+    _worker_document = document
+    _worker_queryset = queryset
+
+
+def _serialize_range_in_worker(index: Optional[str], low: Optional[int], high: int) -> list[dict]:
+    return serialize_range(_worker_document, _worker_queryset, index, low, high)
+
+
+class BulkIndexer:
+    """
+    Index all objects in a queryset into Elasticsearch.
+
+    :param document: the Document class, must implement `create_document(obj)`
+    :param queryset: the objects to index, the ordering is ignored
+    :param using: the Elasticsearch connection alias
+    :param index: the index to write to, the index of the document is used if not provided
+    :param chunk_size: number of documents per bulk request
+    :param thread_count: number of concurrent bulk requests
+    :param workers: number of processes serializing documents, 0 or 1 serializes in the current process
+    :param scan_size: number of objects per primary key range
+    :param checkpoint: Checkpoint to resume from and to store progress in
+    :param progress: callable that receives the BulkIndexStats at most every `progress_interval` seconds
+    """
+    def __init__(self, document, queryset, using: Optional[str] = None, index: Optional[str] = None,
+                 chunk_size: Optional[int] = None, thread_count: Optional[int] = None, workers: Optional[int] = None,
+                 scan_size: Optional[int] = None, checkpoint: Optional[Checkpoint] = None,
+                 progress: Optional[Callable[[BulkIndexStats], None]] = None, progress_interval: float = 10.0):
+        bulk_settings = app_settings.BULK
+
+        self.document = document
+        self.queryset = queryset
+        self.using = using
+        self.index = index
+        self.chunk_size = chunk_size or bulk_settings['CHUNK_SIZE']
+        self.thread_count = thread_count or bulk_settings['THREAD_COUNT']
+        self.workers = workers if workers is not None else bulk_settings['WORKERS']
+        self.scan_size = scan_size or bulk_settings['SCAN_SIZE']
+        self.checkpoint = checkpoint
+        self.progress = progress
+        self.progress_interval = progress_interval
+
+    def _next_boundary(self, low: Optional[int]) -> Optional[int]:
+        """
+        Returns the highest primary key of the range starting after `low`, None when there is nothing left.
+        """
+        pks = self.queryset.order_by('pk').values_list('pk', flat=True)
+        if low is not None:
+            pks = pks.filter(pk__gt=low)
+
+        boundary = list(pks[self.scan_size - 1:self.scan_size])
+        if not boundary:
+            # Less than scan_size objects left, the last range ends at the highest primary key
+            boundary = list(pks.order_by('-pk')[:1])
+        return boundary[0] if boundary else None
+
+    def _iter_ranges(self, start_after: Optional[int]) -> Iterator[tuple[Optional[int], int]]:
+        low = start_after
+        while (high := self._next_boundary(low)) is not None:
+            yield low, high
+            low = high
+
+    def _iter_batches(self, start_after: Optional[int]) -> Iterator[tuple[int, list[dict]]]:
+        """
+        Yields the upper bound of every range together with the serialized actions, in primary key order.
+        """
+        ranges = self._iter_ranges(start_after)
+        if self.workers <= 1:
+            for low, high in ranges:
+                yield high, serialize_range(self.document, self.queryset, self.index, low, high)
+            return
+
+        # With the fork start method the document and queryset are handed to the workers without pickling them
+        context = multiprocessing.get_context('fork')
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=context, initializer=_init_worker,
+                                 initargs=(self.document, self.queryset)) as executor:
+            # Keep a bounded number of ranges in flight, results are yielded in the order of the ranges
+            pending = deque()
+            for low, high in ranges:
+                pending.append((high, executor.submit(_serialize_range_in_worker, self.index, low, high)))
+                if len(pending) >= self.workers * 2:
+                    high, future = pending.popleft()
+                    yield high, future.result()
+
+            while pending:
+                high, future = pending.popleft()
+                yield high, future.result()
+
+    def _iter_actions(self, start_after: Optional[int], ranges: deque, owner: threading.Thread) -> Iterator[dict]:
+        """
+        Yields the actions of all ranges. The upper bound of every range is appended to `ranges` together with the
+        number of actions produced up to and including that range.
+        """
+        produced = 0
+        try:
+            for high, batch in self._iter_batches(start_after):
+                produced += len(batch)
+                ranges.append((high, produced))
+                yield from batch
+        finally:
+            # Consumed by a thread of parallel_bulk, the database connections that thread opened are closed. The
+            # connections of the thread running the indexer (`owner`) are left alone.
+            if threading.current_thread() is not owner:
+                connections.close_all()
+
+    def _acknowledge(self, ranges: deque, done: int, previously_indexed: int) -> None:
+        # Results are returned in the order of the actions, so a range is indexed once all its actions are
+        while ranges and ranges[0][1] <= done:
+            self._store_progress(ranges.popleft()[0], previously_indexed + done)
+
+    def run(self) -> BulkIndexStats:
+        state = self.checkpoint.data if self.checkpoint else {}
+        start_after = state.get('last_pk')
+        previously_indexed = state.get('indexed', 0)
+        if start_after is not None:
+            log.info(f'Resuming bulk index after pk {start_after}, {previously_indexed} documents already indexed')
+
+        stats = BulkIndexStats(total=previously_indexed)
+        # Upper bound of every range with the number of actions produced up to and including that range
+        ranges = deque()
+
+        started = reported = time.monotonic()
+        done = 0
+        client = self.document._get_connection(self.using)
+        actions = self._iter_actions(start_after, ranges, threading.current_thread())
+        for _ in parallel_bulk(client, actions, thread_count=self.thread_count, chunk_size=self.chunk_size):
+            done += 1
+            self._acknowledge(ranges, done, previously_indexed)
+
+            now = time.monotonic()
+            if self.progress and now - reported >= self.progress_interval:
+                stats.indexed, stats.total, stats.elapsed = done, previously_indexed + done, now - started
+                self.progress(stats)
+                reported = now
+        self._acknowledge(ranges, done, previously_indexed)
+
+        stats.indexed, stats.total, stats.elapsed = done, previously_indexed + done, time.monotonic() - started
+        log.info(f'Bulk indexed {stats.indexed} documents in {stats.elapsed:.2f} second(s), '
+                 f'{stats.docs_per_second:.0f} documents/s')
+        return stats
+
+    def _store_progress(self, last_pk: int, indexed: int) -> None:
+        if self.checkpoint:
+            self.checkpoint.update(last_pk=last_pk, indexed=indexed)
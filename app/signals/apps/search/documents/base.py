@@ -1,11 +1,15 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2021 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
 import logging
+from datetime import datetime
 
 from django.db.models import Case, When
+from django.utils import timezone
 from elasticsearch.helpers import bulk
 from elasticsearch_dsl import Document, Index, Search
 
+from signals.apps.search.bulk import BulkIndexer
+
 log = logging.getLogger(__name__)
 
 
@@ -47,33 +51,154 @@ class DocumentBase(Document):
         )
 
     @classmethod
-    def clear_index(cls, index=None):
-        index_instance = Index(cls._default_index(index))
+    def clear_index(cls, index=None, using=None):
+        name = cls._default_index(index)
+        es = cls._get_connection(using)
+        if es.indices.exists_alias(name=name):
+            # An index cannot be deleted through its alias, delete the indices behind the alias instead
+            for index_name in es.indices.get_alias(name=name):
+                es.indices.delete(index=index_name)
+            return
+
+        index_instance = Index(name)
         if index_instance.exists():
             index_instance.delete()
 
+    def get_updated_since_queryset(self, since):
+        """
+        Objects changed since the given moment, used to catch up with changes made during a rebuild. Documents that
+        do not implement this are not caught up.
+        """
+        return None
+
+    def get_deleted_since_ids(self, since):
+        """
+        Primary keys of the objects deleted since the given moment, used to remove the objects deleted during a rebuild
+        from the new index. Documents that do not implement this are not cleaned up.
+        """
+        return None
+
     @classmethod
     def prepare_batch(cls, queryset):
-        for obj in queryset.iterator():
+        # Evaluating the queryset as a whole (instead of using iterator()) makes the prefetch_related lookups work
+        for obj in queryset:
             yield cls().create_document(obj).create_document_dict()
 
     @classmethod
-    def bulk(cls, queryset, size, using=None):
-        es = cls._get_connection(using)
-        for start in range(0, queryset.count(), size):
-            end = start + size
-            bulk(
-                client=es,
-                actions=cls.prepare_batch(queryset[start:end]),
-                chunk_size=size,
-            )
+    def bulk(cls, queryset, size=None, using=None, **kwargs):
+        """
+        Index the queryset in primary key ranges, see `signals.apps.search.bulk.BulkIndexer` for the options.
+        """
+        return BulkIndexer(cls, queryset, using=using, chunk_size=size, **kwargs).run()
 
     @classmethod
-    def index_documents(cls, index=None, using=None, batch=1000, queryset=None):
-        qs = queryset.all() if queryset else cls().get_queryset()
+    def index_documents(cls, index=None, using=None, batch=None, queryset=None, **kwargs):
+        qs = queryset.all() if queryset is not None else cls().get_queryset()
 
         cls.init(index, using)
-        cls.bulk(qs, batch, using)
+        return cls.bulk(qs, batch, using, index=index, **kwargs)
+
+    @classmethod
+    def rebuild(cls, using=None, checkpoint=None, keep_old_indices=False, **kwargs):
+        """
+        Rebuild the index without downtime.
+
+        All documents are indexed into a new index, the alias (the name of the index of the document) is moved to the
+        new index once it is complete. Until then searches and updates use the current index. Changes made during the
+        rebuild are indexed again after the alias has been moved, objects deleted during the rebuild (see
+        `get_deleted_since_ids`) are deleted from the new index before and after the alias is moved.
+
+        When a concrete index exists with the name of the alias it is removed in the same atomic alias update.
+
+        :param checkpoint: signals.apps.search.bulk.Checkpoint, an interrupted rebuild is resumed from it
+        :param keep_old_indices: do not delete the indices the alias pointed to
+        :param kwargs: options of the BulkIndexer
+        :return: BulkIndexStats of the initial indexing
+        """
+        es = cls._get_connection(using)
+        alias = cls._default_index()
+        state = checkpoint.data if checkpoint else {}
+
+        index = state.get('index')
+        if index and state.get('alias') == alias and es.indices.exists(index=index):
+            started_at = datetime.fromisoformat(state['started_at'])
+        else:
+            started_at = timezone.now()
+            index = f'{alias}-{started_at:%Y%m%d%H%M%S}'
+            if checkpoint:
+                checkpoint.clear()
+                checkpoint.update(alias=alias, index=index, started_at=started_at.isoformat())
+
+        cls.init(index=index, using=using)
+        # Refreshing is of no use while nobody searches the new index
+        es.indices.put_settings(index=index, body={'index': {'refresh_interval': '-1'}})
+        stats = cls.bulk(cls().get_queryset(), using=using, index=index, checkpoint=checkpoint, **kwargs)
+        es.indices.put_settings(index=index, body={'index': {'refresh_interval': None}})
+
+        # Until the alias is moved changes are written to the current index
+        caught_up_at = timezone.now()
+        cls._index_updated_since(started_at, using=using, index=index, **kwargs)
+        cls._delete_deleted_since(es, index, started_at)
+        es.indices.refresh(index=index)
+
+        old_indices = cls._move_alias(es, alias, index)
+        # From now on deletions reach the new index through the alias. Deleting the objects again also covers the ones
+        # deleted in a transaction that was committed after the first pass, deleting a missing document is harmless.
+        cls._delete_deleted_since(es, index, started_at)
+
+        # Changes made while catching up, after the alias is moved changes are written to the new index
+        cls._index_updated_since(caught_up_at, using=using, **kwargs)
+
+        if not keep_old_indices:
+            for old_index in old_indices:
+                es.indices.delete(index=old_index)
+
+        if checkpoint:
+            checkpoint.clear()
+        return stats
+
+    @classmethod
+    def _index_updated_since(cls, since, **kwargs):
+        queryset = cls().get_updated_since_queryset(since)
+        if queryset is not None:
+            cls.bulk(queryset, **kwargs)
+
+    @classmethod
+    def delete_documents(cls, pks, index=None, using=None):
+        """
+        Delete the documents of the given objects with bulk requests.
+        """
+        index = cls._default_index(index)
+        # Objects deleted before they were indexed are not found, which is fine
+        bulk(cls._get_connection(using), ({'_op_type': 'delete', '_index': index, '_id': pk} for pk in pks),
+             raise_on_error=False)
+
+    @classmethod
+    def _delete_deleted_since(cls, es, index, since):
+        """
+        Delete the objects deleted since the given moment from the given index.
+        """
+        pks = cls().get_deleted_since_ids(since)
+        if pks is not None:
+            # Objects deleted before they were indexed are not found, which is fine
+            bulk(es, ({'_op_type': 'delete', '_index': index, '_id': pk} for pk in pks), raise_on_error=False)
+
+    @staticmethod
+    def _move_alias(es, alias, index):
+        """
+        Point the alias to the given index, returns the indices the alias pointed to before.
+        """
+        actions = [{'add': {'index': index, 'alias': alias}}]
+        old_indices = []
+        if es.indices.exists_alias(name=alias):
+            old_indices = [name for name in es.indices.get_alias(name=alias) if name != index]
+            actions = [{'remove': {'index': name, 'alias': alias}} for name in old_indices] + actions
+        elif es.indices.exists(index=alias):
+            # The index was created before aliases were used, it is replaced by the alias
+            actions.insert(0, {'remove_index': {'index': alias}})
+
+        es.indices.update_aliases(body={'actions': actions})
+        return old_indices
 
     @classmethod
     def ping(cls, using=None):
@@ -7,7 +7,7 @@ from elasticsearch_dsl.query import Bool
 
 from signals.apps.search.documents.base import DocumentBase
 from signals.apps.search.settings import app_settings
-from signals.apps.signals.models import Signal
+from signals.apps.signals.models import DeletedSignal, Signal
 
 log = logging.getLogger(__name__)
 
@@ -78,6 +78,7 @@ class SignalDocument(DocumentBase):
             'reporter',
             'priority',
             'parent',
+            'type_assignment',
         ).prefetch_related(
             'category_assignment__category__departments',
             'children',
@@ -87,6 +88,13 @@ class SignalDocument(DocumentBase):
             '-updated_at'
         ).all()
 
+    def get_updated_since_queryset(self, since):
+        return self.get_queryset().filter(updated_at__gte=since)
+
+    def get_deleted_since_ids(self, since):
+        # Every deleted signal leaves a DeletedSignal row behind
+        return DeletedSignal.objects.filter(deleted_at__gte=since).values_list('signal_id', flat=True).iterator()
+
     @classmethod
     def create_document(cls, obj):
         category_assignment = None
@@ -110,7 +118,7 @@ class SignalDocument(DocumentBase):
                         'code': department.code,
                         'name': department.name,
                         'is_intern': department.is_intern,
-                    } for department in category_assignment.category.departments.iterator()],
+                    } for department in category_assignment.category.departments.all()],
                     'parent': {
                         'name': category_assignment.category.parent.name,
                         'slug': category_assignment.category.parent.slug,
@@ -1,10 +1,13 @@
 # SPDX-License-Identifier: MPL-2.0
 # Copyright (C) 2019 - 2021 Gemeente Amsterdam
+import os
+import tempfile
 from timeit import default_timer as timer
 
 from django.core.management import BaseCommand
 from django.utils import timezone
 
+from signals.apps.search.bulk import Checkpoint
 from signals.apps.search.documents.signal import SignalDocument
 from signals.apps.signals.models import Signal
 
@@ -22,6 +25,14 @@ class Command(BaseCommand):
         parser.add_argument('--signal-ids', type=str, dest='signal_ids', help='A set of signals that need re-indexing')
         parser.add_argument('--from-date', type=str, dest='from_date', help='Index all signals from date, format YYYY-MM-DD')  # noqa
         parser.add_argument('--to-date', type=str, dest='to_date', help='Index all signals from date, format YYYY-MM-DD')  # noqa
+        parser.add_argument('--rebuild', action='store_true', dest='_rebuild', help='Rebuild the index in a new index and move the alias to it when done (zero-downtime)')  # noqa
+        parser.add_argument('--resume', action='store_true', dest='resume', help='Resume an interrupted --rebuild or --index-all from the checkpoint')  # noqa
+        parser.add_argument('--checkpoint', type=str, dest='checkpoint', help='Checkpoint file, defaults to a file in the temp directory for --rebuild')  # noqa
+        parser.add_argument('--keep-old-indices', action='store_true', dest='keep_old_indices', help='Do not delete the old indices after a --rebuild')  # noqa
+        parser.add_argument('--chunk-size', type=int, dest='chunk_size', help='Number of documents per bulk request')
+        parser.add_argument('--thread-count', type=int, dest='thread_count', help='Number of concurrent bulk requests')
+        parser.add_argument('--workers', type=int, dest='workers', help='Number of processes serializing documents')
+        parser.add_argument('--scan-size', type=int, dest='scan_size', help='Number of signals per primary key range')
 
     def handle(self, *args, **options):
         start = timer()
@@ -37,8 +48,13 @@ class Command(BaseCommand):
         self.stdout.write(f'Time: {stop - start:.2f} second(s)')
         self.stdout.write('Done!')
 
-    def _apply_options(self, **options):
+    def _apply_options(self, **options):  # noqa C901
         self._dry_run = options['_dry_run']
+        self._bulk_options = {
+            key: options[key] for key in ('chunk_size', 'thread_count', 'workers', 'scan_size')
+            if options.get(key) is not None
+        }
+        self._bulk_options['progress'] = self._report_progress
         if self._dry_run:
             self.stdout.write('* Dry Run enabled, no changes will be made to the index')
 
@@ -48,7 +64,9 @@ class Command(BaseCommand):
         if options['_init_index'] and not options['_clear_index']:
             self._init_index()
 
-        if options['signal_id']:
+        if options['_rebuild']:
+            self._rebuild(options['checkpoint'], options['resume'], options['keep_old_indices'])
+        elif options['signal_id']:
             self._index_signal(signal_id=int(options['signal_id']))
         elif options['signal_ids']:
             self._index_signals(signal_ids=list(map(int, options['signal_ids'].split(','))))
@@ -57,7 +75,7 @@ class Command(BaseCommand):
             to_date = options['to_date'] or None
             self._index_date_range(from_date, to_date)
         elif options['_index_documents']:
-            self._index_documents()
+            self._index_documents(options['checkpoint'], options['resume'])
         else:
             self.stdout.write('* No index option given')
 
@@ -72,10 +90,38 @@ class Command(BaseCommand):
         if not self._dry_run:
             SignalDocument.init()
 
-    def _index_documents(self):
+    def _get_checkpoint(self, path, resume):
+        checkpoint = Checkpoint(path)
+        if not resume:
+            checkpoint.clear()
+        elif checkpoint.data:
+            self.stdout.write(f'* Resuming from checkpoint {path}')
+        return checkpoint
+
+    def _report_progress(self, stats):
+        self.stdout.write(f'* Indexed {stats.total} Signals ({stats.docs_per_second:.0f} Signals/s)')
+
+    def _report_stats(self, stats):
+        self.stdout.write(f'* Indexed {stats.indexed} Signals in {stats.elapsed:.2f} second(s) '
+                          f'({stats.docs_per_second:.0f} Signals/s)')
+
+    def _index_documents(self, checkpoint_path=None, resume=False):
         self.stdout.write('* Index all Signals in bulk')
         if not self._dry_run:
-            SignalDocument.index_documents()
+            checkpoint = self._get_checkpoint(checkpoint_path, resume) if checkpoint_path else None
+            stats = SignalDocument.index_documents(checkpoint=checkpoint, **self._bulk_options)
+            if checkpoint:
+                checkpoint.clear()
+            self._report_stats(stats)
+
+    def _rebuild(self, checkpoint_path=None, resume=False, keep_old_indices=False):
+        self.stdout.write('* Rebuild the index')
+        if not self._dry_run:
+            checkpoint_path = checkpoint_path or os.path.join(tempfile.gettempdir(), 'elastic_index_rebuild.json')
+            checkpoint = self._get_checkpoint(checkpoint_path, resume)
+            stats = SignalDocument.rebuild(checkpoint=checkpoint, keep_old_indices=keep_old_indices,
+                                           **self._bulk_options)
+            self._report_stats(stats)
 
     def _index_signal(self, signal_id):
         self.stdout.write(f'* Index Signal #{signal_id}')
@@ -101,7 +147,7 @@ class Command(BaseCommand):
             self.stderr.write(f'* Signals not found #{", #".join(map(str, ids_diff))}')
         else:
             if not self._dry_run:
-                SignalDocument.index_documents(queryset=signal_qs)
+                SignalDocument.index_documents(queryset=signal_qs, **self._bulk_options)
 
     def _index_date_range(self, from_date=None, to_date=None):
         if not from_date and not to_date:
@@ -129,4 +175,4 @@ class Command(BaseCommand):
         self.stdout.write(f'* Indexing Signals in range from {from_date:%Y-%m-%d %H:%M:%S} to '
                           f'{to_date:%Y-%m-%d %H:%M:%S}, found {signal_qs.count()} signals')
         if not self._dry_run:
-            SignalDocument.index_documents(queryset=signal_qs)
+            SignalDocument.index_documents(queryset=signal_qs, **self._bulk_options)
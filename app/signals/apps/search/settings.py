@@ -10,6 +10,12 @@ DEFAULTS = dict(
         INDEX='signals',
     ),
     TIMEOUT=10,
+    BULK=dict(
+        CHUNK_SIZE=500,
+        THREAD_COUNT=4,
+        WORKERS=0,
+        SCAN_SIZE=2000,
+    ),
 )
 
 
@@ -1,16 +1,24 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2023 Gemeente Amsterdam
+# Copyright (C) 2023 - 2026 Gemeente Amsterdam
 import logging
 
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from signals.apps.search.documents.status_message import StatusMessage as StatusMessageDocument
-from signals.apps.search.tasks import delete_from_elastic, save_to_elastic
+from signals.apps.search.tasks import (
+    delete_from_elastic,
+    delete_many_from_elastic,
+    save_many_to_elastic,
+    save_to_elastic
+)
 from signals.apps.search.transformers.status_message import transform
 from signals.apps.signals.managers import (
+    bulk_deletion_in_progress,
     create_child,
     create_initial,
+    create_initial_bulk,
+    delete_bulk,
     update_category_assignment,
     update_location,
     update_priority,
@@ -31,6 +39,18 @@ def add_to_elastic_handler(sender, signal_obj, **kwargs):
     save_to_elastic.delay(signal_id=signal_obj.id)
 
 
+@receiver(create_initial_bulk, dispatch_uid='search_add_many_to_elastic')
+def add_many_to_elastic_handler(sender, signal_objs, **kwargs):
+    # Add to elastic in a single task
+    save_many_to_elastic.delay(signal_ids=[signal_obj.id for signal_obj in signal_objs])
+
+
+@receiver(delete_bulk, dispatch_uid='search_delete_many_from_elastic')
+def delete_many_from_elastic_handler(sender, signal_ids, **kwargs):
+    # Remove from elastic in a single task
+    delete_many_from_elastic.delay(signal_ids=signal_ids)
+
+
 @receiver(post_save, sender=StatusMessageModel, dispatch_uid='status_message_post_save_receiver')
 def status_message_post_save_receiver(sender: str, instance: StatusMessageModel, **kwargs):
     """Django signal receiver used to index StatusMessage models in elasticsearch
@@ -78,6 +98,10 @@ def signal_post_deleted_receiver(sender: str, instance: Signal, **kwargs):
     instance : Signal
         The instance of the Signal model that was deleted from the database.
     """
+    if bulk_deletion_in_progress.get():
+        # Removed from elastic together with the other deleted signals, see delete_many_from_elastic_handler
+        return
+
     try:
         delete_from_elastic(signal=instance)
     except Exception as e:
@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2021 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
 import logging
 
 from django.utils import timezone
@@ -22,6 +22,22 @@ def save_to_elastic(signal_id):
     signal_document.save()
 
 
+@app.task
+def save_many_to_elastic(signal_ids):
+    if not SignalDocument.ping():
+        raise Exception('Elastic cluster is unreachable')
+
+    SignalDocument.bulk(SignalDocument().get_queryset().filter(id__in=signal_ids), workers=0)
+
+
+@app.task
+def delete_many_from_elastic(signal_ids):
+    if not SignalDocument.ping():
+        raise Exception('Elastic cluster is unreachable')
+
+    SignalDocument.delete_documents(signal_ids)
+
+
 @app.task
 def rebuild_index():
     log.info('rebuild_index - start')
@@ -29,8 +45,8 @@ def rebuild_index():
     if not SignalDocument.ping():
         raise Exception('Elastic cluster is unreachable')
 
-    SignalDocument.index_documents()
-    log.info('rebuild_index - done!')
+    stats = SignalDocument.rebuild()
+    log.info(f'rebuild_index - done! Indexed {stats.indexed} signals ({stats.docs_per_second:.0f} signals/s)')
 
 
 @app.task
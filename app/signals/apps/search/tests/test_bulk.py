@@ -0,0 +1,140 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+import os
+import tempfile
+import threading
+from collections import deque
+from unittest.mock import MagicMock, patch
+
+from django.test import TestCase
+from django.utils import timezone
+
+from signals.apps.search.bulk import BulkIndexer, Checkpoint, serialize_range
+from signals.apps.search.documents.signal import SignalDocument
+from signals.apps.signals.factories import SignalFactory
+from signals.apps.signals.models import DeletedSignal, Signal
+
+
+class _Document:
+    """
+    Stands in for a Document, the action of an object is its primary key.
+    """
+    def __init__(self, obj):
+        self.obj = obj
+
+    @classmethod
+    def create_document(cls, obj):
+        return cls(obj)
+
+    def create_document_dict(self):
+        return {'_id': self.obj.pk}
+
+    @staticmethod
+    def _get_connection(using=None):
+        return MagicMock()
+
+
+def _parallel_bulk(client, actions, **kwargs):
+    for action in actions:
+        yield True, {'index': action}
+
+
+class TestCheckpoint(TestCase):
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), 'checkpoint.json')
+
+    def test_update(self):
+        checkpoint = Checkpoint(self.path)
+        self.assertEqual(checkpoint.data, {})
+
+        checkpoint.update(last_pk=10, indexed=5)
+        self.assertEqual(Checkpoint(self.path).data, {'last_pk': 10, 'indexed': 5})
+
+    def test_clear(self):
+        checkpoint = Checkpoint(self.path)
+        checkpoint.update(last_pk=10)
+        checkpoint.clear()
+
+        self.assertEqual(checkpoint.data, {})
+        self.assertFalse(os.path.exists(self.path))
+
+
+@patch('signals.apps.search.bulk.parallel_bulk', side_effect=_parallel_bulk)
+class TestBulkIndexer(TestCase):
+    def setUp(self):
+        self.signals = SignalFactory.create_batch(5)
+        self.pks = sorted(signal.pk for signal in self.signals)
+        self.checkpoint = Checkpoint(os.path.join(tempfile.mkdtemp(), 'checkpoint.json'))
+
+    def test_serialize_range(self, _):
+        actions = serialize_range(_Document, Signal.objects.all(), 'index', self.pks[0], self.pks[2])
+        self.assertEqual(actions, [{'_id': self.pks[1], '_index': 'index'}, {'_id': self.pks[2], '_index': 'index'}])
+
+    def test_run(self, parallel_bulk):
+        indexer = BulkIndexer(_Document, Signal.objects.all(), scan_size=2, workers=0, checkpoint=self.checkpoint)
+        stats = indexer.run()
+
+        self.assertEqual(stats.indexed, 5)
+        self.assertEqual(stats.total, 5)
+        self.assertEqual(self.checkpoint.data, {'last_pk': self.pks[-1], 'indexed': 5})
+
+        self.assertEqual(parallel_bulk.call_count, 1)
+        self.assertEqual(list(indexer._iter_ranges(None)),
+                         [(None, self.pks[1]), (self.pks[1], self.pks[3]), (self.pks[3], self.pks[4])])
+
+    def test_resume(self, parallel_bulk):
+        self.checkpoint.update(last_pk=self.pks[2], indexed=3)
+
+        indexer = BulkIndexer(_Document, Signal.objects.all(), scan_size=2, workers=0, checkpoint=self.checkpoint)
+        stats = indexer.run()
+
+        self.assertEqual(stats.indexed, 2)
+        self.assertEqual(stats.total, 5)
+        self.assertEqual(self.checkpoint.data, {'last_pk': self.pks[-1], 'indexed': 5})
+
+    def test_progress(self, parallel_bulk):
+        progress = MagicMock()
+        indexer = BulkIndexer(_Document, Signal.objects.all(), scan_size=2, workers=0, progress=progress,
+                              progress_interval=0)
+        indexer.run()
+
+        self.assertEqual(progress.call_count, 5)
+
+    @patch('signals.apps.search.bulk.connections')
+    def test_connections_closed_in_consuming_thread(self, connections, parallel_bulk):
+        indexer = BulkIndexer(_Document, Signal.objects.all(), scan_size=2, workers=0)
+
+        # Consumed by the thread running the indexer, its connections stay open
+        list(indexer._iter_actions(None, deque(), threading.current_thread()))
+        connections.close_all.assert_not_called()
+
+        # Consumed by another thread, like the threads of parallel_bulk
+        actions = indexer._iter_actions(None, deque(), threading.current_thread())
+        thread = threading.Thread(target=list, args=(actions, ))
+        thread.start()
+        thread.join()
+        connections.close_all.assert_called_once_with()
+
+
+class TestDeletedSinceRebuild(TestCase):
+    def test_get_deleted_since_ids(self):
+        signal = SignalFactory.create()
+        since = timezone.now()
+        DeletedSignal.objects.create_from_signal(signal=signal, action='manual', note='test')
+
+        self.assertEqual(list(SignalDocument().get_deleted_since_ids(since)), [signal.pk])
+        self.assertEqual(list(SignalDocument().get_deleted_since_ids(timezone.now())), [])
+
+    @patch('signals.apps.search.documents.base.bulk')
+    def test_delete_deleted_since(self, bulk):
+        signals = SignalFactory.create_batch(2)
+        since = timezone.now()
+        for signal in signals:
+            DeletedSignal.objects.create_from_signal(signal=signal, action='automatic', note='test')
+
+        es = MagicMock()
+        SignalDocument._delete_deleted_since(es, 'signals-test', since)
+        self.assertEqual(bulk.call_count, 1)
+        self.assertEqual(sorted(list(bulk.call_args.args[1]), key=lambda action: action['_id']),
+                         [{'_op_type': 'delete', '_index': 'signals-test', '_id': signal.pk}
+                          for signal in sorted(signals, key=lambda signal: signal.pk)])
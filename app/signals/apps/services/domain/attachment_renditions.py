@@ -0,0 +1,118 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+"""
+Renditions (smaller copies) of image attachments.
+
+Every image attachment gets a thumbnail, a JPEG sized for the PDF of a signal and a WebP for displaying the image in
+the frontend. Images are never enlarged, an image smaller than the size of a rendition is only converted.
+"""
+import hashlib
+import io
+import logging
+import os
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from signals.apps.signals.models import Attachment, AttachmentRendition
+from signals.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+rendition_metrics = get_metrics('attachment_renditions')
+
+
+@dataclass(frozen=True)
+class RenditionSpec:
+    kind: str
+    max_size: int
+    format: str
+    mimetype: str
+    extension: str
+
+
+def get_rendition_specs() -> tuple[RenditionSpec, ...]:
+    return (
+        RenditionSpec(AttachmentRendition.THUMBNAIL, settings.ATTACHMENT_THUMBNAIL_SIZE, 'JPEG', 'image/jpeg', 'jpg'),
+        RenditionSpec(AttachmentRendition.PDF, settings.API_PDF_RESIZE_IMAGES_TO, 'JPEG', 'image/jpeg', 'jpg'),
+        RenditionSpec(AttachmentRendition.WEBP, settings.ATTACHMENT_WEBP_SIZE, 'WEBP', 'image/webp', 'webp'),
+    )
+
+
+class AttachmentRenditionService:
+    @staticmethod
+    def open_image(attachment: Attachment) -> Image.Image | None:
+        try:
+            with default_storage.open(attachment.file.name) as file:
+                image = Image.open(io.BytesIO(file.read()))
+                image.load()
+        except (UnidentifiedImageError, Image.DecompressionBombError, OSError):
+            logger.warning(f'Cannot open image attachment pk={attachment.pk}', exc_info=True)
+            return None
+
+        # Photos taken with a phone are often stored rotated, with the orientation in the EXIF data
+        return ImageOps.exif_transpose(image)
+
+    @staticmethod
+    def render(image: Image.Image, spec: RenditionSpec) -> tuple[bytes, int, int]:
+        """
+        Returns the encoded rendition of the image and its dimensions.
+        """
+        # Convert before resizing, palette images are otherwise resized without resampling
+        if spec.format == 'JPEG':
+            rendition = image.convert('RGB')
+        elif image.mode not in ('RGB', 'RGBA'):
+            # WebP supports transparency
+            rendition = image.convert('RGBA' if image.mode in ('LA', 'P', 'PA') else 'RGB')
+        else:
+            rendition = image.copy()
+        rendition.thumbnail((spec.max_size, spec.max_size), resample=Image.Resampling.LANCZOS)
+
+        with io.BytesIO() as buffer:
+            rendition.save(buffer, format=spec.format, quality=settings.ATTACHMENT_RENDITION_QUALITY, optimize=True)
+            return buffer.getvalue(), rendition.width, rendition.height
+
+    @staticmethod
+    def create_renditions(attachment: Attachment) -> list[AttachmentRendition]:
+        """
+        Create (or replace) the renditions of an image attachment, a rendition that did not change is left alone.
+        """
+        with rendition_metrics.timer('open'):
+            image = AttachmentRenditionService.open_image(attachment)
+        if image is None:
+            rendition_metrics.increment('errors')
+            return []
+
+        existing = {rendition.kind: rendition for rendition in attachment.renditions.all()}
+        name, _ = os.path.splitext(os.path.basename(attachment.file.name))
+
+        renditions = []
+        for spec in get_rendition_specs():
+            with rendition_metrics.timer(spec.kind):
+                data, width, height = AttachmentRenditionService.render(image, spec)
+            checksum = hashlib.sha256(data).hexdigest()
+
+            rendition = existing.get(spec.kind)
+            if rendition is not None and rendition.checksum == checksum:
+                renditions.append(rendition)
+                continue
+
+            if rendition is None:
+                rendition = AttachmentRendition(attachment=attachment, kind=spec.kind)
+            elif rendition.file:
+                rendition.file.delete(save=False)
+
+            rendition.mimetype = spec.mimetype
+            rendition.width = width
+            rendition.height = height
+            rendition.size = len(data)
+            rendition.checksum = checksum
+            rendition.file.save(f'{name}_{spec.kind}.{spec.extension}', ContentFile(data), save=False)
+            rendition.save()
+
+            rendition_metrics.increment('created')
+            renditions.append(rendition)
+        return renditions
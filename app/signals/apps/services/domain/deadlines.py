@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2021 Gemeente Amsterdam
+# Copyright (C) 2021 - 2026 Gemeente Amsterdam
 """
 Calculate deadline for solving complaints.
 
@@ -65,17 +65,30 @@ class DeadlineCalculationService:
 
         return deadline
 
-    def from_signal_and_category(signal, category):
+    @staticmethod
+    def get_current_slo(category):
         """
-        Get deadline and factor 3 delayed deadline for a Signal and a Category.
+        Get the ServiceLevelObjective currently in use for a Category, None if it has none.
+        """
+        return category.slo.order_by('created_at').last()
+
+    @staticmethod
+    def from_created_at_and_slo(created_at, slo):
         """
-        if not category.slo.exists():
+        Get deadline and factor 3 delayed deadline for a Signal created at the given moment and a
+        ServiceLevelObjective.
+        """
+        if slo is None:
             return None, None
-        current_slo = category.slo.order_by('created_at').last()
 
-        deadline = DeadlineCalculationService.get_deadline(
-            signal.created_at, current_slo.n_days, current_slo.use_calendar_days, 1)
-        deadline_factor_3 = DeadlineCalculationService.get_deadline(
-            signal.created_at, current_slo.n_days, current_slo.use_calendar_days, 3)
+        deadline = DeadlineCalculationService.get_deadline(created_at, slo.n_days, slo.use_calendar_days, 1)
+        deadline_factor_3 = DeadlineCalculationService.get_deadline(created_at, slo.n_days, slo.use_calendar_days, 3)
 
         return deadline, deadline_factor_3
+
+    def from_signal_and_category(signal, category):
+        """
+        Get deadline and factor 3 delayed deadline for a Signal and a Category.
+        """
+        return DeadlineCalculationService.from_created_at_and_slo(
+            signal.created_at, DeadlineCalculationService.get_current_slo(category))
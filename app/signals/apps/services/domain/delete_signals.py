@@ -0,0 +1,157 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+"""
+Deletion of signals that have been in a closed state for longer than the retention period.
+
+Signals are deleted in batches. The signals of a batch are selected in primary key order, starting after the last
+signal of the previous batch, so a run can be resumed from any signal. Every batch, the selected signals together with
+their children, is deleted in one transaction: the DeletedSignal audit rows are inserted with a single bulk insert and
+the signals are deleted with a single queryset delete. That delete goes through Django's deletion collector, the rows
+of models with delete receivers (among which the signals themselves) are still loaded, but their receivers do no work
+of their own. Once the transaction is committed the `delete_bulk` Django signal removes all signals of the batch from
+the search index at once, the statistics of their reporters are refreshed once and the files of the attachments are
+removed from the storage.
+"""
+import logging
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+
+from signals.apps.services.domain.reporter_statistics import (
+    ReporterStatisticsService,
+    get_reporter_keys
+)
+from signals.apps.signals.managers import bulk_deletion_in_progress, delete_bulk
+from signals.apps.signals.models import (
+    Attachment,
+    AttachmentRendition,
+    DeletedSignal,
+    Reporter,
+    Signal
+)
+from signals.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+deletion_metrics = get_metrics('signal_deletion')
+
+
+def get_deletion_note(signal: Signal, now: datetime) -> str:
+    if signal.is_child:
+        assert signal.parent and signal.parent.status
+        return (f'Parent signal was in state "{signal.parent.status.get_state_display()}" '
+                f'for {(now - signal.parent.status.created_at).days} days')
+
+    assert signal.status
+    return (f'Signal was in state "{signal.status.get_state_display()}" '
+            f'for {(now - signal.status.created_at).days} days')
+
+
+@dataclass(frozen=True)
+class DeletionBatch:
+    # The selected signals, the children of these signals are deleted as well
+    signal_ids: list[int]
+    # The number of deleted signals, including the children
+    deleted: int
+
+    @property
+    def last_id(self) -> int | None:
+        return self.signal_ids[-1] if self.signal_ids else None
+
+
+class SignalDeletionService:
+    @staticmethod
+    def get_candidates(state: str, before: datetime) -> QuerySet:
+        """
+        The signals (not being a child signal) that are in the given state since before the given moment.
+        """
+        return Signal.objects.filter(parent_id__isnull=True, status__state=state, status__created_at__lt=before)
+
+    @staticmethod
+    def select_batch(candidates: QuerySet, start_after: int, batch_size: int, lock: bool = False) -> list[int]:
+        """
+        The primary keys of the first batch_size candidates with a primary key above start_after. With lock the
+        selected signals are locked until the end of the transaction.
+        """
+        queryset = candidates.filter(pk__gt=start_after).order_by('pk')
+        if lock:
+            queryset = queryset.select_for_update(of=('self', ))
+        return list(queryset.values_list('pk', flat=True)[:batch_size])
+
+    @staticmethod
+    def delete_tree(signal_ids: list[int], batch_uuid: uuid.UUID | None = None, action: str = 'automatic',
+                    deleted_by: str | None = None) -> int:
+        """
+        Delete the given signals and their children, returns the number of deleted signals. Must be called in a
+        transaction, the files of the attachments are removed once it is committed.
+        """
+        now = timezone.now()
+        signals = list(
+            Signal.objects.filter(Q(pk__in=signal_ids) | Q(parent_id__in=signal_ids))
+            .select_related('status', 'category_assignment__category', 'parent__status')
+        )
+        tree_ids = [signal.pk for signal in signals]
+
+        DeletedSignal.objects.bulk_create([
+            DeletedSignal.objects.build_from_signal(signal=signal, action=action, deleted_by=deleted_by,
+                                                    note=get_deletion_note(signal, now), batch_uuid=batch_uuid)
+            for signal in signals
+        ])
+
+        file_names = [
+            *Attachment.objects.filter(_signal__in=tree_ids).values_list('file', flat=True),
+            *AttachmentRendition.objects.filter(attachment___signal__in=tree_ids).values_list('file', flat=True),
+        ]
+        reporter_keys = set()
+        for email, phone in Reporter.objects.filter(_signal__in=tree_ids).values_list('email', 'phone'):
+            reporter_keys |= get_reporter_keys(email, phone)
+
+        # Goes through the deletion collector: the children, their parents and the rows of models with delete
+        # receivers are loaded, the other dependent rows are deleted with set-based statements. The receivers of the
+        # rows skip their work, it is done for the whole batch once the transaction is committed.
+        token = bulk_deletion_in_progress.set(True)
+        try:
+            Signal.objects.filter(pk__in=tree_ids).delete()
+        finally:
+            bulk_deletion_in_progress.reset(token)
+
+        transaction.on_commit(lambda: delete_bulk.send_robust(sender=SignalDeletionService, signal_ids=tree_ids))
+        ReporterStatisticsService.schedule_refresh(keys=reporter_keys)
+        transaction.on_commit(lambda: SignalDeletionService.delete_files(file_names))
+        return len(tree_ids)
+
+    @staticmethod
+    def delete_batch(candidates: QuerySet, start_after: int, batch_size: int, batch_uuid: uuid.UUID | None = None,
+                     action: str = 'automatic', deleted_by: str | None = None) -> DeletionBatch:
+        """
+        Delete the first batch_size candidates with a primary key above start_after, including their children.
+        """
+        with transaction.atomic():
+            signal_ids = SignalDeletionService.select_batch(candidates, start_after, batch_size, lock=True)
+            if not signal_ids:
+                return DeletionBatch(signal_ids=[], deleted=0)
+
+            deleted = SignalDeletionService.delete_tree(signal_ids, batch_uuid=batch_uuid, action=action,
+                                                        deleted_by=deleted_by)
+
+        deletion_metrics.increment('batches')
+        deletion_metrics.increment('signals', deleted)
+        return DeletionBatch(signal_ids=signal_ids, deleted=deleted)
+
+    @staticmethod
+    def delete_files(file_names: Iterable[str]) -> None:
+        """
+        Remove the files of deleted attachments from the storage, a file that cannot be removed is only logged.
+        """
+        for name in filter(None, file_names):
+            try:
+                default_storage.delete(name)
+            except Exception as e:
+                deletion_metrics.increment('file_errors')
+                logger.warning(f'Removing file "{name}" of a deleted signal went wrong, error: {e}')
@@ -1,23 +1,47 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2020 - 2023 Vereniging van Nederlandse Gemeenten, Gemeente Amsterdam
+# Copyright (C) 2020 - 2026 Vereniging van Nederlandse Gemeenten, Gemeente Amsterdam
+import threading
 import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Optional
 
+from django.db import transaction
 from django.utils import timezone
 
 from signals.apps.dsl.evaluators.evaluator import Evaluator
 from signals.apps.dsl.ExpressionEvaluator import ExpressionEvaluator
 from signals.apps.signals.managers import SignalManager
 from signals.apps.signals.models import Area, AreaType, RoutingExpression, Signal
+from signals.apps.signals.utils.version_stamp import VersionStamp
+from signals.metrics import get_metrics
+
+routing_metrics = get_metrics('routing')
+routing_plan_version = VersionStamp('signals:routing_plan:version')
 
 
 class DslService:
     compiler = ExpressionEvaluator()
-    _code_cache: dict[str, Evaluator] = {}
+
+    # Compiled expressions, the least recently used are evicted when the cache is full. Expressions are also compiled
+    # when validated through the API so the number of distinct expressions is not bound by the stored expressions.
+    _code_cache: OrderedDict[str, Evaluator] = OrderedDict()
+    _code_cache_max_size: int = 512
+    _code_cache_lock = threading.Lock()
 
     def _compile(self, code: str) -> Evaluator:
-        if code not in self._code_cache:
-            self._code_cache[code] = self.compiler.compile(code)
-        return self._code_cache[code]
+        with self._code_cache_lock:
+            if code in self._code_cache:
+                self._code_cache.move_to_end(code)
+                return self._code_cache[code]
+
+        evaluator = self.compiler.compile(code)
+        with self._code_cache_lock:
+            self._code_cache[code] = evaluator
+            while len(self._code_cache) > self._code_cache_max_size:
+                self._code_cache.popitem(last=False)
+        return evaluator
 
     def evaluate(self, context, code: str):
         evaluator = self._compile(code)
@@ -49,7 +73,7 @@ class SignalContext:
             self._areas = self._init_areas()
         return self._areas
 
-    def __call__(self, signal: Signal):
+    def __call__(self, signal: Signal, areas: Optional[Mapping] = None):
 
         t = timezone.make_naive(signal.incident_date_start).strftime("%H:%M:%S")
 
@@ -64,7 +88,7 @@ class SignalContext:
             'stadsdeel': signal.location.stadsdeel,
             'time': time.strptime(t, "%H:%M:%S"),
             'day': signal.incident_date_start.strftime("%A"),
-            'areas': self.areas
+            'areas': self.areas if areas is None else areas
         }
 
         # add additonal question answers id to context
@@ -86,57 +110,191 @@ class SignalContext:
         return tmp
 
 
+@dataclass(frozen=True)
+class CompiledRoutingRule:
+    """
+    A routing expression with its compiled evaluator and pre-resolved department and user.
+    """
+    pk: int
+    order: int
+    evaluator: Optional[Evaluator]
+    department_id: int
+    user_email: Optional[str] = None
+    # Set when the expression does not compile or the user is no longer active or no longer part of the department.
+    # These rules are deactivated when they are reached.
+    deactivate: bool = False
+
+
+@dataclass(frozen=True)
+class RoutingPlan:
+    """
+    The immutable evaluation plan for all active routing expressions in order. The areas are prepared geometries per
+    area type name and area code, as used by the "location in areas.<type>.<code>" expressions.
+    """
+    version: str
+    rules: tuple[CompiledRoutingRule, ...]
+    areas: Mapping[str, Mapping[str, object]]
+
+
+class RoutingEngine:
+    """
+    Builds and caches the `RoutingPlan`.
+
+    Every process holds its own plan, it is rebuilt when the shared version stamp changes. The stamp is bumped when
+    routing expressions, expressions, areas, users or department memberships change.
+    """
+    dsl_service = DslService()
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._plan: Optional[RoutingPlan] = None
+
+    def _compile_rule(self, rule: RoutingExpression, user_departments: dict[int, set[int]]) -> CompiledRoutingRule:
+        deactivate = False
+        if rule._user and not rule._user.is_active:
+            # The user is no longer active
+            deactivate = True
+        elif rule._user and rule._department_id not in user_departments.get(rule._user_id, set()):
+            # The user is no longer a member of the department
+            deactivate = True
+
+        evaluator = None
+        if not deactivate:
+            try:
+                evaluator = self.dsl_service._compile(rule._expression.code)
+            except Exception:
+                # Compilation failed, the rule will be deactivated
+                deactivate = True
+
+        return CompiledRoutingRule(
+            pk=rule.pk,
+            order=rule.order,
+            evaluator=evaluator,
+            department_id=rule._department_id,
+            user_email=rule._user.email if rule._user else None,
+            deactivate=deactivate,
+        )
+
+    @staticmethod
+    def _get_user_departments(user_ids: set[int]) -> dict[int, set[int]]:
+        from signals.apps.users.models import Profile
+
+        user_departments: dict[int, set[int]] = {}
+        memberships = Profile.departments.through.objects.filter(
+            profile__user_id__in=user_ids
+        ).values_list('profile__user_id', 'department_id')
+        for user_id, department_id in memberships:
+            user_departments.setdefault(user_id, set()).add(department_id)
+        return user_departments
+
+    @staticmethod
+    def _get_areas() -> Mapping[str, Mapping[str, object]]:
+        area_type_names = dict(AreaType.objects.values_list('id', 'name'))
+
+        areas: dict[str, dict[str, object]] = {name: {} for name in area_type_names.values()}
+        for area in Area.objects.only('code', 'geometry', '_type_id').iterator():
+            areas[area_type_names[area._type_id]][area.code] = area.geometry.prepared
+        return MappingProxyType({name: MappingProxyType(codes) for name, codes in areas.items()})
+
+    def build_plan(self, version: str) -> RoutingPlan:
+        with routing_metrics.timer('build'):
+            rules = list(RoutingExpression.objects.select_related('_expression', '_user').filter(
+                is_active=True,
+                _expression___type__name='routing',
+            ).order_by('order'))
+
+            user_departments = self._get_user_departments({rule._user_id for rule in rules if rule._user_id})
+            plan = RoutingPlan(
+                version=version,
+                rules=tuple(self._compile_rule(rule, user_departments) for rule in rules),
+                areas=self._get_areas(),
+            )
+        routing_metrics.increment('plan_builds')
+        return plan
+
+    def get_plan(self) -> RoutingPlan:
+        version = routing_plan_version.get()
+
+        plan = self._plan
+        if plan is not None and plan.version == version:
+            routing_metrics.increment('plan_hits')
+            return plan
+
+        routing_metrics.increment('plan_misses')
+        with self._lock:
+            if self._plan is None or self._plan.version != version:
+                self._plan = self.build_plan(version)
+            return self._plan
+
+    def reset(self) -> None:
+        with self._lock:
+            self._plan = None
+
+
+routing_engine = RoutingEngine()
+
+
+def _bump_routing_plan_version() -> None:
+    routing_plan_version.bump()
+    routing_engine.reset()
+
+
+def invalidate_routing_plan() -> None:
+    """
+    Bump the shared version stamp so that all processes rebuild their routing plan. The version is bumped again once
+    the transaction is committed, a plan another process built before the commit (from the old data) is not used
+    afterwards.
+    """
+    _bump_routing_plan_version()
+    transaction.on_commit(_bump_routing_plan_version)
+
+
 class SignalDslService(DslService):
     context_func = SignalContext()
     signal_manager: SignalManager = SignalManager()
+    engine: RoutingEngine = routing_engine
 
-    def process_routing_rules(self, signal):  # noqa C901
-        ctx = self.context_func(signal)
-        rules = RoutingExpression.objects.select_related('_expression', '_department')
-        for rule in rules.filter(is_active=True, _expression___type__name='routing').order_by('order'):
-            if rule._user and not rule._user.is_active:
-                # The user is no longer active so let's de activate the rule
-                rule.is_active = False
-                rule.save(update_fields=['is_active'])
-                continue  # Continue to the next rule
+    @staticmethod
+    def _deactivate_rule(rule: CompiledRoutingRule) -> None:
+        RoutingExpression.objects.filter(pk=rule.pk).update(is_active=False)
+        invalidate_routing_plan()
 
-            if (rule._department and rule._user
-                    and not rule._user.profile.departments.filter(id=rule._department.id).exists()):
-                # The user is no longer a member of the department so let's de activate the rule
-                rule.is_active = False
-                rule.save(update_fields=['is_active'])
+    def process_routing_rules(self, signal):
+        plan = self.engine.get_plan()
+        with routing_metrics.timer('evaluate'):
+            return self._apply_plan(plan, signal)
+
+    def _apply_plan(self, plan: RoutingPlan, signal) -> bool:
+        ctx = self.context_func(signal, areas=plan.areas)
+        for rule in plan.rules:
+            if rule.deactivate:
+                self._deactivate_rule(rule)
                 continue  # Continue to the next rule
 
-            evaluator = None
+            routing_metrics.increment('rules_evaluated')
+            eval_result = False
             try:
-                evaluator = self._compile(rule._expression.code)
+                eval_result = rule.evaluator.evaluate(ctx)
             except Exception:
-                # compilation failed, invalidate rule
-                rule.is_active = False
-                rule.save()
-
-            if evaluator and rule.is_active:
-                eval_result = False
-                try:
-                    eval_result = evaluator.evaluate(ctx)
-                except Exception:
-                    # ignore runtime errors
-                    pass
-                if eval_result:
-                    # assign relation to department
-                    data = {
-                        'routing_assignment': {
-                            'departments': [
-                                {
-                                    'id': rule._department.id
-                                }
-                            ]
-                        }
+                # ignore runtime errors
+                pass
+
+            if eval_result:
+                # assign relation to department
+                data = {
+                    'routing_assignment': {
+                        'departments': [
+                            {
+                                'id': rule.department_id
+                            }
+                        ]
                     }
+                }
 
-                    if rule._user:
-                        data['user_assignment'] = {'user': {'email': rule._user.email}}
+                if rule.user_email:
+                    data['user_assignment'] = {'user': {'email': rule.user_email}}
 
-                    self.signal_manager.update_multiple(data, signal)
-                    return True
+                self.signal_manager.update_multiple(data, signal)
+                routing_metrics.increment('matches')
+                return True
         return False
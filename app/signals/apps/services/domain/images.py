@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2023 Gemeente Amsterdam
+# Copyright (C) 2023 - 2026 Gemeente Amsterdam
 import base64
 import io
 import logging
@@ -8,6 +8,9 @@ import os
 from django.core.files.storage import default_storage
 from PIL import Image, UnidentifiedImageError
 
+# Imported from its module, the models package imports this module through the Attachment model
+from signals.apps.signals.models.attachment_rendition import AttachmentRendition
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,6 +29,58 @@ class DataUriImageEncodeService:
 
         return image.resize(size=(width, height), resample=Image.Resampling.LANCZOS).convert('RGB')
 
+    @staticmethod
+    def get_rendition_data_uri(att, max_size):
+        """
+        Returns the PDF rendition of the attachment as data URI, or None if there is no PDF rendition that fits
+        within max_size.
+        """
+        for rendition in att.renditions.all():
+            if rendition.kind != AttachmentRendition.PDF or rendition.width > max_size or rendition.height > max_size:
+                continue
+
+            try:
+                with default_storage.open(rendition.file.name) as file:
+                    data = file.read()
+            except:  # noqa:E722
+                msg = f'Cannot open PDF rendition of image attachment pk={att.pk}'
+                logger.warning(msg, exc_info=True)
+                return None
+
+            return f'data:image/jpg;base64,{base64.b64encode(data).decode("utf-8")}'
+        return None
+
+    @staticmethod
+    def get_image_data_uri(att, max_size):
+        """
+        Returns the image attachment as JPEG data URI that fits within max_size, or None if it cannot be opened.
+        """
+        with io.BytesIO() as buffer:
+            try:
+                with default_storage.open(att.file.name) as file:
+                    buffer.write(file.read())
+                    image = Image.open(buffer)
+            except UnidentifiedImageError:
+                # PIL cannot open the attached file it is probably not an image.
+                msg = f'Cannot open image attachment pk={att.pk}'
+                logger.warning(msg)
+                return None
+            except:  # noqa:E722
+                # Attachment cannot be opened - log the exception.
+                msg = f'Cannot open image attachment pk={att.pk}'
+                logger.warning(msg, exc_info=True)
+                return None
+
+            if image.width > max_size or image.height > max_size:
+                image = DataUriImageEncodeService.resize(image, max_size)
+
+            if image.mode == 'RGBA':
+                image = image.convert('RGB')
+
+            with io.BytesIO() as new_buffer:
+                image.save(new_buffer, format='JPEG')
+                return f'data:image/jpg;base64,{base64.b64encode(new_buffer.getvalue()).decode("utf-8")}'
+
     @staticmethod
     def get_context_data_images(signal, max_size):
         jpg_data_uris = []
@@ -33,43 +88,21 @@ class DataUriImageEncodeService:
         user_emails = []
         att_created_ats = []
 
-        for att in signal.attachments.all():
+        for att in signal.attachments.prefetch_related('renditions'):
             # Attachment is_image property is currently not reliable
             _, ext = os.path.splitext(att.file.name)
             if ext.lower() not in ['.gif', '.jpg', '.jpeg', '.png']:
                 continue  # unsupported image format, or not image format
 
-            with io.BytesIO() as buffer:
-                try:
-                    with default_storage.open(att.file.name) as file:
-                        buffer.write(file.read())
-                        image = Image.open(buffer)
-                except UnidentifiedImageError:
-                    # PIL cannot open the attached file it is probably not an image.
-                    msg = f'Cannot open image attachment pk={att.pk}'
-                    logger.warning(msg)
+            # Use the PDF rendition when there is one, otherwise resize the original image
+            encoded = DataUriImageEncodeService.get_rendition_data_uri(att, max_size)
+            if encoded is None:
+                encoded = DataUriImageEncodeService.get_image_data_uri(att, max_size)
+                if encoded is None:
                     continue
-                except:  # noqa:E722
-                    # Attachment cannot be opened - log the exception.
-                    msg = f'Cannot open image attachment pk={att.pk}'
-                    logger.warning(msg, exc_info=True)
-                    continue
-
-                if image.width > max_size or image.height > max_size:
-                    image = DataUriImageEncodeService.resize(image, max_size)
-
-                if image.mode == 'RGBA':
-                    image = image.convert('RGB')
-
-                with io.BytesIO() as new_buffer:
-                    new_buffer = io.BytesIO()
-                    image.save(new_buffer, format='JPEG')
-                    encoded = f'data:image/jpg;base64,{base64.b64encode(new_buffer.getvalue()).decode("utf-8")}'
-
-            att_filename = os.path.basename(att.file.name)
 
             jpg_data_uris.append(encoded)
-            att_filenames.append(att_filename)
+            att_filenames.append(os.path.basename(att.file.name))
             user_emails.append(att.created_by)
             att_created_ats.append(att.created_at)
 
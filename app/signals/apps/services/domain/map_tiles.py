@@ -0,0 +1,219 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+"""
+Fetching and caching of WMTS map tiles.
+
+Tiles are fetched concurrently over a pooled HTTP session and stored in a size-bounded cache on the local disk, keyed
+by (layer, zoom, x, y). The layer is derived from the URL template of the tile server. When the cache grows beyond its
+maximum size the least recently used tiles are removed.
+"""
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from signals.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+tile_metrics = get_metrics('map_tiles')
+
+TileKey = tuple[str, int, int, int]  # (layer, zoom, x, y)
+
+
+def get_layer(url_template: str) -> str:
+    """
+    Name of the layer served by the given URL template, used in the cache key.
+    """
+    return hashlib.sha1(url_template.encode()).hexdigest()[:16]
+
+
+class TileCache:
+    """
+    Cache of map tiles on the local disk, shared by all processes on the same machine.
+
+    Reading a tile updates its modification time, so the modification time tells when a tile was last used.
+    """
+    def __init__(self, location: str, max_size: int, max_age: int):
+        self.location = location
+        self.max_size = max_size
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._size: int | None = None  # Estimated size of the cache in bytes, None until first scanned
+
+    def _path(self, key: TileKey) -> str:
+        layer, zoom, x, y = key
+        return os.path.join(self.location, layer, str(zoom), str(x), f'{y}.tile')
+
+    def get(self, key: TileKey) -> bytes | None:
+        path = self._path(key)
+        try:
+            if self.max_age and time.time() - os.path.getmtime(path) > self.max_age:
+                return None
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)
+        except OSError:
+            return None
+        return data
+
+    def set(self, key: TileKey, data: bytes) -> None:
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temporary file first, a concurrent reader never sees a partially written tile
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f'Could not cache map tile {key}: {e}')
+            return
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(data)
+            if self._size > self.max_size:
+                self._evict()
+
+    def _iter_tiles(self) -> Iterable[os.DirEntry]:
+        stack = [self.location]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith('.tile'):
+                            yield entry
+            except OSError:
+                continue
+
+    def _scan_size(self) -> int:
+        return sum(entry.stat().st_size for entry in self._iter_tiles())
+
+    def _evict(self) -> None:
+        """
+        Remove the least recently used tiles until the cache is at 90% of its maximum size.
+        """
+        tiles = sorted(
+            ((entry.stat().st_mtime, entry.stat().st_size, entry.path) for entry in self._iter_tiles()),
+            reverse=True
+        )
+        size = sum(tile_size for _, tile_size, _ in tiles)
+        target = self.max_size * 0.9
+        while tiles and size > target:
+            _, tile_size, path = tiles.pop()
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            size -= tile_size
+            tile_metrics.increment('evictions')
+        self._size = size
+
+
+class TileFetcher:
+    """
+    Fetches tiles concurrently, tiles found in the cache are not fetched.
+    """
+    def __init__(self, cache: TileCache, concurrency: int, timeout: float):
+        self.cache = cache
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self._session: requests.Session | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=1,
+                        pool_maxsize=self.concurrency,
+                        max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504]),
+                    )
+                    session.mount('https://', adapter)
+                    session.mount('http://', adapter)
+                    self._session = session
+        return self._session
+
+    def _fetch(self, url: str) -> bytes | None:
+        try:
+            with tile_metrics.timer('fetch'):
+                response = self.session.get(url, timeout=self.timeout)
+                response.raise_for_status()
+        except requests.RequestException as e:
+            logger.warning(f'Could not fetch map tile {url}: {e}')
+            tile_metrics.increment('errors')
+            return None
+        return response.content
+
+    def get_tiles(self, url_template: str, zoom: int, tiles: Iterable[tuple[int, int]]) -> dict[tuple[int, int], bytes]:
+        """
+        Returns the tile data for the given (x, y) tiles, tiles that could not be fetched are left out.
+        """
+        layer = get_layer(url_template)
+
+        result = {}
+        missing = []
+        for x, y in tiles:
+            data = self.cache.get((layer, zoom, x, y))
+            if data is None:
+                missing.append((x, y))
+            else:
+                result[(x, y)] = data
+        tile_metrics.increment('hits', len(result))
+        tile_metrics.increment('misses', len(missing))
+
+        if missing:
+            try:
+                urls = [url_template.format(zoom=zoom, x=x, y=y) for x, y in missing]
+            except (KeyError, IndexError) as e:
+                logger.warning(f'Invalid map tile URL template {url_template}: {e}')
+                return result
+
+            with ThreadPoolExecutor(max_workers=min(self.concurrency, len(missing))) as executor:
+                for (x, y), data in zip(missing, executor.map(self._fetch, urls)):
+                    if data is not None:
+                        self.cache.set((layer, zoom, x, y), data)
+                        result[(x, y)] = data
+        return result
+
+
+_tile_fetcher: TileFetcher | None = None
+_tile_fetcher_lock = threading.Lock()
+
+
+def get_tile_fetcher() -> TileFetcher:
+    """
+    The tile fetcher of this process, configured with the MAP_TILE_* settings.
+    """
+    global _tile_fetcher
+    if _tile_fetcher is None:
+        with _tile_fetcher_lock:
+            if _tile_fetcher is None:
+                cache = TileCache(
+                    location=settings.MAP_TILE_CACHE_DIR or os.path.join(tempfile.gettempdir(), 'signals_map_tiles'),
+                    max_size=settings.MAP_TILE_CACHE_MAX_SIZE,
+                    max_age=settings.MAP_TILE_CACHE_MAX_AGE,
+                )
+                _tile_fetcher = TileFetcher(
+                    cache=cache,
+                    concurrency=settings.MAP_TILE_FETCH_CONCURRENCY,
+                    timeout=settings.MAP_TILE_FETCH_TIMEOUT,
+                )
+    return _tile_fetcher
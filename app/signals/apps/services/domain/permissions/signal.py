@@ -1,9 +1,15 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2021 Gemeente Amsterdam
+# Copyright (C) 2021 - 2026 Gemeente Amsterdam
+from functools import cached_property
+
 from django.conf import settings
 from django.db.models import Q
 
 from signals.apps.services.domain.permissions.base import PermissionService
+from signals.apps.services.domain.permissions.utils import (
+    get_visibility_scope,
+    make_permission_condition_for_user
+)
 
 
 class SignalPermissionService(PermissionService):
@@ -75,3 +81,98 @@ class SignalPermissionService(PermissionService):
                 SignalPermissionService.has_permission_via_department_routing(user, signal)
         )
         return has_read_permission and SignalPermissionService.has_permission(user, 'signals.sia_read')
+
+
+class SignalPermissionEvaluator:
+    """
+    Evaluates the signal permissions of one user, the permissions and the category and department grants of the user
+    are loaded once and every decision is memoized. Use get_signal_permission_evaluator to share an evaluator within a
+    request.
+
+    has_signal_permission answers the same question as SignalPermissionService.has_signal_permission. is_visible and
+    filter_visible answer the same question as Signal.objects.filter_for_user, filter_visible for a list of signals in
+    a single query.
+    """
+    def __init__(self, user):
+        self.user = user
+        self._signal_permissions: dict[int, bool] = {}
+        self._visible: dict[int, bool] = {}
+
+    @cached_property
+    def can_view_all_categories(self) -> bool:
+        return SignalPermissionService.has_permission(self.user, 'signals.sia_can_view_all_categories')
+
+    @cached_property
+    def has_read_permission(self) -> bool:
+        return SignalPermissionService.has_permission(self.user, 'signals.sia_read')
+
+    @cached_property
+    def scope(self):
+        return get_visibility_scope(self.user)
+
+    def has_permission_via_category(self, signal) -> bool:
+        if self.user.is_superuser or SignalPermissionService._skip_permission_check(permission='VIA_CATEGORY'):
+            return True
+
+        category_assignment = signal.category_assignment
+        return category_assignment is not None and category_assignment.category_id in self.scope.viewable_category_ids
+
+    def has_permission_via_department_routing(self, signal) -> bool:
+        if (self.user.is_superuser or
+                SignalPermissionService._skip_permission_check(permission='VIA_DEPARTMENT_ROUTING')):
+            return True
+
+        if not self.scope.department_ids:
+            return False  # No need to look up the routing of the signal
+
+        return not self.scope.department_ids.isdisjoint(
+            signal.signal_departments.filter(relation_type='routing').values_list('departments__pk', flat=True)
+        )
+
+    def has_signal_permission(self, signal) -> bool:
+        if self.user.is_superuser:
+            return True  # With great power comes great responsibility
+
+        if signal.pk not in self._signal_permissions:
+            self._signal_permissions[signal.pk] = self.has_read_permission and (
+                self.has_permission_via_category(signal) or self.has_permission_via_department_routing(signal)
+            )
+        return self._signal_permissions[signal.pk]
+
+    def can_view_signal(self, signal) -> bool:
+        """
+        The object level permission of SignalViewObjectPermission and ReporterPermission.
+        """
+        return self.can_view_all_categories or self.has_signal_permission(signal)
+
+    def filter_visible(self, signal_ids) -> set[int]:
+        """
+        The ids of the given signals the user may see, decided in a single query for the signals not seen before.
+        """
+        from signals.apps.signals.models import Signal
+
+        signal_ids = {int(signal_id) for signal_id in signal_ids}
+        if self.can_view_all_categories:
+            return signal_ids
+
+        unknown = signal_ids.difference(self._visible)
+        if unknown:
+            visible = set(Signal.objects.filter(make_permission_condition_for_user(self.user),
+                                                pk__in=unknown).values_list('pk', flat=True))
+            self._visible.update((signal_id, signal_id in visible) for signal_id in unknown)
+
+        return {signal_id for signal_id in signal_ids if self._visible[signal_id]}
+
+    def is_visible(self, signal_id) -> bool:
+        return bool(self.filter_visible([signal_id]))
+
+
+def get_signal_permission_evaluator(request) -> SignalPermissionEvaluator:
+    """
+    The permission evaluator of the user of the request, created once per request.
+    """
+    evaluator = getattr(request, '_signal_permission_evaluator', None)
+    if evaluator is None or evaluator.user != request.user:
+        evaluator = SignalPermissionEvaluator(request.user)
+        request._signal_permission_evaluator = evaluator
+    return evaluator
@@ -1,22 +1,71 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2021 Gemeente Amsterdam
+# Copyright (C) 2021 - 2026 Gemeente Amsterdam
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
 from django.db.models import Q
 
+from signals.apps.signals.utils.version_stamp import VersionStamp
+
+# Bumped whenever the departments of a profile or the departments of a category change
+visibility_scope_version = VersionStamp('permissions:visibility_scope:version')
+
+
+@dataclass(frozen=True)
+class VisibilityScope:
+    """
+    What a user without the "show all categories" permission may see: the signals in the categories their departments
+    are responsible for or can view, and the signals routed to their departments. The object level permission checks
+    only consider the categories their departments can view (viewable_category_ids).
+    """
+    category_ids: frozenset[int]
+    department_ids: frozenset[int]
+    viewable_category_ids: frozenset[int] = frozenset()
+
+
+def _compute_visibility_scope(user) -> VisibilityScope:
+    departments = user.profile.departments
+    department_ids = frozenset(departments.values_list('id', flat=True))
+    grants = departments.filter(
+        Q(categorydepartment__is_responsible=True) | Q(categorydepartment__can_view=True)
+    ).values_list('categorydepartment__category_id', 'categorydepartment__can_view') if department_ids else []
+    grants = list(grants)
+    return VisibilityScope(
+        category_ids=frozenset(category_id for category_id, _ in grants),
+        department_ids=department_ids,
+        viewable_category_ids=frozenset(category_id for category_id, can_view in grants if can_view),
+    )
+
+
+def get_visibility_scope(user) -> VisibilityScope:
+    """
+    The visibility scope of the user, cached until the departments of a profile or category change.
+    """
+    cache_key = f'permissions:visibility_scope:{visibility_scope_version.get()}:{user.pk}'
+    scope = cache.get(cache_key)
+    if scope is None:
+        scope = _compute_visibility_scope(user)
+        cache.set(cache_key, scope, settings.VISIBILITY_SCOPE_CACHE_TIMEOUT)
+    return scope
+
+
+def invalidate_visibility_scopes() -> None:
+    """
+    Bump the version stamp, so the visibility scopes of all users are recomputed. The version is bumped again once
+    the transaction is committed, a scope computed before the commit (from the old data) is not used afterwards.
+    """
+    visibility_scope_version.bump()
+    transaction.on_commit(visibility_scope_version.bump)
+
 
 def make_permission_condition_for_user_by_category(user):
-    return Q(category_assignment__category_id__in=user.profile.departments.prefetch_related(
-        'categorydepartment_set'
-    ).filter(
-        Q(categorydepartment__is_responsible=True) |
-        Q(categorydepartment__can_view=True)
-    ).values_list(
-        'categorydepartment__category_id',
-        flat=True
-    ))
+    return Q(category_assignment__category_id__in=get_visibility_scope(user).category_ids)
 
 
 def make_permission_condition_for_user_by_department_routing(user):
-    return Q(routing_assignment__departments__id__in=user.profile.departments.values_list('id', flat=True))
+    return Q(routing_assignment__departments__id__in=get_visibility_scope(user).department_ids)
 
 
 def make_permission_condition_for_user(user):
@@ -0,0 +1,128 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+"""
+Anonymization of the contact details of reporters of closed signals (AVG).
+
+Reporters are anonymized in batches, every batch in its own transaction: the reporters are anonymized with one UPDATE
+statement and the notes on their signals, and the history of these notes, are written with bulk inserts.
+"""
+import logging
+
+from django.db import transaction
+from django.db.models import Case, F, Q, QuerySet, Value, When
+from django.utils import timezone
+
+from signals.apps.history.services import SignalLogService
+from signals.apps.services.domain.reporter_statistics import (
+    ReporterStatisticsService,
+    get_reporter_keys
+)
+from signals.apps.signals.models import Note, Reporter, Signal
+from signals.apps.signals.workflow import (
+    AFGEHANDELD,
+    GEANNULEERD,
+    GESPLITST,
+    VERZOEK_TOT_AFHANDELING
+)
+from signals.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+anonymization_metrics = get_metrics('reporter_anonymization')
+
+ALLOWED_SIGNAL_STATES = [AFGEHANDELD, GEANNULEERD, GESPLITST, VERZOEK_TOT_AFHANDELING]
+
+HAS_EMAIL = Q(email__isnull=False) & ~Q(email__exact='')
+HAS_PHONE = Q(phone__isnull=False) & ~Q(phone__exact='')
+
+
+def get_anonymization_note(email_anonymized: bool, phone_anonymized: bool) -> str:
+    changed = []
+    if email_anonymized:
+        changed.append('email')
+    if phone_anonymized:
+        changed.append('telefoonnummer')
+    return 'Vanwege de AVG zijn de volgende gegevens van de melder geanonimiseerd: {}'.format(', '.join(changed))
+
+
+class ReporterAnonymizationService:
+    @staticmethod
+    def get_candidates(days: int) -> QuerySet:
+        """
+        The reporters with contact details, created more than the given number of days ago, of a closed signal.
+        """
+        created_before = timezone.now() - timezone.timedelta(days=days)
+        return Reporter.objects.filter(
+            HAS_EMAIL | HAS_PHONE,
+            created_at__lt=created_before,
+            _signal__status__state__in=ALLOWED_SIGNAL_STATES,
+        )
+
+    @staticmethod
+    def anonymize_batch(reporter_ids: list[int]) -> int:
+        """
+        Anonymize the given reporters and add a note to the signals they are the reporter of, returns the number of
+        anonymized reporters.
+        """
+        with transaction.atomic():
+            reporters = list(
+                Reporter.objects.filter(HAS_EMAIL | HAS_PHONE, pk__in=reporter_ids).select_for_update(of=('self', ))
+                .values_list('pk', 'email', 'phone', 'email_anonymized', 'phone_anonymized', 'signal')
+            )
+            if not reporters:
+                return 0
+
+            now = timezone.now()
+            anonymized_ids = [reporter[0] for reporter in reporters]
+            Reporter.objects.filter(pk__in=anonymized_ids).update(
+                email_anonymized=Case(When(HAS_EMAIL, then=Value(True)), default=F('email_anonymized')),
+                phone_anonymized=Case(When(HAS_PHONE, then=Value(True)), default=F('phone_anonymized')),
+                email=Case(When(HAS_EMAIL, then=Value(None)), default=F('email')),
+                phone=Case(When(HAS_PHONE, then=Value(None)), default=F('phone')),
+                updated_at=now,
+            )
+
+            keys = set()
+            notes = []
+            for _, email, phone, email_anonymized, phone_anonymized, signal_id in reporters:
+                keys |= get_reporter_keys(email, phone)
+                if signal_id is None:
+                    # Not the (current) reporter of a signal
+                    continue
+
+                text = get_anonymization_note(email_anonymized or bool(email), phone_anonymized or bool(phone))
+                notes.append(Note(_signal_id=signal_id, text=text, created_by=None))  # Shown as "SIA systeem"
+
+            notes = Note.objects.bulk_create(notes)
+            SignalLogService.log_create_notes(notes)
+            Signal.objects.filter(pk__in=[note._signal_id for note in notes]).update(updated_at=now)
+
+            # The UPDATE does not send post_save, so the statistics of the reporters are not refreshed by the receivers
+            ReporterStatisticsService.refresh_keys(keys)
+
+        anonymization_metrics.increment('anonymized', len(anonymized_ids))
+        return len(anonymized_ids)
+
+    @staticmethod
+    def anonymize(days: int, batch_size: int) -> int:
+        """
+        Anonymize all candidates in batches of batch_size reporters, the progress is logged after every batch. Returns
+        the number of anonymized reporters.
+        """
+        candidates = ReporterAnonymizationService.get_candidates(days=days)
+        total = candidates.count()
+
+        anonymized, last_id = 0, 0
+        while True:
+            reporter_ids = list(
+                candidates.filter(pk__gt=last_id).order_by('pk').values_list('pk', flat=True)[:batch_size]
+            )
+            if not reporter_ids:
+                break
+
+            anonymized += ReporterAnonymizationService.anonymize_batch(reporter_ids)
+            last_id = reporter_ids[-1]
+
+            logger.info(f'Anonymized {anonymized} of {total} reporter(s)')
+
+        return anonymized
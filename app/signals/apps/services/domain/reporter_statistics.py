@@ -0,0 +1,158 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+"""
+Statistics of the signals of a reporter, shown in the context of a signal.
+
+The statistics are kept per (normalized) email address and per phone number and are recomputed from the signals
+whenever a signal, reporter or feedback of the reporter changes, once the transaction of the change is committed. The
+row is locked while the statistics are recomputed, so concurrent changes for the same reporter are counted one after
+another, without holding up the transaction of the change. A refresh that fails after the change is committed does not
+fail the change, the refresh_reporter_statistics task retries it.
+"""
+import logging
+from collections.abc import Iterable
+
+from django.db import transaction
+from django.db.models import Count, Q
+
+from signals.apps.signals import workflow
+from signals.apps.signals.models import Reporter, ReporterStatistics, Signal
+from signals.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+statistics_metrics = get_metrics('reporter_statistics')
+
+EMAIL = 'email'
+PHONE = 'phone'
+
+CLOSED_STATES = [workflow.GEANNULEERD, workflow.AFGEHANDELD, workflow.GESPLITST]
+
+
+def normalize_email(email: str | None) -> str | None:
+    email = (email or '').strip().lower()
+    return email or None
+
+
+def normalize_phone(phone: str | None) -> str | None:
+    phone = (phone or '').strip()
+    return phone or None
+
+
+def get_reporter_keys(email: str | None, phone: str | None) -> set[tuple[str, str]]:
+    """
+    The keys of the statistics a reporter with the given email address and phone number counts towards.
+    """
+    keys = set()
+    if email := normalize_email(email):
+        keys.add((EMAIL, email))
+    if phone := normalize_phone(phone):
+        keys.add((PHONE, phone))
+    return keys
+
+
+class ReporterStatisticsService:
+    @staticmethod
+    def compute(key_type: str, value: str) -> dict[str, int]:
+        """
+        Count the signals of the reporter, the same way the signal context always did.
+        """
+        reporter_filter = {key_type: value}
+
+        counts = Signal.objects.filter_reporter(**reporter_filter).filter(parent__isnull=True).aggregate(
+            signal_count=Count('pk'),
+            open_count=Count('pk', filter=~Q(status__state__in=CLOSED_STATES)),
+        )
+        # Not filtering parent__isnull=True, as feedback is not requested for child signals.
+        counts['positive_count'] = Signal.objects.reporter_feedback_count(is_satisfied=True, **reporter_filter)
+        counts['negative_count'] = Signal.objects.reporter_feedback_count(is_satisfied=False, **reporter_filter)
+        return counts
+
+    @staticmethod
+    def refresh(key_type: str, value: str) -> ReporterStatistics | None:
+        """
+        Recompute the statistics of the reporter, the statistics are removed when the reporter has no signals (left).
+        """
+        with transaction.atomic():
+            statistics, _ = ReporterStatistics.objects.get_or_create(**{key_type: value})
+            statistics = ReporterStatistics.objects.select_for_update().get(pk=statistics.pk)
+
+            counts = ReporterStatisticsService.compute(key_type, value)
+            statistics_metrics.increment('refreshed')
+            if not any(counts.values()):
+                statistics.delete()
+                return None
+
+            for field, count in counts.items():
+                setattr(statistics, field, count)
+            statistics.save()
+        return statistics
+
+    @staticmethod
+    def refresh_keys(keys: Iterable[tuple[str, str]]) -> None:
+        # Always lock the rows in the same order
+        for key_type, value in sorted(set(keys)):
+            ReporterStatisticsService.refresh(key_type, value)
+
+    @staticmethod
+    def get_keys_of_reporters(reporter_ids: Iterable[int]) -> set[tuple[str, str]]:
+        reporter_ids = [reporter_id for reporter_id in reporter_ids if reporter_id is not None]
+        if not reporter_ids:
+            return set()
+
+        keys = set()
+        for email, phone in Reporter.objects.filter(pk__in=reporter_ids).values_list('email', 'phone'):
+            keys |= get_reporter_keys(email, phone)
+        return keys
+
+    @staticmethod
+    def refresh_reporters(reporter_ids: Iterable[int]) -> None:
+        ReporterStatisticsService.refresh_keys(ReporterStatisticsService.get_keys_of_reporters(reporter_ids))
+
+    @staticmethod
+    def schedule_refresh(keys: Iterable[tuple[str, str]] = (), reporter_ids: Iterable[int] = ()) -> None:
+        """
+        Refresh the statistics of the given reporters once the current transaction is committed. The reporters can be
+        given by key or by id, the keys of reporters given by id are looked up after the commit.
+
+        When refreshing fails (a lock timeout or a deadlock) the error is logged and the refresh_reporter_statistics
+        task is queued to retry it, the committed change itself does not fail.
+        """
+        from signals.apps.signals.tasks import refresh_reporter_statistics
+
+        keys = set(keys)
+        reporter_ids = {reporter_id for reporter_id in reporter_ids if reporter_id is not None}
+        if not keys and not reporter_ids:
+            return
+
+        def refresh():
+            all_keys = set(keys)
+            try:
+                all_keys |= ReporterStatisticsService.get_keys_of_reporters(reporter_ids)
+                ReporterStatisticsService.refresh_keys(all_keys)
+            except Exception as e:
+                statistics_metrics.increment('errors')
+                logger.warning(f'Refreshing the statistics of {len(all_keys)} reporter(s) went wrong, retrying in a '
+                               f'task, error: {e}')
+                refresh_reporter_statistics.delay(keys=sorted(all_keys), reporter_ids=sorted(reporter_ids))
+
+        # Robust, so that an error queueing the task is only logged
+        transaction.on_commit(refresh, robust=True)
+
+    @staticmethod
+    def get_for_email(email: str) -> ReporterStatistics:
+        """
+        Returns the statistics of the reporter with the given email address, computed once if they are missing (for
+        reporters whose signals were not changed since the statistics were introduced and not rebuilt).
+        """
+        email = normalize_email(email)
+        if email is None:
+            return ReporterStatistics()
+
+        statistics = ReporterStatistics.objects.filter(email=email).first()
+        if statistics is not None:
+            statistics_metrics.increment('hits')
+            return statistics
+
+        statistics_metrics.increment('misses')
+        return ReporterStatisticsService.refresh(EMAIL, email) or ReporterStatistics(email=email)
@@ -1,11 +1,12 @@
 # SPDX-License-Identifier: MPL-2.0
 # Copyright (C) 2020 - 2021 Vereniging van Nederlandse Gemeenten, Gemeente Amsterdam
 import io
-import urllib.request
 from math import asinh, modf, pi, radians, tan
 
 from PIL import Image
 
+from signals.apps.services.domain.map_tiles import get_tile_fetcher
+
 TILE_SIZE = 256
 
 
@@ -48,15 +49,14 @@ class WMTSMapGenerator:
         ytiles = top + bottom + 1
 
         img = Image.new("RGBA", (xtiles*TILE_SIZE, ytiles*TILE_SIZE), 0)
-        try:
-            for i in range(-left, right + 1, 1):
-                for j in range(-top, bottom + 1, 1):
-                    url = url_template.format(zoom=zoom, x=x+i, y=y+j)
-                    with urllib.request.urlopen(url) as response:
-                        offset = ((i+left) * TILE_SIZE, (j+top) * TILE_SIZE)
-                        img.paste(Image.open(io.BytesIO(response.read())), offset)
-        except Exception:
-            pass  # use empty image in case of errors
+
+        tiles = [(x+i, y+j) for i in range(-left, right + 1, 1) for j in range(-top, bottom + 1, 1)]
+        for (tile_x, tile_y), data in get_tile_fetcher().get_tiles(url_template, zoom, tiles).items():
+            offset = ((tile_x-x+left) * TILE_SIZE, (tile_y-y+top) * TILE_SIZE)
+            try:
+                img.paste(Image.open(io.BytesIO(data)), offset)
+            except Exception:
+                pass  # leave the tile empty in case of errors
 
         return img
 
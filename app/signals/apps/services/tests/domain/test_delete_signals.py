@@ -0,0 +1,138 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+import uuid
+from datetime import timedelta
+from unittest import mock
+
+from django.core.files.storage import default_storage
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from signals.apps.services.domain.delete_signals import SignalDeletionService
+from signals.apps.services.domain.reporter_statistics import EMAIL, ReporterStatisticsService
+from signals.apps.signals.factories import AttachmentFactory, SignalFactory
+from signals.apps.signals.models import DeletedSignal, Signal, Status
+from signals.apps.signals.tasks import delete_signals_in_state_for_x_days
+from signals.apps.signals.workflow import AFGEHANDELD, GEANNULEERD
+from signals.settings import FEATURE_FLAGS
+
+
+def create_signal_in_state(state, days_ago, **kwargs):
+    signal = SignalFactory.create(status__state=state, **kwargs)
+    Status.objects.filter(pk=signal.status_id).update(created_at=timezone.now() - timedelta(days=days_ago))
+    return signal
+
+
+class TestSignalDeletionService(TestCase):
+    def setUp(self):
+        self.candidates = SignalDeletionService.get_candidates(AFGEHANDELD, timezone.now() - timedelta(days=365))
+
+    def test_get_candidates(self):
+        signal = create_signal_in_state(AFGEHANDELD, 400)
+        SignalFactory.create(parent=signal)
+        create_signal_in_state(AFGEHANDELD, 100)
+        create_signal_in_state(GEANNULEERD, 400)
+
+        self.assertEqual(list(self.candidates.values_list('pk', flat=True)), [signal.pk])
+
+    def test_delete_batch(self):
+        signals = [create_signal_in_state(AFGEHANDELD, 400) for _ in range(3)]
+        children = SignalFactory.create_batch(2, parent=signals[0])
+        batch_uuid = uuid.uuid4()
+
+        batch = SignalDeletionService.delete_batch(self.candidates, start_after=0, batch_size=2, batch_uuid=batch_uuid)
+
+        self.assertEqual(batch.signal_ids, [signals[0].pk, signals[1].pk])
+        self.assertEqual(batch.last_id, signals[1].pk)
+        self.assertEqual(batch.deleted, 4)
+        self.assertEqual(list(Signal.objects.values_list('pk', flat=True)), [signals[2].pk])
+
+        deleted_signals = DeletedSignal.objects.filter(batch_uuid=batch_uuid)
+        self.assertEqual(deleted_signals.count(), 4)
+
+        deleted_child = deleted_signals.get(signal_id=children[0].pk)
+        self.assertEqual(deleted_child.parent_signal_id, signals[0].pk)
+        self.assertEqual(deleted_child.action, 'automatic')
+        self.assertEqual(deleted_child.note, 'Parent signal was in state "Afgehandeld" for 400 days')
+        self.assertEqual(deleted_signals.get(signal_id=signals[1].pk).note,
+                         'Signal was in state "Afgehandeld" for 400 days')
+
+        # Resumes after the last signal of the previous batch
+        batch = SignalDeletionService.delete_batch(self.candidates, start_after=batch.last_id, batch_size=2)
+        self.assertEqual(batch.signal_ids, [signals[2].pk])
+        self.assertFalse(Signal.objects.exists())
+
+        batch = SignalDeletionService.delete_batch(self.candidates, start_after=batch.last_id, batch_size=2)
+        self.assertEqual(batch.signal_ids, [])
+        self.assertIsNone(batch.last_id)
+
+    @mock.patch('signals.apps.search.signal_receivers.delete_from_elastic')
+    @mock.patch('signals.apps.search.signal_receivers.delete_many_from_elastic')
+    def test_delete_batch_once_per_batch(self, delete_many_from_elastic, delete_from_elastic):
+        signal = create_signal_in_state(AFGEHANDELD, 400, reporter__email='reporter@example.com')
+        child = SignalFactory.create(parent=signal, reporter__email='reporter@example.com')
+        other = create_signal_in_state(AFGEHANDELD, 400, reporter__email='other@example.com')
+
+        with mock.patch.object(ReporterStatisticsService, 'refresh_keys') as refresh_keys:
+            with self.captureOnCommitCallbacks(execute=True):
+                SignalDeletionService.delete_batch(self.candidates, start_after=0, batch_size=10)
+
+        # No work per deleted signal or reporter, the whole batch is handled once it is committed
+        delete_from_elastic.assert_not_called()
+        delete_many_from_elastic.delay.assert_called_once()
+        self.assertEqual(sorted(delete_many_from_elastic.delay.call_args.kwargs['signal_ids']),
+                         sorted([signal.pk, child.pk, other.pk]))
+        refresh_keys.assert_called_once()
+        self.assertLessEqual({(EMAIL, 'reporter@example.com'), (EMAIL, 'other@example.com')},
+                             set(refresh_keys.call_args.args[0]))
+
+    def test_delete_batch_removes_attachment_files(self):
+        signal = create_signal_in_state(AFGEHANDELD, 400)
+        child = SignalFactory.create(parent=signal)
+        file_names = [AttachmentFactory.create(_signal=signal).file.name,
+                      AttachmentFactory.create(_signal=child).file.name]
+        self.assertTrue(all(default_storage.exists(name) for name in file_names))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            SignalDeletionService.delete_batch(self.candidates, start_after=0, batch_size=10)
+
+        self.assertFalse(any(default_storage.exists(name) for name in file_names))
+
+
+@override_settings(
+    FEATURE_FLAGS={**FEATURE_FLAGS, 'DELETE_SIGNALS_IN_STATE_X_AFTER_PERIOD_Y_ENABLED': True},
+    SIGNAL_DELETION_BATCH_SIZE=2,
+    SIGNAL_DELETION_BATCH_DELAY=0,
+)
+class TestDeleteSignalsInStateForXDays(TestCase):
+    def setUp(self):
+        self.signals = [create_signal_in_state(AFGEHANDELD, 400) for _ in range(5)]
+
+    def test_delete_in_batches(self):
+        delete_signals_in_state_for_x_days(state=AFGEHANDELD, days=365)
+
+        self.assertFalse(Signal.objects.exists())
+        self.assertEqual(DeletedSignal.objects.values('batch_uuid').distinct().count(), 1)
+
+    @override_settings(SIGNAL_DELETION_BATCHES_PER_TASK=2)
+    def test_continues_in_next_task(self):
+        with mock.patch.object(delete_signals_in_state_for_x_days, 'delay') as mocked_delay:
+            delete_signals_in_state_for_x_days(state=AFGEHANDELD, days=365)
+
+        self.assertEqual(list(Signal.objects.values_list('pk', flat=True)), [self.signals[4].pk])
+        batch_uuid = DeletedSignal.objects.values_list('batch_uuid', flat=True).first()
+        mocked_delay.assert_called_once_with(state=AFGEHANDELD, days=365, batch_uuid=str(batch_uuid),
+                                             start_after=self.signals[3].pk)
+
+    def test_start_after(self):
+        delete_signals_in_state_for_x_days(state=AFGEHANDELD, days=365, start_after=self.signals[2].pk)
+
+        self.assertEqual(list(Signal.objects.order_by('pk').values_list('pk', flat=True)),
+                         [signal.pk for signal in self.signals[:3]])
+
+    def test_failed_batch_deleted_one_by_one(self):
+        with mock.patch.object(SignalDeletionService, 'delete_batch', side_effect=Exception('error')):
+            delete_signals_in_state_for_x_days(state=AFGEHANDELD, days=365)
+
+        self.assertFalse(Signal.objects.exists())
+        self.assertEqual(DeletedSignal.objects.count(), 5)
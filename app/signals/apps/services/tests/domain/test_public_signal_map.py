@@ -0,0 +1,96 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+import gzip
+from unittest import mock
+
+import brotli
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from signals.apps.services.domain.public_signal_map import (
+    BROTLI,
+    CACHE_KEY,
+    GZIP,
+    IDENTITY,
+    REFRESH_LOCK_CACHE_KEY,
+    REFRESH_SCHEDULED_CACHE_KEY,
+    PublicSignalMapService,
+    get_content_encoding
+)
+from signals.apps.signals import workflow
+from signals.apps.signals.factories import SignalFactoryValidLocation
+from signals.apps.signals.tasks import refresh_public_signal_map
+from signals.cache import clear_local_tiers
+
+
+class TestGetContentEncoding(TestCase):
+    def test_get_content_encoding(self):
+        available = {IDENTITY: b'', GZIP: b'', BROTLI: b''}
+
+        self.assertEqual(get_content_encoding('', available), IDENTITY)
+        self.assertEqual(get_content_encoding('gzip, deflate', available), GZIP)
+        self.assertEqual(get_content_encoding('gzip, deflate, br', available), BROTLI)
+        self.assertEqual(get_content_encoding('br;q=0.5, gzip', available), GZIP)
+        self.assertEqual(get_content_encoding('*', available), BROTLI)
+        self.assertEqual(get_content_encoding('gzip;q=0, identity', available), IDENTITY)
+        self.assertEqual(get_content_encoding('br', {IDENTITY: b'', GZIP: b''}), IDENTITY)
+
+
+class TestPublicSignalMapService(TestCase):
+    def setUp(self):
+        cache.clear()
+        clear_local_tiers()
+
+    def test_only_open_signals(self):
+        signal = SignalFactoryValidLocation.create(status__state=workflow.GEMELD)
+        SignalFactoryValidLocation.create(status__state=workflow.AFGEHANDELD)
+
+        public_signal_map = PublicSignalMapService.get()
+
+        self.assertIn(f'"id": {signal.pk}'.encode(), public_signal_map.content[IDENTITY])
+        self.assertEqual(public_signal_map.content[IDENTITY].count(b'"Feature"'), 1)
+
+    def test_compressed(self):
+        SignalFactoryValidLocation.create(status__state=workflow.GEMELD)
+
+        public_signal_map = PublicSignalMapService.build()
+
+        data = public_signal_map.content[IDENTITY]
+        self.assertEqual(gzip.decompress(public_signal_map.content[GZIP]), data)
+        self.assertEqual(brotli.decompress(public_signal_map.content[BROTLI]), data)
+
+    def test_kept_in_process_memory(self):
+        public_signal_map = PublicSignalMapService.get()
+
+        # Only the digest is looked up while the map did not change
+        cache.delete(CACHE_KEY)
+        with mock.patch.object(PublicSignalMapService, 'query') as mocked_query:
+            self.assertIs(PublicSignalMapService.get(), public_signal_map)
+        mocked_query.assert_not_called()
+
+    def test_expired_map_regenerated_once(self):
+        public_signal_map = PublicSignalMapService.build()
+
+        def store_map(seconds):
+            # The process holding the lock stores the map
+            cache.set(CACHE_KEY, public_signal_map)
+
+        cache.add(REFRESH_LOCK_CACHE_KEY, True)
+        with mock.patch('signals.apps.services.domain.public_signal_map.time.sleep', side_effect=store_map), \
+                mock.patch.object(PublicSignalMapService, 'query') as mocked_query:
+            self.assertEqual(PublicSignalMapService.get(), public_signal_map)
+        mocked_query.assert_not_called()
+
+    @override_settings(PUBLIC_SIGNAL_MAP_REFRESH_DELAY=30)
+    def test_schedule_refresh(self):
+        with mock.patch.object(refresh_public_signal_map, 'apply_async') as mocked_apply_async:
+            with self.captureOnCommitCallbacks(execute=True):
+                PublicSignalMapService.schedule_refresh()
+                PublicSignalMapService.schedule_refresh()
+
+                # Not flagged as scheduled before the change is committed
+                self.assertIsNone(cache.get(REFRESH_SCHEDULED_CACHE_KEY))
+
+        # Changes within the delay are picked up by the same refresh
+        mocked_apply_async.assert_called_once_with(countdown=30)
+        self.assertTrue(cache.get(REFRESH_SCHEDULED_CACHE_KEY))
@@ -1,11 +1,17 @@
 # SPDX-License-Identifier: MPL-2.0
 # Copyright (C) 2020 - 2022 Vereniging van Nederlandse Gemeenten, Gemeente Amsterdam
 import io
-from unittest.mock import patch
+import os
+import shutil
+import tempfile
+import time
+from unittest.mock import Mock, patch
 
+import requests
 from django.test import TestCase
 from PIL import Image
 
+from signals.apps.services.domain.map_tiles import TileCache, TileFetcher
 from signals.apps.services.domain.wmts_map_generator import WMTSMapGenerator
 
 
@@ -22,22 +28,82 @@ class WMTSMapGeneratorTest(TestCase):
         self.assertEqual(x, 67322)
         self.assertEqual(y, 43079)
 
-    @patch("urllib.request.urlopen")
-    def test_make_map(self, urlopen):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.tile_fetcher = TileFetcher(TileCache(self.cache_dir, max_size=1024 * 1024, max_age=60), concurrency=4,
+                                        timeout=1)
+
         tile_img = Image.new("RGBA", (256, 256), 0)
         png_array = io.BytesIO()
         tile_img.save(png_array, format='png')
-        urlopen.return_value.__enter__.return_value.read.return_value = png_array.getvalue()
-
-        try:
-            map = WMTSMapGenerator.make_map(
-                url_template="https://service.pdok.nl/brt/achtergrondkaart/wmts/v2_0/standaard/EPSG:28992/{z}/{x}/{y}.png", # noqa
-                lat=52.0870974,
-                lon=4.3075533,
-                zoom=17,
-                img_size=[648, 250]
-            )
-            self.assertIsNotNone(map)
-            self.assertEqual(map.size, (648, 250))
-        except Exception:
-            self.fail('Mapgenerator raised unexpected exception!')
+        self.tile_fetcher._session = Mock()
+        self.tile_fetcher._session.get.return_value.content = png_array.getvalue()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_make_map(self):
+        with patch('signals.apps.services.domain.wmts_map_generator.get_tile_fetcher', return_value=self.tile_fetcher):
+            try:
+                map = WMTSMapGenerator.make_map(
+                    url_template="https://service.pdok.nl/brt/achtergrondkaart/wmts/v2_0/standaard/EPSG:28992/{zoom}/{x}/{y}.png", # noqa
+                    lat=52.0870974,
+                    lon=4.3075533,
+                    zoom=17,
+                    img_size=[648, 250]
+                )
+                self.assertIsNotNone(map)
+                self.assertEqual(map.size, (648, 250))
+            except Exception:
+                self.fail('Mapgenerator raised unexpected exception!')
+
+    def test_make_map_from_cached_tiles(self):
+        url_template = 'https://tiles.example.com/{zoom}/{x}/{y}.png'
+        with patch('signals.apps.services.domain.wmts_map_generator.get_tile_fetcher', return_value=self.tile_fetcher):
+            WMTSMapGenerator.make_map(url_template=url_template, lat=52.0870974, lon=4.3075533, zoom=17,
+                                      img_size=[648, 250])
+            fetched = self.tile_fetcher._session.get.call_count
+            self.assertGreater(fetched, 0)
+
+            map = WMTSMapGenerator.make_map(url_template=url_template, lat=52.0870974, lon=4.3075533, zoom=17,
+                                            img_size=[648, 250])
+
+        self.assertEqual(map.size, (648, 250))
+        self.assertEqual(self.tile_fetcher._session.get.call_count, fetched)
+
+    def test_make_map_fetch_errors(self):
+        self.tile_fetcher._session.get.side_effect = requests.ConnectionError
+        with patch('signals.apps.services.domain.wmts_map_generator.get_tile_fetcher', return_value=self.tile_fetcher):
+            map = WMTSMapGenerator.make_map(url_template='https://tiles.example.com/{zoom}/{x}/{y}.png',
+                                            lat=52.0870974, lon=4.3075533, zoom=17, img_size=[648, 250])
+
+        # An empty map is returned
+        self.assertEqual(map.size, (648, 250))
+        self.assertEqual(len(os.listdir(self.cache_dir)), 0)
+
+
+class TileCacheTest(TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_get_set(self):
+        cache = TileCache(self.cache_dir, max_size=1024, max_age=60)
+        self.assertIsNone(cache.get(('layer', 17, 1, 2)))
+
+        cache.set(('layer', 17, 1, 2), b'tile')
+        self.assertEqual(cache.get(('layer', 17, 1, 2)), b'tile')
+        self.assertIsNone(cache.get(('other-layer', 17, 1, 2)))
+
+    def test_evict_least_recently_used(self):
+        cache = TileCache(self.cache_dir, max_size=250, max_age=60)
+        now = time.time()
+        for x in range(3):
+            cache.set(('layer', 17, x, 0), b'x' * 100)
+            # Make sure the tiles have a distinct modification time, the third tile triggers the eviction
+            os.utime(cache._path(('layer', 17, x, 0)), (now - 10 + x, now - 10 + x))
+
+        self.assertIsNone(cache.get(('layer', 17, 0, 0)))
+        self.assertIsNotNone(cache.get(('layer', 17, 2, 0)))
@@ -1,11 +1,24 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2021 Gemeente Amsterdam
+# Copyright (C) 2021 - 2026 Gemeente Amsterdam
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Permission
-from django.test import TestCase, override_settings
-
-from signals.apps.services.domain.permissions.signal import SignalPermissionService
-from signals.apps.signals.factories import SignalFactory
+from django.test import RequestFactory, TestCase, override_settings
+
+from signals.apps.services.domain.permissions.signal import (
+    SignalPermissionEvaluator,
+    SignalPermissionService,
+    get_signal_permission_evaluator
+)
+from signals.apps.services.domain.permissions.utils import invalidate_visibility_scopes
+from signals.apps.signals.factories import (
+    CategoryFactory,
+    DepartmentFactory,
+    SignalDepartmentsFactory,
+    SignalFactory
+)
+from signals.apps.signals.models import SignalDepartments
+from signals.apps.users.factories import SuperUserFactory, UserFactory
+from signals.cache import clear_local_tiers
 
 
 class TestSignalPermissionService(TestCase):
@@ -72,3 +85,77 @@ class TestSignalPermissionService(TestCase):
         self.user.user_permissions.add(sia_read)
 
         self.assertTrue(SignalPermissionService.has_signal_permission(self.user, self.signal))
+
+
+class TestSignalPermissionEvaluator(TestCase):
+    def setUp(self):
+        clear_local_tiers()
+        invalidate_visibility_scopes()
+
+        self.department = DepartmentFactory.create()
+        self.category = CategoryFactory.create(departments=[self.department])
+        self.other_category = CategoryFactory.create()
+
+        self.user = UserFactory.create()
+        self.user.profile.departments.add(self.department)
+        self.user.user_permissions.add(Permission.objects.get(codename='sia_read'))
+
+        self.signal = SignalFactory.create(category_assignment__category=self.category)
+        self.other_signal = SignalFactory.create(category_assignment__category=self.other_category)
+        self.routed_signal = SignalFactory.create(category_assignment__category=self.other_category)
+        self.routed_signal.routing_assignment = SignalDepartmentsFactory.create(
+            _signal=self.routed_signal,
+            relation_type=SignalDepartments.REL_ROUTING,
+            departments=[self.department]
+        )
+        self.routed_signal.save()
+
+    def test_has_signal_permission(self):
+        evaluator = SignalPermissionEvaluator(self.user)
+
+        for signal in (self.signal, self.other_signal, self.routed_signal):
+            self.assertEqual(evaluator.has_signal_permission(signal),
+                             SignalPermissionService.has_signal_permission(self.user, signal))
+
+        self.assertTrue(evaluator.has_signal_permission(self.signal))
+        self.assertFalse(evaluator.has_signal_permission(self.other_signal))
+        self.assertTrue(evaluator.has_signal_permission(self.routed_signal))
+
+        # The decisions are memoized
+        with self.assertNumQueries(0):
+            self.assertTrue(evaluator.can_view_signal(self.signal))
+            self.assertFalse(evaluator.can_view_signal(self.other_signal))
+
+    def test_has_signal_permission_super_user(self):
+        evaluator = SignalPermissionEvaluator(SuperUserFactory.create())
+
+        with self.assertNumQueries(0):
+            self.assertTrue(evaluator.has_signal_permission(self.other_signal))
+
+    def test_filter_visible(self):
+        evaluator = SignalPermissionEvaluator(self.user)
+        signal_ids = [self.signal.pk, self.other_signal.pk, self.routed_signal.pk]
+
+        self.assertEqual(evaluator.filter_visible(signal_ids), {self.signal.pk, self.routed_signal.pk})
+        with self.assertNumQueries(0):
+            self.assertTrue(evaluator.is_visible(str(self.signal.pk)))
+            self.assertFalse(evaluator.is_visible(self.other_signal.pk))
+
+    def test_filter_visible_view_all_categories(self):
+        self.user.user_permissions.add(Permission.objects.get(codename='sia_can_view_all_categories'))
+        evaluator = SignalPermissionEvaluator(get_user_model().objects.get(pk=self.user.pk))
+        signal_ids = {self.signal.pk, self.other_signal.pk, self.routed_signal.pk}
+
+        self.assertEqual(evaluator.filter_visible(signal_ids), signal_ids)
+        with self.assertNumQueries(0):
+            self.assertEqual(evaluator.filter_visible(signal_ids), signal_ids)
+
+    def test_get_signal_permission_evaluator(self):
+        request = RequestFactory().get('/')
+        request.user = self.user
+
+        evaluator = get_signal_permission_evaluator(request)
+        self.assertIs(get_signal_permission_evaluator(request), evaluator)
+
+        request.user = SuperUserFactory.create()
+        self.assertIsNot(get_signal_permission_evaluator(request), evaluator)
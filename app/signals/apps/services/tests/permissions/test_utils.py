@@ -0,0 +1,80 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from django.test import TestCase
+
+from signals.apps.services.domain.permissions.utils import (
+    VisibilityScope,
+    get_visibility_scope,
+    invalidate_visibility_scopes
+)
+from signals.apps.signals.factories import CategoryFactory, DepartmentFactory, SignalFactory
+from signals.apps.signals.models import CategoryDepartment, Signal
+from signals.apps.users.factories import UserFactory
+from signals.cache import clear_local_tiers
+
+
+class TestVisibilityScope(TestCase):
+    def setUp(self):
+        clear_local_tiers()
+        invalidate_visibility_scopes()
+
+        self.department = DepartmentFactory.create()
+        self.category = CategoryFactory.create(departments=[self.department])
+        self.other_category = CategoryFactory.create()
+
+        self.user = UserFactory.create()
+        self.user.profile.departments.add(self.department)
+
+    def test_get_visibility_scope(self):
+        scope = get_visibility_scope(self.user)
+        self.assertEqual(scope, VisibilityScope(category_ids=frozenset([self.category.pk]),
+                                                department_ids=frozenset([self.department.pk]),
+                                                viewable_category_ids=frozenset([self.category.pk])))
+
+        # The scope is cached
+        with self.assertNumQueries(0):
+            self.assertEqual(get_visibility_scope(self.user), scope)
+
+    def test_get_visibility_scope_without_departments(self):
+        user = UserFactory.create()
+        self.assertEqual(get_visibility_scope(user), VisibilityScope(category_ids=frozenset(),
+                                                                     department_ids=frozenset()))
+
+    def test_profile_departments_changed(self):
+        get_visibility_scope(self.user)
+
+        department = DepartmentFactory.create()
+        self.other_category.departments.add(department, through_defaults={'is_responsible': False, 'can_view': True})
+        self.user.profile.departments.add(department)
+        scope = get_visibility_scope(self.user)
+        self.assertEqual(scope.category_ids, {self.category.pk, self.other_category.pk})
+        self.assertEqual(scope.department_ids, {self.department.pk, department.pk})
+        self.assertEqual(scope.viewable_category_ids, {self.category.pk, self.other_category.pk})
+
+        self.user.profile.departments.clear()
+        self.assertEqual(get_visibility_scope(self.user), VisibilityScope(category_ids=frozenset(),
+                                                                          department_ids=frozenset()))
+
+    def test_category_departments_changed(self):
+        get_visibility_scope(self.user)
+
+        category_department = CategoryDepartment.objects.create(category=self.other_category,
+                                                                department=self.department,
+                                                                is_responsible=False, can_view=False)
+        self.assertEqual(get_visibility_scope(self.user).category_ids, {self.category.pk})
+
+        category_department.can_view = True
+        category_department.save()
+        self.assertEqual(get_visibility_scope(self.user).category_ids, {self.category.pk, self.other_category.pk})
+
+        self.category.departments.remove(self.department)
+        self.assertEqual(get_visibility_scope(self.user).category_ids, {self.other_category.pk})
+
+        category_department.delete()
+        self.assertEqual(get_visibility_scope(self.user).category_ids, set())
+
+    def test_filter_for_user(self):
+        signal = SignalFactory.create(category_assignment__category=self.category)
+        SignalFactory.create(category_assignment__category=self.other_category)
+
+        self.assertEqual(list(Signal.objects.filter_for_user(self.user)), [signal])
@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2021 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
 from django.core.management import BaseCommand
 
 from signals.apps.signals.tasks import anonymize_reporters
@@ -8,11 +8,19 @@ from signals.apps.signals.tasks import anonymize_reporters
 class Command(BaseCommand):
     def add_arguments(self, parser):
         parser.add_argument('--days', type=int, help='')
+        parser.add_argument('--dry-run', action='store_true', help='Only count the reporters that would be anonymized')
+        parser.add_argument('--batch-size', type=int, help='Anonymize the reporters in batches of this size')
+        parser.add_argument('--per-reporter', action='store_true',
+                            help='Anonymize the reporters with a task per reporter instead of in batches')
 
     def handle(self, *args, **options):
         days = options['days'] or 365
         if days < 365:
             self.stderr.write('days should be 365 or higher')
+        elif options['dry_run']:
+            reporter_count = anonymize_reporters(days=days, dry_run=True)
+            self.stdout.write('{} reporter(s) would be anonymized'.format(reporter_count))
         else:
-            reporter_count = anonymize_reporters(days=days)
+            reporter_count = anonymize_reporters(days=days, bulk=False if options['per_reporter'] else None,
+                                                 batch_size=options['batch_size'])
             self.stdout.write('Anonymized {} reporter(s)'.format(reporter_count))
@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+import json
+
+from django.core.management import BaseCommand, CommandError
+
+from signals.benchmark.dataset import DatasetConfig, seed_dataset
+from signals.benchmark.runner import compare_reports, run_benchmarks
+from signals.benchmark.scenarios import SCENARIOS
+
+
+class Command(BaseCommand):
+    help = ('Benchmark the hot paths of the API and the tasks against the local database. Never run this against a '
+            'production database, the benchmark dataset is seeded into it.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seed-dataset', action='store_true', dest='seed_dataset',
+                            help='Seed the benchmark dataset first, the database must not contain any signals')
+        parser.add_argument('--signals', type=int, default=DatasetConfig.signals,
+                            help=f'Number of signals in the seeded dataset. Default {DatasetConfig.signals}.')
+        parser.add_argument('--random-seed', type=int, default=DatasetConfig.seed,
+                            help=f'Seed of the random generators used for the dataset. Default {DatasetConfig.seed}.')
+        parser.add_argument('--scenario', action='append', dest='scenarios', choices=list(SCENARIOS.keys()),
+                            help='Scenario to run, can be given more than once (if none given all scenarios are run)')
+        parser.add_argument('--iterations', type=int, default=20, help='Measured runs per scenario. Default 20.')
+        parser.add_argument('--warmup', type=int, default=2, help='Unmeasured runs per scenario. Default 2.')
+        parser.add_argument('--label', type=str, help='Label of the report, for example the name of a branch')
+        parser.add_argument('--output', type=str, help='Write the JSON report to this file')
+        parser.add_argument('--compare', type=str, help='Compare the results with this (earlier) JSON report')
+        parser.add_argument('--threshold', type=float, default=0.1,
+                            help='Relative increase of a latency or memory metric that counts as a regression. '
+                                 'Default 0.1 (10%%).')
+        parser.add_argument('--fail-on-regression', action='store_true', dest='fail_on_regression',
+                            help='Exit with an error when a regression was found')
+
+    def handle(self, *args, **options):
+        if options['iterations'] < 1:
+            raise CommandError('The number of iterations must be at least 1')
+
+        if options['seed_dataset']:
+            config = DatasetConfig(signals=options['signals'], seed=options['random_seed'])
+            try:
+                dataset = seed_dataset(config)
+            except ValueError as e:
+                raise CommandError(str(e))
+            self.stdout.write(f'Seeded the benchmark dataset: {dataset}')
+
+        names = options['scenarios'] or list(SCENARIOS.keys())
+        report = run_benchmarks(names, iterations=options['iterations'], warmup=options['warmup'],
+                                label=options['label'], progress=self._write_results)
+
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump(report, f, indent=2)
+            self.stdout.write(f'Wrote the report to {options["output"]}')
+
+        if options['compare']:
+            self._compare(options['compare'], report, options['threshold'], options['fail_on_regression'])
+
+    def _write_results(self, name, results):
+        if 'skipped' in results:
+            self.stdout.write(f'{name}: skipped, {results["skipped"]}')
+            return
+
+        self.stdout.write(f'{name}: p50 {results["p50_ms"]:.1f}ms, p95 {results["p95_ms"]:.1f}ms, '
+                          f'p99 {results["p99_ms"]:.1f}ms, {results["queries"]:g} queries, '
+                          f'peak memory {results["peak_memory_kib"]:.0f}KiB')
+
+    def _compare(self, path, report, threshold, fail_on_regression):
+        with open(path) as f:
+            baseline = json.load(f)
+
+        try:
+            changes = compare_reports(baseline, report, threshold)
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        regressions = [change for change in changes if change.regression]
+        for change in changes:
+            relative = f'{change.relative:+.1%}' if change.relative is not None else 'n/a'
+            marker = ' REGRESSION' if change.regression else ''
+            self.stdout.write(f'{change.scenario} {change.metric}: {change.baseline:g} -> {change.current:g} '
+                              f'({relative}){marker}')
+
+        self.stdout.write(f'{len(regressions)} regression(s) compared to {path}')
+        if regressions and fail_on_regression:
+            raise CommandError(f'{len(regressions)} regression(s) found')
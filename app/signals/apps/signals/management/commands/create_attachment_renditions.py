@@ -0,0 +1,32 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from django.core.management import BaseCommand
+
+from signals.apps.signals.models import Attachment
+from signals.apps.signals.tasks import create_attachment_renditions
+
+
+class Command(BaseCommand):
+    help = 'Create the renditions of image attachments that have none yet, for attachments added before renditions ' \
+           'existed.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', help='Also (re)create the renditions of attachments that '
+                                                               'already have renditions')
+        parser.add_argument('--async', action='store_true', dest='run_async',
+                            help='Queue a Celery task per attachment instead of creating the renditions directly')
+
+    def handle(self, *args, **options):
+        attachments = Attachment.objects.filter(is_image=True)
+        if not options['all']:
+            attachments = attachments.filter(renditions__isnull=True)
+
+        count = 0
+        for attachment_id in attachments.order_by('pk').values_list('pk', flat=True).distinct().iterator():
+            if options['run_async']:
+                create_attachment_renditions.delay(attachment_id)
+            else:
+                create_attachment_renditions(attachment_id)
+            count += 1
+
+        self.stdout.write(f'Created the renditions of {count} attachment(s)')
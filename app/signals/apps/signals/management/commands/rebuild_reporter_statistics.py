@@ -0,0 +1,38 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from django.core.management import BaseCommand
+from django.db.models.functions import Lower, Trim
+
+from signals.apps.services.domain.reporter_statistics import EMAIL, PHONE, ReporterStatisticsService
+from signals.apps.signals.models import Reporter, ReporterStatistics
+
+
+class Command(BaseCommand):
+    help = 'Recompute the statistics of all reporters, for example after signals or reporters were changed in bulk.'
+
+    def handle(self, *args, **options):
+        # Only the current reporter of a signal counts
+        reporters = Reporter.objects.filter(signal__isnull=False)
+        emails = reporters.exclude(email__isnull=True).exclude(email='').annotate(
+            key=Lower(Trim('email'))
+        ).order_by('key').values_list('key', flat=True).distinct()
+        phones = reporters.exclude(phone__isnull=True).exclude(phone='').annotate(
+            key=Trim('phone')
+        ).order_by('key').values_list('key', flat=True).distinct()
+
+        count = 0
+        for key_type, keys in ((EMAIL, emails), (PHONE, phones)):
+            seen = set()
+            for key in keys.iterator():
+                if key:
+                    ReporterStatisticsService.refresh(key_type, key)
+                    seen.add(key)
+                    count += 1
+
+            # Reporters without signals (left)
+            stale = ReporterStatistics.objects.filter(**{f'{key_type}__isnull': False})
+            ReporterStatistics.objects.filter(
+                pk__in=[pk for pk, key in stale.values_list('pk', key_type) if key not in seen]
+            ).delete()
+
+        self.stdout.write(f'Rebuilt the statistics of {count} reporter(s)')
@@ -1,7 +1,9 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2022 Vereniging van Nederlandse Gemeenten, Gemeente Amsterdam, Delta10 B.V.
+# Copyright (C) 2019 - 2026 Vereniging van Nederlandse Gemeenten, Gemeente Amsterdam, Delta10 B.V.
 import os
+from contextvars import ContextVar
 
+from django.conf import settings
 from django.contrib.gis.db import models
 from django.core.exceptions import ValidationError
 from django.db import transaction
@@ -12,6 +14,7 @@ from signals.settings import DEFAULT_SIGNAL_AREA_TYPE
 # Declaring custom Django signals for our `SignalManager`.
 
 create_initial = DjangoSignal()
+create_initial_bulk = DjangoSignal()
 create_child = DjangoSignal()
 add_attachment = DjangoSignal()
 update_location = DjangoSignal()
@@ -23,6 +26,12 @@ create_note = DjangoSignal()
 update_type = DjangoSignal()
 update_user_assignment = DjangoSignal()
 update_signal_departments = DjangoSignal()
+# Sent once signals deleted in bulk are committed, with the ids of all deleted signals (including the children)
+delete_bulk = DjangoSignal()
+
+# True while signals are deleted in bulk, the post_delete receivers of the rows leave their work to the receivers of
+# `delete_bulk`, which handle all deleted signals at once
+bulk_deletion_in_progress: ContextVar[bool] = ContextVar('signals_bulk_deletion_in_progress', default=False)
 
 
 def send_signals(to_send):
@@ -53,33 +62,16 @@ class SignalManager(models.Manager):
         :returns: Signal object
         """
         from .models import CategoryAssignment, Location, Priority, Reporter, Status, Type
-        from .utils.location import _get_area, _get_stadsdeel_code
 
         if session:
-            from signals.apps.questionnaires.services import SessionService
-            session_service = SessionService(session)
-            session_extra_properties = session_service.get_extra_properties()
-            if 'extra_properties' in signal_data:
-                signal_data['extra_properties'] = signal_data['extra_properties'] + session_extra_properties
-            else:
-                signal_data.update({'extra_properties': session_extra_properties})
+            self._add_session_extra_properties(signal_data, session)
 
         signal = self.create(**signal_data)
 
         # Set default (empty dict) value for `priority_data` if None is given.
         priority_data = priority_data or {}
 
-        # SIG-2513 Determine the stadsdeel
-        default_stadsdeel = location_data['stadsdeel'] if 'stadsdeel' in location_data else None
-        location_data['stadsdeel'] = _get_stadsdeel_code(location_data['geometrie'], default_stadsdeel)
-
-        # set area_type and area_code if default area type is provided
-        if DEFAULT_SIGNAL_AREA_TYPE:
-            area = _get_area(location_data['geometrie'], DEFAULT_SIGNAL_AREA_TYPE)
-            if area:
-                location_data['area_type_code'] = DEFAULT_SIGNAL_AREA_TYPE
-                location_data['area_code'] = area.code
-                location_data['area_name'] = area.name
+        self._set_location_areas(location_data)
 
         # Create dependent model instances with correct foreign keys to Signal
         location = Location.objects.create(**location_data, _signal_id=signal.pk)
@@ -111,6 +103,33 @@ class SignalManager(models.Manager):
 
         return signal
 
+    @staticmethod
+    def _add_session_extra_properties(signal_data, session):
+        from signals.apps.questionnaires.services import SessionService
+
+        session_service = SessionService(session)
+        session_extra_properties = session_service.get_extra_properties()
+        if 'extra_properties' in signal_data:
+            signal_data['extra_properties'] = signal_data['extra_properties'] + session_extra_properties
+        else:
+            signal_data.update({'extra_properties': session_extra_properties})
+
+    @staticmethod
+    def _set_location_areas(location_data):
+        from .utils.location import _get_area, _get_stadsdeel_code
+
+        # SIG-2513 Determine the stadsdeel
+        default_stadsdeel = location_data['stadsdeel'] if 'stadsdeel' in location_data else None
+        location_data['stadsdeel'] = _get_stadsdeel_code(location_data['geometrie'], default_stadsdeel)
+
+        # set area_type and area_code if default area type is provided
+        if DEFAULT_SIGNAL_AREA_TYPE:
+            area = _get_area(location_data['geometrie'], DEFAULT_SIGNAL_AREA_TYPE)
+            if area:
+                location_data['area_type_code'] = DEFAULT_SIGNAL_AREA_TYPE
+                location_data['area_code'] = area.code
+                location_data['area_name'] = area.name
+
     def create_initial(self, signal_data, location_data, status_data, category_assignment_data,
                        reporter_data, priority_data=None, type_data=None, session=None):
         """Create a new `Signal` object with all related objects.
@@ -143,6 +162,144 @@ class SignalManager(models.Manager):
 
         return signal
 
+    def _validate_bulk_children(self, signals):
+        """Validate the children among the given (new) `Signal` objects the way `Signal.save` does, counting the
+        children created together.
+        """
+        new_children = {}
+        for signal in signals:
+            if signal.parent is not None:
+                parent, count = new_children.get(signal.parent.pk, (signal.parent, 0))
+                new_children[signal.parent.pk] = (parent, count + 1)
+
+        for parent, count in new_children.values():
+            if parent.is_child:
+                raise ValidationError('A child of a child is not allowed')
+
+            if parent.children.count() + count > settings.SIGNAL_MAX_NUMBER_OF_CHILDREN:
+                raise ValidationError('Maximum number of children reached for the parent Signal')
+
+    def _create_initial_bulk_no_transaction(self, items):  # noqa: C901
+        """Create many new `Signal` objects with all related objects.
+            If a transaction is needed use SignalManager.create_initial_bulk
+
+        :param items: list of dicts with the keyword arguments of `create_initial` for every Signal
+        :returns: list of Signal objects
+        """
+        from signals.apps.questionnaires.models import Session
+        from signals.apps.services.domain.deadlines import DeadlineCalculationService
+        from signals.apps.services.domain.reporter_statistics import (
+            ReporterStatisticsService,
+            get_reporter_keys
+        )
+
+        from .models import CategoryAssignment, Location, Priority, Reporter, Status, Type
+
+        if not items:
+            return []
+
+        signals = []
+        for item in items:
+            signal_data = item['signal_data']
+            if item.get('session'):
+                self._add_session_extra_properties(signal_data, item['session'])
+            signals.append(self.model(**signal_data))
+
+        self._validate_bulk_children(signals)
+        signals = self.bulk_create(signals)
+
+        # The current service level objective is looked up once per category
+        slos = {}
+
+        locations, statuses, category_assignments, reporters, priorities, types = [], [], [], [], [], []
+        for signal, item in zip(signals, items):
+            location_data = item['location_data']
+            self._set_location_areas(location_data)
+            location = Location(**location_data, _signal=signal)
+            location.set_address_text()
+            locations.append(location)
+
+            statuses.append(Status(**item['status_data'], _signal=signal))
+
+            category_assignment = CategoryAssignment(**item['category_assignment_data'], _signal=signal)
+            if category_assignment.category_id not in slos:
+                slos[category_assignment.category_id] = DeadlineCalculationService.get_current_slo(
+                    category_assignment.category)
+            category_assignment.deadline, category_assignment.deadline_factor_3 = \
+                DeadlineCalculationService.from_created_at_and_slo(signal.created_at,
+                                                                   slos[category_assignment.category_id])
+            category_assignment.stored_handling_message = category_assignment.category.handling_message  # SIG-3555
+            category_assignments.append(category_assignment)
+
+            # Original reporters are approved immediately, there is no earlier reporter to verify against.
+            reporters.append(Reporter(**item['reporter_data'], _signal=signal,
+                                      state=Reporter.REPORTER_STATE_APPROVED))
+
+            priorities.append(Priority(**(item.get('priority_data') or {}), _signal=signal))
+
+            # If type_data is None a Type is created with the default "SIGNAL" value
+            signal_type = Type(**(item.get('type_data') or {}), _signal=signal)
+            signal_type.full_clean(exclude=['_signal'], validate_unique=False)
+            types.append(signal_type)
+
+        # One multi-row INSERT per model
+        Location.objects.bulk_create(locations)
+        Status.objects.bulk_create(statuses)
+        CategoryAssignment.objects.bulk_create(category_assignments)
+        Reporter.objects.bulk_create(reporters)
+        Priority.objects.bulk_create(priorities)
+        Type.objects.bulk_create(types)
+
+        # Set Signal to dependent model instance foreign keys
+        for signal, location, status, category_assignment, reporter, priority, signal_type in zip(
+                signals, locations, statuses, category_assignments, reporters, priorities, types):
+            signal.location = location
+            signal.status = status
+            signal.category_assignment = category_assignment
+            signal.reporter = reporter
+            signal.priority = priority
+            signal.type_assignment = signal_type
+        self.bulk_update(signals, ['location', 'status', 'category_assignment', 'reporter', 'priority',
+                                   'type_assignment'])
+
+        sessions = []
+        for signal, item in zip(signals, items):
+            if item.get('session'):
+                session = item['session']
+                session._signal = signal
+                sessions.append(session)
+        if sessions:
+            Session.objects.bulk_update(sessions, ['_signal'])
+
+        # No post_save is sent for the reporters, so the statistics are refreshed here once the signals are committed
+        keys = set()
+        for reporter in reporters:
+            keys |= get_reporter_keys(reporter.email, reporter.phone)
+        ReporterStatisticsService.schedule_refresh(keys=keys)
+
+        return signals
+
+    def create_initial_bulk(self, items):
+        """Create many new `Signal` objects with all related objects, with a few multi-row statements instead of the
+        statements of `create_initial` for every Signal.
+
+        The history of all signals is logged at once and a single `create_initial_bulk` Django signal is sent for all
+        signals (instead of `create_initial` for every Signal) once the transaction is committed.
+
+        :param items: list of dicts with the keyword arguments of `create_initial` for every Signal (signal_data,
+            location_data, status_data, category_assignment_data, reporter_data and optionally priority_data,
+            type_data and session)
+        :returns: list of Signal objects
+        """
+        with transaction.atomic():
+            signals = self._create_initial_bulk_no_transaction(items)
+
+            if signals:
+                transaction.on_commit(lambda: create_initial_bulk.send_robust(sender=self.__class__,
+                                                                              signal_objs=signals))
+
+        return signals
+
     def add_image(self, image, signal):
         return self.add_attachment(image, signal)
 
@@ -175,19 +332,8 @@ class SignalManager(models.Manager):
         :returns: Location object
         """
         from .models import Location
-        from .utils.location import _get_area, _get_stadsdeel_code
-
-        # SIG-2513 Determine the stadsdeel
-        default_stadsdeel = data['stadsdeel'] if 'stadsdeel' in data else None
-        data['stadsdeel'] = _get_stadsdeel_code(data['geometrie'], default_stadsdeel)
 
-        # set area_type and area_code if default area type is provided
-        if DEFAULT_SIGNAL_AREA_TYPE:
-            area = _get_area(data['geometrie'], DEFAULT_SIGNAL_AREA_TYPE)
-            if area:
-                data['area_type_code'] = DEFAULT_SIGNAL_AREA_TYPE
-                data['area_code'] = area.code
-                data['area_name'] = area.name
+        self._set_location_areas(data)
 
         prev_location = signal.location
         location = Location.objects.create(**data, _signal_id=signal.id)
@@ -0,0 +1,40 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('signals', '0197_auto_20231030_1323'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AttachmentRendition',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('kind', models.CharField(choices=[('thumbnail', 'Thumbnail'), ('pdf', 'PDF'), ('webp', 'WebP')],
+                                          max_length=16)),
+                ('file', models.FileField(max_length=255, upload_to='attachments/renditions/%Y/%m/%d/')),
+                ('mimetype', models.CharField(max_length=30)),
+                ('width', models.PositiveIntegerField()),
+                ('height', models.PositiveIntegerField()),
+                ('size', models.PositiveIntegerField()),
+                ('checksum', models.CharField(max_length=64)),
+                ('attachment', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE,
+                                                 related_name='renditions', to='signals.attachment')),
+            ],
+            options={
+                'ordering': ('attachment', 'kind'),
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='attachmentrendition',
+            constraint=models.UniqueConstraint(fields=('attachment', 'kind'),
+                                               name='signals_attachmentrendition_unique_constraint'),
+        ),
+    ]
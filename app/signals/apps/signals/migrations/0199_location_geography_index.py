@@ -0,0 +1,26 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+import signals.apps.signals.models.functions.geography
+
+
+class Migration(migrations.Migration):
+    # The locations table is large, build the index without locking it for writes
+    atomic = False
+
+    dependencies = [
+        ('signals', '0198_attachmentrendition'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='location',
+            index=django.contrib.postgres.indexes.GistIndex(
+                signals.apps.signals.models.functions.geography.AsGeography('geometrie'),
+                name='signals_location_geography',
+            ),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('signals', '0199_location_geography_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReporterStatistics',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('email', models.EmailField(max_length=254, null=True, unique=True)),
+                ('phone', models.CharField(max_length=17, null=True, unique=True)),
+                ('signal_count', models.PositiveIntegerField(default=0)),
+                ('open_count', models.PositiveIntegerField(default=0)),
+                ('positive_count', models.PositiveIntegerField(default=0)),
+                ('negative_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'reporter statistics',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='reporterstatistics',
+            constraint=models.CheckConstraint(
+                check=(models.Q(('email__isnull', False), ('phone__isnull', True))
+                       | models.Q(('email__isnull', True), ('phone__isnull', False))),
+                name='signals_reporterstatistics_email_or_phone',
+            ),
+        ),
+    ]
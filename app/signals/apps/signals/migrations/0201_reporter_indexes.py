@@ -0,0 +1,25 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+import django.db.models.functions.text
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # The reporters table is large, build the indexes without locking it for writes
+    atomic = False
+
+    dependencies = [
+        ('signals', '0200_reporterstatistics'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='reporter',
+            index=models.Index(django.db.models.functions.text.Upper('email'), name='signals_reporter_email_upper'),
+        ),
+        AddIndexConcurrently(
+            model_name='reporter',
+            index=models.Index(fields=['phone'], name='signals_reporter_phone'),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.functions.text
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # The notes and locations tables are large, build the indexes without locking them for writes
+    atomic = False
+
+    dependencies = [
+        ('signals', '0201_reporter_indexes'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name='note',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper('text'),
+                    name='gin_trgm_ops',
+                ),
+                name='signals_note_text_trgm',
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name='note',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.search.SearchVector('text', config='dutch'),
+                name='signals_note_text_search',
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name='location',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper('address_text'),
+                    name='gin_trgm_ops',
+                ),
+                name='signals_location_address_trgm',
+            ),
+        ),
+    ]
@@ -1,7 +1,8 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2023 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
 from signals.apps.signals.models.area import Area, AreaType
 from signals.apps.signals.models.attachment import Attachment
+from signals.apps.signals.models.attachment_rendition import AttachmentRendition
 from signals.apps.signals.models.buurt import Buurt
 from signals.apps.signals.models.category import Category
 from signals.apps.signals.models.category_assignment import CategoryAssignment
@@ -29,6 +30,7 @@ from signals.apps.signals.models.note import Note
 from signals.apps.signals.models.priority import Priority
 from signals.apps.signals.models.question import Question
 from signals.apps.signals.models.reporter import Reporter
+from signals.apps.signals.models.reporter_statistics import ReporterStatistics
 from signals.apps.signals.models.routing_expression import RoutingExpression
 from signals.apps.signals.models.signal import Signal
 from signals.apps.signals.models.signal_departments import SignalDepartments
@@ -46,6 +48,7 @@ __all__ = [
     'Area',
     'AreaType',
     'Attachment',
+    'AttachmentRendition',
     'Buurt',
     'Category',
     'CategoryAssignment',
@@ -74,6 +77,7 @@ __all__ = [
     'Question',
     'Priority',
     'Reporter',
+    'ReporterStatistics',
     'Signal',
     'ServiceLevelObjective',
     'Source',
@@ -0,0 +1,44 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from django.contrib.gis.db import models
+
+from signals.apps.signals.models.mixins import CreatedUpdatedModel
+
+
+class AttachmentRendition(CreatedUpdatedModel):
+    """
+    A smaller copy of an image attachment, created asynchronously after the attachment was added.
+
+    The thumbnail is used for previews, the PDF rendition is embedded in the PDF of a signal and the WebP rendition is
+    meant for displaying an image in the frontend without downloading the original.
+    """
+    THUMBNAIL = 'thumbnail'
+    PDF = 'pdf'
+    WEBP = 'webp'
+    KIND_CHOICES = (
+        (THUMBNAIL, 'Thumbnail'),
+        (PDF, 'PDF'),
+        (WEBP, 'WebP'),
+    )
+
+    attachment = models.ForeignKey(
+        'signals.Attachment',
+        on_delete=models.CASCADE,
+        related_name='renditions',
+    )
+    kind = models.CharField(max_length=16, choices=KIND_CHOICES)
+    file = models.FileField(upload_to='attachments/renditions/%Y/%m/%d/', max_length=255)
+    mimetype = models.CharField(max_length=30)
+    width = models.PositiveIntegerField()
+    height = models.PositiveIntegerField()
+    size = models.PositiveIntegerField()  # bytes
+    checksum = models.CharField(max_length=64)  # SHA-256 of the file, hex encoded
+
+    class Meta:
+        ordering = ('attachment', 'kind')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['attachment', 'kind'],
+                name='%(app_label)s_%(class)s_unique_constraint'
+            )
+        ]
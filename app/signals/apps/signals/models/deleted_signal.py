@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2022 - 2023 Gemeente Amsterdam
+# Copyright (C) 2022 - 2026 Gemeente Amsterdam
 import uuid
 from typing import TYPE_CHECKING
 
@@ -13,12 +13,16 @@ if TYPE_CHECKING:
 
 
 class DeleteSignalManager(models.Manager):
-    def create_from_signal(self, signal: "Signal", action: str, note: str, deleted_by: str | None = None,
-                           batch_uuid: uuid.UUID | None = None):
+    def build_from_signal(self, signal: "Signal", action: str, note: str, deleted_by: str | None = None,
+                          batch_uuid: uuid.UUID | None = None) -> "DeletedSignal":
+        """
+        Returns an unsaved DeletedSignal for the given Signal, so deletions of many signals can be stored with
+        bulk_create.
+        """
         assert signal.status
         assert signal.category_assignment and signal.category_assignment.category
 
-        return super().create(
+        return self.model(
             # Fields to store from the given Signal
             signal_id=signal.id,
             signal_uuid=signal.uuid,
@@ -32,6 +36,13 @@ class DeleteSignalManager(models.Manager):
             deleted_by=deleted_by, action=action, note=note, batch_uuid=batch_uuid
         )
 
+    def create_from_signal(self, signal: "Signal", action: str, note: str, deleted_by: str | None = None,
+                           batch_uuid: uuid.UUID | None = None):
+        deleted_signal = self.build_from_signal(signal=signal, action=action, note=note, deleted_by=deleted_by,
+                                                batch_uuid=batch_uuid)
+        deleted_signal.save(force_insert=True, using=self.db)
+        return deleted_signal
+
 
 class DeletedSignal(Model):
     """
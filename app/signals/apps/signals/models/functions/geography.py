@@ -0,0 +1,31 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from django.contrib.gis.db.models import GeometryField
+from django.db.models import BooleanField, FloatField, Func
+
+
+class AsGeography(Func):
+    """
+    Casts a geometry to a geography, distances between geographies are in meters.
+
+    Locations have a GiST index on this expression, queries must use it unchanged for the index to be used.
+    """
+    template = '(%(expressions)s)::geography'
+    output_field = GeometryField(geography=True)
+
+
+class DWithin(Func):
+    """
+    Whether two geographies are within the given distance (in meters) of each other, can use a GiST index.
+    """
+    function = 'ST_DWithin'
+    output_field = BooleanField()
+
+
+class KNNDistance(Func):
+    """
+    The distance between two geographies with the <-> operator, ordering by it can use a GiST index (nearest first).
+    """
+    template = '%(expressions)s'
+    arg_joiner = ' <-> '
+    output_field = FloatField()
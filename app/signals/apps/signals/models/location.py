@@ -1,11 +1,14 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2021 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
 import copy
 
 from django.contrib.contenttypes.fields import GenericRelation
 from django.contrib.gis.db import models
 from django.contrib.gis.gdal import CoordTransform, SpatialReference
+from django.contrib.postgres.indexes import GinIndex, GistIndex, OpClass
+from django.db.models.functions import Upper
 
+from signals.apps.signals.models.functions.geography import AsGeography
 from signals.apps.signals.models.mixins import CreatedUpdatedModel
 from signals.apps.signals.utils.location import AddressFormatter
 
@@ -73,14 +76,24 @@ class Location(CreatedUpdatedModel):
 
     history_log = GenericRelation('history.Log', object_id_field='object_pk')
 
+    class Meta:
+        indexes = [
+            # Used for searching locations within a distance in meters, see DWithin
+            GistIndex(AsGeography('geometrie'), name='signals_location_geography'),
+            # Used by "address_text__icontains", which Django compiles to UPPER("address_text") LIKE UPPER(...)
+            GinIndex(OpClass(Upper('address_text'), name='gin_trgm_ops'), name='signals_location_address_trgm'),
+        ]
+
     @property
     def short_address_text(self):
         # openbare_ruimte huisnummerhuiletter-huisnummer_toevoeging
         return AddressFormatter(address=self.address).format('O hlT') if self.address else ''
 
-    def save(self, *args, **kwargs):
-        # Set address_text
+    def set_address_text(self):
         self.address_text = AddressFormatter(address=self.address).format('O hlT p W') if self.address else ''
+
+    def save(self, *args, **kwargs):
+        self.set_address_text()
         super().save(*args, **kwargs)
 
     def get_rd_coordinates(self):
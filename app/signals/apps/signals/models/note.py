@@ -1,10 +1,23 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2021 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
 from django.contrib.contenttypes.fields import GenericRelation
 from django.contrib.gis.db import models
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVector
+from django.db.models.functions import Upper
 
 from signals.apps.signals.models.mixins import CreatedUpdatedModel
 
+# Text search configuration of the full-text search on notes, the notes are written in Dutch
+NOTE_SEARCH_CONFIG = 'dutch'
+
+
+def get_note_search_vector() -> SearchVector:
+    """
+    The search vector of the text of a note, queries must use this exact expression to use the search index.
+    """
+    return SearchVector('text', config=NOTE_SEARCH_CONFIG)
+
 
 class Note(CreatedUpdatedModel):
     """Notes field for `Signal` instance."""
@@ -21,4 +34,8 @@ class Note(CreatedUpdatedModel):
         ordering = ('-created_at',)
         indexes = [
             models.Index(fields=['created_at']),
+            # Used by "text__icontains", which Django compiles to UPPER("text") LIKE UPPER(...)
+            GinIndex(OpClass(Upper('text'), name='gin_trgm_ops'), name='signals_note_text_trgm'),
+            # Used by the full-text search on notes, see get_note_search_vector
+            GinIndex(get_note_search_vector(), name='signals_note_text_search'),
         ]
@@ -1,10 +1,11 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2023 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
 from typing import Final
 
 from django.contrib.contenttypes.fields import GenericRelation
 from django.contrib.gis.db import models
 from django.core.exceptions import MultipleObjectsReturned
+from django.db.models.functions import Upper
 from django_fsm import ConcurrentTransitionMixin, FSMField, transition
 
 from signals.apps.email_integrations.models import EmailTemplate
@@ -56,6 +57,11 @@ class Reporter(ConcurrentTransitionMixin, CreatedUpdatedModel):
             ('sia_can_view_contact_details', 'Inzien van contactgegevens melder (in melding)'),
         )
         ordering = ('created_at',)
+        indexes = [
+            # Signals of a reporter are looked up with reporter__email__iexact
+            models.Index(Upper('email'), name='signals_reporter_email_upper'),
+            models.Index(fields=['phone'], name='signals_reporter_phone'),
+        ]
 
     @property
     def is_anonymized(self) -> bool:
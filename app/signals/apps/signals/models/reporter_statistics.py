@@ -0,0 +1,31 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from django.contrib.gis.db import models
+
+
+class ReporterStatistics(models.Model):
+    """
+    Counts of the signals of a reporter, identified by either the (normalized) email address or phone number.
+
+    Kept up to date by the ReporterStatisticsService whenever a signal, reporter or feedback changes, so the context of
+    a signal does not have to aggregate all signals of the reporter. A reporter without signals has no statistics.
+    """
+    email = models.EmailField(null=True, unique=True)  # lowercase
+    phone = models.CharField(max_length=17, null=True, unique=True)
+
+    signal_count = models.PositiveIntegerField(default=0)
+    open_count = models.PositiveIntegerField(default=0)
+    positive_count = models.PositiveIntegerField(default=0)
+    negative_count = models.PositiveIntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = 'reporter statistics'
+        constraints = [
+            models.CheckConstraint(
+                check=(models.Q(email__isnull=False, phone__isnull=True)
+                       | models.Q(email__isnull=True, phone__isnull=False)),
+                name='%(app_label)s_%(class)s_email_or_phone'
+            ),
+        ]
@@ -1,9 +1,15 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2021 Gemeente Amsterdam
-from django.db.models import Count, F, Max, QuerySet
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
+import datetime
+
+from django.conf import settings
+from django.contrib.gis.db.models import PointField
+from django.db.models import Count, Exists, F, Max, OuterRef, Q, QuerySet, Value
+from django.utils import timezone
 
 from signals.apps.services.domain.permissions.signal import SignalPermissionService
 from signals.apps.services.domain.permissions.utils import make_permission_condition_for_user
+from signals.apps.signals.models.functions.geography import AsGeography, DWithin, KNNDistance
 
 
 class SignalQuerySet(QuerySet):
@@ -25,13 +31,45 @@ class SignalQuerySet(QuerySet):
             qs = qs.filter(reporter__email__iexact=email)
 
         if phone:
-            qs = qs.filter(reporter__phone=email)
+            qs = qs.filter(reporter__phone=phone)
 
         return qs
 
-    def reporter_feedback_count(self, email, is_satisfied=True):
+    def filter_near(self, point, distance):
+        """
+        Signals located within the given distance (in meters) of the point, uses the geography index on locations.
+        """
+        return self.filter(DWithin(AsGeography('location__geometrie'),
+                                   AsGeography(Value(point, output_field=PointField())),
+                                   distance))
+
+    def order_by_distance(self, point):
+        """
+        Nearest signals first, uses the geography index on locations.
+        """
+        return self.order_by(KNNDistance(AsGeography('location__geometrie'),
+                                         AsGeography(Value(point, output_field=PointField()))))
+
+    def filter_context_near(self, signal):
+        """
+        Signals in the same category as the given signal, created recently and close to it. Parent signals are left
+        out, their child signals are not.
+        """
+        weeks = settings.SIGNAL_API_CONTEXT_GEOGRAPHY_CREATED_DELTA_WEEKS
+        created_after = timezone.now() - datetime.timedelta(weeks=weeks)
+        has_children = Exists(self.model.objects.filter(parent_id=OuterRef('pk')))
+
+        return self.filter_near(
+            signal.location.geometrie, settings.SIGNAL_API_CONTEXT_GEOGRAPHY_RADIUS
+        ).filter(
+            Q(parent__isnull=False) | ~has_children,
+            category_assignment__category_id=signal.category_assignment.category_id,
+            created_at__gte=created_after,
+        ).exclude(pk=signal.pk)
+
+    def reporter_feedback_count(self, email=None, is_satisfied=True, phone=None):
         return self.filter_reporter(
-            email=email
+            email=email, phone=phone
         ).annotate(
             feedback_count=Count('feedback')
         ).filter(
@@ -1,15 +1,41 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2021 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
 from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models.signals import m2m_changed, post_delete, post_init, post_save
 from django.dispatch import receiver
 
+from signals.apps.feedback.models import Feedback
+from signals.apps.services.domain.dsl import invalidate_routing_plan
+from signals.apps.services.domain.permissions.utils import invalidate_visibility_scopes
+from signals.apps.services.domain.public_signal_map import PublicSignalMapService
+from signals.apps.services.domain.reporter_statistics import (
+    ReporterStatisticsService,
+    get_reporter_keys
+)
 from signals.apps.signals import tasks
 from signals.apps.signals.managers import (
+    add_attachment,
+    bulk_deletion_in_progress,
     create_initial,
+    create_initial_bulk,
     update_category_assignment,
     update_location,
     update_status
 )
+from signals.apps.signals.models import (
+    Area,
+    AreaType,
+    CategoryDepartment,
+    Expression,
+    Reporter,
+    RoutingExpression,
+    Signal
+)
+from signals.apps.signals.utils.area_index import invalidate_area_index
+from signals.apps.users.models import Profile
+
+User = get_user_model()
 
 
 @receiver(create_initial, dispatch_uid='signals_create_initial')
@@ -18,6 +44,18 @@ def signals_create_initial_handler(sender, signal_obj, **kwargs):
     tasks.apply_auto_create_children.apply_async(kwargs={'signal_id': signal_obj.id}, countdown=30)
 
 
+@receiver(create_initial_bulk, dispatch_uid='signals_create_initial_bulk')
+def signals_create_initial_bulk_handler(sender, signal_objs, **kwargs):
+    for signal_obj in signal_objs:
+        signals_create_initial_handler(sender, signal_obj)
+
+
+@receiver(add_attachment, dispatch_uid='signals_add_attachment')
+def signals_add_attachment_handler(sender, signal_obj, attachment, **kwargs):
+    if attachment.is_image:
+        tasks.create_attachment_renditions.delay(attachment.pk)
+
+
 @receiver(update_location, dispatch_uid='signals_update_location')
 def signals_update_location_handler(sender, signal_obj, **kwargs):
     if not settings.FEATURE_FLAGS['DSL_RUN_ROUTING_EXPRESSIONS_ON_UPDATES']:
@@ -37,3 +75,130 @@ def signals_update_category_assignment_handler(sender, signal_obj, **kwargs):
 @receiver(update_status, dispatch_uid='signals_update_status')
 def update_status_handler(sender, signal_obj, status, prev_status, *args, **kwargs):
     tasks.update_status_children_based_on_parent(signal_id=signal_obj.pk)
+
+
+@receiver(create_initial, dispatch_uid='signals_create_initial_public_signal_map')
+@receiver(create_initial_bulk, dispatch_uid='signals_create_initial_bulk_public_signal_map')
+@receiver(update_location, dispatch_uid='signals_update_location_public_signal_map')
+@receiver(update_status, dispatch_uid='signals_update_status_public_signal_map')
+@receiver(update_category_assignment, dispatch_uid='signals_update_category_assignment_public_signal_map')
+def public_signal_map_changed_handler(sender, **kwargs):
+    # Only these changes are visible on the public map
+    PublicSignalMapService.schedule_refresh()
+
+
+@receiver(post_save, sender=Area, dispatch_uid='signals_area_post_save')
+@receiver(post_delete, sender=Area, dispatch_uid='signals_area_post_delete')
+@receiver(post_save, sender=AreaType, dispatch_uid='signals_area_type_post_save')
+@receiver(post_delete, sender=AreaType, dispatch_uid='signals_area_type_post_delete')
+def area_changed_handler(sender, instance, **kwargs):
+    invalidate_area_index()
+    invalidate_routing_plan()
+
+
+@receiver(post_save, sender=RoutingExpression, dispatch_uid='signals_routing_expression_post_save')
+@receiver(post_delete, sender=RoutingExpression, dispatch_uid='signals_routing_expression_post_delete')
+@receiver(post_save, sender=Expression, dispatch_uid='signals_expression_post_save')
+@receiver(post_delete, sender=Expression, dispatch_uid='signals_expression_post_delete')
+def routing_changed_handler(sender, instance, **kwargs):
+    invalidate_routing_plan()
+
+
+@receiver(post_save, sender=User, dispatch_uid='signals_user_post_save_routing_plan')
+def user_changed_handler(sender, instance, update_fields=None, **kwargs):
+    # Routing plans only depend on the active state and email of users, ignore logins
+    if update_fields and set(update_fields) <= {'last_login'}:
+        return
+    invalidate_routing_plan()
+
+
+@receiver(post_delete, sender=User, dispatch_uid='signals_user_post_delete_routing_plan')
+def user_deleted_handler(sender, instance, **kwargs):
+    # The user of a RoutingExpression is set to NULL when the user is deleted
+    invalidate_routing_plan()
+
+
+@receiver(m2m_changed, sender=Profile.departments.through, dispatch_uid='signals_profile_departments_changed')
+def profile_departments_changed_handler(sender, instance, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        invalidate_routing_plan()
+        invalidate_visibility_scopes()
+
+
+@receiver(post_save, sender=CategoryDepartment, dispatch_uid='signals_category_department_post_save')
+@receiver(post_delete, sender=CategoryDepartment, dispatch_uid='signals_category_department_post_delete')
+def category_department_changed_handler(sender, instance, **kwargs):
+    invalidate_visibility_scopes()
+
+
+@receiver(m2m_changed, sender=CategoryDepartment, dispatch_uid='signals_category_departments_changed')
+def category_departments_changed_handler(sender, instance, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        invalidate_visibility_scopes()
+
+
+def _signal_statistics_state(signal):
+    # Read from __dict__, deferred fields must not be loaded
+    return tuple(signal.__dict__.get(field) for field in ('reporter_id', 'status_id', 'parent_id'))
+
+
+def _reporter_statistics_state(reporter):
+    return tuple(reporter.__dict__.get(field) for field in ('email', 'phone'))
+
+
+@receiver(post_init, sender=Signal, dispatch_uid='signals_signal_post_init_reporter_statistics')
+def signal_post_init_reporter_statistics_handler(sender, instance, **kwargs):
+    instance._reporter_statistics_state = _signal_statistics_state(instance)
+
+
+@receiver(post_save, sender=Signal, dispatch_uid='signals_signal_post_save_reporter_statistics')
+def signal_post_save_reporter_statistics_handler(sender, instance, **kwargs):
+    """
+    The statistics of a reporter only depend on the reporter, status and parent of the signals
+    """
+    previous_reporter_id, *previous_state = instance._reporter_statistics_state
+    instance._reporter_statistics_state = _signal_statistics_state(instance)
+    reporter_id, *state = instance._reporter_statistics_state
+    if reporter_id == previous_reporter_id and state == previous_state:
+        return
+
+    ReporterStatisticsService.schedule_refresh(reporter_ids={reporter_id, previous_reporter_id})
+
+
+@receiver(post_init, sender=Reporter, dispatch_uid='signals_reporter_post_init_reporter_statistics')
+def reporter_post_init_reporter_statistics_handler(sender, instance, **kwargs):
+    instance._reporter_statistics_state = _reporter_statistics_state(instance)
+
+
+@receiver(post_save, sender=Reporter, dispatch_uid='signals_reporter_post_save_reporter_statistics')
+def reporter_post_save_reporter_statistics_handler(sender, instance, created, **kwargs):
+    """
+    A new reporter only counts once it is the reporter of its signal, a changed (anonymized) email address or phone
+    number moves the signal to the statistics of another reporter
+    """
+    previous_state = instance._reporter_statistics_state
+    instance._reporter_statistics_state = _reporter_statistics_state(instance)
+    if created or previous_state == instance._reporter_statistics_state:
+        return
+
+    ReporterStatisticsService.schedule_refresh(
+        keys=get_reporter_keys(*previous_state) | get_reporter_keys(instance.email, instance.phone)
+    )
+
+
+@receiver(post_delete, sender=Reporter, dispatch_uid='signals_reporter_post_delete_reporter_statistics')
+def reporter_post_delete_reporter_statistics_handler(sender, instance, **kwargs):
+    # Reporters are deleted together with their signal, which is deleted after the reporters
+    if bulk_deletion_in_progress.get():
+        # Refreshed for all reporters of the deleted signals at once
+        return
+
+    ReporterStatisticsService.schedule_refresh(keys=get_reporter_keys(instance.email, instance.phone))
+
+
+@receiver(post_save, sender=Feedback, dispatch_uid='signals_feedback_post_save_reporter_statistics')
+def feedback_post_save_reporter_statistics_handler(sender, instance, **kwargs):
+    keys = set()
+    for email, phone in Reporter.objects.filter(signal__pk=instance._signal_id).values_list('email', 'phone'):
+        keys |= get_reporter_keys(email, phone)
+    ReporterStatisticsService.schedule_refresh(keys=keys)
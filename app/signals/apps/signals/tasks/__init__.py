@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2023 Gemeente Amsterdam
+# Copyright (C) 2023 - 2026 Gemeente Amsterdam
 from signals.apps.signals.tasks.anonymize_reporter import anonymize_reporter, anonymize_reporters
+from signals.apps.signals.tasks.attachment_renditions import create_attachment_renditions
 from signals.apps.signals.tasks.child_signals import (
     apply_auto_create_children,
     update_status_children_based_on_parent
@@ -10,9 +11,11 @@ from signals.apps.signals.tasks.delete_signals import (
     delete_closed_signals,
     delete_signals_in_state_for_x_days
 )
+from signals.apps.signals.tasks.public_signal_map import refresh_public_signal_map
 from signals.apps.signals.tasks.refresh_database_view import (
     refresh_materialized_view_public_signals_geography_feature_collection
 )
+from signals.apps.signals.tasks.reporter_statistics import refresh_reporter_statistics
 from signals.apps.signals.tasks.signal_routing import apply_routing
 
 __all__ = [
@@ -21,8 +24,11 @@ __all__ = [
     'anonymize_reporters',
     'apply_routing',
     'clearsessions',
+    'create_attachment_renditions',
     'delete_signals_in_state_for_x_days',
     'delete_closed_signals',
     'refresh_materialized_view_public_signals_geography_feature_collection',
+    'refresh_public_signal_map',
+    'refresh_reporter_statistics',
     'update_status_children_based_on_parent',
 ]
@@ -1,35 +1,39 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2023 Gemeente Amsterdam
+# Copyright (C) 2023 - 2026 Gemeente Amsterdam
 import logging
 
-from django.db.models import Q
-from django.utils import timezone
+from django.conf import settings
 
+from signals.apps.services.domain.reporter_anonymization import (
+    ReporterAnonymizationService,
+    get_anonymization_note
+)
 from signals.apps.signals.models import Reporter
 from signals.apps.signals.models.signal import Signal
-from signals.apps.signals.workflow import (
-    AFGEHANDELD,
-    GEANNULEERD,
-    GESPLITST,
-    VERZOEK_TOT_AFHANDELING
-)
 from signals.celery import app
 
 log = logging.getLogger(__name__)
 
 
 @app.task(priority=0)
-def anonymize_reporters(days=365):
-    created_before = (timezone.now() - timezone.timedelta(days=days))
-    allowed_signal_states = [AFGEHANDELD, GEANNULEERD, GESPLITST, VERZOEK_TOT_AFHANDELING]
+def anonymize_reporters(days=365, bulk=None, dry_run=False, batch_size=None):
+    """
+    Anonymize the reporters of signals closed for at least the given number of days. Unless bulk is False (defaults to
+    REPORTER_ANONYMIZATION_BULK) the reporters are anonymized in batches of batch_size (defaults to
+    REPORTER_ANONYMIZATION_BATCH_SIZE) reporters instead of with a task per reporter. With dry_run the reporters that
+    would be anonymized are only counted.
+    """
+    reporter_ids = ReporterAnonymizationService.get_candidates(days=days).values_list('pk', flat=True)
+    if dry_run:
+        return reporter_ids.count()
+
+    if bulk is None:
+        bulk = settings.REPORTER_ANONYMIZATION_BULK
 
-    reporter_ids = Reporter.objects.filter(
-        (Q(email__isnull=False) & ~Q(email__exact='')) | (Q(phone__isnull=False) & ~Q(phone__exact='')),
-        created_at__lt=created_before,
-        _signal__status__state__in=allowed_signal_states,
-    ).values_list(
-        'pk', flat=True
-    )
+    if bulk:
+        return ReporterAnonymizationService.anonymize(
+            days=days, batch_size=batch_size or settings.REPORTER_ANONYMIZATION_BATCH_SIZE
+        )
 
     reporter_count = reporter_ids.count()
     for reporter_id in reporter_ids:
@@ -52,13 +56,7 @@ def anonymize_reporter(reporter_id):
         if not reporter.is_anonymized:
             reporter.anonymize()
 
-            changed = []
-            if reporter.email_anonymized:
-                changed.append('email')
-            if reporter.phone_anonymized:
-                changed.append('telefoonnummer')
-            text = 'Vanwege de AVG zijn de volgende gegevens van de melder ' \
-                   'geanonimiseerd: {}'.format(', '.join(changed))
+            text = get_anonymization_note(reporter.email_anonymized, reporter.phone_anonymized)
 
             Signal.actions.create_note(data={
                 'text': text,
@@ -0,0 +1,26 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+import logging
+
+from django.db.utils import OperationalError
+
+from signals.apps.services.domain.attachment_renditions import AttachmentRenditionService
+from signals.apps.signals.models import Attachment
+from signals.celery import app
+
+log = logging.getLogger(__name__)
+
+
+@app.task(autoretry_for=(OperationalError, ), max_retries=5, default_retry_delay=10)
+def create_attachment_renditions(attachment_id):
+    try:
+        attachment = Attachment.objects.get(pk=attachment_id)
+    except Attachment.DoesNotExist:
+        # The attachment was deleted before the renditions could be created
+        log.warning(f'Attachment pk={attachment_id} does not exist, no renditions created')
+        return
+
+    if not attachment.is_image:
+        return
+
+    AttachmentRenditionService.create_renditions(attachment)
@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2023 Gemeente Amsterdam
+# Copyright (C) 2023 - 2026 Gemeente Amsterdam
 import logging
+import time
 import uuid
 import warnings
 from datetime import timedelta
@@ -9,6 +10,11 @@ from django.conf import settings
 from django.db import transaction
 from django.utils import timezone
 
+from signals.apps.services.domain.delete_signals import (
+    DeletionBatch,
+    SignalDeletionService,
+    get_deletion_note
+)
 from signals.apps.signals.models import DeletedSignal, Signal
 from signals.apps.signals.workflow import AFGEHANDELD, GEANNULEERD, GESPLITST
 from signals.celery import app
@@ -16,35 +22,71 @@ from signals.celery import app
 log = logging.getLogger(__name__)
 
 
+def _validate_deletion_arguments(state: str, days: int) -> None:
+    if not settings.FEATURE_FLAGS.get('DELETE_SIGNALS_IN_STATE_X_AFTER_PERIOD_Y_ENABLED', False):
+        raise ValueError('Feature flag "DELETE_SIGNALS_IN_STATE_X_AFTER_PERIOD_Y_ENABLED" is not enabled')
+
+    if state not in [AFGEHANDELD, GEANNULEERD, GESPLITST, ]:
+        raise ValueError('Invalid state(s) provided must be one of '
+                         f'"{", ".join([AFGEHANDELD, GEANNULEERD, GESPLITST, ])}"')
+
+    if days < 365:
+        raise ValueError('Invalid days provided must be at least 365')
+
+
+def _delete_batch(candidates, start_after: int, batch_size: int, batch_uuid: uuid.UUID) -> DeletionBatch:
+    try:
+        return SignalDeletionService.delete_batch(candidates, start_after=start_after, batch_size=batch_size,
+                                                  batch_uuid=batch_uuid)
+    except Exception as e:
+        # Delete the signals of the batch one by one, so a single signal cannot stop the deletion of the others
+        log.error(f'Deleting the signals after #{start_after} in a batch went wrong, error: {e}')
+        signal_ids = SignalDeletionService.select_batch(candidates, start_after, batch_size)
+        for signal_id in signal_ids:
+            delete_signal(signal_id, batch_uuid)
+        return DeletionBatch(signal_ids=signal_ids, deleted=len(signal_ids))
+
+
 @app.task
-def delete_signals_in_state_for_x_days(state: str, days: int):
+def delete_signals_in_state_for_x_days(state: str, days: int, batch_uuid: str | None = None, start_after: int = 0):
     """
     Asynchronous task to delete signals in a specific state that have been in that state for at least the specified
     number of days.
 
+    The signals are deleted in batches of SIGNAL_DELETION_BATCH_SIZE signals (and their children), waiting
+    SIGNAL_DELETION_BATCH_DELAY seconds between two batches. After SIGNAL_DELETION_BATCHES_PER_TASK batches the task
+    queues itself to continue after the last deleted signal. An interrupted run can be resumed by running the task
+    again, optionally starting after the last signal that was logged as deleted.
+
     Args:
         state (str): The state of signals to be deleted.
         days (int): The minimum number of days a signal should have been in the state to be eligible for deletion.
+        batch_uuid (str, optional): The unique identifier of the deletion run, passed on when the task continues.
+        start_after (int, optional): Only signals with a higher id are deleted.
     """
-    if not settings.FEATURE_FLAGS.get('DELETE_SIGNALS_IN_STATE_X_AFTER_PERIOD_Y_ENABLED', False):
-        raise ValueError('Feature flag "DELETE_SIGNALS_IN_STATE_X_AFTER_PERIOD_Y_ENABLED" is not enabled')
+    _validate_deletion_arguments(state, days)
 
-    if state not in [AFGEHANDELD, GEANNULEERD, GESPLITST, ]:
-        raise ValueError('Invalid state(s) provided must be one of '
-                         f'"{", ".join([AFGEHANDELD, GEANNULEERD, GESPLITST, ])}"')
+    batch_uuid = uuid.UUID(str(batch_uuid)) if batch_uuid else uuid.uuid4()
+    batch_size = settings.SIGNAL_DELETION_BATCH_SIZE
 
-    if days < 365:
-        raise ValueError('Invalid days provided must be at least 365')
+    candidates = SignalDeletionService.get_candidates(state=state, before=timezone.now() - timedelta(days=days))
+    for batch_number in range(settings.SIGNAL_DELETION_BATCHES_PER_TASK):
+        if batch_number and settings.SIGNAL_DELETION_BATCH_DELAY:
+            time.sleep(settings.SIGNAL_DELETION_BATCH_DELAY)
 
-    batch_uuid = uuid.uuid4()
+        batch = _delete_batch(candidates, start_after, batch_size, batch_uuid)
+        if batch.last_id is None:
+            return
 
-    signal_qs = Signal.objects.filter(
-        parent_id__isnull=True,
-        status__state=state,
-        status__created_at__lt=timezone.now() - timedelta(days=days)
-    )
-    for signal in signal_qs:
-        delete_signal.delay(signal.id, batch_uuid)
+        start_after = batch.last_id
+        log.info(f'Deleted {batch.deleted} signal(s) in state "{state}" up to and including #{start_after} '
+                 f'(batch {batch_uuid})')
+
+        if len(batch.signal_ids) < batch_size:
+            return
+
+    delete_signals_in_state_for_x_days.delay(state=state, days=days, batch_uuid=str(batch_uuid),
+                                             start_after=start_after)
 
 
 @app.task(priority=0)
@@ -67,24 +109,22 @@ def delete_signal(signal_id: int, batch_uuid: uuid.UUID | None = None):  # noqa
         for child_signal in signal.children.all():
             delete_signal(child_signal.id, batch_uuid)
 
-    if signal.is_child:
-        assert signal.parent and signal.parent.status
-        note = (f'Parent signal was in state "{signal.parent.status.get_state_display()}" '
-                f'for {(timezone.now() - signal.parent.status.created_at).days} days')
-    else:
-        assert signal.status
-        note = (f'Signal was in state "{signal.status.get_state_display()}" '
-                f'for {(timezone.now() - signal.status.created_at).days} days')
+    note = get_deletion_note(signal, timezone.now())
 
     try:
         with transaction.atomic():
             DeletedSignal.objects.create_from_signal(signal=signal, action='automatic', note=note,
                                                      batch_uuid=batch_uuid)
 
+            file_names = []
             for attachment in signal.attachments.all():
+                file_names.append(attachment.file.name)
+                file_names.extend(attachment.renditions.values_list('file', flat=True))
                 attachment.delete()
 
             signal.delete()
+
+            transaction.on_commit(lambda: SignalDeletionService.delete_files(file_names))
     except Exception as e:
         logging.error(f'Deleting Signal with id #{signal.id} went wrong, error: {e}')
 
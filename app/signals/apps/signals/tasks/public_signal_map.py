@@ -0,0 +1,15 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from django.db.utils import OperationalError
+
+from signals.apps.services.domain.public_signal_map import PublicSignalMapService
+from signals.celery import app
+
+
+@app.task(autoretry_for=(OperationalError, ), max_retries=3, default_retry_delay=10)
+def refresh_public_signal_map():
+    """
+    Regenerate the cached GeoJSON of the public signal map, scheduled when signals changed and can be added to the
+    Celery beat schedule to regenerate it periodically.
+    """
+    PublicSignalMapService.refresh()
@@ -0,0 +1,20 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from django.db.utils import OperationalError
+
+from signals.apps.services.domain.reporter_statistics import ReporterStatisticsService
+from signals.celery import app
+
+
+@app.task(autoretry_for=(OperationalError, ), max_retries=5, default_retry_delay=30)
+def refresh_reporter_statistics(keys: list[list[str]] | None = None, reporter_ids: list[int] | None = None):
+    """
+    Recompute the statistics of the given reporters, queued when refreshing them right after a change went wrong.
+
+    Args:
+        keys (list, optional): The (key type, value) pairs of the reporters, see get_reporter_keys.
+        reporter_ids (list, optional): The ids of the reporters.
+    """
+    all_keys = {(key_type, value) for key_type, value in keys or []}
+    all_keys |= ReporterStatisticsService.get_keys_of_reporters(reporter_ids or [])
+    ReporterStatisticsService.refresh_keys(all_keys)
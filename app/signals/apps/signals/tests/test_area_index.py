@@ -0,0 +1,112 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from django.contrib.gis.geos import MultiPolygon, Point, Polygon
+from django.test import TestCase
+
+from signals.apps.signals.factories import AreaFactory, AreaTypeFactory
+from signals.apps.signals.models import Area
+from signals.apps.signals.utils.area_index import (
+    STRTree,
+    area_index,
+    area_index_version,
+    invalidate_area_index
+)
+
+
+class _Extent:
+    def __init__(self, extent):
+        self.extent = extent
+
+
+class TestSTRTree(TestCase):
+    def test_empty(self):
+        tree = STRTree([])
+        self.assertIsNone(tree.root)
+        self.assertEqual(list(tree.query_point(1, 1)), [])
+
+    def test_query_point(self):
+        items = [_Extent((x, y, x + 1, y + 1)) for x in range(20) for y in range(20)]
+        tree = STRTree(items, node_capacity=4)
+
+        found = list(tree.query_point(5.5, 7.5))
+        self.assertEqual(len(found), 1)
+        self.assertEqual(found[0].extent, (5, 7, 6, 8))
+
+        # A point on a shared corner is within the extent of four items
+        self.assertEqual(len(list(tree.query_point(5, 7))), 4)
+        self.assertEqual(list(tree.query_point(100, 100)), [])
+
+
+class TestAreaIndex(TestCase):
+    def setUp(self):
+        invalidate_area_index()
+
+        self.district = AreaTypeFactory.create(code='district')
+        self.centrum = AreaFactory.create(
+            geometry=MultiPolygon([Polygon.from_bbox([4.877157, 52.357204, 4.929686, 52.385239])], srid=4326),
+            name='Centrum',
+            code='centrum',
+            _type=self.district,
+        )
+        self.oost = AreaFactory.create(
+            geometry=MultiPolygon([Polygon.from_bbox([4.929686, 52.357204, 4.989686, 52.385239])], srid=4326),
+            name='Oost',
+            code='oost',
+            _type=self.district,
+        )
+
+    def test_get_area(self):
+        area = area_index.get_area(Point(4.88, 52.36, srid=4326), 'district')
+        self.assertEqual(area, self.centrum)
+        self.assertEqual(area.code, 'centrum')
+        self.assertEqual(area.name, 'Centrum')
+
+        self.assertEqual(area_index.get_area(Point(4.95, 52.36, srid=4326), 'district'), self.oost)
+        self.assertIsNone(area_index.get_area(Point(6, 53, srid=4326), 'district'))
+        self.assertIsNone(area_index.get_area(Point(4.88, 52.36, srid=4326), 'unknown-area-type'))
+
+    def test_get_area_matches_database(self):
+        for point in [Point(4.88, 52.36, srid=4326), Point(4.95, 52.36, srid=4326), Point(6, 53, srid=4326)]:
+            expected = Area.objects.filter(geometry__contains=point).first()
+            self.assertEqual(area_index.get_area(point), expected)
+
+    def test_get_area_without_database_queries(self):
+        point = Point(4.88, 52.36, srid=4326)
+        area_index.get_area(point, 'district')  # Builds the index
+
+        # With the default check interval the version stamp is not read on every lookup
+        with self.assertNumQueries(0):
+            self.assertEqual(area_index.get_area(point, 'district'), self.centrum)
+
+    def test_invalidate_bumps_again_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_area_index()
+            version = area_index_version.get()
+        self.assertNotEqual(area_index_version.get(), version)
+
+    def test_invalidated_on_change(self):
+        point = Point(4.88, 52.36, srid=4326)
+        self.assertEqual(area_index.get_area(point, 'district'), self.centrum)
+
+        self.centrum.delete()
+        self.assertIsNone(area_index.get_area(point, 'district'))
+
+        noord = AreaFactory.create(
+            geometry=MultiPolygon([Polygon.from_bbox([4.87, 52.35, 4.89, 52.37])], srid=4326),
+            name='Noord',
+            code='noord',
+            _type=self.district,
+        )
+        self.assertEqual(area_index.get_area(point, 'district'), noord)
+
+    def test_first_area_in_default_ordering(self):
+        point = Point(4.88, 52.36, srid=4326)
+        AreaFactory.create(
+            geometry=MultiPolygon([Polygon.from_bbox([4.87, 52.35, 4.89, 52.37])], srid=4326),
+            name='Amstel',
+            code='amstel',
+            _type=self.district,
+        )
+
+        self.assertEqual(area_index.get_area(point, 'district').code, 'amstel')
+        self.assertEqual(area_index.get_area(point, 'district'), Area.objects.filter(geometry__contains=point).first())
@@ -0,0 +1,111 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+import base64
+import hashlib
+from io import BytesIO
+
+from django.test import TestCase, override_settings
+from PIL import Image
+
+from signals.apps.services.domain.attachment_renditions import AttachmentRenditionService
+from signals.apps.services.domain.images import DataUriImageEncodeService
+from signals.apps.signals.factories import AttachmentFactory, SignalFactory
+from signals.apps.signals.models import AttachmentRendition
+from signals.apps.signals.tasks import create_attachment_renditions
+
+
+def create_image_data(size, format='JPEG', mode='RGB'):
+    buffer = BytesIO()
+    Image.new(mode, size).save(buffer, format=format)
+    return buffer.getvalue()
+
+
+@override_settings(ATTACHMENT_THUMBNAIL_SIZE=100, API_PDF_RESIZE_IMAGES_TO=400, ATTACHMENT_WEBP_SIZE=600)
+class TestAttachmentRenditions(TestCase):
+    def setUp(self):
+        self.signal = SignalFactory.create()
+
+    def test_create_renditions(self):
+        attachment = AttachmentFactory.create(_signal=self.signal, file__filename='photo.jpg',
+                                              file__data=create_image_data((1000, 500)))
+
+        renditions = AttachmentRenditionService.create_renditions(attachment)
+
+        self.assertEqual(attachment.renditions.count(), 3)
+        dimensions = {rendition.kind: (rendition.width, rendition.height) for rendition in renditions}
+        self.assertEqual(dimensions, {
+            AttachmentRendition.THUMBNAIL: (100, 50),
+            AttachmentRendition.PDF: (400, 200),
+            AttachmentRendition.WEBP: (600, 300),
+        })
+
+        for rendition in renditions:
+            with rendition.file.open('rb') as f:
+                data = f.read()
+            self.assertEqual(rendition.size, len(data))
+            self.assertEqual(rendition.checksum, hashlib.sha256(data).hexdigest())
+
+            image = Image.open(BytesIO(data))
+            self.assertEqual(image.size, (rendition.width, rendition.height))
+            self.assertEqual(image.format, 'WEBP' if rendition.kind == AttachmentRendition.WEBP else 'JPEG')
+
+    def test_small_image_is_not_enlarged(self):
+        attachment = AttachmentFactory.create(_signal=self.signal, file__filename='small.png',
+                                              file__data=create_image_data((50, 80), format='PNG', mode='RGBA'))
+
+        renditions = AttachmentRenditionService.create_renditions(attachment)
+
+        self.assertEqual({(rendition.width, rendition.height) for rendition in renditions}, {(50, 80)})
+
+    def test_create_renditions_again(self):
+        attachment = AttachmentFactory.create(_signal=self.signal, file__filename='photo.jpg',
+                                              file__data=create_image_data((1000, 500)))
+
+        renditions = AttachmentRenditionService.create_renditions(attachment)
+        renditions_again = AttachmentRenditionService.create_renditions(attachment)
+
+        self.assertEqual(attachment.renditions.count(), 3)
+        self.assertEqual([rendition.pk for rendition in renditions], [rendition.pk for rendition in renditions_again])
+        self.assertEqual([rendition.file.name for rendition in renditions],
+                         [rendition.file.name for rendition in renditions_again])
+
+    def test_invalid_image(self):
+        attachment = AttachmentFactory.create(_signal=self.signal, file__filename='invalid.jpg', file__data=b'blah')
+
+        self.assertEqual(AttachmentRenditionService.create_renditions(attachment), [])
+        self.assertEqual(attachment.renditions.count(), 0)
+
+    def test_task(self):
+        attachment = AttachmentFactory.create(_signal=self.signal, file__filename='photo.jpg',
+                                              file__data=create_image_data((1000, 500)))
+        attachment.is_image = True
+        attachment.save()
+
+        create_attachment_renditions(attachment.pk)
+        self.assertEqual(attachment.renditions.count(), 3)
+
+        # Deleted attachments and attachments that are not an image are skipped
+        create_attachment_renditions(attachment.pk + 1000)
+
+        attachment.renditions.all().delete()
+        attachment.is_image = False
+        attachment.save()
+        create_attachment_renditions(attachment.pk)
+        self.assertEqual(attachment.renditions.count(), 0)
+
+    def test_pdf_uses_rendition(self):
+        attachment = AttachmentFactory.create(_signal=self.signal, file__filename='photo.jpg',
+                                              file__data=create_image_data((1000, 500)))
+        renditions = AttachmentRenditionService.create_renditions(attachment)
+        pdf_rendition = next(rendition for rendition in renditions if rendition.kind == AttachmentRendition.PDF)
+        with pdf_rendition.file.open('rb') as f:
+            expected = f'data:image/jpg;base64,{base64.b64encode(f.read()).decode("utf-8")}'
+
+        jpg_data_uris, att_filenames, _, _ = DataUriImageEncodeService.get_context_data_images(self.signal, 400)
+        self.assertEqual(jpg_data_uris, [expected])
+        self.assertEqual(len(att_filenames), 1)
+
+        # A rendition that is too large for the PDF is not used, the original is resized instead
+        jpg_data_uris, _, _, _ = DataUriImageEncodeService.get_context_data_images(self.signal, 200)
+        self.assertEqual(len(jpg_data_uris), 1)
+        self.assertNotEqual(jpg_data_uris, [expected])
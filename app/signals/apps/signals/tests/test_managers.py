@@ -1,13 +1,15 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2021 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
 from unittest.mock import patch
 
 from django.contrib.gis.geos import MultiPolygon, Point, Polygon
 from django.core.exceptions import ValidationError
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
+from signals.apps.history.models import Log
+from signals.apps.signals import workflow
 from signals.apps.signals.factories import AreaFactory, CategoryFactory, SignalFactory
-from signals.apps.signals.models import CategoryAssignment, Signal, Type
+from signals.apps.signals.models import CategoryAssignment, Priority, Reporter, Signal, Type
 
 
 class TestSignalManager(TestCase):
@@ -218,3 +220,52 @@ class TestSignalManager(TestCase):
         self.assertEqual(self.signal.types.count(), 2)
         self.assertIsNotNone(self.signal.type_assignment)
         self.assertEqual(self.signal.type_assignment.name, Type.SIGNAL)
+
+    def _get_create_initial_items(self, count, **signal_data):
+        return [{
+            'signal_data': {
+                'text': f'Bladiebla {i}',
+                'incident_date_start': '2020-02-26T12:00:00.000000Z',
+                'source': 'online',
+                **signal_data,
+            },
+            'location_data': {'geometrie': self.pt_in_center},
+            'status_data': {},
+            'category_assignment_data': {'category': self.category},
+            'reporter_data': {'email': f'reporter-{i}@example.com'},
+            'priority_data': None,
+            'type_data': {'name': Type.QUESTION} if i == 0 else None,
+        } for i in range(count)]
+
+    def test_create_initial_bulk(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            signals = Signal.actions.create_initial_bulk(self._get_create_initial_items(3))
+
+        self.assertEqual(len(signals), 3)
+        for i, signal in enumerate(Signal.objects.filter(pk__in=[s.pk for s in signals]).order_by('pk')):
+            self.assertEqual(signal.text, f'Bladiebla {i}')
+            self.assertEqual(signal.location.area_code, self.area.code)
+            self.assertEqual(signal.status.state, workflow.GEMELD)
+            self.assertEqual(signal.category_assignment.category, self.category)
+            self.assertEqual(signal.reporter.email, f'reporter-{i}@example.com')
+            self.assertEqual(signal.reporter.state, Reporter.REPORTER_STATE_APPROVED)
+            self.assertEqual(signal.priority.priority, Priority.PRIORITY_NORMAL)
+            self.assertEqual(signal.type_assignment.name, Type.QUESTION if i == 0 else Type.SIGNAL)
+
+            # The history is logged in bulk once the transaction is committed
+            self.assertTrue(Log.objects.filter(_signal_id=signal.pk, action=Log.ACTION_CREATE).exists())
+
+    def test_create_initial_bulk_sends_one_signal(self):
+        with patch('signals.apps.signals.managers.create_initial_bulk.send_robust') as send_robust:
+            with self.captureOnCommitCallbacks(execute=True):
+                signals = Signal.actions.create_initial_bulk(self._get_create_initial_items(2))
+
+        send_robust.assert_called_once()
+        self.assertEqual(send_robust.call_args.kwargs['signal_objs'], signals)
+
+    @override_settings(SIGNAL_MAX_NUMBER_OF_CHILDREN=2)
+    def test_create_initial_bulk_max_number_of_children(self):
+        with self.assertRaises(ValidationError):
+            Signal.actions.create_initial_bulk(self._get_create_initial_items(3, parent=self.signal))
+
+        self.assertFalse(self.signal.children.exists())
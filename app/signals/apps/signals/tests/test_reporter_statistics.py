@@ -0,0 +1,145 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db.utils import OperationalError
+from django.test import TestCase
+from django.utils import timezone
+
+from signals.apps.feedback.factories import FeedbackFactory
+from signals.apps.services.domain.reporter_statistics import EMAIL, PHONE, ReporterStatisticsService
+from signals.apps.signals import workflow
+from signals.apps.signals.factories import SignalFactory
+from signals.apps.signals.models import ReporterStatistics, Signal
+from signals.apps.signals.tasks import refresh_reporter_statistics
+
+
+class TestReporterStatistics(TestCase):
+    email = 'reporter@example.com'
+
+    def _get_statistics(self, email=None):
+        return ReporterStatistics.objects.get(email=email or self.email)
+
+    def test_signals_created(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            SignalFactory.create(reporter__email=self.email, status__state=workflow.GEMELD)
+            SignalFactory.create(reporter__email='Reporter@Example.com', status__state=workflow.AFGEHANDELD)
+
+        statistics = self._get_statistics()
+        self.assertEqual(statistics.signal_count, 2)
+        self.assertEqual(statistics.open_count, 1)
+        self.assertEqual(statistics.positive_count, 0)
+        self.assertEqual(statistics.negative_count, 0)
+
+    def test_child_signals_not_counted(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            parent = SignalFactory.create(reporter__email=self.email)
+            SignalFactory.create(reporter__email=self.email, parent=parent)
+
+        self.assertEqual(self._get_statistics().signal_count, 1)
+
+    def test_status_updated(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            signal = SignalFactory.create(reporter__email=self.email, status__state=workflow.GEMELD)
+        self.assertEqual(self._get_statistics().open_count, 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Signal.actions.update_status({'state': workflow.AFGEHANDELD, 'text': 'Afgehandeld'}, signal)
+            # Only recomputed once the status change is committed
+            self.assertEqual(self._get_statistics().open_count, 1)
+        self.assertEqual(self._get_statistics().open_count, 0)
+
+    def test_feedback_submitted(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            signal = SignalFactory.create(reporter__email=self.email)
+            feedback = FeedbackFactory.create(_signal=signal, is_satisfied=True)
+        self.assertEqual(self._get_statistics().positive_count, 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            feedback.submitted_at = timezone.now()
+            feedback.save()
+        self.assertEqual(self._get_statistics().positive_count, 1)
+        self.assertEqual(self._get_statistics().negative_count, 0)
+
+    def test_reporter_updated(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            signal = SignalFactory.create(reporter__email=self.email)
+            SignalFactory.create(reporter__email=self.email)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Signal.actions.update_reporter({'email': 'other@example.com', 'phone': None}, signal)
+
+        self.assertEqual(self._get_statistics().signal_count, 1)
+        self.assertEqual(self._get_statistics('other@example.com').signal_count, 1)
+
+    def test_reporter_anonymized(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            signal = SignalFactory.create(reporter__email=self.email, reporter__phone='0612345678')
+        self.assertTrue(ReporterStatistics.objects.filter(phone='0612345678').exists())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            signal.reporter.anonymize()
+
+        self.assertFalse(ReporterStatistics.objects.filter(email=self.email).exists())
+        self.assertFalse(ReporterStatistics.objects.filter(phone='0612345678').exists())
+
+    @patch('signals.apps.signals.tasks.refresh_reporter_statistics.delay')
+    def test_refresh_error_is_retried_in_task(self, delay):
+        with patch.object(ReporterStatisticsService, 'refresh_keys', side_effect=OperationalError('deadlock')):
+            # The committed change does not fail
+            with self.captureOnCommitCallbacks(execute=True):
+                signal = SignalFactory.create(reporter__email=self.email)
+
+        self.assertFalse(ReporterStatistics.objects.filter(email=self.email).exists())
+        self.assertIn(signal.reporter_id, {reporter_id for call in delay.call_args_list
+                                           for reporter_id in call.kwargs['reporter_ids']})
+
+        for call in delay.call_args_list:
+            refresh_reporter_statistics(**call.kwargs)
+        self.assertEqual(self._get_statistics().signal_count, 1)
+
+    def test_refresh_task_by_key(self):
+        SignalFactory.create(reporter__email=self.email)
+        ReporterStatistics.objects.all().delete()
+
+        refresh_reporter_statistics(keys=[[EMAIL, self.email]])
+        self.assertEqual(self._get_statistics().signal_count, 1)
+
+    def test_compute(self):
+        SignalFactory.create(reporter__email=self.email, reporter__phone='0612345678')
+
+        self.assertEqual(ReporterStatisticsService.compute(EMAIL, self.email),
+                         {'signal_count': 1, 'open_count': 1, 'positive_count': 0, 'negative_count': 0})
+        self.assertEqual(ReporterStatisticsService.compute(PHONE, '0612345678'),
+                         {'signal_count': 1, 'open_count': 1, 'positive_count': 0, 'negative_count': 0})
+
+    def test_get_for_email(self):
+        SignalFactory.create(reporter__email=self.email)
+        ReporterStatistics.objects.all().delete()
+
+        # Missing statistics are computed once
+        statistics = ReporterStatisticsService.get_for_email('REPORTER@example.com')
+        self.assertEqual(statistics.signal_count, 1)
+
+        with self.assertNumQueries(1):
+            statistics = ReporterStatisticsService.get_for_email(self.email)
+        self.assertEqual(statistics.signal_count, 1)
+
+        statistics = ReporterStatisticsService.get_for_email('unknown@example.com')
+        self.assertEqual(statistics.signal_count, 0)
+        self.assertFalse(ReporterStatistics.objects.filter(email='unknown@example.com').exists())
+
+    def test_rebuild_command(self):
+        SignalFactory.create(reporter__email=self.email, reporter__phone='0612345678')
+        ReporterStatistics.objects.all().delete()
+        ReporterStatistics.objects.create(email='stale@example.com', signal_count=1)
+
+        out = StringIO()
+        call_command('rebuild_reporter_statistics', stdout=out)
+
+        self.assertEqual(self._get_statistics().signal_count, 1)
+        self.assertEqual(ReporterStatistics.objects.get(phone='0612345678').signal_count, 1)
+        self.assertFalse(ReporterStatistics.objects.filter(email='stale@example.com').exists())
+        self.assertIn('Rebuilt the statistics of 2 reporter(s)', out.getvalue())
@@ -0,0 +1,103 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from django.contrib.gis import geos
+from django.test import TestCase
+
+from signals.apps.services.domain.dsl import (
+    SignalDslService,
+    invalidate_routing_plan,
+    routing_engine,
+    routing_metrics
+)
+from signals.apps.signals.factories import (
+    AreaFactory,
+    DepartmentFactory,
+    ExpressionFactory,
+    ExpressionTypeFactory,
+    RoutingExpressionFactory,
+    SignalFactory
+)
+from signals.apps.users.factories import UserFactory
+from signals.instrumentation import instrument
+
+
+class TestRoutingEngine(TestCase):
+    dsl_service = SignalDslService()
+
+    def setUp(self):
+        invalidate_routing_plan()
+        routing_metrics.reset()
+
+        geometry = geos.MultiPolygon([geos.Polygon.from_bbox([4.877157, 52.357204, 4.929686, 52.385239])], srid=4326)
+        self.area = AreaFactory.create(geometry=geometry, name='centrum', code='centrum', _type__name='gebied',
+                                       _type__code='stadsdeel')
+
+        self.routing_type = ExpressionTypeFactory.create(name='routing')
+        self.department = DepartmentFactory.create()
+        self.user = UserFactory.create()
+        self.user.profile.departments.add(self.department)
+
+        expression = ExpressionFactory.create(_type=self.routing_type, name='centrum',
+                                              code=f'location in areas."{self.area._type.name}"."{self.area.code}"')
+        self.routing_expression = RoutingExpressionFactory.create(_expression=expression, _department=self.department,
+                                                                  _user=self.user, is_active=True, order=1)
+
+    def test_plan(self):
+        plan = routing_engine.get_plan()
+
+        self.assertEqual(len(plan.rules), 1)
+        rule = plan.rules[0]
+        self.assertEqual(rule.pk, self.routing_expression.pk)
+        self.assertEqual(rule.department_id, self.department.id)
+        self.assertEqual(rule.user_email, self.user.email)
+        self.assertFalse(rule.deactivate)
+        self.assertIn(self.area.code, plan.areas[self.area._type.name])
+
+    def test_plan_is_reused(self):
+        plan = routing_engine.get_plan()
+
+        # Only the version stamp is looked up
+        with instrument('test') as stats:
+            self.assertIs(routing_engine.get_plan(), plan)
+        self.assertEqual(stats.cache_hits, 1)
+        self.assertEqual(stats.cache_misses, 0)
+
+        self.assertEqual(routing_metrics.get('plan_builds'), 1)
+        self.assertEqual(routing_metrics.get('plan_hits'), 1)
+
+    def test_plan_rebuilt_on_change(self):
+        plan = routing_engine.get_plan()
+
+        expression = ExpressionFactory.create(_type=self.routing_type, name='sub', code='sub == "test"')
+        RoutingExpressionFactory.create(_expression=expression, _department=self.department, is_active=True, order=0)
+
+        new_plan = routing_engine.get_plan()
+        self.assertNotEqual(plan.version, new_plan.version)
+        self.assertEqual([rule.order for rule in new_plan.rules], [0, 1])
+
+        self.user.profile.departments.remove(self.department)
+        self.assertTrue(routing_engine.get_plan().rules[1].deactivate)
+
+        self.user.delete()
+        self.assertIsNone(routing_engine.get_plan().rules[1].user_email)
+
+    def test_invalidate_bumps_again_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_routing_plan()
+            version = routing_engine.get_plan().version
+        self.assertNotEqual(routing_engine.get_plan().version, version)
+
+    def test_process_routing_rules(self):
+        signal = SignalFactory.create(location__geometrie=geos.Point(4.88, 52.36))
+        self.assertTrue(self.dsl_service.process_routing_rules(signal))
+
+        signal.refresh_from_db()
+        self.assertEqual(signal.routing_assignment.departments.first().id, self.department.id)
+        self.assertEqual(signal.user_assignment.user.id, self.user.id)
+
+        signal_outside = SignalFactory.create(location__geometrie=geos.Point(1.0, 1.0))
+        self.assertFalse(self.dsl_service.process_routing_rules(signal_outside))
+
+        self.assertEqual(routing_metrics.get('matches'), 1)
+        self.assertEqual(routing_metrics.get('rules_evaluated'), 2)
+        self.assertEqual(routing_metrics.snapshot()['timings']['evaluate']['count'], 2)
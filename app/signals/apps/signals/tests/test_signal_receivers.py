@@ -4,8 +4,9 @@ from unittest import mock
 
 from django.test import TestCase, override_settings
 
-from signals.apps.signals.factories import SignalFactory
+from signals.apps.signals.factories import AttachmentFactory, SignalFactory
 from signals.apps.signals.managers import (
+    add_attachment,
     create_initial,
     update_category_assignment,
     update_location
@@ -49,3 +50,16 @@ class TestSignalsSignalReceivers(TestCase):
         mocked_tasks.apply_routing.delay.assert_called_once_with(
             self.signal.id
         )
+
+    @mock.patch('signals.apps.signals.signal_receivers.tasks', autospec=True)
+    def test_signals_add_attachment_handler(self, mocked_tasks):
+        attachment = AttachmentFactory.create(_signal=self.signal)
+        add_attachment.send_robust(
+            sender=self.__class__,
+            signal_obj=self.signal,
+            attachment=attachment,
+        )
+
+        mocked_tasks.create_attachment_renditions.delay.assert_called_once_with(
+            attachment.pk
+        )
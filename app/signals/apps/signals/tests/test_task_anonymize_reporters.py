@@ -1,12 +1,15 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2023 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
+from unittest.mock import patch
+
 from django.db.models import Q
-from django.test import TransactionTestCase
+from django.test import TransactionTestCase, override_settings
 from django.utils import timezone
 from freezegun import freeze_time
 
+from signals.apps.history.models import Log
 from signals.apps.signals.factories import SignalFactory
-from signals.apps.signals.models import Reporter
+from signals.apps.signals.models import Note, Reporter
 from signals.apps.signals.tasks import anonymize_reporter, anonymize_reporters
 from signals.apps.signals.workflow import (
     AFGEHANDELD,
@@ -210,3 +213,44 @@ class TestAnonymizeTasks(TransactionTestCase):
         self.assertIsNone(reporter.phone)
         self.assertFalse(reporter.email_anonymized)
         self.assertTrue(reporter.phone_anonymized)
+
+    @override_settings(REPORTER_ANONYMIZATION_BATCH_SIZE=2)
+    def test_anonymize_reporters_in_batches(self):
+        with freeze_time(timezone.now() - timezone.timedelta(days=3)):
+            signals = SignalFactory.create_batch(5, status__state=AFGEHANDELD)
+        signals[0].reporter.phone = None
+        signals[0].reporter.save()
+
+        self.assertEqual(anonymize_reporters(days=1, bulk=True), 5)
+
+        self.assertFalse(Reporter.objects.filter(Q(email__isnull=False) | Q(phone__isnull=False)).exists())
+        self.assertEqual(Note.objects.count(), 5)
+        self.assertEqual(Log.objects.filter(content_type__model='note').count(), 5)
+
+        note = Note.objects.get(_signal=signals[0])
+        self.assertEqual(note.text, 'Vanwege de AVG zijn de volgende gegevens van de melder geanonimiseerd: email')
+        self.assertIsNone(note.created_by)
+        self.assertEqual(note.history_log.get().rendered['action'], 'Notitie toegevoegd:')
+        self.assertEqual(Note.objects.get(_signal=signals[1]).text,
+                         'Vanwege de AVG zijn de volgende gegevens van de melder geanonimiseerd: email, telefoonnummer')
+
+        # Anonymized reporters are not anonymized again
+        self.assertEqual(anonymize_reporters(days=1, bulk=True), 0)
+        self.assertEqual(Note.objects.count(), 5)
+
+    def test_anonymize_reporters_dry_run(self):
+        with freeze_time(timezone.now() - timezone.timedelta(days=3)):
+            SignalFactory.create_batch(2, status__state=AFGEHANDELD)
+            SignalFactory.create(status__state=BEHANDELING)
+
+        self.assertEqual(anonymize_reporters(days=1, dry_run=True), 2)
+        self.assertEqual(Reporter.objects.filter(email_anonymized=False, phone_anonymized=False).count(), 3)
+
+    def test_anonymize_reporters_per_reporter(self):
+        with freeze_time(timezone.now() - timezone.timedelta(days=3)):
+            signal = SignalFactory.create(status__state=AFGEHANDELD)
+
+        with patch.object(anonymize_reporter, 'apply_async') as patched_apply_async:
+            self.assertEqual(anonymize_reporters(days=1, bulk=False), 1)
+
+        patched_apply_async.assert_called_once_with(kwargs={'reporter_id': signal.reporter.pk}, priority=0)
@@ -0,0 +1,229 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+"""
+Process-local index of `Area` geometries used to enrich signal locations.
+
+Every `Signal` that is created or relocated needs its stadsdeel and area code,
+which used to be resolved with two point-in-polygon queries per lookup. This
+module keeps the areas of each requested area type in memory as prepared GEOS
+geometries behind a Sort-Tile-Recursive (STR) packed R-tree, so a lookup is a
+bounding box descent followed by a prepared `contains` check.
+
+Areas are (re)loaded rarely, through the `load_areas` management command or the
+Django admin. Every change bumps a version stamp stored in the shared Django
+cache, every process compares its local version with that stamp and rebuilds
+its index when they differ.
+"""
+import threading
+import time
+from math import ceil, sqrt
+from typing import Iterator, Optional
+
+from django.conf import settings
+from django.contrib.gis.geos import GEOSGeometry
+from django.db import transaction
+
+from signals.apps.signals.models import Area
+from signals.apps.signals.utils.version_stamp import VersionStamp
+
+area_index_version = VersionStamp('signals:area_index:version')
+
+# Key under which the index containing all area types is stored
+ALL_AREA_TYPES = None
+
+
+class _Node:
+    """
+    Node of the STR-tree, leaves hold the indexed entries.
+    """
+    __slots__ = ('extent', 'children', 'entries')
+
+    def __init__(self, extent, children=None, entries=None):
+        self.extent = extent
+        self.children = children or []
+        self.entries = entries or []
+
+
+class _AreaEntry:
+    """
+    An indexed area, holds the prepared geometry and what is needed to return an `Area` instance.
+    """
+    __slots__ = ('extent', 'prepared', 'sort_key', 'area')
+
+    def __init__(self, area: Area, type_code: str):
+        self.extent = area.geometry.extent
+        self.prepared = area.geometry.prepared
+        # Mirrors the default ordering of the Area model: ['_type', 'code'] where the ordering of the AreaType is code
+        self.sort_key = (type_code, area.code)
+        self.area = area
+
+
+def _union_extent(extents):
+    min_x, min_y, max_x, max_y = zip(*extents)
+    return min(min_x), min(min_y), max(max_x), max(max_y)
+
+
+def _extent_contains(extent, x, y) -> bool:
+    return extent[0] <= x <= extent[2] and extent[1] <= y <= extent[3]
+
+
+class STRTree:
+    """
+    Static R-tree bulk loaded with the Sort-Tile-Recursive algorithm.
+
+    The tree is immutable after creation, a changed set of areas results in a new tree.
+    """
+    def __init__(self, items: list, node_capacity: int = 10):
+        self.node_capacity = node_capacity
+        self.root = self._build(items) if items else None
+
+    def _pack(self, items: list) -> list[list]:
+        """
+        Tile the items (anything with an `extent`) into groups of at most `node_capacity` items.
+        """
+        def center_x(item):
+            return (item.extent[0] + item.extent[2]) / 2
+
+        def center_y(item):
+            return (item.extent[1] + item.extent[3]) / 2
+
+        n_slices = ceil(sqrt(ceil(len(items) / self.node_capacity)))
+        slice_size = n_slices * self.node_capacity
+
+        groups = []
+        items = sorted(items, key=center_x)
+        for i in range(0, len(items), slice_size):
+            vertical_slice = sorted(items[i:i + slice_size], key=center_y)
+            for j in range(0, len(vertical_slice), self.node_capacity):
+                groups.append(vertical_slice[j:j + self.node_capacity])
+        return groups
+
+    def _build(self, entries: list) -> _Node:
+        nodes = [_Node(_union_extent([entry.extent for entry in group]), entries=group)
+                 for group in self._pack(entries)]
+        while len(nodes) > 1:
+            nodes = [_Node(_union_extent([node.extent for node in group]), children=group)
+                     for group in self._pack(nodes)]
+        return nodes[0]
+
+    def query_point(self, x: float, y: float) -> Iterator:
+        """
+        Yields all entries whose extent contains the given point.
+        """
+        if self.root is None:
+            return
+
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if not _extent_contains(node.extent, x, y):
+                continue
+            stack.extend(node.children)
+            for entry in node.entries:
+                if _extent_contains(entry.extent, x, y):
+                    yield entry
+
+
+class AreaIndex:
+    """
+    In-memory lookup of areas, per area type, that contain a given point.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._trees: dict[Optional[str], STRTree] = {}
+        self._version: Optional[str] = None
+        self._checked_at: float = 0.0
+
+    def _check_version(self) -> None:
+        """
+        Drop all trees when the shared version stamp changed. The shared version is checked at most once every
+        AREA_INDEX_VERSION_CHECK_INTERVAL seconds.
+        """
+        interval = getattr(settings, 'AREA_INDEX_VERSION_CHECK_INTERVAL', 5)
+        now = time.monotonic()
+        if self._version is not None and now - self._checked_at < interval:
+            return
+
+        version = area_index_version.get()
+        with self._lock:
+            self._checked_at = now
+            if version != self._version:
+                self._trees = {}
+                self._version = version
+
+    @staticmethod
+    def _build_tree(area_type: Optional[str]) -> STRTree:
+        queryset = Area.objects.select_related('_type')
+        if area_type:
+            queryset = queryset.filter(_type__code=area_type)
+
+        entries = []
+        for area in queryset.iterator():
+            if area.geometry is None or area.geometry.empty:
+                continue
+            entries.append(_AreaEntry(area, area._type.code))
+        return STRTree(entries)
+
+    def _get_tree(self, area_type: Optional[str]) -> STRTree:
+        self._check_version()
+
+        tree = self._trees.get(area_type)
+        if tree is None:
+            with self._lock:
+                tree = self._trees.get(area_type)
+                if tree is None:
+                    tree = self._build_tree(area_type)
+                    self._trees[area_type] = tree
+        return tree
+
+    def get_area(self, geometry: GEOSGeometry, area_type: Optional[str] = None) -> Optional[Area]:
+        """
+        Returns the first Area (in the default ordering of the Area model) that contains the given geometry.
+
+        :param geometry: the geometry, normally a Point
+        :param area_type: the code of the AreaType to look in, all area types are used if not provided
+        :return: Area or None
+        """
+        tree = self._get_tree(area_type or ALL_AREA_TYPES)
+        if tree.root is None:
+            return None
+
+        srid = Area._meta.get_field('geometry').srid
+        if geometry.srid and geometry.srid != srid:
+            geometry = geometry.transform(srid, clone=True)
+
+        point = geometry if geometry.geom_type == 'Point' else geometry.point_on_surface
+        matches = [
+            entry for entry in tree.query_point(point.x, point.y)
+            if entry.prepared.contains(geometry)
+        ]
+        if not matches:
+            return None
+        return min(matches, key=lambda entry: entry.sort_key).area
+
+    def reset(self) -> None:
+        """
+        Drop the local trees, they will be rebuilt on the next lookup.
+        """
+        with self._lock:
+            self._trees = {}
+            self._version = None
+            self._checked_at = 0.0
+
+
+area_index = AreaIndex()
+
+
+def _bump_area_index_version() -> None:
+    area_index_version.bump()
+    area_index.reset()
+
+
+def invalidate_area_index() -> None:
+    """
+    Bump the shared version stamp so that all processes rebuild their area index, and reset the local index. The
+    version is bumped again once the transaction is committed, an index another process built from the areas before
+    the commit is not used afterwards.
+    """
+    _bump_area_index_version()
+    transaction.on_commit(_bump_area_index_version)
@@ -8,6 +8,7 @@ from django.contrib.gis.db.models import PointField
 from django.db.models import Q
 
 from signals.apps.signals.models import Area
+from signals.apps.signals.utils.area_index import area_index
 
 
 def _get_area(geometry: PointField, area_type: Optional[str] = None) -> Optional[Area]:
@@ -19,6 +20,9 @@ def _get_area(geometry: PointField, area_type: Optional[str] = None) -> Optional
     :param area_type:
     :return: Area or None
     """
+    if settings.FEATURE_FLAGS.get('AREA_INDEX_ENABLED', True):
+        return area_index.get_area(geometry=geometry, area_type=area_type)
+
     query = Q(geometry__contains=geometry)
     if area_type:
         query &= Q(_type__code=area_type)
@@ -0,0 +1,36 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+import uuid
+
+from django.core.cache import cache
+
+# Common prefix of the cache keys of version stamps, the tiered cache keeps these only briefly in the local tier
+CACHE_KEY_PREFIX = 'version_stamp:'
+
+
+class VersionStamp:
+    """
+    A version stamp shared by all processes through the Django cache.
+
+    Process-local caches remember the version they were built for and rebuild when the shared version changed.
+    Whoever changes the underlying data bumps the version.
+
+    :param timeout: number of seconds the version stamp is kept, None keeps it forever. An expired version stamp is
+                    replaced by a new version, so the process-local caches are rebuilt.
+    """
+    def __init__(self, cache_key: str, timeout: int | None = None):
+        self.cache_key = f'{CACHE_KEY_PREFIX}{cache_key}'
+        self.timeout = timeout
+
+    def get(self) -> str:
+        version = cache.get(self.cache_key)
+        if version is None:
+            # No version stamp known (yet), add one. If another process beats us to it we use theirs.
+            cache.add(self.cache_key, uuid.uuid4().hex, self.timeout)
+            version = cache.get(self.cache_key)
+        return version
+
+    def bump(self) -> str:
+        version = uuid.uuid4().hex
+        cache.set(self.cache_key, version, self.timeout)
+        return version
@@ -23,7 +23,9 @@ _available_settings = {
     ],
     'USER_ID_FIELDS': ''.split(','),  # fieldnames separated by comma's
     'ALWAYS_OK': False,
-    'MIN_INTERVAL_KEYSET_UPDATE': 30
+    'MIN_INTERVAL_KEYSET_UPDATE': 30,
+    'VERIFIED_TOKEN_CACHE_SIZE': 1024,  # number of tokens, 0 disables the cache
+    'VERIFIED_TOKEN_CACHE_MAX_AGE': 300,  # seconds
 }
 
 _settings = {}
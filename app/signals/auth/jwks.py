@@ -1,5 +1,6 @@
 # SPDX-License-Identifier: MPL-2.0
 # Copyright (C) 2020 - 2021 Vereniging van Nederlandse Gemeenten, Gemeente Amsterdam
+import hashlib
 import time
 
 import requests
@@ -10,6 +11,7 @@ from .config import AuthConfigurationError, get_settings
 
 _keyset = None
 _keyset_last_update = 0
+_keyset_version = None
 
 
 def get_keyset():
@@ -19,6 +21,16 @@ def get_keyset():
     return _keyset
 
 
+def get_keyset_version():
+    """
+    Version of the keyset, changes when keys are added to or removed from the
+    keyset. Reloading an unchanged keyset keeps the version.
+    """
+    if not _keyset_version:
+        get_keyset()
+    return _keyset_version
+
+
 def check_update_keyset():
     """
     When loading a JWKS from a url (public endpoint), we might need to
@@ -35,7 +47,7 @@ def init_keyset():
     """
     Initialize keyset, by loading keyset from settings
     """
-    global _keyset
+    global _keyset, _keyset_last_update, _keyset_version
 
     _keyset = JWKSet()
     settings = get_settings()
@@ -49,6 +61,11 @@ def init_keyset():
     if len(_keyset['keys']) == 0:
         raise AuthConfigurationError('No keys loaded!')
 
+    _keyset_last_update = time.time()
+    _keyset_version = hashlib.sha256(
+        ','.join(sorted(key.thumbprint() for key in _keyset['keys'])).encode()
+    ).hexdigest()
+
 
 def load_jwks(jwks):
     global _keyset
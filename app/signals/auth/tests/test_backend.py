@@ -9,6 +9,7 @@ from rest_framework.exceptions import AuthenticationFailed
 from signals.auth.backend import JWTAuthBackend
 from signals.auth.config import get_settings
 from signals.auth.jwks import get_keyset
+from signals.auth.token_cache import VerifiedTokenCache, get_verified_token_cache, token_metrics
 from signals.auth.tokens import JWTAccessToken
 from signals.test.utils import SignalsBaseApiTestCase
 
@@ -101,3 +102,69 @@ class TestBackend(SignalsBaseApiTestCase):
 
             e = cm.exception
             self.assertEqual(str(e), 'User {} is not authorized'.format('idonotexist'))
+
+
+class TestVerifiedTokenCache(SignalsBaseApiTestCase):
+    kid = "2aedafba-8170-4064-b704-ce92b7c89cc6"
+
+    def setUp(self):
+        get_verified_token_cache().reset()
+        token_metrics.reset()
+
+    def _bearer(self, **claims):
+        token = jwt.JWT(header={"kid": self.kid, "alg": "ES256"}, claims=claims)
+        token.make_signed_token(get_keyset().get_key(self.kid))
+        return 'Bearer {}'.format(token.serialize())
+
+    def test_token_verified_once(self):
+        user_id_field = get_settings()['USER_ID_FIELDS'][0]
+        bearer = self._bearer(**{user_id_field: 'test@example.com', 'exp': round(time.time()) + 600})
+
+        with patch('signals.auth.tokens.JWTAccessToken.decode_token', wraps=JWTAccessToken.decode_token) as decode:
+            for _ in range(3):
+                claims, user_id = JWTAccessToken.token_data(bearer, True)
+                self.assertEqual(user_id, 'test@example.com')
+                self.assertEqual(claims[user_id_field], 'test@example.com')
+
+        self.assertEqual(decode.call_count, 1)
+        self.assertEqual(token_metrics.get('cache_misses'), 1)
+        self.assertEqual(token_metrics.get('cache_hits'), 2)
+
+    def test_keyset_change_invalidates(self):
+        user_id_field = get_settings()['USER_ID_FIELDS'][0]
+        bearer = self._bearer(**{user_id_field: 'test@example.com'})
+
+        JWTAccessToken.token_data(bearer, True)
+        with patch('signals.auth.tokens.get_keyset_version', return_value='rotated'):
+            with patch('signals.auth.tokens.JWTAccessToken.decode_token',
+                       wraps=JWTAccessToken.decode_token) as decode:
+                JWTAccessToken.token_data(bearer, True)
+                JWTAccessToken.token_data(bearer, True)
+
+        self.assertEqual(decode.call_count, 1)
+
+    def test_failed_verification_not_cached(self):
+        with self.assertRaises(AuthenticationFailed):
+            JWTAccessToken.token_data(self._bearer(will_not_match='test@example.com'), True)
+
+        self.assertEqual(len(get_verified_token_cache()), 0)
+        self.assertEqual(token_metrics.get('failures'), 1)
+
+    def test_expiry(self):
+        cache = VerifiedTokenCache(max_size=10, max_age=300)
+
+        cache.set('expired', 'v1', {'exp': time.time() - 1}, 'test@example.com')
+        self.assertIsNone(cache.get('expired', 'v1'))
+
+        cache.set('valid', 'v1', {'exp': time.time() + 60}, 'test@example.com')
+        self.assertEqual(cache.get('valid', 'v1').user_id, 'test@example.com')
+        self.assertIsNone(cache.get('valid', 'v2'))
+
+    def test_bounded(self):
+        cache = VerifiedTokenCache(max_size=2, max_age=300)
+        for token in ('a', 'b', 'c'):
+            cache.set(token, 'v1', {}, f'{token}@example.com')
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get('a', 'v1'))
+        self.assertIsNotNone(cache.get('c', 'v1'))
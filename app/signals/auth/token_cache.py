@@ -0,0 +1,105 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+"""
+Cache of verified tokens.
+
+Clients send the same bearer token with every request, verifying its signature every time is wasted work. Once a
+token is verified its claims are cached, keyed by the SHA-256 digest of the token, until the token expires. Every entry
+records the version of the keyset it was verified with, so entries verified with a keyset that has since changed are
+verified again.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from signals.metrics import get_metrics
+
+from .config import get_settings
+
+token_metrics = get_metrics('auth_tokens')
+
+
+@dataclass(frozen=True)
+class VerifiedToken:
+    keyset_version: str
+    expires_at: float
+    claims: dict
+    user_id: str
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU cache of verified tokens, local to the process.
+
+    :param max_size: maximum number of tokens in the cache
+    :param max_age: maximum number of seconds a token is cached, also for tokens that expire later or never
+    """
+    def __init__(self, max_size: int, max_age: int):
+        self.max_size = max_size
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._tokens: OrderedDict[str, VerifiedToken] = OrderedDict()
+
+    @staticmethod
+    def _digest(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str, keyset_version: str) -> VerifiedToken | None:
+        digest = self._digest(token)
+        with self._lock:
+            verified = self._tokens.get(digest)
+            if verified is None:
+                return None
+
+            if verified.keyset_version != keyset_version or verified.expires_at <= time.time():
+                del self._tokens[digest]
+                return None
+
+            self._tokens.move_to_end(digest)
+            return verified
+
+    def set(self, token: str, keyset_version: str, claims: dict, user_id: str) -> None:
+        if self.max_size <= 0:
+            return
+
+        expires_at = time.time() + self.max_age
+        if isinstance(claims.get('exp'), (int, float)):
+            expires_at = min(expires_at, claims['exp'])
+
+        verified = VerifiedToken(keyset_version=keyset_version, expires_at=expires_at, claims=claims, user_id=user_id)
+        digest = self._digest(token)
+        with self._lock:
+            self._tokens[digest] = verified
+            self._tokens.move_to_end(digest)
+            while len(self._tokens) > self.max_size:
+                self._tokens.popitem(last=False)
+                token_metrics.increment('evictions')
+
+    def reset(self) -> None:
+        with self._lock:
+            self._tokens = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+
+_verified_token_cache: VerifiedTokenCache | None = None
+_verified_token_cache_lock = threading.Lock()
+
+
+def get_verified_token_cache() -> VerifiedTokenCache:
+    """
+    The verified token cache of this process, configured with the SIGNALS_AUTH settings.
+    """
+    global _verified_token_cache
+    if _verified_token_cache is None:
+        with _verified_token_cache_lock:
+            if _verified_token_cache is None:
+                settings = get_settings()
+                _verified_token_cache = VerifiedTokenCache(
+                    max_size=settings['VERIFIED_TOKEN_CACHE_SIZE'],
+                    max_age=settings['VERIFIED_TOKEN_CACHE_MAX_AGE'],
+                )
+    return _verified_token_cache
@@ -9,7 +9,8 @@ from jwcrypto.jwt import JWT, JWTExpired, JWTMissingKey
 from rest_framework.exceptions import AuthenticationFailed
 
 from .config import get_settings
-from .jwks import check_update_keyset, get_keyset
+from .jwks import check_update_keyset, get_keyset, get_keyset_version
+from .token_cache import get_verified_token_cache, token_metrics
 
 
 class JWTAccessToken:
@@ -68,5 +69,21 @@ class JWTAccessToken:
         if prefix.lower() != 'bearer':
             raise AuthenticationFailed('invalid token format')
 
-        jwt = JWTAccessToken.decode_token(token=raw_jwt)
-        return JWTAccessToken.decode_claims(jwt.claims)
+        # A token that was verified before is not verified again until it expires or the keyset changes
+        cache = get_verified_token_cache()
+        verified = cache.get(raw_jwt, get_keyset_version())
+        if verified is not None:
+            token_metrics.increment('cache_hits')
+            return dict(verified.claims), verified.user_id
+
+        token_metrics.increment('cache_misses')
+        try:
+            with token_metrics.timer('verify'):
+                jwt = JWTAccessToken.decode_token(token=raw_jwt)
+                claims, user_id = JWTAccessToken.decode_claims(jwt.claims)
+        except AuthenticationFailed:
+            token_metrics.increment('failures')
+            raise
+
+        cache.set(raw_jwt, get_keyset_version(), claims, user_id)
+        return dict(claims), user_id
@@ -0,0 +1,9 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+"""
+Benchmarks of the hot paths of the API and the tasks, run with the `benchmark` management command.
+
+A deterministic dataset is seeded into the (local) database, after which every scenario is run a number of times while
+its latency, number of queries and memory use are recorded. The results are written to a JSON report, reports of
+different commits can be compared to find regressions.
+"""
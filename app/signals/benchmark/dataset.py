@@ -0,0 +1,124 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+"""
+Deterministic benchmark dataset of areas, categories, users and signals with history.
+
+Seeding with the same configuration and random seed into an empty database always creates the same dataset (apart from
+primary keys, UUIDs and timestamps).
+"""
+import math
+import random
+from dataclasses import asdict, dataclass
+
+import factory.random
+from django.contrib.auth import get_user_model
+from django.contrib.gis.geos import MultiPolygon, Polygon
+from django.db import transaction
+
+from signals.apps.history.models import Log
+from signals.apps.history.services import SignalLogService
+from signals.apps.signals import workflow
+from signals.apps.signals.factories import (
+    AreaFactory,
+    AreaTypeFactory,
+    CategoryFactory,
+    NoteFactory,
+    ParentCategoryFactory,
+    SignalFactoryValidLocation
+)
+from signals.apps.signals.models import Area, Category, Signal
+from signals.apps.users.factories import UserFactory
+
+User = get_user_model()
+
+# The superuser the API scenarios are run as
+BENCHMARK_USER_EMAIL = 'benchmark@example.com'
+
+# Covers the valid locations used by the signal factories
+AREAS_BBOX = (4.75, 52.28, 5.05, 52.43)
+
+# States of the seeded signals, open states are more common
+SIGNAL_STATES = [
+    workflow.GEMELD, workflow.GEMELD, workflow.AFWACHTING, workflow.BEHANDELING, workflow.BEHANDELING,
+    workflow.INGEPLAND, workflow.AFGEHANDELD, workflow.GEANNULEERD,
+]
+
+
+@dataclass(frozen=True)
+class DatasetConfig:
+    signals: int = 1000
+    areas: int = 16
+    categories: int = 20
+    users: int = 10
+    # Notes (and history log entries) per signal
+    notes: int = 2
+    seed: int = 42
+
+
+def get_area_grid(count: int, bbox: tuple[float, float, float, float] = AREAS_BBOX) -> list[MultiPolygon]:
+    """
+    Split the bounding box in (at least) count areas, returns the first count areas.
+    """
+    columns = math.ceil(math.sqrt(count))
+    rows = math.ceil(count / columns)
+    min_lon, min_lat, max_lon, max_lat = bbox
+    width, height = (max_lon - min_lon) / columns, (max_lat - min_lat) / rows
+
+    return [
+        MultiPolygon([Polygon.from_bbox((
+            min_lon + width * (i % columns),
+            min_lat + height * (i // columns),
+            min_lon + width * (i % columns + 1),
+            min_lat + height * (i // columns + 1),
+        ))], srid=4326)
+        for i in range(count)
+    ]
+
+
+def describe_dataset() -> dict:
+    """
+    The size of the dataset in the database, reported with the results.
+    """
+    return {
+        'signals': Signal.objects.count(),
+        'areas': Area.objects.count(),
+        'categories': Category.objects.filter(parent__isnull=False).count(),
+        'users': User.objects.count(),
+        'history': Log.objects.count(),
+    }
+
+
+def seed_dataset(config: DatasetConfig) -> dict:
+    """
+    Seed the benchmark dataset, the database must not contain any signals yet.
+    """
+    if Signal.objects.exists():
+        raise ValueError('The database already contains signals, seed the benchmark dataset into an empty database')
+
+    random.seed(config.seed)
+    factory.random.reseed_random(config.seed)
+
+    with transaction.atomic():
+        area_type = AreaTypeFactory.create(code='benchmark', name='Benchmark')
+        for i, geometry in enumerate(get_area_grid(config.areas)):
+            AreaFactory.create(_type=area_type, code=f'benchmark-{i}', name=f'Benchmark {i}', geometry=geometry)
+
+        parents = ParentCategoryFactory.create_batch(max(1, config.categories // 5))
+        categories = [CategoryFactory.create(parent=parents[i % len(parents)]) for i in range(config.categories)]
+
+        UserFactory.create(email=BENCHMARK_USER_EMAIL, is_superuser=True, is_staff=True)
+        users = UserFactory.create_batch(config.users)
+
+        for i in range(config.signals):
+            signal = SignalFactoryValidLocation.create(
+                category_assignment__category=categories[i % len(categories)],
+                status__state=SIGNAL_STATES[i % len(SIGNAL_STATES)],
+                reporter__email=f'reporter-{i % max(1, config.signals // 4)}@example.com',
+            )
+            SignalLogService.log_create_initial(signal)
+
+            # The post_save receiver of Note logs the notes
+            for _ in range(config.notes):
+                NoteFactory.create(_signal=signal, created_by=random.choice(users).email)
+
+    return describe_dataset() | {'config': asdict(config)}
@@ -0,0 +1,170 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+"""
+Running the benchmark scenarios, writing the report and comparing reports.
+
+Latency and the number of queries are recorded for every run. The memory use is measured with tracemalloc in one extra
+run, as tracing memory allocations slows down the code being measured.
+"""
+import platform
+import subprocess
+import time
+import tracemalloc
+from dataclasses import dataclass
+
+import django
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from signals.benchmark.dataset import describe_dataset
+from signals.benchmark.scenarios import SCENARIOS, Scenario, ScenarioSkipped
+
+# Version of the report format, reports of different versions cannot be compared
+REPORT_VERSION = 1
+
+PERCENTILES = (50, 90, 95, 99)
+
+# The metrics compared between two reports, a higher value is worse for all of them
+COMPARED_METRICS = ('p50_ms', 'p95_ms', 'queries', 'peak_memory_kib')
+
+
+def percentile(values: list[float], p: float) -> float:
+    """
+    The p-th percentile of the values, linearly interpolated between the closest ranks.
+    """
+    if not values:
+        raise ValueError('No values')
+
+    values = sorted(values)
+    rank = (len(values) - 1) * p / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (rank - lower)
+
+
+def call(func, rollback: bool) -> None:
+    if not rollback:
+        func()
+        return
+
+    with transaction.atomic():
+        func()
+        transaction.set_rollback(True)
+
+
+def measure(scenario: Scenario, iterations: int, warmup: int) -> dict:
+    try:
+        func = scenario.prepare()
+    except ScenarioSkipped as e:
+        return {'skipped': str(e)}
+
+    for _ in range(warmup):
+        call(func, scenario.rollback)
+
+    timings, queries = [], []
+    for _ in range(iterations):
+        with CaptureQueriesContext(connection) as context:
+            started = time.perf_counter()
+            call(func, scenario.rollback)
+            timings.append(time.perf_counter() - started)
+        queries.append(len(context.captured_queries))
+
+    tracemalloc.start()
+    try:
+        call(func, scenario.rollback)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    timings_ms = [timing * 1000 for timing in timings]
+    return {
+        'iterations': iterations,
+        **{f'p{p}_ms': round(percentile(timings_ms, p), 3) for p in PERCENTILES},
+        'min_ms': round(min(timings_ms), 3),
+        'max_ms': round(max(timings_ms), 3),
+        'mean_ms': round(sum(timings_ms) / len(timings_ms), 3),
+        'queries': percentile(queries, 50),
+        'max_queries': max(queries),
+        'peak_memory_kib': round(peak / 1024, 1),
+    }
+
+
+def get_commit() -> str | None:
+    try:
+        result = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, timeout=5, check=True)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def get_environment() -> dict:
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT version(), postgis_full_version()')
+        postgres_version, postgis_version = cursor.fetchone()
+
+    return {
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'platform': platform.platform(),
+        'postgres': postgres_version,
+        'postgis': postgis_version,
+    }
+
+
+def run_benchmarks(names: list[str], iterations: int, warmup: int, label: str | None = None, progress=None) -> dict:
+    """
+    Run the named scenarios and return the report, progress is called with the name and the results of every
+    scenario once it finished.
+    """
+    results = {}
+    for name in names:
+        results[name] = measure(SCENARIOS[name], iterations=iterations, warmup=warmup)
+        if progress is not None:
+            progress(name, results[name])
+
+    return {
+        'version': REPORT_VERSION,
+        'created_at': timezone.now().isoformat(),
+        'label': label,
+        'commit': get_commit(),
+        'environment': get_environment(),
+        'dataset': describe_dataset(),
+        'scenarios': results,
+    }
+
+
+@dataclass(frozen=True)
+class Change:
+    scenario: str
+    metric: str
+    baseline: float
+    current: float
+    regression: bool
+
+    @property
+    def relative(self) -> float | None:
+        return (self.current - self.baseline) / self.baseline if self.baseline else None
+
+
+def compare_reports(baseline: dict, current: dict, threshold: float) -> list[Change]:
+    """
+    The changes of the metrics of the scenarios in both reports. The number of queries is deterministic, so any
+    increase is a regression, the other metrics regressed when they increased by more than threshold (a fraction).
+    """
+    if baseline.get('version') != current.get('version'):
+        raise ValueError(f'Cannot compare a version {baseline.get("version")} report with a version '
+                         f'{current.get("version")} report')
+
+    changes = []
+    for name, results in current['scenarios'].items():
+        baseline_results = baseline['scenarios'].get(name)
+        if not baseline_results or 'skipped' in baseline_results or 'skipped' in results:
+            continue
+
+        for metric in COMPARED_METRICS:
+            before, after = baseline_results[metric], results[metric]
+            limit = before if metric == 'queries' else before * (1 + threshold)
+            changes.append(Change(scenario=name, metric=metric, baseline=before, current=after,
+                                  regression=after > limit))
+    return changes
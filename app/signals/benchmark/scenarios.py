@@ -0,0 +1,168 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+"""
+The benchmarked hot paths.
+
+Every scenario is a function that prepares the scenario and returns the callable that is measured. A scenario that
+cannot run in the current environment (for example without Elasticsearch) raises ScenarioSkipped. Scenarios that
+change data are run in a transaction that is rolled back after every run, so every run starts from the same dataset.
+"""
+import itertools
+import tempfile
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from signals.apps.reporting.csv.datawarehouse.categories import create_category_assignments_csv
+from signals.apps.reporting.csv.datawarehouse.locations import create_locations_csv
+from signals.apps.reporting.csv.datawarehouse.signals import create_signals_csv
+from signals.apps.reporting.csv.datawarehouse.statusses import create_statuses_csv
+from signals.apps.search.documents.signal import SignalDocument
+from signals.apps.services.domain.pdf import PDFSummaryService
+from signals.apps.signals.models import Category, Signal
+from signals.apps.signals.tasks import apply_routing
+from signals.benchmark.dataset import BENCHMARK_USER_EMAIL
+
+User = get_user_model()
+
+# Number of (different) signals the detail like scenarios cycle through
+SAMPLE_SIZE = 25
+
+
+class ScenarioSkipped(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    prepare: Callable[[], Callable[[], None]]
+    # Run in a transaction that is rolled back after every run
+    rollback: bool = False
+
+
+SCENARIOS: dict[str, Scenario] = {}
+
+
+def scenario(name: str, rollback: bool = False):
+    def decorator(prepare):
+        SCENARIOS[name] = Scenario(name=name, prepare=prepare, rollback=rollback)
+        return prepare
+    return decorator
+
+
+def get_benchmark_user():
+    try:
+        return User.objects.get(email=BENCHMARK_USER_EMAIL)
+    except User.DoesNotExist:
+        raise ScenarioSkipped('No benchmark user, seed the benchmark dataset first')
+
+
+def get_api_client(user=None) -> APIClient:
+    # Requests are handled by the complete middleware stack, "localhost" is an allowed host by default
+    client = APIClient(SERVER_NAME='localhost')
+    if user is not None:
+        client.force_authenticate(user=user)
+    return client
+
+
+def get_sample_signal_ids() -> itertools.cycle:
+    signal_ids = list(Signal.objects.order_by('pk').values_list('pk', flat=True)[:SAMPLE_SIZE])
+    if not signal_ids:
+        raise ScenarioSkipped('No signals, seed the benchmark dataset first')
+    return itertools.cycle(signal_ids)
+
+
+def get(client: APIClient, path: str, data: dict | None = None, expected_status: int = 200) -> Callable[[], None]:
+    def run():
+        response = client.get(path, data)
+        if response.status_code != expected_status:
+            raise AssertionError(f'GET {path} returned {response.status_code}, expected {expected_status}')
+    return run
+
+
+@scenario('private_signal_list')
+def private_signal_list():
+    return get(get_api_client(get_benchmark_user()), '/signals/v1/private/signals/')
+
+
+@scenario('private_signal_detail')
+def private_signal_detail():
+    client = get_api_client(get_benchmark_user())
+    signal_ids = get_sample_signal_ids()
+
+    def run():
+        get(client, f'/signals/v1/private/signals/{next(signal_ids)}')()
+    return run
+
+
+@scenario('private_signal_geography')
+def private_signal_geography():
+    return get(get_api_client(get_benchmark_user()), '/signals/v1/private/signals/geography')
+
+
+@scenario('search')
+def search():
+    if not SignalDocument.ping():
+        raise ScenarioSkipped('Elasticsearch is not available')
+    return get(get_api_client(get_benchmark_user()), '/signals/v1/private/search', {'q': 'melding'})
+
+
+@scenario('public_signal_create', rollback=True)
+def public_signal_create():
+    category = Category.objects.filter(parent__isnull=False, is_active=True).select_related('parent').first()
+    if category is None:
+        raise ScenarioSkipped('No categories, seed the benchmark dataset first')
+
+    client = get_api_client()
+    data = {
+        'text': 'Er ligt afval naast de container',
+        'location': {'geometrie': {'type': 'Point', 'coordinates': [4.90022563, 52.36768424]}},
+        'category': {
+            'sub_category': f'/signals/v1/public/terms/categories/{category.parent.slug}/sub_categories/{category.slug}'
+        },
+        'reporter': {'email': 'melder@example.com', 'sharing_allowed': False},
+        'incident_date_start': '2026-01-01T12:00:00+01:00',
+        'source': 'online',
+    }
+
+    # Every run comes from another address, the signals of one address are throttled
+    addresses = (f'10.{n // 65536 % 256}.{n // 256 % 256}.{n % 256}' for n in itertools.count())
+
+    def run():
+        response = client.post('/signals/v1/public/signals/', data, format='json', REMOTE_ADDR=next(addresses))
+        if response.status_code != 201:
+            raise AssertionError(f'Creating a signal returned {response.status_code}: {response.content[:200]}')
+    return run
+
+
+@scenario('apply_routing', rollback=True)
+def routing():
+    signal_ids = get_sample_signal_ids()
+
+    def run():
+        apply_routing(next(signal_ids))
+    return run
+
+
+@scenario('pdf_summary')
+def pdf_summary():
+    user = get_benchmark_user()
+    signal_ids = get_sample_signal_ids()
+
+    def run():
+        signal = Signal.objects.get(pk=next(signal_ids))
+        PDFSummaryService.get_pdf(signal, user, include_contact_details=True)
+    return run
+
+
+@scenario('datawarehouse_csv')
+def datawarehouse_csv():
+    def run():
+        with tempfile.TemporaryDirectory() as location:
+            for create_csv in (create_signals_csv, create_locations_csv, create_statuses_csv,
+                               create_category_assignments_csv):
+                create_csv(location)
+    return run
@@ -0,0 +1,274 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+"""
+Two tier cache backend: a small LRU cache in the memory of the process in front of a shared cache.
+
+Reads are served from the process-local tier when possible, writes go to both tiers. Other processes do not see the
+writes of this process in their local tier until the local entry expired, so the local tier only keeps entries for a
+short time (LOCAL_TIMEOUT). Keys missing from the shared cache are remembered as missing for NEGATIVE_TIMEOUT seconds.
+
+Keys whose value is read, modified and written back (like the request history of the DRF throttles) must not be kept
+in the local tier, a process would otherwise overwrite the writes of other processes. Give these a local timeout of 0.
+
+Configuration, the LOCATION is the alias of the shared cache:
+
+    CACHES = {
+        'default': {
+            'BACKEND': 'signals.cache.TieredCache',
+            'LOCATION': 'shared',
+            'OPTIONS': {
+                'LOCAL_MAX_ENTRIES': 1000,
+                'LOCAL_TIMEOUT': 10,
+                'NEGATIVE_TIMEOUT': 5,
+                # The local timeout of keys starting with the given prefix, 0 disables the local tier for these keys
+                'LOCAL_TIMEOUTS': {'version_stamp:': 1},
+            },
+        },
+        'shared': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'signals_cache',
+        },
+    }
+"""
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+from signals.instrumentation import record_cache_lookup
+from signals.metrics import get_metrics
+
+cache_metrics = get_metrics('cache')
+
+# Marks a key that is missing from the shared cache
+_MISSING = object()
+
+
+class LocalTier:
+    """
+    LRU cache of pickled values with an expiry time per entry, shared by all threads of the process.
+    """
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, bytes | object]] = OrderedDict()
+
+    def get(self, key: str) -> tuple[bool, object]:
+        """
+        Returns whether the key was found and its value, _MISSING for a key known to be missing from the shared cache.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+
+            expires_at, data = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+
+        return True, data if data is _MISSING else pickle.loads(data)
+
+    def set(self, key: str, value: object, timeout: float) -> None:
+        if timeout <= 0:
+            self.delete(key)
+            return
+
+        data = value if value is _MISSING else pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + timeout, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                cache_metrics.increment('local_evictions')
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Django creates a cache backend per thread, the local tiers are kept per process
+_local_tiers: dict[str, LocalTier] = {}
+_local_tiers_lock = threading.Lock()
+
+
+def clear_local_tiers() -> None:
+    """
+    Drop the local tiers of this process, the shared caches are left alone.
+    """
+    with _local_tiers_lock:
+        for local_tier in _local_tiers.values():
+            local_tier.clear()
+
+
+class TieredCache(BaseCache):
+    def __init__(self, location: str, params: dict):
+        super().__init__(params)
+        options = params.get('OPTIONS', {})
+
+        self.shared_alias = location
+        self.local_timeout = float(options.get('LOCAL_TIMEOUT', 10))
+        self.negative_timeout = float(options.get('NEGATIVE_TIMEOUT', 5))
+        # Longest prefix first, so the most specific prefix matches
+        self.local_timeouts = sorted(((prefix, float(timeout))
+                                      for prefix, timeout in options.get('LOCAL_TIMEOUTS', {}).items()),
+                                     key=lambda item: len(item[0]), reverse=True)
+
+        with _local_tiers_lock:
+            name = f'{location}:{self.key_prefix}'
+            if name not in _local_tiers:
+                _local_tiers[name] = LocalTier(int(options.get('LOCAL_MAX_ENTRIES', 1000)))
+            self.local = _local_tiers[name]
+
+    @property
+    def shared(self) -> BaseCache:
+        return caches[self.shared_alias]
+
+    def _get_local_timeout(self, key: str, timeout=DEFAULT_TIMEOUT) -> float:
+        local_timeout = self.local_timeout
+        for prefix, prefix_timeout in self.local_timeouts:
+            if key.startswith(prefix):
+                local_timeout = prefix_timeout
+                break
+
+        if timeout is not DEFAULT_TIMEOUT and timeout is not None:
+            local_timeout = min(local_timeout, timeout)
+        return local_timeout
+
+    def _resolve(self, timeout, version) -> tuple[object, int]:
+        return (self.default_timeout if timeout is DEFAULT_TIMEOUT else timeout,
+                self.version if version is None else version)
+
+    def get(self, key, default=None, version=None):
+        _, version = self._resolve(None, version)
+        local_key = self.make_and_validate_key(key, version=version)
+        local_timeout = self._get_local_timeout(key)
+
+        if local_timeout > 0:
+            found, value = self.local.get(local_key)
+            if found:
+                cache_metrics.increment('local_hits')
+                if value is _MISSING:
+                    record_cache_lookup(misses=1)
+                    return default
+                record_cache_lookup(hits=1)
+                return value
+
+        cache_metrics.increment('shared_lookups')
+        value = self.shared.get(key, _MISSING, version=version)
+        if value is _MISSING:
+            record_cache_lookup(misses=1)
+            if local_timeout > 0 and self.negative_timeout > 0:
+                self.local.set(local_key, _MISSING, min(local_timeout, self.negative_timeout))
+            return default
+
+        record_cache_lookup(hits=1)
+        if local_timeout > 0:
+            self.local.set(local_key, value, local_timeout)
+        return value
+
+    def _get_many_local(self, keys: list, version: int) -> tuple[dict, list]:
+        """
+        Returns the values found in the local tier and the keys that have to be looked up in the shared cache.
+        """
+        result = {}
+        missing = []
+        for key in keys:
+            if self._get_local_timeout(key) > 0:
+                found, value = self.local.get(self.make_and_validate_key(key, version=version))
+                if found:
+                    cache_metrics.increment('local_hits')
+                    if value is not _MISSING:
+                        result[key] = value
+                    continue
+            missing.append(key)
+        return result, missing
+
+    def get_many(self, keys, version=None):
+        _, version = self._resolve(None, version)
+        keys = list(keys)
+
+        result, missing = self._get_many_local(keys, version)
+        if missing:
+            cache_metrics.increment('shared_lookups')
+            found = self.shared.get_many(missing, version=version)
+            for key in missing:
+                local_timeout = self._get_local_timeout(key)
+                local_key = self.make_and_validate_key(key, version=version)
+                if key in found:
+                    result[key] = found[key]
+                    if local_timeout > 0:
+                        self.local.set(local_key, found[key], local_timeout)
+                elif local_timeout > 0 and self.negative_timeout > 0:
+                    self.local.set(local_key, _MISSING, min(local_timeout, self.negative_timeout))
+
+        record_cache_lookup(hits=len(result), misses=len(keys) - len(result))
+        return result
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        timeout, version = self._resolve(timeout, version)
+        self.shared.set(key, value, timeout=timeout, version=version)
+        self.local.set(self.make_and_validate_key(key, version=version), value,
+                       self._get_local_timeout(key, timeout))
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        timeout, version = self._resolve(timeout, version)
+        failed = self.shared.set_many(data, timeout=timeout, version=version)
+        for key, value in data.items():
+            local_key = self.make_and_validate_key(key, version=version)
+            if key in failed:
+                self.local.delete(local_key)
+            else:
+                self.local.set(local_key, value, self._get_local_timeout(key, timeout))
+        return failed
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        timeout, version = self._resolve(timeout, version)
+        local_key = self.make_and_validate_key(key, version=version)
+
+        added = self.shared.add(key, value, timeout=timeout, version=version)
+        if added:
+            self.local.set(local_key, value, self._get_local_timeout(key, timeout))
+        else:
+            # Another process added the key, read it from the shared cache next time
+            self.local.delete(local_key)
+        return added
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        timeout, version = self._resolve(timeout, version)
+        return self.shared.touch(key, timeout=timeout, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        _, version = self._resolve(None, version)
+        value = self.shared.incr(key, delta, version=version)
+        self.local.set(self.make_and_validate_key(key, version=version), value, self._get_local_timeout(key))
+        return value
+
+    def delete(self, key, version=None):
+        _, version = self._resolve(None, version)
+        self.local.delete(self.make_and_validate_key(key, version=version))
+        return self.shared.delete(key, version=version)
+
+    def delete_many(self, keys, version=None):
+        _, version = self._resolve(None, version)
+        for key in keys:
+            self.local.delete(self.make_and_validate_key(key, version=version))
+        self.shared.delete_many(keys, version=version)
+
+    def has_key(self, key, version=None):
+        return self.get(key, _MISSING, version=version) is not _MISSING
+
+    def clear(self):
+        self.local.clear()
+        self.shared.clear()
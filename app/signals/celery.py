@@ -1,10 +1,35 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2018 - 2022 Gemeente Amsterdam
+# Copyright (C) 2018 - 2026 Gemeente Amsterdam
 import os
 
 from celery import Celery
+from celery.signals import task_postrun, task_prerun, worker_process_init
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'signals.settings')
 app = Celery('signals')
 app.config_from_object('django.conf:settings', namespace='CELERY')
 app.autodiscover_tasks()
+
+
+@worker_process_init.connect
+def warm_up_caches(**kwargs):
+    # Imported here, Django is not set up yet when this module is imported
+    from signals.apps.email_integrations.renderers.email_template_renderer import (
+        warm_up_email_template_cache
+    )
+
+    warm_up_email_template_cache()
+
+
+@task_prerun.connect
+def instrument_task(**kwargs):
+    from signals.instrumentation import task_instrumentation
+
+    task_instrumentation.task_prerun(**kwargs)
+
+
+@task_postrun.connect
+def record_task(**kwargs):
+    from signals.instrumentation import task_instrumentation
+
+    task_instrumentation.task_postrun(**kwargs)
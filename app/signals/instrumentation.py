@@ -0,0 +1,216 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+"""
+Per request (and per task) instrumentation of database queries and cache lookups.
+
+While a request or task is instrumented every query is counted and timed. Its SQL is reduced to a fingerprint
+(literals and lists of parameters removed) so repeated queries, the typical N+1 problem, show up as duplicates. The
+fingerprints are only computed when the duplicates are asked for, once per distinct SQL statement per process. Cache
+lookups of the default cache are counted as hits or misses. The totals are added to the process-wide "requests" and
+"tasks" metrics per view or task.
+
+Views can declare a query budget, the maximum number of queries a request may issue. A request that exceeds its
+budget is logged, or when QUERY_BUDGET_ACTION is "raise" the query that exceeds the budget raises QueryBudgetExceeded.
+"""
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import connections
+
+from signals.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+request_metrics = get_metrics('requests')
+task_metrics = get_metrics('tasks')
+
+BUDGET_ACTION_LOG = 'log'
+BUDGET_ACTION_RAISE = 'raise'
+
+# Lists of parameters, "IN (%s, %s, %s)" and "VALUES (%s, %s), (%s, %s)", differ in length between queries
+_PARAMETER_LISTS = re.compile(r'\((?:\s*%s\s*,)*\s*%s\s*\)(?:\s*,\s*\((?:\s*%s\s*,)*\s*%s\s*\))*')
+# String and numeric literals
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r'\s+')
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+@lru_cache(maxsize=2048)
+def get_fingerprint(sql: str) -> str:
+    """
+    The SQL of a query without its literals and with its lists of parameters collapsed.
+    """
+    sql = _PARAMETER_LISTS.sub('(...)', sql)
+    sql = _LITERALS.sub('?', sql)
+    return _WHITESPACE.sub(' ', sql).strip()
+
+
+@dataclass
+class Stats:
+    name: str
+    query_budget: int | None = None
+    queries: int = 0
+    db_time: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    # The executed SQL statements, with placeholders for the parameters
+    statements: Counter = field(default_factory=Counter)
+
+    @property
+    def fingerprints(self) -> Counter:
+        fingerprints = Counter()
+        for sql, count in self.statements.items():
+            fingerprints[get_fingerprint(sql)] += count
+        return fingerprints
+
+    @property
+    def duplicate_queries(self) -> int:
+        return sum(count - 1 for count in self.fingerprints.values() if count > 1)
+
+    def get_duplicates(self, limit: int = 5) -> list[tuple[str, int]]:
+        return [(fingerprint, count) for fingerprint, count in self.fingerprints.most_common(limit) if count > 1]
+
+    def budget_exceeded(self) -> bool:
+        return self.query_budget is not None and self.queries > self.query_budget
+
+
+_current: ContextVar[Stats | None] = ContextVar('signals_instrumentation_stats', default=None)
+
+
+def get_current_stats() -> Stats | None:
+    return _current.get()
+
+
+def record_cache_lookup(hits: int = 0, misses: int = 0) -> None:
+    stats = _current.get()
+    if stats is not None:
+        stats.cache_hits += hits
+        stats.cache_misses += misses
+
+
+def _execute_wrapper(stats: Stats):
+    def wrapper(execute, sql, params, many, context):
+        stats.queries += 1
+        if (stats.query_budget is not None and stats.queries == stats.query_budget + 1
+                and settings.QUERY_BUDGET_ACTION == BUDGET_ACTION_RAISE):
+            raise QueryBudgetExceeded(f'{stats.name} exceeded its query budget of {stats.query_budget} queries')
+
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            stats.db_time += time.perf_counter() - started
+            stats.statements[sql] += 1
+    return wrapper
+
+
+@contextmanager
+def instrument(name: str, query_budget: int | None = None):
+    """
+    Instrument the queries and cache lookups within the block, yields the Stats.
+    """
+    stats = Stats(name=name, query_budget=query_budget)
+    token = _current.set(stats)
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(_execute_wrapper(stats)))
+            yield stats
+    finally:
+        _current.reset(token)
+
+
+def record(metrics, stats: Stats, duration: float) -> None:
+    """
+    Add the stats of a request or task to the metrics, and log the request or task when it exceeded its query budget.
+    """
+    metrics.increment(f'{stats.name}.count')
+    metrics.increment(f'{stats.name}.queries', stats.queries)
+    metrics.increment(f'{stats.name}.duplicate_queries', stats.duplicate_queries)
+    metrics.increment(f'{stats.name}.cache_hits', stats.cache_hits)
+    metrics.increment(f'{stats.name}.cache_misses', stats.cache_misses)
+    metrics.observe(f'{stats.name}.duration', duration)
+    metrics.observe(f'{stats.name}.db_time', stats.db_time)
+
+    if stats.budget_exceeded():
+        metrics.increment(f'{stats.name}.budget_exceeded')
+        duplicates = '; '.join(f'{count}x {fingerprint[:200]}' for fingerprint, count in stats.get_duplicates(3))
+        logger.warning(f'{stats.name} issued {stats.queries} queries, its query budget is {stats.query_budget}. '
+                       f'Most duplicated queries: {duplicates or "none"}')
+
+
+def query_budget(max_queries: int | dict[str, int]):
+    """
+    Declare the query budget of a view function or view class. The budget of a DRF viewset can be given per action,
+    for example {'list': 10, 'retrieve': 20}.
+    """
+    def decorator(view):
+        view.query_budget = max_queries
+        return view
+    return decorator
+
+
+def get_query_budget(view_func, action: str | None) -> int | None:
+    # Function views have the budget as attribute, DRF views have it on their class
+    budget = getattr(view_func, 'query_budget', None)
+    view_class = getattr(view_func, 'cls', getattr(view_func, 'view_class', None))
+    if budget is None and view_class is not None:
+        budget = getattr(view_class, 'query_budget', None)
+
+    if isinstance(budget, dict):
+        return budget.get(action)
+    return budget
+
+
+def get_action(view_func, method: str) -> str | None:
+    # The action a DRF viewset maps the request method to
+    actions = getattr(view_func, 'actions', None)
+    return actions.get(method.lower()) if actions else None
+
+
+def get_view_name(view_func, action: str | None = None) -> str:
+    """
+    The name of the view in the metrics, including the action for DRF viewsets.
+    """
+    view_class = getattr(view_func, 'cls', getattr(view_func, 'view_class', None))
+    if view_class is None:
+        return f'{view_func.__module__}.{view_func.__qualname__}'
+    return f'{view_class.__name__}.{action}' if action else view_class.__name__
+
+
+class TaskInstrumentation:
+    """
+    Instruments Celery tasks, connected to the task_prerun and task_postrun signals.
+    """
+    def __init__(self):
+        self._running: dict[str, tuple[ExitStack, Stats, float]] = {}
+
+    def task_prerun(self, task_id=None, task=None, **kwargs):
+        if not settings.QUERY_INSTRUMENTATION_ENABLED or task_id is None:
+            return
+
+        stack = ExitStack()
+        stats = stack.enter_context(instrument(task.name))
+        self._running[task_id] = (stack, stats, time.perf_counter())
+
+    def task_postrun(self, task_id=None, **kwargs):
+        running = self._running.pop(task_id, None)
+        if running is None:
+            return
+
+        stack, stats, started = running
+        stack.close()
+        record(task_metrics, stats, time.perf_counter() - started)
+
+
+task_instrumentation = TaskInstrumentation()
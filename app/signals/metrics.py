@@ -0,0 +1,95 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+"""
+In-process counters and timings.
+
+Every metric is kept in-process, so it can be inspected in tests and by the application itself, and is also
+reported through the OpenTelemetry metrics API. The latter is a no-op unless a MeterProvider is configured.
+"""
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from opentelemetry import metrics as otel_metrics
+
+_registry: dict[str, 'Metrics'] = {}
+_registry_lock = threading.Lock()
+
+
+class Metrics:
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._counters: dict[str, int] = defaultdict(int)
+        self._timings: dict[str, list[float]] = defaultdict(lambda: [0, 0.0])  # [count, total seconds]
+
+        self._meter = otel_metrics.get_meter(f'signals.{name}')
+        self._otel_counters = {}
+        self._otel_histograms = {}
+
+    def _otel_counter(self, key: str):
+        if key not in self._otel_counters:
+            self._otel_counters[key] = self._meter.create_counter(f'signals.{self.name}.{key}')
+        return self._otel_counters[key]
+
+    def _otel_histogram(self, key: str):
+        if key not in self._otel_histograms:
+            self._otel_histograms[key] = self._meter.create_histogram(f'signals.{self.name}.{key}', unit='s')
+        return self._otel_histograms[key]
+
+    def increment(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[key] += amount
+            counter = self._otel_counter(key)
+        counter.add(amount)
+
+    def observe(self, key: str, seconds: float) -> None:
+        with self._lock:
+            timing = self._timings[key]
+            timing[0] += 1
+            timing[1] += seconds
+            histogram = self._otel_histogram(key)
+        histogram.record(seconds)
+
+    @contextmanager
+    def timer(self, key: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(key, time.perf_counter() - start)
+
+    def get(self, key: str) -> int:
+        return self._counters.get(key, 0)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                'counters': dict(self._counters),
+                'timings': {
+                    key: {'count': count, 'total': total, 'mean': total / count if count else 0.0}
+                    for key, (count, total) in self._timings.items()
+                },
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._timings.clear()
+
+
+def get_metrics(name: str) -> Metrics:
+    """
+    Returns the (process-wide) metrics with the given name, creates them if needed.
+    """
+    with _registry_lock:
+        if name not in _registry:
+            _registry[name] = Metrics(name)
+        return _registry[name]
+
+
+def get_all_metrics() -> dict[str, dict]:
+    with _registry_lock:
+        registered = list(_registry.values())
+    return {metric.name: metric.snapshot() for metric in registered}
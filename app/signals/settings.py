@@ -112,6 +112,7 @@ INSTALLED_APPS: list[str] = [
 
 MIDDLEWARE: list[str] = [
     'corsheaders.middleware.CorsMiddleware',
+    'signals.apps.api.middleware.QueryInstrumentationMiddleware',
     'signals.apps.api.middleware.MaintenanceModeMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -213,12 +214,32 @@ DATABASES: dict[str, dict[str, str | int | None]] = {
 }
 
 # Django cache settings
-CACHES: dict[str, dict[str, str | int]] = {
+# The default cache keeps recently used entries in the memory of the process (for at most CACHE_LOCAL_TIMEOUT seconds)
+# in front of the shared cache. The shared cache is a database cache by default, any Django cache backend can be used.
+CACHES: dict[str, dict[str, Any]] = {
     'default': {
-        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
-        'LOCATION': 'signals_cache',
+        'BACKEND': 'signals.cache.TieredCache',
+        'LOCATION': 'shared',
         'TIMEOUT': os.getenv('CACHE_TIMEOUT', 3900),
-    }
+        'OPTIONS': {
+            'LOCAL_MAX_ENTRIES': int(os.getenv('CACHE_LOCAL_MAX_ENTRIES', 1000)),
+            'LOCAL_TIMEOUT': float(os.getenv('CACHE_LOCAL_TIMEOUT', 10)),
+            'NEGATIVE_TIMEOUT': float(os.getenv('CACHE_NEGATIVE_TIMEOUT', 5)),
+            'LOCAL_TIMEOUTS': {
+                # Version stamps invalidate the caches of other processes, keep them fresh
+                'version_stamp:': float(os.getenv('CACHE_VERSION_STAMP_LOCAL_TIMEOUT', 1)),
+                # The request history of throttles is read, modified and written back, it must never be stale
+                'throttle_': 0,
+                # The public signal map is several megabytes, it is kept in the memory of the process instead
+                'public_signal_map:data': 0,
+            },
+        },
+    },
+    'shared': {
+        'BACKEND': os.getenv('CACHE_SHARED_BACKEND', 'django.core.cache.backends.db.DatabaseCache'),
+        'LOCATION': os.getenv('CACHE_SHARED_LOCATION', 'signals_cache'),
+        'TIMEOUT': os.getenv('CACHE_TIMEOUT', 3900),
+    },
 }
 
 # Django security settings
@@ -271,12 +292,19 @@ FILE_UPLOAD_PERMISSIONS: None = None
 
 # Object store - Datawarehouse (DWH)
 DWH_MEDIA_ROOT: str | None = os.getenv('DWH_MEDIA_ROOT')
+# Number of tables exported at the same time by the incremental export
+DWH_EXPORT_WORKERS: int = int(os.getenv('DWH_EXPORT_WORKERS', 4))
+# The incremental export also exports rows changed this many seconds before the previous high-water mark
+DWH_INCREMENTAL_OVERLAP_SECONDS: int = int(os.getenv('DWH_INCREMENTAL_OVERLAP_SECONDS', 300))
 
-SIGNALS_AUTH: dict[str, str | bool | list[str] | None] = {
+SIGNALS_AUTH: dict[str, str | bool | int | list[str] | None] = {
     'JWKS': os.getenv('PUB_JWKS'),
     'JWKS_URL': os.getenv('JWKS_URL'),
     'USER_ID_FIELDS': os.getenv('USER_ID_FIELDS', 'email').split(','),
     'ALWAYS_OK': os.getenv('SIGNALS_AUTH_ALWAYS_OK', False) in TRUE_VALUES,
+    # Verified tokens are cached until they expire, for at most VERIFIED_TOKEN_CACHE_MAX_AGE seconds
+    'VERIFIED_TOKEN_CACHE_SIZE': int(os.getenv('SIGNALS_AUTH_VERIFIED_TOKEN_CACHE_SIZE', 1024)),
+    'VERIFIED_TOKEN_CACHE_MAX_AGE': int(os.getenv('SIGNALS_AUTH_VERIFIED_TOKEN_CACHE_MAX_AGE', 300)),
 }
 
 # Celery settings
@@ -388,7 +416,7 @@ FRONTEND_URL: str | None = os.getenv('FRONTEND_URL', None)
 ML_TOOL_ENDPOINT: str = os.getenv('SIGNALS_ML_TOOL_ENDPOINT', 'https://api.data.amsterdam.nl/signals_mltool')  # noqa
 
 # Search settings
-SEARCH: dict[str, int | dict[str, str]] = {
+SEARCH: dict[str, int | dict[str, str] | dict[str, int]] = {
     'PAGE_SIZE': 500,
     'CONNECTION': {
         'HOST': os.getenv('ELASTICSEARCH_HOST', 'elastic-index.service.consul:9200'),
@@ -396,6 +424,15 @@ SEARCH: dict[str, int | dict[str, str]] = {
         'STATUS_MESSAGE_INDEX': os.getenv('ELASTICSEARCH_STATUS_MESSAGE_INDEX', 'status_messages'),
     },
     'TIMEOUT': int(os.getenv('ELASTICSEARCH_TIMEOUT', 10)),
+    'BULK': {
+        # Number of documents per bulk request and the number of concurrent bulk requests
+        'CHUNK_SIZE': int(os.getenv('ELASTICSEARCH_BULK_CHUNK_SIZE', 500)),
+        'THREAD_COUNT': int(os.getenv('ELASTICSEARCH_BULK_THREAD_COUNT', 4)),
+        # Number of processes serializing documents, 0 serializes in the current process (Celery workers cannot fork)
+        'WORKERS': int(os.getenv('ELASTICSEARCH_BULK_WORKERS', 0)),
+        # Number of signals per primary key range
+        'SCAN_SIZE': int(os.getenv('ELASTICSEARCH_BULK_SCAN_SIZE', 2000)),
+    },
 }
 
 API_DETERMINE_STADSDEEL_ENABLED_AREA_TYPE: str = 'sia-stadsdeel'
@@ -418,15 +455,85 @@ PDOK_LOCATIESERVER_SUGGEST_ENDPOINT: str = os.getenv('PDOK_LOCATIESERVER_SUGGEST
 DEFAULT_PDOK_MUNICIPALITIES: list[str] = os.getenv('DEFAULT_PDOK_MUNICIPALITIES',
                                                    'Amsterdam,Amstelveen,Weesp,Ouder-Amstel').split(',')
 
+# The address validation used when creating and updating signals. Set it to
+# 'signals.apps.api.validation.address.fixture.FixtureAddressValidation' to validate addresses against the PDOK
+# responses in ADDRESS_VALIDATION_FIXTURE (a JSON file, a few addresses in Amsterdam and Weesp by default) instead of
+# PDOK itself.
+ADDRESS_VALIDATION_CLASS: str = os.getenv('ADDRESS_VALIDATION_CLASS',
+                                          'signals.apps.api.validation.address.pdok.PDOKAddressValidation')
+ADDRESS_VALIDATION_FIXTURE: str | None = os.getenv('ADDRESS_VALIDATION_FIXTURE', None)
+
+# PDOK requests share a connection pool and are cut off after the timeouts. Search results are cached per process, and
+# after PDOK_CIRCUIT_BREAKER_THRESHOLD consecutive failures PDOK is not asked for PDOK_CIRCUIT_BREAKER_RESET_TIMEOUT
+# seconds; addresses are then stored unvalidated.
+PDOK_POOL_SIZE: int = int(os.getenv('PDOK_POOL_SIZE', 10))
+PDOK_CONNECT_TIMEOUT: float = float(os.getenv('PDOK_CONNECT_TIMEOUT', 1))  # seconds
+PDOK_READ_TIMEOUT: float = float(os.getenv('PDOK_READ_TIMEOUT', 3))  # seconds
+PDOK_CACHE_SIZE: int = int(os.getenv('PDOK_CACHE_SIZE', 1024))
+PDOK_CACHE_TIMEOUT: int = int(os.getenv('PDOK_CACHE_TIMEOUT', 60 * 60))  # seconds
+PDOK_CIRCUIT_BREAKER_THRESHOLD: int = int(os.getenv('PDOK_CIRCUIT_BREAKER_THRESHOLD', 5))
+PDOK_CIRCUIT_BREAKER_RESET_TIMEOUT: int = int(os.getenv('PDOK_CIRCUIT_BREAKER_RESET_TIMEOUT', 30))  # seconds
+
 # use dynamic map server for pdf, empty by default
 # example servers
 # 'https://service.pdok.nl/brt/achtergrondkaart/wmts/v2_0/standaard/EPSG:28992/{z}/{x}/{y}.png'
 # 'https://a.tile.openstreetmap.org/{zoom}/{x}/{y}.png'
 DEFAULT_MAP_TILE_SERVER: str = os.getenv('DEFAULT_MAP_TILE_SERVER', '')
 
+# Tiles of the map tile server are cached on the local disk, in the temp directory by default
+MAP_TILE_CACHE_DIR: str | None = os.getenv('MAP_TILE_CACHE_DIR', None)
+MAP_TILE_CACHE_MAX_SIZE: int = int(os.getenv('MAP_TILE_CACHE_MAX_SIZE', 256 * 1024 * 1024))  # bytes
+MAP_TILE_CACHE_MAX_AGE: int = int(os.getenv('MAP_TILE_CACHE_MAX_AGE', 30 * 24 * 60 * 60))  # seconds
+MAP_TILE_FETCH_CONCURRENCY: int = int(os.getenv('MAP_TILE_FETCH_CONCURRENCY', 8))
+MAP_TILE_FETCH_TIMEOUT: float = float(os.getenv('MAP_TILE_FETCH_TIMEOUT', 5))
+
+# The retention task deletes signals in batches of SIGNAL_DELETION_BATCH_SIZE signals (and their children) and waits
+# SIGNAL_DELETION_BATCH_DELAY seconds between two batches. After SIGNAL_DELETION_BATCHES_PER_TASK batches the task
+# queues itself to continue with the next batch.
+SIGNAL_DELETION_BATCH_SIZE: int = int(os.getenv('SIGNAL_DELETION_BATCH_SIZE', 100))
+SIGNAL_DELETION_BATCH_DELAY: float = float(os.getenv('SIGNAL_DELETION_BATCH_DELAY', 0.5))  # seconds
+SIGNAL_DELETION_BATCHES_PER_TASK: int = int(os.getenv('SIGNAL_DELETION_BATCHES_PER_TASK', 50))
+
+# Reporters are anonymized in batches of REPORTER_ANONYMIZATION_BATCH_SIZE reporters, set REPORTER_ANONYMIZATION_BULK
+# to False to anonymize them with a task per reporter instead.
+REPORTER_ANONYMIZATION_BULK: bool = os.getenv('REPORTER_ANONYMIZATION_BULK', True) in TRUE_VALUES
+REPORTER_ANONYMIZATION_BATCH_SIZE: int = int(os.getenv('REPORTER_ANONYMIZATION_BATCH_SIZE', 500))
+
+# The GeoJSON of the public signal map is cached for at most PUBLIC_SIGNAL_MAP_CACHE_TIMEOUT seconds and regenerated
+# PUBLIC_SIGNAL_MAP_REFRESH_DELAY seconds after signals changed. Clients may reuse a response for
+# PUBLIC_SIGNAL_MAP_MAX_AGE seconds.
+PUBLIC_SIGNAL_MAP_CACHE_TIMEOUT: int = int(os.getenv('PUBLIC_SIGNAL_MAP_CACHE_TIMEOUT', 15 * 60))  # seconds
+PUBLIC_SIGNAL_MAP_REFRESH_DELAY: int = int(os.getenv('PUBLIC_SIGNAL_MAP_REFRESH_DELAY', 30))  # seconds
+PUBLIC_SIGNAL_MAP_MAX_AGE: int = int(os.getenv('PUBLIC_SIGNAL_MAP_MAX_AGE', 60))  # seconds
+
+# The queries and cache lookups of every request and task are counted per view or task, see signals.instrumentation.
+# QUERY_INSTRUMENTATION_HEADERS adds the counts to the response headers. A request exceeding the query budget of its
+# view is logged (QUERY_BUDGET_ACTION "log") or fails (QUERY_BUDGET_ACTION "raise").
+QUERY_INSTRUMENTATION_ENABLED: bool = os.getenv('QUERY_INSTRUMENTATION_ENABLED', True) in TRUE_VALUES
+QUERY_INSTRUMENTATION_HEADERS: bool = os.getenv('QUERY_INSTRUMENTATION_HEADERS', False) in TRUE_VALUES
+QUERY_BUDGET_ACTION: str = os.getenv('QUERY_BUDGET_ACTION', 'log')
+
+# The in-process metrics are served by the /status/metrics endpoint when enabled, if METRICS_ENDPOINT_TOKEN is set the
+# token must be given as bearer token
+METRICS_ENDPOINT_ENABLED: bool = os.getenv('METRICS_ENDPOINT_ENABLED', False) in TRUE_VALUES
+METRICS_ENDPOINT_TOKEN: str | None = os.getenv('METRICS_ENDPOINT_TOKEN', None)
+
+# The categories and departments a user may see signals of (see signals.apps.services.domain.permissions.utils) are
+# cached for at most VISIBILITY_SCOPE_CACHE_TIMEOUT seconds, they are invalidated when the departments change.
+VISIBILITY_SCOPE_CACHE_TIMEOUT: int = int(os.getenv('VISIBILITY_SCOPE_CACHE_TIMEOUT', 60 * 60))  # seconds
+
+# The choices of the signal filters that are read from the database (areas, buurten, categories, departments and
+# sources) are cached for at most FILTER_CHOICES_CACHE_TIMEOUT seconds, they are invalidated when these change.
+FILTER_CHOICES_CACHE_TIMEOUT: int = int(os.getenv('FILTER_CHOICES_CACHE_TIMEOUT', 60 * 60))  # seconds
+
 # Default setting for area type
 DEFAULT_SIGNAL_AREA_TYPE: str = os.getenv('DEFAULT_SIGNAL_AREA_TYPE', 'district')
 
+# The in-memory area index checks the shared version stamp at most once every X seconds, so lookups do not read the
+# (shared) cache every time. Other processes can use stale areas for at most this long after the areas changed, 0 checks
+# the stamp on every lookup.
+AREA_INDEX_VERSION_CHECK_INTERVAL: int = int(os.getenv('AREA_INDEX_VERSION_CHECK_INTERVAL', 5))
+
 # Logo used on first page of generated PDFs, supports SVG, PNG, and JPG in
 # order of preference. Note that this logo is rescaled to 100 pixels in height.
 # Note: this assumes the configured image is available through the staticfiles
@@ -437,6 +544,12 @@ API_PDF_LOGO_STATIC_FILE: str = os.getenv('API_PDF_LOGO_STATIC_FILE', 'api/logo-
 # along the largest side, aspect ratio is maintained.
 API_PDF_RESIZE_IMAGES_TO: int = 800
 
+# Image attachments get renditions (smaller copies) after they are added: a thumbnail, a JPEG of
+# `API_PDF_RESIZE_IMAGES_TO` pixels used in the PDFs and a WebP. The sizes are the maximum along the largest side.
+ATTACHMENT_THUMBNAIL_SIZE: int = int(os.getenv('ATTACHMENT_THUMBNAIL_SIZE', 256))
+ATTACHMENT_WEBP_SIZE: int = int(os.getenv('ATTACHMENT_WEBP_SIZE', 1600))
+ATTACHMENT_RENDITION_QUALITY: int = int(os.getenv('ATTACHMENT_RENDITION_QUALITY', 85))
+
 # Maximum size for attachments
 API_MAX_UPLOAD_SIZE: int = int(os.getenv('API_MAX_UPLOAD_SIZE', '20971520'))  # 20MB
 
@@ -516,6 +629,9 @@ FEATURE_FLAGS: dict[str, bool] = {
 
     # Run routing expressions again when updating signal subcategory or location
     'DSL_RUN_ROUTING_EXPRESSIONS_ON_UPDATES': os.getenv('DSL_RUN_ROUTING_EXPRESSIONS_ON_UPDATES', False) in TRUE_VALUES,
+
+    # Resolve the stadsdeel and area of a location using the in-memory area index instead of database queries
+    'AREA_INDEX_ENABLED': os.getenv('AREA_INDEX_ENABLED', True) in TRUE_VALUES,
 }
 
 # Per default log to console
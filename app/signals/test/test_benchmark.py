@@ -0,0 +1,105 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, TestCase
+
+from signals.apps.history.models import Log
+from signals.apps.signals.models import Note, Signal
+from signals.benchmark.dataset import DatasetConfig, get_area_grid, seed_dataset
+from signals.benchmark.runner import compare_reports, measure, percentile
+from signals.benchmark.scenarios import SCENARIOS
+
+
+class TestRunner(SimpleTestCase):
+    def test_percentile(self):
+        self.assertEqual(percentile([4, 1, 3, 2], 0), 1)
+        self.assertEqual(percentile([4, 1, 3, 2], 50), 2.5)
+        self.assertEqual(percentile([4, 1, 3, 2], 100), 4)
+        self.assertEqual(percentile([7], 95), 7)
+
+        with self.assertRaises(ValueError):
+            percentile([], 50)
+
+    def test_compare_reports(self):
+        def report(p50_ms, queries):
+            return {'version': 1, 'scenarios': {
+                'detail': {'p50_ms': p50_ms, 'p95_ms': 20, 'queries': queries, 'peak_memory_kib': 100},
+                'search': {'skipped': 'Elasticsearch is not available'},
+            }}
+
+        changes = compare_reports(report(10, 5), report(10.5, 5), threshold=0.1)
+        self.assertEqual(len(changes), 4)
+        self.assertFalse(any(change.regression for change in changes))
+
+        changes = compare_reports(report(10, 5), report(12, 6), threshold=0.1)
+        self.assertEqual({change.metric for change in changes if change.regression}, {'p50_ms', 'queries'})
+
+        with self.assertRaises(ValueError):
+            compare_reports({'version': 0, 'scenarios': {}}, report(10, 5), threshold=0.1)
+
+    def test_get_area_grid(self):
+        areas = get_area_grid(5, bbox=(0, 0, 3, 2))
+        self.assertEqual(len(areas), 5)
+        self.assertEqual(areas[0].extent, (0, 0, 1, 1))
+        self.assertEqual(areas[4].extent, (1, 1, 2, 2))
+
+
+class TestBenchmark(TestCase):
+    config = DatasetConfig(signals=4, areas=4, categories=2, users=2, notes=1)
+
+    def test_seed_dataset(self):
+        dataset = seed_dataset(self.config)
+
+        self.assertEqual(dataset['signals'], 4)
+        self.assertEqual(dataset['areas'], 4)
+        self.assertEqual(Note.objects.count(), 4)
+        # Every note is logged once
+        self.assertEqual(Log.objects.filter(content_type=ContentType.objects.get_for_model(Note)).count(), 4)
+        self.assertTrue(Log.objects.filter(_signal__isnull=False).exists())
+
+        with self.assertRaises(ValueError):
+            seed_dataset(self.config)
+
+    def test_measure(self):
+        seed_dataset(self.config)
+
+        results = measure(SCENARIOS['private_signal_detail'], iterations=3, warmup=1)
+        self.assertEqual(results['iterations'], 3)
+        self.assertLessEqual(results['p50_ms'], results['p95_ms'])
+        self.assertGreater(results['queries'], 0)
+
+        # Changes of the scenarios that change data are rolled back
+        measure(SCENARIOS['public_signal_create'], iterations=2, warmup=0)
+        self.assertEqual(Signal.objects.count(), 4)
+
+    def test_measure_skipped(self):
+        results = measure(SCENARIOS['private_signal_detail'], iterations=3, warmup=1)
+        self.assertIn('skipped', results)
+
+    def test_command(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, 'report.json')
+            out = StringIO()
+            call_command('benchmark', '--seed-dataset', '--signals', '3', '--scenario', 'private_signal_list',
+                         '--iterations', '2', '--warmup', '0', '--output', output, stdout=out)
+
+            with open(output) as f:
+                report = json.load(f)
+            self.assertEqual(report['dataset']['signals'], 3)
+            self.assertEqual(list(report['scenarios'].keys()), ['private_signal_list'])
+            self.assertIn('private_signal_list: p50', out.getvalue())
+
+            # A report compared to itself has no regressions
+            out = StringIO()
+            call_command('benchmark', '--scenario', 'private_signal_list', '--iterations', '2', '--compare', output,
+                         '--threshold', '100', stdout=out)
+            self.assertIn('0 regression(s)', out.getvalue())
+
+            with self.assertRaises(CommandError):
+                call_command('benchmark', '--seed-dataset', '--iterations', '1', stdout=StringIO())
@@ -0,0 +1,143 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from unittest import mock
+
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+
+from signals.cache import TieredCache, cache_metrics, clear_local_tiers
+
+CACHES = {
+    'default': {
+        'BACKEND': 'signals.cache.TieredCache',
+        'LOCATION': 'test-shared',
+        'OPTIONS': {
+            'LOCAL_TIMEOUT': 10,
+            'NEGATIVE_TIMEOUT': 5,
+            'LOCAL_MAX_ENTRIES': 3,
+            'LOCAL_TIMEOUTS': {'uncached:': 0},
+        },
+    },
+    'test-shared': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'test-tiered-cache-shared',
+    },
+}
+
+
+@override_settings(CACHES=CACHES)
+class TestTieredCache(SimpleTestCase):
+    def setUp(self):
+        self.cache = caches['default']
+        self.shared = caches['test-shared']
+        self.cache.clear()
+        clear_local_tiers()
+        cache_metrics.reset()
+
+    def test_backend(self):
+        self.assertIsInstance(self.cache, TieredCache)
+
+    def test_get_from_local_tier(self):
+        self.cache.set('key', {'value': 1})
+
+        with mock.patch.object(self.shared, 'get') as shared_get:
+            self.assertEqual(self.cache.get('key'), {'value': 1})
+            shared_get.assert_not_called()
+        self.assertEqual(cache_metrics.get('local_hits'), 1)
+
+    def test_values_are_copied(self):
+        self.cache.set('key', [1])
+        self.cache.get('key').append(2)
+        self.assertEqual(self.cache.get('key'), [1])
+
+    def test_get_from_shared(self):
+        self.shared.set('key', 'shared value')
+
+        self.assertEqual(self.cache.get('key'), 'shared value')
+        self.assertEqual(cache_metrics.get('shared_lookups'), 1)
+
+        # Now cached locally
+        self.assertEqual(self.cache.get('key'), 'shared value')
+        self.assertEqual(cache_metrics.get('shared_lookups'), 1)
+
+    def test_negative_caching(self):
+        self.assertIsNone(self.cache.get('missing'))
+        self.assertEqual(self.cache.get('missing', 'default'), 'default')
+        self.assertFalse(self.cache.has_key('missing'))
+        self.assertEqual(cache_metrics.get('shared_lookups'), 1)
+
+        # A write by this process replaces the negative entry
+        self.cache.set('missing', 'value')
+        self.assertEqual(self.cache.get('missing'), 'value')
+
+    def test_local_expiry(self):
+        self.shared.set('key', 'old')
+        self.assertEqual(self.cache.get('key'), 'old')
+
+        # Written by another process
+        self.shared.set('key', 'new')
+        self.assertEqual(self.cache.get('key'), 'old')
+
+        with mock.patch('signals.cache.time.monotonic', return_value=10 ** 9):
+            self.assertEqual(self.cache.get('key'), 'new')
+
+    def test_per_key_local_timeout(self):
+        self.cache.set('uncached:key', 'value')
+        self.shared.set('uncached:key', 'new')
+        self.assertEqual(self.cache.get('uncached:key'), 'new')
+
+        self.cache.set('short', 'value', timeout=0)
+        self.assertIsNone(self.cache.get('short'))
+
+    def test_add_and_delete(self):
+        self.assertTrue(self.cache.add('key', 'first'))
+        self.assertFalse(self.cache.add('key', 'second'))
+        self.assertEqual(self.cache.get('key'), 'first')
+
+        self.cache.delete('key')
+        self.assertIsNone(self.shared.get('key'))
+        self.assertIsNone(self.cache.get('key'))
+
+    def test_incr(self):
+        self.cache.set('counter', 1)
+        self.assertEqual(self.cache.incr('counter'), 2)
+        self.assertEqual(self.cache.get('counter'), 2)
+        self.assertEqual(self.shared.get('counter'), 2)
+
+    def test_versions(self):
+        self.cache.set('key', 'value', version=1)
+        self.assertIsNone(self.cache.get('key', version=2))
+
+        self.cache.incr_version('key', version=1)
+        self.assertIsNone(self.cache.get('key', version=1))
+        self.assertEqual(self.cache.get('key', version=2), 'value')
+
+    def test_many(self):
+        self.cache.set_many({'a': 1, 'b': 2})
+        self.shared.set('c', 3)
+        self.assertEqual(self.cache.get_many(['a', 'b', 'c', 'd']), {'a': 1, 'b': 2, 'c': 3})
+
+        # Served from the local tier now, also for keys known to be missing
+        with mock.patch.object(self.shared, 'get_many') as shared_get_many:
+            self.assertEqual(self.cache.get_many(['a', 'c', 'd']), {'a': 1, 'c': 3})
+            shared_get_many.assert_not_called()
+
+        self.cache.delete_many(['a', 'c'])
+        self.assertEqual(self.cache.get_many(['a', 'b', 'c']), {'b': 2})
+
+    def test_bounded(self):
+        for i in range(5):
+            self.cache.set(f'key-{i}', i)
+
+        self.assertEqual(len(self.cache.local), 3)
+        self.assertEqual(cache_metrics.get('local_evictions'), 2)
+        # Evicted keys are still in the shared cache
+        self.assertEqual(self.cache.get('key-0'), 0)
+
+
+class TestDefaultCache(SimpleTestCase):
+    def test_read_modify_write_keys_not_cached_locally(self):
+        cache = caches['default']
+        # The request history of DRF throttles, see SimpleRateThrottle.cache_format
+        self.assertEqual(cache._get_local_timeout('throttle_nouser_127.0.0.1'), 0)
+        self.assertGreater(cache._get_local_timeout('other'), 0)
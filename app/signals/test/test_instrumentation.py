@@ -0,0 +1,92 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+
+from signals.apps.signals.models import Category
+from signals.cache import clear_local_tiers
+from signals.instrumentation import (
+    get_fingerprint,
+    get_query_budget,
+    get_view_name,
+    instrument,
+    query_budget,
+    task_instrumentation,
+    task_metrics
+)
+
+
+class TestFingerprint(SimpleTestCase):
+    def test_get_fingerprint(self):
+        self.assertEqual(
+            get_fingerprint('SELECT "a"  FROM "t"\n WHERE "t"."id" IN (%s, %s, %s) AND "t"."b" = %s LIMIT 21'),
+            'SELECT "a" FROM "t" WHERE "t"."id" IN (...) AND "t"."b" = %s LIMIT ?'
+        )
+        self.assertEqual(get_fingerprint('INSERT INTO "t" ("a", "b") VALUES (%s, %s), (%s, %s)'),
+                         get_fingerprint('INSERT INTO "t" ("a", "b") VALUES (%s, %s)'))
+        self.assertEqual(get_fingerprint("SELECT 'x' = 'it''s', 1.5"), 'SELECT ? = ?, ?')
+
+
+class TestViews(SimpleTestCase):
+    def test_query_budget(self):
+        @query_budget(5)
+        def view(request):
+            pass
+
+        @query_budget({'list': 10})
+        class ViewSet:
+            pass
+
+        viewset_view = mock.Mock(spec=['cls', 'actions'], cls=ViewSet, actions={'get': 'list'})
+
+        self.assertEqual(get_query_budget(view, None), 5)
+        self.assertEqual(get_query_budget(viewset_view, 'list'), 10)
+        self.assertIsNone(get_query_budget(viewset_view, 'retrieve'))
+        self.assertEqual(get_view_name(viewset_view, 'list'), 'ViewSet.list')
+        self.assertTrue(get_view_name(view).endswith('test_query_budget.<locals>.view'))
+
+
+class TestInstrument(TestCase):
+    def setUp(self):
+        cache.clear()
+        clear_local_tiers()
+
+    def test_instrument(self):
+        with instrument('test') as stats:
+            for _ in range(3):
+                list(Category.objects.filter(pk=1))
+            Category.objects.count()
+
+        self.assertEqual(stats.queries, 4)
+        self.assertEqual(stats.duplicate_queries, 2)
+        self.assertEqual(len(stats.get_duplicates()), 1)
+        self.assertGreater(stats.db_time, 0)
+
+        # Queries after the block are not counted
+        Category.objects.count()
+        self.assertEqual(stats.queries, 4)
+
+    def test_instrument_cache_lookups(self):
+        cache.set('present', 1)
+
+        with instrument('test') as stats:
+            cache.get('missing')
+            cache.get('present')
+            cache.get_many(['present', 'other'])
+
+        self.assertEqual(stats.cache_hits, 2)
+        self.assertEqual(stats.cache_misses, 2)
+
+    def test_task_instrumentation(self):
+        task_metrics.reset()
+        task = mock.Mock()
+        task.name = 'signals.apps.signals.tasks.test'
+
+        task_instrumentation.task_prerun(task_id='1', task=task)
+        Category.objects.count()
+        task_instrumentation.task_postrun(task_id='1', task=task)
+
+        self.assertEqual(task_metrics.get('signals.apps.signals.tasks.test.count'), 1)
+        self.assertEqual(task_metrics.get('signals.apps.signals.tasks.test.queries'), 1)